@@ -83,14 +83,14 @@ import numba.core.types as types
 # Re-export all type names
 from numba.core.types import *
 
-# Re-export decorators
-from numba.core.decorators import (cfunc, jit, njit, stencil,
-                                   jit_module)
+# Re-export decorators, numba.stencil is resolved by __getattr__ below
+from numba.core.decorators import (cfunc, jit, njit, jit_module)
 
 # Re-export vectorize decorators and the thread layer querying function
 from numba.np.ufunc import (vectorize, guvectorize, threading_layer,
                             get_num_threads, set_num_threads,
                             set_parallel_chunksize, get_parallel_chunksize,
+                            set_parallel_schedule, get_parallel_schedule,
                             get_thread_id)
 
 # Re-export Numpy helpers
@@ -102,7 +102,10 @@ from numba import experimental
 # Initialize withcontexts
 import numba.core.withcontexts
 from numba.core.withcontexts import objmode_context as objmode
-from numba.core.withcontexts import parallel_chunksize
+from numba.core.withcontexts import parallel_chunksize, parallel_schedule
+
+# Re-export the declaration of user-defined prange reductions
+from numba.parfors.reduction import reduction
 
 # Initialize target extensions
 import numba.core.target_extension
@@ -110,6 +113,14 @@ import numba.core.target_extension
 # Initialize typed containers
 import numba.typed
 
+def __getattr__(name):
+    # Uses PEP-562, the stencil machinery is heavy and only needed once a
+    # stencil is defined
+    if name == 'stencil':
+        from numba.stencils.stencil import stencil
+        return stencil
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Keep this for backward compatibility.
 def test(argv, **kwds):
     # To speed up the import time, avoid importing `unittest` and other test
@@ -139,6 +150,10 @@ __all__ = """
     set_parallel_chunksize
     get_parallel_chunksize
     parallel_chunksize
+    set_parallel_schedule
+    get_parallel_schedule
+    parallel_schedule
+    reduction
     """.split() + types.__all__ + errors.__all__
 
 
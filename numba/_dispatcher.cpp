@@ -1,5 +1,6 @@
 #include "_pymodule.h"
 
+#include <atomic>
 #include <cstring>
 #include <ctime>
 #include <cassert>
@@ -385,6 +386,80 @@ else                                                            \
 typedef std::vector<Type> TypeTable;
 typedef std::vector<PyObject*> Functions;
 
+/* An immutable hash table mapping the argument types of each overload of a
+   dispatcher to the callable implementing it.
+
+   Calls whose argument types exactly match an already-compiled overload are
+   resolved with a single probe of this table, instead of rating every
+   overload with TypeManager::selectOverload().  The table is never mutated
+   once built: a new table is published whenever an overload is added, so
+   lookups are safe without taking any lock. */
+class ExactMatchTable {
+public:
+    ExactMatchTable(int argct, const TypeTable &overloads,
+                    const Functions &functions)
+        : argct(argct)
+    {
+        size_t capacity = 8;
+        while (capacity < 2 * functions.size())
+            capacity *= 2;
+        mask = capacity - 1;
+        keys.resize(capacity * argct);
+        values.resize(capacity, NULL);
+        for (size_t i = 0; i < functions.size(); ++i) {
+            const Type *sig = &overloads[i * argct];
+            size_t pos = probe(sig);
+            if (values[pos] == NULL) {
+                std::memcpy(&keys[pos * argct], sig, argct * sizeof(Type));
+                values[pos] = functions[i];
+            }
+            else {
+                /* Several overloads have the same types: leave it to
+                   selectOverload() to report the ambiguity */
+                values[pos] = ambiguous();
+            }
+        }
+    }
+
+    /* Return the callable whose overload exactly matches *sig*, or NULL. */
+    PyObject *lookup(const Type sig[]) const {
+        PyObject *cfunc = values[probe(sig)];
+        return cfunc == ambiguous() ? NULL : cfunc;
+    }
+
+private:
+    int argct;
+    size_t mask;
+    /* A flattened array of argument types, argct per slot */
+    TypeTable keys;
+    /* The callable of each slot, NULL for empty slots */
+    Functions values;
+
+    static PyObject *ambiguous() {
+        static char sentinel;
+        return reinterpret_cast<PyObject *>(&sentinel);
+    }
+
+    static size_t hash(const Type sig[], int argct) {
+        /* FNV-1a */
+        size_t x = 2166136261u;
+        for (int i = 0; i < argct; ++i) {
+            x = (x ^ (size_t) (unsigned int) sig[i]) * 16777619u;
+        }
+        return x;
+    }
+
+    /* Return the slot holding *sig*, or the empty slot where it belongs. */
+    size_t probe(const Type sig[]) const {
+        size_t pos = hash(sig, argct) & mask;
+        while (values[pos] != NULL &&
+               std::memcmp(&keys[pos * argct], sig, argct * sizeof(Type))) {
+            pos = (pos + 1) & mask;
+        }
+        return pos;
+    }
+};
+
 /* The Dispatcher class is the base class of all dispatchers in the CPU and
    CUDA targets. Its main responsibilities are:
 
@@ -426,6 +501,13 @@ public:
     /* A flattened array of argument types to all overloads
      * (invariant: sizeof(overloads) == argct * sizeof(functions)) */
     TypeTable overloads;
+    /* The exact match table of the current overloads (NULL if none) */
+    std::atomic<const ExactMatchTable *> exact_matches;
+    /* The number of lookups in progress in an exact match table */
+    mutable std::atomic<int> exact_match_readers;
+    /* Tables replaced by a newer one. A concurrent lookup may still be
+       using them, they are freed once no lookup is in progress. */
+    std::vector<const ExactMatchTable *> retired_exact_matches;
 
     /* Add a new overload. Parameters:
 
@@ -437,6 +519,25 @@ public:
             overloads.push_back(args[i]);
         }
         functions.push_back(callable);
+        publishExactMatches(new ExactMatchTable(argct, overloads, functions));
+    }
+
+    void publishExactMatches(const ExactMatchTable *table) {
+        const ExactMatchTable *old = exact_matches.exchange(table);
+        if (old != NULL)
+            retired_exact_matches.push_back(old);
+        /* A lookup starting after this point sees the new table, so the
+           retired ones can be freed if none is in progress. Otherwise they
+           are kept until a later publication or the dispatcher is freed. */
+        if (exact_match_readers.load() == 0)
+            freeRetiredExactMatches();
+    }
+
+    void freeRetiredExactMatches() {
+        for (size_t i = 0; i < retired_exact_matches.size(); ++i) {
+            delete retired_exact_matches[i];
+        }
+        retired_exact_matches.clear();
     }
 
     /* Given a list of types, find the overloads that have a matching signature.
@@ -467,6 +568,18 @@ public:
             selected = 0;
         }
         else {
+            // Fast path: an overload matches the argument types exactly,
+            // it is always the best match.
+            // The table is only read between the increment and the
+            // decrement of the reader count, see publishExactMatches().
+            exact_match_readers.fetch_add(1);
+            const ExactMatchTable *table = exact_matches.load();
+            PyObject *cfunc = table != NULL ? table->lookup(sig) : NULL;
+            exact_match_readers.fetch_sub(1);
+            if (cfunc != NULL) {
+                matches = 1;
+                return cfunc;
+            }
             matches = tm->selectOverload(sig, &overloads[0], selected, argct,
                                          ovct, allow_unsafe,
                                          exact_match_required);
@@ -479,10 +592,17 @@ public:
 
     /* Remove all overloads */
     void clear() {
+        publishExactMatches(NULL);
         functions.clear();
         overloads.clear();
     }
 
+    /* Free the exact match tables */
+    void freeExactMatches() {
+        clear();
+        freeRetiredExactMatches();
+    }
+
 };
 
 
@@ -498,7 +618,7 @@ Dispatcher_dealloc(Dispatcher *self)
 {
     Py_XDECREF(self->argnames);
     Py_XDECREF(self->defargs);
-    self->clear();
+    self->freeExactMatches();
     Py_TYPE(self)->tp_free((PyObject*)self);
 }
 
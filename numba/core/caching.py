@@ -4,15 +4,22 @@ Caching mechanism for compiled functions.
 
 
 from abc import ABCMeta, abstractmethod, abstractproperty
+from collections import namedtuple
 import contextlib
 import errno
 import hashlib
 import inspect
 import itertools
+import mmap
+import multiprocessing
 import os
 import pickle
+import re
+import struct
 import sys
 import tempfile
+import time
+import types as pytypes
 import uuid
 import warnings
 
@@ -23,7 +30,7 @@ from numba.core.errors import NumbaWarning
 from numba.core.base import BaseContext
 from numba.core.codegen import CodeLibrary
 from numba.core.compiler import CompileResult
-from numba.core import config, compiler
+from numba.core import config, compiler, sigutils, types
 from numba.core.serialize import dumps
 
 
@@ -145,6 +152,10 @@ class _CacheLocator(metaclass=ABCMeta):
         path = os.path.abspath(py_file)
         subpath = os.path.dirname(path)
         parentdir = os.path.split(subpath)[-1]
+        if config.CACHE_CONTENT_KEYS:
+            # Entries are keyed on the contents of the functions, so copies
+            # of the source tree at different locations can share the cache.
+            return parentdir
         # Use SHA1 to reduce path length.
         # Note: windows doesn't like long path.
         hashed = hashlib.sha1(subpath.encode()).hexdigest()
@@ -476,7 +487,9 @@ class IndexDataCacheFile(object):
                     break
             overloads[key] = data_name
             self._save_index(overloads)
-        self._save_data(data_name, data)
+        # The key is saved along the data, as concurrent writers of the
+        # index may have assigned the same data file to different keys.
+        self._save_data(data_name, (key, data))
 
     def load(self, key):
         """
@@ -487,10 +500,13 @@ class IndexDataCacheFile(object):
         if data_name is None:
             return
         try:
-            return self._load_data(data_name)
+            stored_key, data = self._load_data(data_name)
         except OSError:
             # File could have been removed while the index still refers it.
             return
+        if stored_key != key:
+            return
+        return data
 
     def _load_index(self):
         """
@@ -531,8 +547,22 @@ class IndexDataCacheFile(object):
             data = f.read()
         tup = pickle.loads(data)
         _cache_log("[cache] data loaded from %r", path)
+        self._touch_data(path)
         return tup
 
+    def _touch_data(self, path):
+        # The access time of a data file records its last use, for the least
+        # recently used eviction in collect_cache_garbage().  It is set
+        # explicitly as file systems are often mounted with "noatime", and
+        # the modification time is left alone for the sake of tools that
+        # look for changed files.
+        try:
+            st = os.stat(path)
+            os.utime(path, ns=(time.time_ns(), st.st_mtime_ns))
+        except OSError:
+            # Read-only cache
+            pass
+
     def _save_data(self, name, data):
         data = self._dump(data)
         path = self._data_path(name)
@@ -570,6 +600,670 @@ class IndexDataCacheFile(object):
             raise
 
 
+class _MappedIndex(object):
+    """
+    A single memory-mapped index shared by all the functions cached in a
+    given directory.
+
+    The index file is an open-addressing hash table of fixed-size slots.
+    Each slot records the digest of an index key, a short digest of the
+    owning function's filename base, the last time the entry was used and
+    the size of its data file.  A lookup is therefore a probe of the mapping
+    instead of an open and an unpickle of a per-function index file.
+
+    Concurrent writers are tolerated the same way as for the pickle index:
+    an entry may get lost, but a lookup can never return the wrong data
+    because the data file stores the full key digest and is checked on load.
+    """
+
+    index_name = 'numba-index.nbm'
+
+    _magic = b'NUMBAIDX'
+    _format_version = 1
+    # magic, format version, capacity, number of used slots
+    _header = struct.Struct('<8sIII4x')
+    # key digest, owner digest, last use time, data size
+    _slot = struct.Struct('<32s8sdQ')
+    _empty = bytes(32)
+    _deleted = b'\xff' * 32
+    _initial_capacity = 256
+    _max_load = 0.5
+
+    # Opened indices, keyed by index file path
+    _instances = {}
+
+    @classmethod
+    def for_path(cls, cache_path):
+        """
+        Return the index for the given cache directory, opening it on
+        first use.
+        """
+        path = os.path.join(cache_path, cls.index_name)
+        try:
+            return cls._instances[path]
+        except KeyError:
+            inst = cls._instances[path] = cls(path)
+            return inst
+
+    def __init__(self, path):
+        self._path = path
+        self._mm = None
+        self._stat_key = None
+
+    @property
+    def path(self):
+        return self._path
+
+    # Mapping management
+
+    def _file_key(self, st):
+        return st.st_dev, st.st_ino, st.st_size
+
+    def _is_stale(self):
+        """
+        Whether the mapped file was replaced (e.g. grown by another process)
+        since it was mapped.
+        """
+        try:
+            st = os.stat(self._path)
+        except FileNotFoundError:
+            return True
+        return self._file_key(st) != self._stat_key
+
+    def _close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+            self._stat_key = None
+
+    def _map(self, create):
+        """
+        Map the index file, creating an empty one first if *create* is
+        true.  Returns False if the index does not exist.
+        """
+        self._close()
+        try:
+            f = open(self._path, 'r+b')
+        except FileNotFoundError:
+            if not create:
+                return False
+            self._write_table(self._initial_capacity, ())
+            f = open(self._path, 'r+b')
+        with f:
+            st = os.fstat(f.fileno())
+            magic, version, capacity, _ = self._header.unpack(
+                f.read(self._header.size))
+            expected = self._header.size + capacity * self._slot.size
+            if (magic != self._magic or version != self._format_version
+                    or st.st_size != expected):
+                # Corrupt or incompatible index, start afresh
+                if not create:
+                    return False
+                return self._reset()
+            self._mm = mmap.mmap(f.fileno(), 0)
+            self._stat_key = self._file_key(st)
+        _cache_log("[cache] index mapped from %r", self._path)
+        return True
+
+    def _reset(self):
+        self._write_table(self._initial_capacity, ())
+        return self._map(create=False)
+
+    def _ensure_mapped(self, create=False, refresh=False):
+        if self._mm is None or (refresh and self._is_stale()):
+            return self._map(create)
+        return True
+
+    def _write_table(self, capacity, entries):
+        """
+        Atomically replace the index file with a table of the given
+        *capacity* holding *entries*.
+        """
+        buf = bytearray(self._header.size + capacity * self._slot.size)
+        count = 0
+        for entry in entries:
+            pos = self._probe_free(buf, capacity, entry[0])
+            self._slot.pack_into(buf, self._slot_offset(pos), *entry)
+            count += 1
+        self._header.pack_into(buf, 0, self._magic, self._format_version,
+                               capacity, count)
+        uid = uuid.uuid4().hex[:16]
+        tmpname = '%s.tmp.%s' % (self._path, uid)
+        try:
+            with open(tmpname, 'wb') as f:
+                f.write(buf)
+            os.replace(tmpname, self._path)
+        except Exception:
+            try:
+                os.unlink(tmpname)
+            except OSError:
+                pass
+            raise
+
+    # Table primitives
+
+    def _slot_offset(self, pos):
+        return self._header.size + pos * self._slot.size
+
+    def _capacity(self, buf):
+        return self._header.unpack_from(buf, 0)[2]
+
+    def _start(self, digest, capacity):
+        return int.from_bytes(digest[:8], 'little') % capacity
+
+    def _probe_free(self, buf, capacity, digest):
+        pos = self._start(digest, capacity)
+        while True:
+            off = self._slot_offset(pos)
+            if buf[off:off + 32] in (self._empty, self._deleted):
+                return pos
+            pos = (pos + 1) % capacity
+
+    def _find(self, digest):
+        """
+        Return the slot position holding *digest*, or None.
+        """
+        mm = self._mm
+        capacity = self._capacity(mm)
+        pos = self._start(digest, capacity)
+        for _ in range(capacity):
+            off = self._slot_offset(pos)
+            stored = mm[off:off + 32]
+            if stored == digest:
+                return pos
+            elif stored == self._empty:
+                return None
+            pos = (pos + 1) % capacity
+        return None
+
+    def _read(self, pos):
+        return self._slot.unpack_from(self._mm, self._slot_offset(pos))
+
+    def _write(self, pos, entry):
+        self._slot.pack_into(self._mm, self._slot_offset(pos), *entry)
+
+    # Public API
+
+    def lookup(self, digest, touch=True):
+        """
+        Return whether *digest* is in the index.  If *touch* is true,
+        the last use time of the entry is updated.
+        """
+        if not self._ensure_mapped():
+            return False
+        pos = self._find(digest)
+        if pos is None:
+            # The index may have been grown by another process
+            if not self._is_stale() or not self._map(create=False):
+                return False
+            pos = self._find(digest)
+            if pos is None:
+                return False
+        if touch:
+            _, owner, _, size = self._read(pos)
+            self._write(pos, (digest, owner, time.time(), size))
+        return True
+
+    def insert(self, digest, owner, size):
+        """
+        Insert or update the entry for *digest*.
+        """
+        self._ensure_mapped(create=True, refresh=True)
+        entry = (digest, owner, time.time(), size)
+        pos = self._find(digest)
+        if pos is not None:
+            self._write(pos, entry)
+            return
+        magic, version, capacity, count = self._header.unpack_from(self._mm)
+        if count + 1 > capacity * self._max_load:
+            self._grow(capacity, entry)
+            return
+        self._write(self._probe_free(self._mm, capacity, digest), entry)
+        self._header.pack_into(self._mm, 0, magic, version, capacity,
+                               count + 1)
+
+    def _grow(self, capacity, entry):
+        entries = [e for e in self.entries() if e[0] != entry[0]]
+        entries.append(entry)
+        while len(entries) > capacity * self._max_load:
+            capacity *= 2
+        self._close()
+        self._write_table(capacity, entries)
+        self._map(create=False)
+        _cache_log("[cache] index grown to %d slots", capacity)
+
+    def entries(self):
+        """
+        Return a list of the live (digest, owner, last use, size) entries.
+        """
+        if not self._ensure_mapped(refresh=True):
+            return []
+        out = []
+        for pos in range(self._capacity(self._mm)):
+            entry = self._read(pos)
+            if entry[0] not in (self._empty, self._deleted):
+                out.append(entry)
+        return out
+
+    def remove(self, digests):
+        """
+        Remove the entries for the given *digests*.
+        """
+        if not self._ensure_mapped(refresh=True):
+            return
+        for digest in digests:
+            pos = self._find(digest)
+            if pos is not None:
+                self._write(pos, (self._deleted, bytes(8), 0.0, 0))
+
+    def remove_owner(self, owner):
+        """
+        Remove all the entries belonging to the given *owner*.
+        """
+        self.remove([e[0] for e in self.entries() if e[1] == owner])
+
+
+class MappedIndexDataCacheFile(IndexDataCacheFile):
+    """
+    Implements the logic for the data files of a cache indexed by a
+    ``_MappedIndex`` shared by the whole cache directory.
+
+    Data files are named after the digest of their index key, so no
+    per-function index needs to be read to locate them.
+    """
+    def __init__(self, cache_path, filename_base, source_stamp):
+        super().__init__(cache_path, filename_base, source_stamp)
+        self._filename_base = filename_base
+        self._data_name_pattern = '%s.{digest}.nbc' % (filename_base,)
+        self._owner = hashlib.sha256(filename_base.encode()).digest()[:8]
+        self._index = _MappedIndex.for_path(cache_path)
+
+    def flush(self):
+        self._index.remove_owner(self._owner)
+
+    def save(self, key, data):
+        """
+        Save a new cache entry with *key* and *data*.
+        """
+        digest = self._key_digest(key)
+        data = self._dump((digest, key, data))
+        path = self._data_path(self._data_name(digest))
+        with self._open_for_write(path) as f:
+            f.write(data)
+        _cache_log("[cache] data saved to %r", path)
+        self._index.insert(digest, self._owner, len(data))
+
+    def load(self, key):
+        """
+        Load a cache entry with *key*.
+        """
+        digest = self._key_digest(key)
+        if not self._index.lookup(digest):
+            return
+        try:
+            entry = self._load_data(self._data_name(digest))
+        except OSError:
+            # File could have been removed while the index still refers it.
+            return
+        # The digest is computed from the repr() of the key, which distinct
+        # keys may share, so the stored key itself is compared too.
+        if entry[:2] != (digest, key):
+            return
+        return entry[2]
+
+    def _touch_data(self, path):
+        # The last use time is recorded in the index
+        pass
+
+    def _key_digest(self, key):
+        # The key is made of types, strings and numbers whose repr() is
+        # stable across processes, unlike their pickled form.
+        token = (self._version, self._filename_base, self._source_stamp, key)
+        return hashlib.sha256(repr(token).encode()).digest()
+
+    def _data_name(self, digest):
+        return self._data_name_pattern.format(digest=digest.hex()[:32])
+
+
+def _hash_code(code, hasher, names):
+    """
+    Hash the bytecode, constants, names and signature of *code* and its
+    nested code objects, and collect the names it refers to into *names*.
+    Unlike marshalling, this ignores the file name and line numbers.
+    """
+    hasher.update(code.co_code)
+    # The bytecode refers to attributes, globals, builtins and variables by
+    # their index in these tuples
+    hasher.update(repr((code.co_names, code.co_varnames, code.co_freevars,
+                        code.co_cellvars, code.co_argcount,
+                        code.co_posonlyargcount, code.co_kwonlyargcount,
+                        code.co_flags)).encode())
+    names.update(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, pytypes.CodeType):
+            _hash_code(const, hasher, names)
+        else:
+            hasher.update(repr(const).encode())
+
+
+def _hash_value(value, hasher, seen):
+    """
+    Hash a value a function refers to through its globals, closure or
+    defaults.
+    """
+    py_func = getattr(value, 'py_func', None)
+    if isinstance(py_func, pytypes.FunctionType):
+        # A jitted callee
+        _hash_function(py_func, hasher, seen)
+    elif isinstance(value, pytypes.FunctionType):
+        _hash_function(value, hasher, seen)
+    elif isinstance(value, pytypes.ModuleType):
+        hasher.update(value.__name__.encode())
+    elif isinstance(value, (tuple, list)):
+        hasher.update(type(value).__name__.encode())
+        for item in value:
+            _hash_value(item, hasher, seen)
+    elif hasattr(value, 'tobytes') and hasattr(value, 'dtype'):
+        # Global arrays are frozen as constants
+        hasher.update(repr((str(value.dtype), value.shape)).encode())
+        hasher.update(value.tobytes())
+    elif hasattr(value, '__qualname__') and hasattr(value, '__module__'):
+        # Classes, builtin functions...
+        hasher.update(('%s.%s' % (value.__module__,
+                                  value.__qualname__)).encode())
+    else:
+        cls = type(value)
+        hasher.update(('%s.%s' % (cls.__module__, cls.__qualname__)).encode())
+        text = repr(value)
+        if ' at 0x' not in text:
+            # Skip the reprs that are only unique by object address
+            hasher.update(text.encode())
+
+
+def _hash_function(func, hasher, seen):
+    if func in seen:
+        # Recursion
+        hasher.update(func.__qualname__.encode())
+        return
+    seen.add(func)
+    hasher.update(func.__qualname__.encode())
+    names = set()
+    _hash_code(func.__code__, hasher, names)
+    func_globals = func.__globals__
+    for name in sorted(names):
+        if name in func_globals:
+            hasher.update(name.encode())
+            _hash_value(func_globals[name], hasher, seen)
+    for cell in func.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            # Empty cell
+            value = None
+        _hash_value(value, hasher, seen)
+    _hash_value(func.__defaults__, hasher, seen)
+    _hash_value(sorted((func.__kwdefaults__ or {}).items()), hasher, seen)
+
+
+def function_content_hash(py_func):
+    """
+    Return a hash of the contents of *py_func*: its bytecode, the globals
+    it refers to, its closure variables and defaults and, transitively, the
+    same for the Python and jitted functions it refers to.  The hash does
+    not depend on the location of the source file, so it is stable across
+    source tree relocations and touches.
+    """
+    hasher = hashlib.sha256()
+    _hash_function(py_func, hasher, set())
+    return hasher.hexdigest()
+
+
+def _referenced_names(code, names):
+    names.update(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, pytypes.CodeType):
+            _referenced_names(const, names)
+
+
+def _collect_callees(func, funcs):
+    """
+    Add *func* and the Python and jitted functions it may call through its
+    globals and closure, transitively, to the set *funcs*.
+    """
+    if func in funcs:
+        return
+    funcs.add(func)
+    names = set()
+    _referenced_names(func.__code__, names)
+    values = [func.__globals__[name] for name in names
+              if name in func.__globals__]
+    for cell in func.__closure__ or ():
+        try:
+            values.append(cell.cell_contents)
+        except ValueError:
+            # Empty cell
+            pass
+    for value in values:
+        value = getattr(value, 'py_func', value)
+        if isinstance(value, pytypes.FunctionType):
+            _collect_callees(value, funcs)
+
+
+def _dependency_stamps(py_func, typemap=None):
+    """
+    Return a mapping of the source files of the functions *py_func* depends
+    on to their timestamps, excluding the file of *py_func* itself and the
+    files of Numba.  The dependencies are the functions reachable through
+    the globals and closures of *py_func* and, if the *typemap* of its
+    compilation is given, the dispatchers and ``@overload`` implementations
+    it was typed with.
+    """
+    funcs = set()
+    _collect_callees(py_func, funcs)
+    for ty in (typemap or {}).values():
+        if isinstance(ty, types.Dispatcher):
+            _collect_callees(ty.dispatcher.py_func, funcs)
+        elif isinstance(ty, types.Function):
+            for template in ty.templates:
+                impl = getattr(template, '_overload_func', None)
+                if isinstance(impl, pytypes.FunctionType):
+                    _collect_callees(impl, funcs)
+    own_file = os.path.abspath(py_func.__code__.co_filename)
+    numba_dir = os.path.dirname(os.path.abspath(numba.__file__))
+    stamps = {}
+    for func in funcs:
+        path = os.path.abspath(func.__code__.co_filename)
+        if path == own_file or path in stamps or path.startswith(numba_dir):
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            # e.g. "<string>"
+            continue
+        stamps[path] = st.st_mtime, st.st_size
+    return stamps
+
+
+def _check_dependency_stamps(stamps):
+    """
+    Whether the source files recorded by _dependency_stamps() are unchanged.
+    """
+    for path, stamp in stamps.items():
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if (st.st_mtime, st.st_size) != stamp:
+            _cache_log("[cache] dependency %r changed", path)
+            return False
+    return True
+
+
+CacheGCResult = namedtuple('CacheGCResult', ['removed', 'freed'])
+CacheGCResult.__doc__ = """
+The outcome of collect_cache_garbage(): the number of files removed and the
+number of bytes freed.
+"""
+
+# Minimum delay between two automatic collections of a cache directory
+_gc_interval = 60
+# Unreferenced and temporary files younger than this are left alone, as they
+# may belong to a save in progress in another process
+_gc_grace_period = 600
+# Time of the last automatic collection, keyed by cache directory
+_last_gc_time = {}
+
+_pickle_data_re = re.compile(r'^.+\.\d{1,9}\.nbc$')
+_mapped_data_re = re.compile(r'^.+\.(?P<digest>[0-9a-f]{32})\.nbc$')
+_tmp_re = re.compile(r'\.tmp\.[0-9a-f]{16}$')
+
+
+def _read_index_references(path):
+    """
+    Return the set of data file names referenced by the pickle index file
+    at *path*, or None if the index is unusable by this Numba version.
+    """
+    try:
+        with open(path, "rb") as f:
+            version = pickle.load(f)
+            if version != numba.__version__:
+                return None
+            stamp, overloads = pickle.loads(f.read())
+    except OSError:
+        return set()
+    except Exception:
+        # Corrupt or incompatible index
+        return None
+    return set(overloads.values())
+
+
+def is_cache_directory(path):
+    """
+    Whether *path* contains Numba cache files.
+    """
+    try:
+        names = os.listdir(path)
+    except OSError:
+        return False
+    return any(name.endswith(('.nbi', '.nbc')) or
+               name == _MappedIndex.index_name for name in names)
+
+
+def collect_cache_garbage(cache_path, max_size=0, max_age=0):
+    """
+    Prune the cache directory *cache_path* and return a ``CacheGCResult``.
+
+    Data files that are not referenced by a usable index (e.g. leftovers of
+    a previous source stamp or written by another Numba version), their
+    obsolete indices and stale temporary files are removed.  Then, least
+    recently used data files are evicted while they are older than
+    *max_age* seconds or while the data files take more than *max_size*
+    bytes.  A zero *max_size* or *max_age* means unbounded.
+    """
+    try:
+        names = os.listdir(cache_path)
+    except OSError:
+        return CacheGCResult(0, 0)
+    now = time.time()
+    removed = freed = 0
+
+    def remove(name, st=None):
+        nonlocal removed, freed
+        path = os.path.join(cache_path, name)
+        try:
+            size = (st or os.stat(path)).st_size
+            os.unlink(path)
+        except OSError:
+            return False
+        _cache_log("[cache] gc removed %r", path)
+        removed += 1
+        freed += size
+        return True
+
+    def stat(name):
+        try:
+            return os.stat(os.path.join(cache_path, name))
+        except OSError:
+            return None
+
+    # Collect the data files referenced by the indices
+    indices = {}
+    for name in names:
+        if name.endswith('.nbi'):
+            refs = _read_index_references(os.path.join(cache_path, name))
+            if refs is None:
+                remove(name)
+            else:
+                indices[name] = refs
+    referenced = set().union(*indices.values())
+    mapped_index = None
+    mapped_entries = {}
+    if _MappedIndex.index_name in names:
+        mapped_index = _MappedIndex.for_path(cache_path)
+        for digest, _, last_use, _ in mapped_index.entries():
+            mapped_entries[digest.hex()[:32]] = digest, last_use
+
+    # Remove unreferenced files and gather the live data files
+    live = []
+    for name in names:
+        if _tmp_re.search(name):
+            st = stat(name)
+            if st is not None and now - st.st_mtime > _gc_grace_period:
+                remove(name, st)
+            continue
+        if _pickle_data_re.match(name):
+            is_live = name in referenced
+            last_use = None
+        else:
+            m = _mapped_data_re.match(name)
+            if m is None:
+                continue
+            entry = mapped_entries.get(m.group('digest'))
+            is_live = entry is not None
+            last_use = entry and entry[1]
+        st = stat(name)
+        if st is None:
+            continue
+        if not is_live:
+            if now - st.st_mtime > _gc_grace_period:
+                remove(name, st)
+            continue
+        live.append((last_use or max(st.st_atime, st.st_mtime), name, st))
+
+    # Evict least recently used data files
+    live.sort()
+    total = sum(st.st_size for _, _, st in live)
+    evicted = set()
+    for last_use, name, st in live:
+        too_old = max_age and now - last_use > max_age
+        too_big = max_size and total > max_size
+        if not (too_old or too_big):
+            break
+        if remove(name, st):
+            total -= st.st_size
+            evicted.add(name)
+
+    if mapped_index is not None:
+        digests = []
+        for name in evicted:
+            m = _mapped_data_re.match(name)
+            if m is not None:
+                digests.append(mapped_entries[m.group('digest')][0])
+        mapped_index.remove(digests)
+    # Remove the indices that no longer refer to any data file
+    for name, refs in indices.items():
+        if all(stat(ref) is None for ref in refs):
+            remove(name)
+    return CacheGCResult(removed, freed)
+
+
+# Cache file implementations, keyed by the value of NUMBA_CACHE_INDEX
+_cache_file_classes = {
+    'pickle': IndexDataCacheFile,
+    'mmap': MappedIndexDataCacheFile,
+}
+
+
 class Cache(_Cache):
     """
     A per-function compilation cache.  The cache saves data in separate
@@ -583,10 +1277,18 @@ class Cache(_Cache):
 
     There is one data file ("function_name-<lineno>.pyXY.<number>.nbc")
     per function, function signature, target architecture and Python version.
+    Along with the cached object, it records the timestamps of the source
+    files of the functions called by the cached function, so that the
+    entry is ignored when one of them changes.
 
     Separate index and data files per Python version avoid pickle
     compatibility problems.
 
+    If NUMBA_CACHE_INDEX is "mmap", the per-function index files are
+    replaced by a single memory-mapped index per cache directory
+    ("numba-index.nbm") and data files are named after the digest of their
+    index key (see ``MappedIndexDataCacheFile``).
+
     Note:
     This contains the driver logic only.  The core logic is provided
     by a subclass of ``CacheImpl`` specified as *_impl_class* in the subclass.
@@ -600,12 +1302,18 @@ class Cache(_Cache):
         self._py_func = py_func
         self._impl = self._impl_class(py_func)
         self._cache_path = self._impl.locator.get_cache_path()
-        # This may be a bit strict but avoids us maintaining a magic number
-        source_stamp = self._impl.locator.get_source_stamp()
+        if config.CACHE_CONTENT_KEYS:
+            # Freshness is checked through the content hash in the index key
+            source_stamp = None
+        else:
+            # This may be a bit strict but avoids us maintaining a magic
+            # number
+            source_stamp = self._impl.locator.get_source_stamp()
         filename_base = self._impl.filename_base
-        self._cache_file = IndexDataCacheFile(cache_path=self._cache_path,
-                                              filename_base=filename_base,
-                                              source_stamp=source_stamp)
+        cache_file_class = _cache_file_classes[config.CACHE_INDEX]
+        self._cache_file = cache_file_class(cache_path=self._cache_path,
+                                            filename_base=filename_base,
+                                            source_stamp=source_stamp)
         self.enable()
 
     def __repr__(self):
@@ -641,6 +1349,10 @@ class Cache(_Cache):
         key = self._index_key(sig, target_context.codegen())
         data = self._cache_file.load(key)
         if data is not None:
+            dependencies, data = data
+            if not _check_dependency_stamps(dependencies):
+                # A function called from this one changed
+                return
             data = self._impl.rebuild(target_context, data)
         return data
 
@@ -658,8 +1370,38 @@ class Cache(_Cache):
             return
         self._impl.locator.ensure_cache_path()
         key = self._index_key(sig, data.codegen)
+        dependencies = self._dependencies(data)
         data = self._impl.reduce(data)
-        self._cache_file.save(key, data)
+        self._cache_file.save(key, (dependencies, data))
+        self._enforce_limits()
+
+    def _dependencies(self, data):
+        """
+        Return the timestamps of the source files of the functions the
+        cached function depends on, which are checked on load.
+        """
+        if config.CACHE_CONTENT_KEYS:
+            # The content hash in the index key covers the callees
+            return {}
+        type_annotation = getattr(data, 'type_annotation', None)
+        typemap = getattr(type_annotation, 'typemap', None)
+        return _dependency_stamps(self._py_func, typemap)
+
+    def _enforce_limits(self):
+        """
+        Evict data files according to NUMBA_CACHE_MAX_SIZE and
+        NUMBA_CACHE_MAX_AGE.  The cache directory is scanned at most once
+        per ``_gc_interval`` seconds per process.
+        """
+        if not (config.CACHE_MAX_SIZE or config.CACHE_MAX_AGE):
+            return
+        now = time.time()
+        if now - _last_gc_time.get(self._cache_path, 0) < _gc_interval:
+            return
+        _last_gc_time[self._cache_path] = now
+        collect_cache_garbage(self._cache_path,
+                              max_size=config.CACHE_MAX_SIZE,
+                              max_age=config.CACHE_MAX_AGE)
 
     @contextlib.contextmanager
     def _guard_against_spurious_io_errors(self):
@@ -681,7 +1423,13 @@ class Cache(_Cache):
         It includes a description of the OS, target architecture and hashes of
         the bytecode for the function and, if the function has a __closure__,
         a hash of the cell_contents.
+
+        If NUMBA_CACHE_CONTENT_KEYS is set, the hashes are replaced by the
+        content hash of the function (see ``function_content_hash``).
         """
+        if config.CACHE_CONTENT_KEYS:
+            return (sig, codegen.magic_tuple(),
+                    (function_content_hash(self._py_func),))
         codebytes = self._py_func.__code__.co_code
         if self._py_func.__closure__ is not None:
             cvars = tuple([x.cell_contents for x in self._py_func.__closure__])
@@ -703,6 +1451,27 @@ class FunctionCache(Cache):
     _impl_class = CompileResultCacheImpl
 
 
+class OverloadImplCache(FunctionCache):
+    """
+    Implements Cache for the implementations of ``@overload`` templates
+    (see NUMBA_CACHE_OVERLOADS).  Caching is best effort: an implementation
+    whose closure variables or compile results cannot be pickled is compiled
+    as usual and its cache is disabled.
+    """
+
+    def load_overload(self, sig, target_context):
+        try:
+            return super().load_overload(sig, target_context)
+        except (TypeError, pickle.PicklingError):
+            self.disable()
+
+    def save_overload(self, sig, data):
+        try:
+            super().save_overload(sig, data)
+        except (TypeError, pickle.PicklingError):
+            self.disable()
+
+
 # Remember used cache filename prefixes.
 _lib_cache_prefixes = set([''])
 
@@ -729,3 +1498,64 @@ def make_library_cache(prefix):
 
     return LibraryCache
 
+
+def _populate_cache_worker(dispatcher, sig):
+    """
+    Compile *sig* for *dispatcher* in a worker process of populate_cache(),
+    saving the result to the cache.
+    """
+    dispatcher.enable_caching()
+    try:
+        dispatcher.compile(sig)
+    except Exception:
+        # The error is reported when the parent process compiles
+        return False
+    return True
+
+
+def populate_cache(items, max_workers=None, mp_context=None):
+    """
+    Compile the given ``(dispatcher, signature)`` pairs in a pool of
+    *max_workers* processes (default: the number of CPUs), then load the
+    compiled overloads in this process from the cache.
+
+    Each pair is compiled by a worker and saved through the
+    ``FunctionCache`` of its dispatcher, so a cold start pays the
+    compilation time once per CPU rather than serially under the global
+    compiler lock, even for a single function with many signatures.
+    Dispatchers that do not have caching enabled, and any overload a worker
+    failed to cache, are compiled in this process, which also reports
+    compilation errors.  *mp_context* is the multiprocessing context of the
+    pool (default: "spawn").
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    items = list(items)
+    tasks = {}
+    for dispatcher, sig in items:
+        if not isinstance(getattr(dispatcher, '_cache', None), FunctionCache):
+            continue
+        args, _ = sigutils.normalize_signature(sig)
+        if tuple(args) in dispatcher.overloads:
+            continue
+        tasks.setdefault((id(dispatcher), tuple(args)), (dispatcher, sig))
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(tasks))
+    if max_workers > 1:
+        if mp_context is None:
+            mp_context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=mp_context) as pool:
+            futures = [pool.submit(_populate_cache_worker, dispatcher, sig)
+                       for dispatcher, sig in tasks.values()]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    # e.g. an unpicklable dispatcher
+                    _cache_log("[cache] populate worker failed: %r", e)
+
+    for dispatcher, sig in items:
+        dispatcher.compile(sig)
@@ -5,6 +5,7 @@ import weakref
 import ctypes
 import html
 import textwrap
+import threading
 
 import llvmlite.binding as ll
 import llvmlite.ir as llvmir
@@ -14,7 +15,8 @@ from numba.core import utils, config, cgutils
 from numba.core.llvm_bindings import create_pass_manager_builder
 from numba.core.runtime.nrtopt import remove_redundant_nrt_refct
 from numba.core.runtime import rtsys
-from numba.core.compiler_lock import require_global_compiler_lock
+from numba.core.compiler_lock import (global_compiler_lock,
+                                      require_global_compiler_lock)
 from numba.core.errors import NumbaInvalidConfigWarning
 from numba.misc.inspection import disassemble_elf_to_cfg
 from numba.misc.llvm_pass_timings import PassTimingsCollection
@@ -668,6 +670,9 @@ class CPUCodeLibrary(CodeLibrary):
         """
         Internal: optimize this library's final module.
         """
+        if self._can_optimize_unlocked():
+            self._optimize_final_module_unlocked()
+            return
         cheap_name = "Module passes (cheap optimization for refprune)"
         with self._recorded_timings.record(cheap_name):
             # A cheaper optimisation pass is run first to try and get as many
@@ -681,6 +686,43 @@ class CPUCodeLibrary(CodeLibrary):
             # The full optimisation suite is then run on the refop pruned IR
             self._codegen._mpm_full.run(self._final_module)
 
+    def _can_optimize_unlocked(self):
+        """
+        Internal: whether the final module may be optimized without holding
+        the compiler lock.
+        """
+        # The Python-level refop pruner and the pass timings work on the
+        # global LLVM context.  A compilation nested in another one in the
+        # same thread must not let other threads in, as the outer compilation
+        # is not at a point where that is safe.  Neither must a library
+        # finalized outside of any pipeline (e.g. the wrappers of a ufunc),
+        # as its caller may hold the lock around state of its own.
+        return (config.CONCURRENT_LLVM_OPT and config.LLVM_REFPRUNE_PASS
+                and not config.LLVM_PASS_TIMINGS
+                and global_compiler_lock.pipeline_depth() == 1)
+
+    def _optimize_final_module_unlocked(self):
+        """
+        Internal: optimize this library's final module with the compiler lock
+        released.  LLVM contexts are not thread-safe, so the module is
+        optimized as a copy living in a context private to this thread.
+        """
+        name = self._final_module.name
+        bitcode = self._final_module.as_bitcode()
+        mpm_cheap, mpm_full = self._codegen._thread_module_pass_managers()
+        with global_compiler_lock.released():
+            context = ll.create_context()
+            module = ll.parse_bitcode(bitcode, context=context)
+            try:
+                mpm_cheap.run(module)
+                mpm_full.run(module)
+                bitcode = module.as_bitcode()
+            finally:
+                # The module must go away before its context does
+                module.close()
+        self._final_module = ll.parse_bitcode(bitcode)
+        self._final_module.name = name
+
     def _get_module_for_linking(self):
         """
         Internal: get a LLVM module suitable for linking multiple times
@@ -1207,12 +1249,15 @@ class CPUCodegen(Codegen):
             loopvect = False
             opt_level = 0
 
-        self._mpm_cheap = self._module_pass_manager(loop_vectorize=loopvect,
-                                                    slp_vectorize=False,
-                                                    opt=opt_level,
-                                                    cost="cheap")
+        self._mpm_cheap_kwargs = dict(loop_vectorize=loopvect,
+                                      slp_vectorize=False,
+                                      opt=opt_level,
+                                      cost="cheap")
+        self._mpm_cheap = self._module_pass_manager(**self._mpm_cheap_kwargs)
 
         self._mpm_full = self._module_pass_manager()
+        # Per-thread module pass managers, see _thread_module_pass_managers()
+        self._thread_local = threading.local()
 
         self._engine.set_object_cache(self._library_class._object_compiled_hook,
                                       self._library_class._object_getbuffer_hook)
@@ -1224,6 +1269,18 @@ class CPUCodegen(Codegen):
             ir_module.data_layout = self._data_layout
         return ir_module
 
+    def _thread_module_pass_managers(self):
+        """
+        Return the (cheap, full) module pass managers of the current thread,
+        as pass managers cannot be run concurrently.
+        """
+        pms = getattr(self._thread_local, 'mpms', None)
+        if pms is None:
+            pms = (self._module_pass_manager(**self._mpm_cheap_kwargs),
+                   self._module_pass_manager())
+            self._thread_local.mpms = pms
+        return pms
+
     def _module_pass_manager(self, **kwargs):
         pm = ll.create_module_pass_manager()
         pm.add_target_library_info(ll.get_process_triple())
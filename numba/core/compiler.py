@@ -5,7 +5,6 @@ from numba.core.tracing import event
 
 from numba.core import (utils, errors, interpreter, bytecode, postproc, config,
                         callconv, cpu)
-from numba.parfors.parfor import ParforDiagnostics
 from numba.core.errors import CompilerError
 from numba.core.environment import lookup_environment
 
@@ -420,6 +419,7 @@ class CompilerBase(object):
         self.state.pipeline = self
 
         # parfor diagnostics info, add to metadata
+        from numba.parfors.parfor import ParforDiagnostics
         self.state.parfor_diagnostics = ParforDiagnostics()
         self.state.metadata['parfor_diagnostics'] = \
             self.state.parfor_diagnostics
@@ -1,3 +1,4 @@
+import contextlib
 import threading
 import functools
 import numba.core.event as ev
@@ -7,6 +8,8 @@ import numba.core.event as ev
 class _CompilerLock(object):
     def __init__(self):
         self._lock = threading.RLock()
+        # Per-thread state, see pipeline()
+        self._local = threading.local()
 
     def acquire(self):
         ev.start_event("numba:compiler_lock")
@@ -22,6 +25,40 @@ class _CompilerLock(object):
     def __exit__(self, exc_val, exc_type, traceback):
         self.release()
 
+    @contextlib.contextmanager
+    def pipeline(self):
+        """
+        Mark a compilation pipeline as running in the current thread for the
+        duration of the context.
+        """
+        self._local.pipelines = self.pipeline_depth() + 1
+        try:
+            yield
+        finally:
+            self._local.pipelines -= 1
+
+    def pipeline_depth(self):
+        """
+        Return the number of compilation pipelines running in the current
+        thread, i.e. 1 when no other compilation is suspended in this
+        thread while the current one completes.
+        """
+        return getattr(self._local, 'pipelines', 0)
+
+    @contextlib.contextmanager
+    def released(self):
+        """
+        Fully release the lock held by the current thread, whatever its
+        recursion level, for the duration of the context, so that other
+        threads can compile meanwhile.  The code run in the context must
+        only touch state private to the current compilation.
+        """
+        state = self._lock._release_save()
+        try:
+            yield
+        finally:
+            self._lock._acquire_restore(state)
+
     def is_locked(self):
         is_owned = getattr(self._lock, '_is_owned')
         if not callable(is_owned):
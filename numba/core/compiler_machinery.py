@@ -348,24 +348,25 @@ class PassManager(object):
             raise RuntimeError("Cannot run non-finalised pipeline")
 
         # walk the passes and run them
-        for idx, (pss, pass_desc) in enumerate(self.passes):
-            try:
-                event("-- %s" % pass_desc)
-                pass_inst = _pass_registry.get(pss).pass_inst
-                if isinstance(pass_inst, CompilerPass):
-                    self._runPass(idx, pass_inst, state)
-                else:
-                    raise BaseException("Legacy pass in use")
-            except _EarlyPipelineCompletion as e:
-                raise e
-            except Exception as e:
-                if (utils.use_new_style_errors() and not
-                        isinstance(e, errors.NumbaError)):
+        with global_compiler_lock.pipeline():
+            for idx, (pss, pass_desc) in enumerate(self.passes):
+                try:
+                    event("-- %s" % pass_desc)
+                    pass_inst = _pass_registry.get(pss).pass_inst
+                    if isinstance(pass_inst, CompilerPass):
+                        self._runPass(idx, pass_inst, state)
+                    else:
+                        raise BaseException("Legacy pass in use")
+                except _EarlyPipelineCompletion as e:
                     raise e
-                msg = "Failed in %s mode pipeline (step: %s)" % \
-                    (self.pipeline_name, pass_desc)
-                patched_exception = self._patch_error(msg, e)
-                raise patched_exception
+                except Exception as e:
+                    if (utils.use_new_style_errors() and not
+                            isinstance(e, errors.NumbaError)):
+                        raise e
+                    msg = "Failed in %s mode pipeline (step: %s)" % \
+                        (self.pipeline_name, pass_desc)
+                    patched_exception = self._patch_error(msg, e)
+                    raise patched_exception
 
     def dependency_analysis(self):
         """
@@ -77,6 +77,18 @@ _old_style_deprecation_msg = (
 )
 
 
+# Check the thread pinning policy, either a name or a list of CPU ranges
+def _validate_thread_affinity(affinity_str):
+    rendered = str(affinity_str).strip().lower()
+    if rendered in ('', 'none', 'compact', 'scatter'):
+        return '' if rendered == 'none' else rendered
+    if not re.fullmatch(r'\d+(-\d+)?(,\d+(-\d+)?)*', rendered):
+        msg = ("Invalid value in NUMBA_THREAD_AFFINITY: "
+               f"{rendered}")
+        raise ValueError(msg)
+    return rendered
+
+
 # Choose how to handle captured errors
 def _validate_captured_errors_style(style_str):
     # to prevent circular import
@@ -96,6 +108,48 @@ def _validate_captured_errors_style(style_str):
         return rendered_style
 
 
+def _validate_cache_index(index_str):
+    rendered_index = str(index_str).lower()
+    if rendered_index not in ('pickle', 'mmap'):
+        msg = ("Invalid cache index in NUMBA_CACHE_INDEX: "
+               f"{rendered_index}")
+        raise ValueError(msg)
+    return rendered_index
+
+
+def _parse_cache_size(size_str):
+    """Parse a size in bytes, with an optional K, M or G suffix (powers of
+    1024).  Zero means unbounded.
+    """
+    text = str(size_str).strip().upper().rstrip('B')
+    scale = 1
+    for i, suffix in enumerate('KMG', start=1):
+        if text.endswith(suffix):
+            text = text[:-1]
+            scale = 1024 ** i
+            break
+    size = int(float(text) * scale)
+    if size < 0:
+        raise ValueError(f"Invalid cache size: {size_str}")
+    return size
+
+
+def _parse_cache_age(age_str):
+    """Parse a duration in seconds, with an optional s, m, h or d suffix.
+    Zero means unbounded.
+    """
+    text = str(age_str).strip().lower()
+    scale = 1
+    units = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+    if text and text[-1] in units:
+        scale = units[text[-1]]
+        text = text[:-1]
+    age = float(text) * scale
+    if age < 0:
+        raise ValueError(f"Invalid cache age: {age_str}")
+    return age
+
+
 class _OptLevel(int):
     """This class holds the "optimisation level" set in `NUMBA_OPT`. As this env
     var can be an int or a string, but is almost always interpreted as an int,
@@ -307,6 +361,28 @@ class _EnvReloader(object):
         # Contains path to the directory
         CACHE_DIR = _readenv("NUMBA_CACHE_DIR", str, "")
 
+        # Select the on-disk cache index backend: "pickle" uses one pickled
+        # index file per function, "mmap" uses a single memory-mapped index
+        # per cache directory.
+        CACHE_INDEX = _readenv("NUMBA_CACHE_INDEX", _validate_cache_index,
+                               "pickle")
+
+        # Key cache entries on a hash of the contents of the function (its
+        # bytecode, globals, closure and, transitively, its jitted callees)
+        # instead of the timestamp of its source file, so that entries
+        # survive touching or relocating the source tree.
+        CACHE_CONTENT_KEYS = _readenv("NUMBA_CACHE_CONTENT_KEYS", int, 0)
+
+        # Also cache the implementations compiled for @overload templates
+        # (including those of Numba's own library functions) on disk.
+        CACHE_OVERLOADS = _readenv("NUMBA_CACHE_OVERLOADS", int, 0)
+
+        # Bound the size and the age (since last use) of the data files in
+        # a cache directory, least recently used files are evicted first.
+        # Zero means unbounded.
+        CACHE_MAX_SIZE = _readenv("NUMBA_CACHE_MAX_SIZE", _parse_cache_size, 0)
+        CACHE_MAX_AGE = _readenv("NUMBA_CACHE_MAX_AGE", _parse_cache_age, 0)
+
         # Enable tracing support
         TRACE = _readenv("NUMBA_TRACE", int, 0)
 
@@ -422,6 +498,10 @@ class _EnvReloader(object):
         )
         THREADING_LAYER = _readenv("NUMBA_THREADING_LAYER", str, 'default')
 
+        # pin the threads of the threading layer to CPUs
+        THREAD_AFFINITY = _readenv("NUMBA_THREAD_AFFINITY",
+                                   _validate_thread_affinity, '')
+
         CAPTURED_ERRORS = _readenv("NUMBA_CAPTURED_ERRORS",
                                    _validate_captured_errors_style,
                                    'new_style')
@@ -574,6 +654,11 @@ class _EnvReloader(object):
             "all" if LLVM_REFPRUNE_PASS else "",
         )
 
+        # Release the compiler lock while running the module-level LLVM
+        # optimizations of a library, so that other threads can compile
+        # meanwhile.
+        CONCURRENT_LLVM_OPT = _readenv("NUMBA_CONCURRENT_LLVM_OPT", int, 0)
+
         # llvmlite memory manager
         USE_LLVMLITE_MEMORY_MANAGER = _readenv(
             "NUMBA_USE_LLVMLITE_MEMORY_MANAGER", int, None
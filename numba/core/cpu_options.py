@@ -69,7 +69,8 @@ class ParallelOptions(AbstractOptionValue):
     Options for controlling auto parallelization.
     """
     __slots__ = ("enabled", "comprehension", "reduction", "inplace_binop",
-                 "setitem", "numpy", "stencil", "fusion", "prange")
+                 "setitem", "numpy", "stencil", "fusion", "prange",
+                 "first_touch")
 
     def __init__(self, value):
         if isinstance(value, bool):
@@ -82,6 +83,8 @@ class ParallelOptions(AbstractOptionValue):
             self.stencil = value
             self.fusion = value
             self.prange = value
+            # Opt-in only, it adds work to every np.empty() call
+            self.first_touch = False
         elif isinstance(value, dict):
             self.enabled = True
             self.comprehension = value.pop('comprehension', True)
@@ -92,6 +95,7 @@ class ParallelOptions(AbstractOptionValue):
             self.stencil = value.pop('stencil', True)
             self.fusion = value.pop('fusion', True)
             self.prange = value.pop('prange', True)
+            self.first_touch = value.pop('first_touch', False)
             if value:
                 msg = "Unrecognized parallel options: %s" % value.keys()
                 raise NameError(msg)
@@ -105,6 +109,7 @@ class ParallelOptions(AbstractOptionValue):
             self.stencil = value.stencil
             self.fusion = value.fusion
             self.prange = value.prange
+            self.first_touch = value.first_touch
         else:
             msg = "Expect parallel option to be either a bool or a dict"
             raise ValueError(msg)
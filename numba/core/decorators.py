@@ -9,7 +9,6 @@ import inspect
 import logging
 
 from numba.core.errors import DeprecationError, NumbaDeprecationWarning
-from numba.stencils.stencil import stencil
 from numba.core import config, extending, sigutils, registry
 
 _logger = logging.getLogger(__name__)
@@ -857,6 +857,15 @@ class Dispatcher(serialize.ReduceMixin, _MemoMixin, _DispatcherBase):
         return self
 
     def compile(self, sig):
+        if self._can_compile:
+            # Fast path: don't contend for the compiler lock if the signature
+            # is already compiled.  Overloads are added under the lock once
+            # fully built, so a hit needs no further check.
+            args, return_type = sigutils.normalize_signature(sig)
+            existing = self.overloads.get(tuple(args))
+            if existing is not None:
+                return existing.entry_point
+
         with ExitStack() as scope:
             cres = None
 
@@ -908,6 +917,12 @@ class Dispatcher(serialize.ReduceMixin, _MemoMixin, _DispatcherBase):
                             return self._compiler.fold_argument_types(args,
                                                                       kws)[1]
                         raise e.bind_fold_arguments(folded)
+                    # Another thread may have compiled the same signature
+                    # while the compiler lock was released for LLVM
+                    # optimization (see NUMBA_CONCURRENT_LLVM_OPT).
+                    existing = self.overloads.get(tuple(args))
+                    if existing is not None:
+                        return existing.entry_point
                     self.add_overload(cres)
                 self._cache.save_overload(sig, cres)
                 return cres.entry_point
@@ -1164,6 +1179,11 @@ class LiftedLoop(LiftedCode):
                     # Check typing error if object mode is used
                     if (cres.typing_error is not None):
                         raise cres.typing_error
+                    # Another thread may have compiled the same signature
+                    # while the compiler lock was released
+                    existing = self.overloads.get(tuple(args))
+                    if existing is not None:
+                        return existing.entry_point
                     self.add_overload(cres)
                 return cres.entry_point
 
@@ -1256,6 +1276,11 @@ class LiftedWith(LiftedCode):
                     if (cres.typing_error is not None and
                             not flags.enable_pyobject):
                         raise cres.typing_error
+                    # Another thread may have compiled the same signature
+                    # while the compiler lock was released
+                    existing = self.overloads.get(tuple(args))
+                    if existing is not None:
+                        return existing.entry_point
                     self.add_overload(cres)
                 return cres.entry_point
 
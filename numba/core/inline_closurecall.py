@@ -4,7 +4,7 @@ import ctypes
 import numba.core.analysis
 from numba.core import (types, typing, errors, ir, rewrites, config, ir_utils,
                         cgutils)
-from numba.parfors.parfor import internal_prange
+from numba.misc.special import internal_prange
 from numba.core.ir_utils import (
     next_label,
     add_offset_to_labels,
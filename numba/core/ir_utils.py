@@ -11,8 +11,10 @@ import collections
 import warnings
 
 import numba
-from numba.core.extending import _Intrinsic
-from numba.core import types, typing, ir, analysis, postproc, rewrites, config
+# extending is imported as a module, as it may be partially initialized
+# when it is the entry point of the import of the core modules
+from numba.core import (types, typing, ir, analysis, postproc, rewrites,
+                        config, extending)
 from numba.core.typing.templates import signature
 from numba.core.analysis import (compute_live_map, compute_use_defs,
                             compute_cfg_from_blocks)
@@ -750,7 +752,7 @@ def has_no_side_effect(rhs, lives, call_table):
             call_list == [max] or
             call_list == [int]):
             return True
-        elif (isinstance(call_list[0], _Intrinsic) and
+        elif (isinstance(call_list[0], extending._Intrinsic) and
               (call_list[0]._name == 'empty_inferred' or
                call_list[0]._name == 'unsafe_empty_inferred')):
             return True
@@ -1616,7 +1618,7 @@ def find_callname(func_ir, expr, typemap=None, definition_finder=get_definition)
             # get the underlying definition of Intrinsic object to be able to
             # find the module effectively.
             # Otherwise, it will return numba.extending
-            if isinstance(def_val, _Intrinsic):
+            if isinstance(def_val, extending._Intrinsic):
                 def_val = def_val._defn
             if hasattr(def_val, '__module__'):
                 mod_name = def_val.__module__
@@ -2105,7 +2107,8 @@ def raise_on_unsupported_feature(func_ir, typemap):
             if isinstance(stmt.value, ir.Expr):
                 if stmt.value.op == 'getattr' and stmt.value.attr == 'view':
                     var = stmt.value.value.name
-                    if isinstance(typemap[var], types.Array):
+                    if isinstance(typemap[var], (types.Array,
+                                                 types.ListType)):
                         continue
                     df = func_ir.get_definition(var)
                     cn = guard(find_callname, func_ir, df)
@@ -2129,7 +2132,8 @@ def raise_on_unsupported_feature(func_ir, typemap):
                        "compile-time constants and there is no known way to "
                        "compile a %s type as a constant.")
                 if (getattr(ty, 'reflected', False) or
-                    isinstance(ty, (types.DictType, types.ListType))):
+                    isinstance(ty, (types.DictType, types.ListType,
+                                    types.SetType))):
                     raise TypingError(msg % (ty, stmt.value.name, ty), loc=stmt.loc)
 
             # checks for generator expressions (yield in use when func_ir has
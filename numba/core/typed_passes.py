@@ -8,14 +8,6 @@ import warnings
 from numba.core import (errors, types, typing, ir, funcdesc, rewrites,
                         typeinfer, config, lowering)
 
-from numba.parfors.parfor import PreParforPass as _parfor_PreParforPass
-from numba.parfors.parfor import ParforPass as _parfor_ParforPass
-from numba.parfors.parfor import ParforFusionPass as _parfor_ParforFusionPass
-from numba.parfors.parfor import ParforPreLoweringPass as \
-    _parfor_ParforPreLoweringPass
-from numba.parfors.parfor import Parfor
-from numba.parfors.parfor_lowering import ParforLower
-
 from numba.core.compiler_machinery import (FunctionPass, LoweringPass,
                                            AnalysisPass, register_pass)
 from numba.core.annotations import type_annotations
@@ -261,6 +253,8 @@ class PreParforPass(FunctionPass):
         """
         Preprocessing for data-parallel computations.
         """
+        from numba.parfors.parfor import PreParforPass as _parfor_PreParforPass
+
         # Ensure we have an IR and type information.
         assert state.func_ir
         preparfor_pass = _parfor_PreParforPass(
@@ -298,6 +292,9 @@ class ParforPass(FunctionPass):
         """
         Convert data-parallel computations into Parfor nodes
         """
+        from numba.parfors.parfor import (ParforPass as _parfor_ParforPass,
+                                          Parfor)
+
         # Ensure we have an IR and type information.
         assert state.func_ir
         parfor_pass = _parfor_ParforPass(state.func_ir,
@@ -353,6 +350,9 @@ class ParforFusionPass(FunctionPass):
         """
         Do fusion of parfor nodes.
         """
+        from numba.parfors.parfor import \
+            ParforFusionPass as _parfor_ParforFusionPass
+
         # Ensure we have an IR and type information.
         assert state.func_ir
         parfor_pass = _parfor_ParforFusionPass(state.func_ir,
@@ -382,6 +382,9 @@ class ParforPreLoweringPass(FunctionPass):
         """
         Prepare parfors for lowering.
         """
+        from numba.parfors.parfor import \
+            ParforPreLoweringPass as _parfor_ParforPreLoweringPass
+
         # Ensure we have an IR and type information.
         assert state.func_ir
         parfor_pass = _parfor_ParforPreLoweringPass(state.func_ir,
@@ -527,6 +530,7 @@ class NativeParforLowering(BaseNativeLowering):
 
     @property
     def lowering_class(self):
+        from numba.parfors.parfor_lowering import ParforLower
         return ParforLower
 
 
@@ -900,6 +900,65 @@ class DictIteratorType(SimpleIteratorType):
         super(DictIteratorType, self).__init__(name, yield_type)
 
 
+class SetType(IterableType):
+    """Typed set type
+
+    The set is stored as a typed dictionary with the set items as keys and
+    placeholder values, see ``dict_type``.
+    """
+
+    mutable = True
+
+    def __init__(self, itemty):
+        assert not isinstance(itemty, TypeRef)
+        itemty = unliteral(itemty)
+        if isinstance(itemty, (Optional, NoneType)):
+            fmt = "Set.item_type cannot be of type {}"
+            raise TypingError(fmt.format(itemty))
+        _sentry_forbidden_types(itemty, itemty)
+        self.item_type = itemty
+        self.dtype = itemty
+        name = "{}[{}]".format(self.__class__.__name__, itemty)
+        super(SetType, self).__init__(name)
+
+    @property
+    def key(self):
+        return self.item_type
+
+    def is_precise(self):
+        return not isinstance(self.item_type, Undefined)
+
+    @property
+    def dict_type(self):
+        """The type of the underlying dictionary.
+        """
+        from .scalars import Integer
+        return DictType(self.item_type, Integer('int8'))
+
+    @property
+    def iterator_type(self):
+        return DictKeysIterableType(self.dict_type).iterator_type
+
+    @classmethod
+    def refine(cls, itemty):
+        """Refine to a precise set type
+        """
+        res = cls(itemty)
+        assert res.is_precise()
+        return res
+
+    def unify(self, typingctx, other):
+        """
+        Unify this with the *other* set.
+        """
+        if isinstance(other, SetType):
+            if not other.is_precise():
+                return self
+
+    def __repr__(self):
+        return f"SetType({self.item_type})"
+
+
 class StructRef(Type):
     """A mutable struct.
     """
@@ -286,6 +286,21 @@ def normalize_shape(shape):
         return types.UniTuple(types.intp, 0)
 
 
+_sort_kinds = ('quicksort', 'mergesort', 'stable', 'radix')
+
+def _check_sort_kind(ary, kind):
+    if not isinstance(kind, types.StringLiteral):
+        raise TypingError('"kind" must be a string literal')
+    if kind.literal_value not in _sort_kinds:
+        msg = '"kind" must be one of {}, got {!r}'
+        raise TypingError(msg.format(_sort_kinds, kind.literal_value))
+    if (kind.literal_value == 'radix' and not
+            isinstance(ary.dtype, (types.Integer, types.Float,
+                                   types.Boolean))):
+        msg = "radix sort is not supported for arrays of {}"
+        raise TypingError(msg.format(ary.dtype))
+
+
 @infer_getattr
 class ArrayAttribute(AttributeTemplate):
     key = types.Array
@@ -466,16 +481,26 @@ class ArrayAttribute(AttributeTemplate):
     @bound_function("array.sort")
     def resolve_sort(self, ary, args, kws):
         assert not args
-        assert not kws
-        return signature(types.none)
+        kwargs = dict(kws)
+        if 'kind' not in kwargs:
+            assert not kwargs
+            return signature(types.none)
+        kind = kwargs.pop('kind')
+        _check_sort_kind(ary, kind)
+        if kwargs:
+            msg = "Unsupported keywords: {!r}"
+            raise TypingError(msg.format([k for k in kwargs.keys()]))
+        def sort_stub(kind='quicksort'):
+            pass
+        pysig = utils.pysignature(sort_stub)
+        return signature(types.none, kind).replace(pysig=pysig)
 
     @bound_function("array.argsort")
     def resolve_argsort(self, ary, args, kws):
         assert not args
         kwargs = dict(kws)
         kind = kwargs.pop('kind', types.StringLiteral('quicksort'))
-        if not isinstance(kind, types.StringLiteral):
-            raise TypingError('"kind" must be a string literal')
+        _check_sort_kind(ary, kind)
         if kwargs:
             msg = "Unsupported keywords: {!r}"
             raise TypingError(msg.format([k for k in kwargs.keys()]))
@@ -5,7 +5,7 @@ import operator
 
 from numba.core import types, errors
 from numba import prange
-from numba.parfors.parfor import internal_prange
+from numba.misc.special import internal_prange
 
 from numba.core.typing.templates import (AttributeTemplate, ConcreteTemplate,
                                          AbstractTemplate, infer_global, infer,
@@ -12,7 +12,7 @@ from collections.abc import Sequence
 from types import MethodType, FunctionType, MappingProxyType
 
 import numba
-from numba.core import types, utils, targetconfig
+from numba.core import config, types, utils, targetconfig
 from numba.core.errors import (
     TypingError,
     InternalError,
@@ -811,6 +811,8 @@ class _OverloadFunctionTemplate(AbstractTemplate):
         # Make dispatcher
         jitdecor = jitter(**self._jit_options)
         disp = jitdecor(pyfunc)
+        if config.CACHE_OVERLOADS and not self._jit_options.get('cache'):
+            self._enable_impl_caching(disp)
         # Make sure that the implementation can be fully compiled
         disp_type = types.Dispatcher(disp)
         disp_type.get_call_type(self.context, args, kws)
@@ -818,6 +820,23 @@ class _OverloadFunctionTemplate(AbstractTemplate):
             self._impl_cache[cache_key] = disp, args
         return disp, args
 
+    def _enable_impl_caching(self, disp):
+        """Save the compiled implementations of the dispatcher `disp` in the
+        on-disk cache, so that other processes need not type and compile
+        them again.
+        """
+        from numba.core.caching import OverloadImplCache
+        from numba.core.dispatcher import Dispatcher
+
+        # Other targets bring their own dispatcher and caching
+        if not isinstance(disp, Dispatcher):
+            return
+        try:
+            disp._cache = OverloadImplCache(disp.py_func)
+        except RuntimeError:
+            # No cache locator for the source file, e.g. generated code
+            pass
+
     def get_impl_key(self, sig):
         """
         Return the key for looking up the implementation for the given
@@ -475,6 +475,9 @@ class _ParallelChunksize(WithContext):
     to the programmer specified value. On exit the original
     chunksize is restored.
     """
+    # The function of the numba module setting the value and returning the
+    # previous one
+    _setter = 'set_parallel_chunksize'
     def mutate_with_body(self, func_ir, blocks, blk_start, blk_end,
                          body_blocks, dispatcher_factory, extra):
         ir_utils.dprint_func_ir(func_ir, "Before with changes", blocks=blocks)
@@ -494,7 +497,7 @@ class _ParallelChunksize(WithContext):
         gvar = scope.redefine("$ngvar", loc)
         set_state.append(ir.Assign(ir.Global('numba', numba, loc), gvar, loc))
         # getattr for set chunksize function in Numba
-        spcattr = ir.Expr.getattr(gvar, 'set_parallel_chunksize', loc)
+        spcattr = ir.Expr.getattr(gvar, self._setter, loc)
         spcvar = scope.redefine("$spc", loc)
         set_state.append(ir.Assign(spcattr, spcvar, loc))
         # call set_parallel_chunksize
@@ -533,3 +536,31 @@ class _ParallelChunksize(WithContext):
         numba.set_parallel_chunksize(self.orig_chunksize)
 
 parallel_chunksize = _ParallelChunksize()
+
+
+class _ParallelSchedule(_ParallelChunksize):
+    """A context-manager that on entry stores the current schedule
+    for the executing parfors and then changes the current schedule
+    to the programmer specified kind. On exit the original
+    schedule is restored.
+    """
+    _setter = 'set_parallel_schedule'
+
+    def __call__(self, *args, **kwargs):
+        """Act like a function and enforce the contract that
+        setting the schedule takes only one string input.
+        """
+        if len(args) != 1 or kwargs or not isinstance(args[0], str):
+            raise ValueError("parallel_schedule takes only a "
+                             "single string argument.")
+
+        self.schedule = args[0]
+        return self
+
+    def __enter__(self):
+        self.orig_schedule = numba.set_parallel_schedule(self.schedule)
+
+    def __exit__(self, typ, val, tb):
+        numba.set_parallel_schedule(self.orig_schedule)
+
+parallel_schedule = _ParallelSchedule()
@@ -456,6 +456,7 @@ def bool_sequence(x):
         types.ListType,
         types.UnicodeType,
         types.Set,
+        types.SetType,
     )
 
     if isinstance(x, valid_types):
@@ -776,6 +777,7 @@ def ol_isinstance(var, typs):
     supported_var_ty = (types.Number, types.Bytes, types.RangeType,
                         types.DictType, types.LiteralStrKeyDict, types.List,
                         types.ListType, types.Tuple, types.UniTuple, types.Set,
+                        types.SetType,
                         types.Function, types.ClassType, types.UnicodeType,
                         types.ClassInstanceType, types.NoneType, types.Array,
                         types.Boolean, types.Float, types.UnicodeCharSeq,
@@ -822,7 +824,7 @@ def ol_isinstance(var, typs):
         if isinstance(typ, types.TypeRef):
             # Use of Numba type classes is in general not supported as they do
             # not work when the jit is disabled.
-            if key not in (types.ListType, types.DictType):
+            if key not in (types.ListType, types.DictType, types.SetType):
                 msg = ("Numba type classes (except numba.typed.* container "
                        "types) are not supported.")
                 raise NumbaTypeError(msg)
@@ -10,7 +10,7 @@ from numba.core.imputils import (lower_builtin, lower_cast,
                                     iterator_impl, impl_ret_untracked)
 from numba.core.typing import signature
 from numba.core.extending import intrinsic, overload, overload_attribute, register_jitable
-from numba.parfors.parfor import internal_prange
+from numba.misc.special import internal_prange
 
 def make_range_iterator(typ):
     """
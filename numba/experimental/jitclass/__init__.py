@@ -1,3 +1,3 @@
 from numba.experimental.jitclass.decorators import jitclass
-from numba.experimental.jitclass import boxing  # Has import-time side effect
-from numba.experimental.jitclass import overloads  # Has import-time side effect
+# The boxing and overloads modules have import-time side effects, they are
+# imported by CPUContext.load_additional_registries() on first compilation.
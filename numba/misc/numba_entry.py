@@ -26,10 +26,64 @@ def make_parser():
                         help='Output system information about gdb')
     parser.add_argument('--sys-json', nargs=1,
                         help='Saves the system info dict as a json file')
+    parser.add_argument('--cache-gc', nargs='*', metavar='DIR',
+                        help='Prune orphaned and least recently used files '
+                             'from the cache directories found under DIR '
+                             '(default: NUMBA_CACHE_DIR and the user-wide '
+                             'cache directory)')
+    parser.add_argument('--cache-max-size', default=None,
+                        help='With --cache-gc, evict the least recently used '
+                             'data files beyond this size per directory '
+                             '(e.g. 500M, default: NUMBA_CACHE_MAX_SIZE)')
+    parser.add_argument('--cache-max-age', default=None,
+                        help='With --cache-gc, evict the data files not used '
+                             'for this long (e.g. 30d, default: '
+                             'NUMBA_CACHE_MAX_AGE)')
     parser.add_argument('filename', nargs='?', help='Python source filename')
     return parser
 
 
+def _format_size(size):
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if size < 1024 or unit == 'GiB':
+            break
+        size /= 1024
+    return '%.1f %s' % (size, unit)
+
+
+def collect_cache_garbage(dirs, max_size=None, max_age=None):
+    """Run the cache garbage collector on all the cache directories found
+    under *dirs* and print a report.
+    """
+    from numba.core import config
+    from numba.core.caching import collect_cache_garbage, is_cache_directory
+    from numba.misc.appdirs import AppDirs
+
+    max_size = (config.CACHE_MAX_SIZE if max_size is None
+                else config._parse_cache_size(max_size))
+    max_age = (config.CACHE_MAX_AGE if max_age is None
+               else config._parse_cache_age(max_age))
+    if not dirs:
+        dirs = [AppDirs(appname="numba", appauthor=False).user_cache_dir]
+        if config.CACHE_DIR:
+            dirs.insert(0, config.CACHE_DIR)
+
+    removed = freed = 0
+    for root in dirs:
+        for path, _, _ in os.walk(root):
+            if not is_cache_directory(path):
+                continue
+            res = collect_cache_garbage(path, max_size=max_size,
+                                        max_age=max_age)
+            if res.removed:
+                print("%s: removed %d files, freed %s"
+                      % (path, res.removed, _format_size(res.freed)))
+            removed += res.removed
+            freed += res.freed
+    print("Cache GC: removed %d files, freed %s"
+          % (removed, _format_size(freed)))
+
+
 def main():
     parser = make_parser()
     args = parser.parse_args()
@@ -45,6 +99,11 @@ def main():
     if args.sysinfo or args.gdbinfo:
         sys.exit(0)
 
+    if args.cache_gc is not None:
+        collect_cache_garbage(args.cache_gc, max_size=args.cache_max_size,
+                              max_age=args.cache_max_age)
+        sys.exit(0)
+
     if args.sys_json:
         info = get_sysinfo()
         info.update({'Start': info['Start'].isoformat()})
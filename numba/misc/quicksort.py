@@ -10,7 +10,8 @@ QuicksortImplementation = collections.namedtuple(
     (# The compile function itself
      'compile',
      # All subroutines exercised by test_sort
-     'partition', 'partition3', 'insertion_sort',
+     'partition', 'partition_left', 'partition_branchless', 'partition3',
+     'insertion_sort', 'partial_insertion_sort', 'heapsort',
      # The top-level function
      'run_quicksort',
      ))
@@ -18,13 +19,41 @@ QuicksortImplementation = collections.namedtuple(
 
 Partition = collections.namedtuple('Partition', ('start', 'stop'))
 
+# A partition to sort, with the number of unbalanced partitionings still
+# allowed before switching to heapsort, and whether it is the leftmost
+# partition (otherwise the element before it is not greater than any of its
+# elements).
+SortFrame = collections.namedtuple('SortFrame', ('start', 'stop',
+                                                 'bad_allowed', 'leftmost'))
+
 # Under this size, switch to a simple insertion sort
-SMALL_QUICKSORT = 15
+SMALL_QUICKSORT = 24
+
+# Over this size, the pivot is the pseudo-median of nine elements rather
+# than the median of three
+NINTHER_THRESHOLD = 128
+
+# Maximum number of moves of the insertion sort attempted on partitions
+# that were already partitioned
+PARTIAL_INSERTION_SORT_LIMIT = 8
+
+# Number of elements compared at once by the branchless partitioning
+BLOCK_SIZE = 64
 
 MAX_STACK = 100
 
 
 def make_quicksort_impl(wrap, lt=None, is_argsort=False, is_list=False, is_np_array=False):
+    """
+    Make a pattern-defeating quicksort (pdqsort, see Orson Peters,
+    "Pattern-defeating Quicksort", 2021): an introsort falling back on
+    heapsort after too many unbalanced partitions, which also detects
+    already sorted partitions, deals with many equal elements in linear
+    time and breaks patterns that would give unbalanced partitions.
+
+    Numpy arrays, which only hold primitive types, are partitioned with
+    the branchless block partitioning of BlockQuicksort.
+    """
 
     intp = types.intp
     zero = intp(0)
@@ -63,6 +92,10 @@ def make_quicksort_impl(wrap, lt=None, is_argsort=False, is_list=False, is_np_ar
 
     LT = wrap(lt if lt is not None else default_lt)
 
+    # NOTE: the comparison function may not be a strict weak ordering
+    # (e.g. when NaNs are involved), so all the scans below are bounded
+    # even when a well-behaved LT would make the bounds redundant.
+
     @wrap
     def insertion_sort(A, R, low, high):
         """
@@ -83,48 +116,288 @@ def make_quicksort_impl(wrap, lt=None, is_argsort=False, is_list=False, is_np_ar
                 j -= 1
             R[j] = k
 
+    @wrap
+    def partial_insertion_sort(A, R, low, high):
+        """
+        Insertion sort A[low:high + 1], giving up after a few moves.
+        Returns whether the partition was sorted.
+        """
+        if high <= low:
+            return True
+
+        moves = 0
+        for i in range(low + 1, high + 1):
+            k = R[i]
+            v = GET(A, k)
+            if LT(v, GET(A, R[i - 1])):
+                j = i
+                while j > low and LT(v, GET(A, R[j - 1])):
+                    R[j] = R[j - 1]
+                    j -= 1
+                R[j] = k
+                moves += i - j
+                if moves > PARTIAL_INSERTION_SORT_LIMIT:
+                    return False
+        return True
+
+    @wrap
+    def heapsort(A, R, low, high):
+        """
+        Heapsort A[low:high + 1]. Note the inclusive bounds.
+        """
+        n = high - low + 1
+        # The heap is built in R[low:low + end] by sifting down the
+        # elements from the middle, then its root is repeatedly swapped
+        # with its last element and sifted down.
+        start = n // 2
+        end = n
+        while end > 1:
+            if start > 0:
+                start -= 1
+            else:
+                end -= 1
+                R[low], R[low + end] = R[low + end], R[low]
+            root = start
+            k = R[low + root]
+            v = GET(A, k)
+            while True:
+                child = 2 * root + 1
+                if child >= end:
+                    break
+                if (child + 1 < end and
+                        LT(GET(A, R[low + child]),
+                           GET(A, R[low + child + 1]))):
+                    child += 1
+                if not LT(v, GET(A, R[low + child])):
+                    break
+                R[low + root] = R[low + child]
+                root = child
+            R[low + root] = k
+
+    @wrap
+    def sort3(A, R, a, b, c):
+        """
+        Sort the three elements A[a], A[b] and A[c].
+        """
+        if LT(GET(A, R[b]), GET(A, R[a])):
+            R[a], R[b] = R[b], R[a]
+        if LT(GET(A, R[c]), GET(A, R[b])):
+            R[b], R[c] = R[c], R[b]
+            if LT(GET(A, R[b]), GET(A, R[a])):
+                R[a], R[b] = R[b], R[a]
+
+    @wrap
+    def choose_pivot(A, R, low, high):
+        """
+        Move the chosen pivot of A[low:high + 1] to A[low].
+        """
+        size = high - low + 1
+        mid = low + size // 2
+        if size > NINTHER_THRESHOLD:
+            # Tukey's ninther
+            sort3(A, R, low, mid, high)
+            sort3(A, R, low + 1, mid - 1, high - 1)
+            sort3(A, R, low + 2, mid + 1, high - 2)
+            sort3(A, R, mid - 1, mid, mid + 1)
+            R[low], R[mid] = R[mid], R[low]
+        else:
+            # median of three {middle, low, high}
+            sort3(A, R, mid, low, high)
+
     @wrap
     def partition(A, R, low, high):
         """
-        Partition A[low:high + 1] around a chosen pivot.  The pivot's index
-        is returned.
+        Partition A[low:high + 1] around its first element: the elements
+        before the pivot are smaller than it and the elements after it are
+        not.  Returns the pivot's index and whether the partition was
+        already partitioned.
         """
         assert low >= 0
         assert high > low
 
-        mid = (low + high) >> 1
-        # NOTE: the pattern of swaps below for the pivot choice and the
-        # partitioning gives good results (i.e. regular O(n log n))
-        # on sorted, reverse-sorted, and uniform arrays.  Subtle changes
-        # risk breaking this property.
+        p = R[low]
+        pivot = GET(A, p)
+        # Find the first element not smaller than the pivot and the last
+        # element smaller than the pivot
+        first = low + 1
+        while first <= high and LT(GET(A, R[first]), pivot):
+            first += 1
+        last = high
+        while last >= first and not LT(GET(A, R[last]), pivot):
+            last -= 1
+        already_partitioned = first > last
+
+        while first < last:
+            R[first], R[last] = R[last], R[first]
+            first += 1
+            while first <= high and LT(GET(A, R[first]), pivot):
+                first += 1
+            last -= 1
+            while last > low and not LT(GET(A, R[last]), pivot):
+                last -= 1
+
+        # Put the pivot in its final place
+        pivot_pos = first - 1
+        R[low] = R[pivot_pos]
+        R[pivot_pos] = p
+        return pivot_pos, already_partitioned
 
-        # median of three {low, middle, high}
-        if LT(GET(A, R[mid]), GET(A, R[low])):
-            R[low], R[mid] = R[mid], R[low]
-        if LT(GET(A, R[high]), GET(A, R[mid])):
-            R[high], R[mid] = R[mid], R[high]
-        if LT(GET(A, R[mid]), GET(A, R[low])):
-            R[low], R[mid] = R[mid], R[low]
-        pivot = GET(A, R[mid])
-
-        # Temporarily stash the pivot at the end
-        R[high], R[mid] = R[mid], R[high]
-        i = low
-        j = high - 1
-        while True:
-            while i < high and LT(GET(A, R[i]), pivot):
-                i += 1
-            while j >= low and LT(pivot, GET(A, R[j])):
-                j -= 1
-            if i >= j:
-                break
-            R[i], R[j] = R[j], R[i]
-            i += 1
-            j -= 1
-        # Put the pivot back in its final place (all items before `i`
-        # are smaller than the pivot, all items at/after `i` are larger)
-        R[i], R[high] = R[high], R[i]
-        return i
+    @wrap
+    def swap_offsets(R, first, last, offsets_l, start_l, offsets_r, start_r,
+                     num, use_swaps):
+        if use_swaps:
+            # A cyclic permutation would not work when both offset
+            # buffers have the same number of elements
+            for i in range(num):
+                l = first + offsets_l[start_l + i]
+                r = last - offsets_r[start_r + i]
+                R[l], R[r] = R[r], R[l]
+        elif num > 0:
+            l = first + offsets_l[start_l]
+            r = last - offsets_r[start_r]
+            tmp = R[l]
+            R[l] = R[r]
+            for i in range(1, num):
+                l = first + offsets_l[start_l + i]
+                R[r] = R[l]
+                r = last - offsets_r[start_r + i]
+                R[l] = R[r]
+            R[r] = tmp
+
+    @wrap
+    def partition_branchless(A, R, low, high, offsets_l, offsets_r):
+        """
+        Same as partition(), but the misplaced elements are found by
+        comparing blocks of elements and recording their offsets without
+        branching (see Edelkamp and Weiss, "BlockQuicksort: How Branch
+        Mispredictions don't affect Quicksort", 2016).
+        """
+        p = R[low]
+        pivot = GET(A, p)
+        first = low + 1
+        while first <= high and LT(GET(A, R[first]), pivot):
+            first += 1
+        last = high
+        while last >= first and not LT(GET(A, R[last]), pivot):
+            last -= 1
+        already_partitioned = first > last
+
+        if not already_partitioned:
+            R[first], R[last] = R[last], R[first]
+            first += 1
+            # From now on, the unknown elements are A[first:last]
+            offsets_l_base = first
+            offsets_r_base = last
+            num_l = num_r = start_l = start_r = 0
+            while first < last:
+                # Fill the empty offset buffers with the offsets of the
+                # elements that are on the wrong side of the pivot
+                num_unknown = last - first
+                if num_l == 0:
+                    left_split = num_unknown // 2 if num_r == 0 else num_unknown
+                else:
+                    left_split = 0
+                right_split = num_unknown - left_split if num_r == 0 else 0
+                for i in range(min(left_split, BLOCK_SIZE)):
+                    offsets_l[num_l] = i
+                    num_l += not LT(GET(A, R[first]), pivot)
+                    first += 1
+                for i in range(min(right_split, BLOCK_SIZE)):
+                    last -= 1
+                    offsets_r[num_r] = i + 1
+                    num_r += LT(GET(A, R[last]), pivot)
+
+                # Swap the misplaced elements pairwise
+                num = min(num_l, num_r)
+                swap_offsets(R, offsets_l_base, offsets_r_base,
+                             offsets_l, start_l, offsets_r, start_r,
+                             num, num_l == num_r)
+                num_l -= num
+                num_r -= num
+                start_l += num
+                start_r += num
+                if num_l == 0:
+                    start_l = 0
+                    offsets_l_base = first
+                if num_r == 0:
+                    start_r = 0
+                    offsets_r_base = last
+
+            # Only one of the buffers may still hold misplaced elements,
+            # move them next to the other side
+            if num_l:
+                while num_l:
+                    num_l -= 1
+                    last -= 1
+                    l = offsets_l_base + offsets_l[start_l + num_l]
+                    R[l], R[last] = R[last], R[l]
+                first = last
+            if num_r:
+                while num_r:
+                    num_r -= 1
+                    r = offsets_r_base - offsets_r[start_r + num_r]
+                    R[r], R[first] = R[first], R[r]
+                    first += 1
+
+        # Put the pivot in its final place
+        pivot_pos = first - 1
+        R[low] = R[pivot_pos]
+        R[pivot_pos] = p
+        return pivot_pos, already_partitioned
+
+    @wrap
+    def partition_left(A, R, low, high):
+        """
+        Partition A[low:high + 1] around its first element: the elements
+        before the pivot are not greater than it and the elements after it
+        are greater.  Used when no element is smaller than the pivot, to
+        skip over the elements equal to it.  Returns the pivot's index.
+        """
+        p = R[low]
+        pivot = GET(A, p)
+        last = high
+        while last > low and LT(pivot, GET(A, R[last])):
+            last -= 1
+        first = low + 1
+        while first < last and not LT(pivot, GET(A, R[first])):
+            first += 1
+
+        while first < last:
+            R[first], R[last] = R[last], R[first]
+            last -= 1
+            while last > low and LT(pivot, GET(A, R[last])):
+                last -= 1
+            first += 1
+            while first <= high and not LT(pivot, GET(A, R[first])):
+                first += 1
+
+        # Put the pivot in its final place
+        R[low] = R[last]
+        R[last] = p
+        return last
+
+    @wrap
+    def break_patterns(R, low, pivot_pos, high):
+        """
+        Swap a few elements of both sides of an unbalanced partitioning
+        to break the pattern that produced it.
+        """
+        l_size = pivot_pos - low
+        if l_size >= SMALL_QUICKSORT:
+            q = l_size // 4
+            for j in range(3 if l_size > NINTHER_THRESHOLD else 1):
+                R[low + j], R[low + q + j] = R[low + q + j], R[low + j]
+                a = pivot_pos - 1 - j
+                b = pivot_pos - q - j
+                R[a], R[b] = R[b], R[a]
+        r_size = high - pivot_pos
+        if r_size >= SMALL_QUICKSORT:
+            q = r_size // 4
+            for j in range(3 if r_size > NINTHER_THRESHOLD else 1):
+                a = pivot_pos + 1 + j
+                b = pivot_pos + 1 + q + j
+                R[a], R[b] = R[b], R[a]
+                R[high - j], R[high + 1 - q - j] = R[high + 1 - q - j], R[high - j]
 
     @wrap
     def partition3(A, low, high):
@@ -165,32 +438,74 @@ def make_quicksort_impl(wrap, lt=None, is_argsort=False, is_list=False, is_np_ar
     def run_quicksort1(A):
         R = make_res(A)
 
-        if len(A) < 2:
+        n = len(A)
+        if n < 2:
             return R
 
-        stack = [Partition(zero, zero)] * MAX_STACK
-        stack[0] = Partition(zero, len(A) - 1)
+        if is_np_array:
+            offsets_l = np.empty(BLOCK_SIZE, dtype=np.intp)
+            offsets_r = np.empty(BLOCK_SIZE, dtype=np.intp)
+
+        # Allow log2(n) unbalanced partitionings before falling back on
+        # heapsort, which bounds the running time to O(n log n)
+        bad_allowed = zero
+        while n > 1:
+            n >>= 1
+            bad_allowed += 1
+
+        stack = [SortFrame(zero, zero, zero, True)] * MAX_STACK
+        stack[0] = SortFrame(zero, len(A) - 1, bad_allowed, True)
         n = 1
 
         while n > 0:
             n -= 1
-            low, high = stack[n]
+            low, high, bad_allowed, leftmost = stack[n]
             # Partition until it becomes more efficient to do an insertion sort
-            while high - low >= SMALL_QUICKSORT:
+            while high - low + 1 >= SMALL_QUICKSORT:
                 assert n < MAX_STACK
-                i = partition(A, R, low, high)
+                size = high - low + 1
+                choose_pivot(A, R, low, high)
+
+                # If the pivot is equal to the element before the partition,
+                # which is not greater than any element of the partition,
+                # the elements equal to the pivot are already in their final
+                # place: skip them.
+                if not leftmost and not LT(GET(A, R[low - 1]),
+                                           GET(A, R[low])):
+                    low = partition_left(A, R, low, high) + 1
+                    continue
+
+                if is_np_array:
+                    i, already_partitioned = partition_branchless(
+                        A, R, low, high, offsets_l, offsets_r)
+                else:
+                    i, already_partitioned = partition(A, R, low, high)
+
+                if i - low < size // 8 or high - i < size // 8:
+                    bad_allowed -= 1
+                    if bad_allowed == 0:
+                        heapsort(A, R, low, high)
+                        low = high
+                        break
+                    break_patterns(R, low, i, high)
+                elif (already_partitioned and
+                      partial_insertion_sort(A, R, low, i - 1) and
+                      partial_insertion_sort(A, R, i + 1, high)):
+                    # The partition was sorted
+                    low = high
+                    break
+
                 # Push largest partition on the stack
                 if high - i > i - low:
                     # Right is larger
-                    if high > i:
-                        stack[n] = Partition(i + 1, high)
-                        n += 1
+                    stack[n] = SortFrame(i + 1, high, bad_allowed, False)
+                    n += 1
                     high = i - 1
                 else:
-                    if i > low:
-                        stack[n] = Partition(low, i - 1)
-                        n += 1
+                    stack[n] = SortFrame(low, i - 1, bad_allowed, leftmost)
+                    n += 1
                     low = i + 1
+                    leftmost = False
 
             insertion_sort(A, R, low, high)
 
@@ -245,8 +560,10 @@ def make_quicksort_impl(wrap, lt=None, is_argsort=False, is_list=False, is_np_ar
 
 
     return QuicksortImplementation(wrap,
-                                   partition, partition3, insertion_sort,
-                                   run_quicksort)
+                                   partition, partition_left,
+                                   partition_branchless, partition3,
+                                   insertion_sort, partial_insertion_sort,
+                                   heapsort, run_quicksort)
 
 
 def make_py_quicksort(*args, **kwargs):
@@ -0,0 +1,160 @@
+"""
+LSD radix sort for arrays of integers, floats and booleans.
+
+The keys are mapped to unsigned integers of the same width whose order is
+the order of the keys, then sorted by successive stable counting sorts on
+each byte, from the least significant one.  NaNs are sorted to the end, as
+in numpy.
+"""
+import collections
+
+import numpy as np
+
+from numba.core import types
+
+
+RadixsortImplementation = collections.namedtuple(
+    'RadixsortImplementation',
+    (# The top-level function
+     'run_radixsort',
+     ))
+
+# Number of bits sorted by each pass
+RADIX_BITS = 8
+
+
+def make_radixsort_impl(wrap, dtype, is_argsort=False):
+    if not isinstance(dtype, (types.Integer, types.Float, types.Boolean)):
+        raise TypeError("radix sort is not supported for %s" % (dtype,))
+
+    nbytes = 1 if isinstance(dtype, types.Boolean) else dtype.bitwidth // 8
+    utype = np.dtype('uint%d' % (nbytes * 8)).type
+    nbuckets = 1 << RADIX_BITS
+    mask = utype(nbuckets - 1)
+    sign = utype(1 << (nbytes * 8 - 1))
+    ones = utype(~utype(0))
+    shifts = np.arange(nbytes, dtype=utype) * utype(RADIX_BITS)
+
+    # The mapping between keys and their unsigned representation
+    if isinstance(dtype, types.Float):
+        @wrap
+        def encode(A):
+            U = A.view(utype)
+            K = np.empty(A.size, dtype=utype)
+            for i in range(A.size):
+                u = U[i]
+                if A[i] != A[i]:
+                    K[i] = ones
+                elif is_argsort and u == sign:
+                    # -0.0 and 0.0 are equal keys for the stable argsort
+                    K[i] = sign
+                elif u & sign:
+                    K[i] = ~u
+                else:
+                    K[i] = u | sign
+            return K
+
+        @wrap
+        def decode(K, A):
+            for i in range(K.size):
+                k = K[i]
+                if k & sign:
+                    K[i] = k ^ sign
+                else:
+                    K[i] = ~k
+            A[:] = K.view(A.dtype)
+
+    elif isinstance(dtype, types.Integer) and dtype.signed:
+        @wrap
+        def encode(A):
+            return A.view(utype) ^ sign
+
+        @wrap
+        def decode(K, A):
+            A[:] = (K ^ sign).view(A.dtype)
+
+    else:
+        @wrap
+        def encode(A):
+            return A.view(utype).copy()
+
+        @wrap
+        def decode(K, A):
+            A[:] = K.view(A.dtype)
+
+    @wrap
+    def radix_passes(K, R):
+        """
+        Sort the keys K and, for argsort, the indices R along with them.
+        Returns the sorted arrays, which may be the workspaces.
+        """
+        n = K.size
+        counts = np.zeros((nbytes, nbuckets), dtype=np.intp)
+        for i in range(n):
+            k = K[i]
+            for b in range(nbytes):
+                counts[b, np.intp((k >> shifts[b]) & mask)] += 1
+
+        WK = np.empty_like(K)
+        if is_argsort:
+            WR = np.empty_like(R)
+        else:
+            WR = R
+        for b in range(nbytes):
+            shift = shifts[b]
+            # Skip the byte if it is the same for all keys
+            if counts[b, np.intp((K[0] >> shift) & mask)] == n:
+                continue
+            total = 0
+            for d in range(nbuckets):
+                c = counts[b, d]
+                counts[b, d] = total
+                total += c
+            for i in range(n):
+                k = K[i]
+                d = np.intp((k >> shift) & mask)
+                pos = counts[b, d]
+                counts[b, d] = pos + 1
+                WK[pos] = k
+                if is_argsort:
+                    WR[pos] = R[i]
+            K, WK = WK, K
+            if is_argsort:
+                R, WR = WR, R
+        return K, R
+
+    if is_argsort:
+        @wrap
+        def run_radixsort(A):
+            R = np.arange(A.size)
+            if A.size < 2:
+                return R
+            K = encode(np.ascontiguousarray(A))
+            K, R = radix_passes(K, R)
+            return R
+    else:
+        @wrap
+        def run_radixsort1(A):
+            if A.size < 2:
+                return A
+            K = encode(np.ascontiguousarray(A))
+            K, _ = radix_passes(K, K)
+            decode(K, A)
+            return A
+
+        @wrap
+        def run_radixsort(A):
+            if A.ndim == 1:
+                return run_radixsort1(A)
+            else:
+                for idx in np.ndindex(A.shape[:-1]):
+                    run_radixsort1(A[idx])
+                return A
+
+    return RadixsortImplementation(run_radixsort=run_radixsort)
+
+
+def make_jit_radixsort(*args, **kwargs):
+    from numba.core.extending import register_jitable
+    return make_radixsort_impl((lambda f: register_jitable(f)),
+                               *args, **kwargs)
@@ -19,6 +19,12 @@ class prange(object):
         return range(*args)
 
 
+class internal_prange(object):
+
+    def __new__(cls, *args):
+        return range(*args)
+
+
 def _gdb_python_call_gen(func_name, *args):
     # generates a call to a function containing a compiled in gdb command,
     # this is to make `numba.gdb*` work in the interpreter.
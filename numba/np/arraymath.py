@@ -19,7 +19,7 @@ from numba.np.numpy_support import (as_dtype, type_can_asarray, type_is_scalar,
 from numba.core.imputils import (lower_builtin, impl_ret_borrowed,
                                  impl_ret_new_ref, impl_ret_untracked)
 from numba.np.arrayobj import (make_array, load_item, store_item,
-                               _empty_nd_impl)
+                               _empty_nd_impl, normalize_axis)
 from numba.np.linalg import ensure_blas
 
 from numba.core.extending import intrinsic
@@ -372,21 +372,120 @@ def array_prod(a):
         return array_prod_impl
 
 
+@register_jitable
+def _moveaxis_last(a, axis):
+    """
+    A view of *a* with the dimension *axis* moved to the end, so that the
+    lanes along *axis* are the last-axis subarrays of the view.
+    """
+    axes = a.shape
+    j = 0
+    for i in range(a.ndim):
+        if i != axis:
+            axes = tuple_setitem(axes, j, i)
+            j += 1
+    axes = tuple_setitem(axes, a.ndim - 1, axis)
+    return np.transpose(a, axes)
+
+
+@register_jitable
+def _lanes_shape(b):
+    """
+    The shape of the array of the lanes of *b* along its last axis.
+    """
+    return b.shape[:-1]
+
+
+def _lane(b, i):
+    """
+    The i'th lane of *b* along its last axis, lanes being numbered in C
+    order.
+    """
+    pass
+
+
+@overload(_lane)
+def _lane_impl(b, i):
+    if b.ndim == 1:
+        return lambda b, i: b
+
+    def impl(b, i):
+        idx = _lanes_shape(b)
+        for d in range(len(idx) - 1, -1, -1):
+            idx = tuple_setitem(idx, d, i % b.shape[d])
+            i //= b.shape[d]
+        return b[idx]
+
+    return impl
+
+
+@register_jitable
+def _scan_chunk(src, out, start, stop, init, prod, skip_nan):
+    """
+    Store in out[start:stop] the cumulative sums (or products if *prod*) of
+    src[start:stop] starting from *init*, NaNs being skipped if *skip_nan*.
+    Returns the last sum or product.
+    """
+    c = init
+    for i in range(start, stop):
+        v = src[i]
+        if not (skip_nan and np.isnan(v)):
+            if prod:
+                c *= v
+            else:
+                c += v
+        out[i] = c
+    return c
+
+
+@register_jitable
+def _scan_lanes(b, out, start, stop, init, prod, skip_nan):
+    """
+    Cumulative sums (or products) of the lanes start to stop of *b* along
+    its last axis into the same lanes of *out*.
+    """
+    for i in range(start, stop):
+        _scan_chunk(_lane(b, i), _lane(out, i), 0, b.shape[-1], init, prod,
+                    skip_nan)
+
+
+def _scan_out_dtype(dtype):
+    # Small integers and booleans are accumulated in intp, as in NumPy
+    is_integer = dtype in types.signed_domain
+    is_bool = dtype == types.bool_
+    if (is_integer and dtype.bitwidth < types.intp.bitwidth) or is_bool:
+        return as_dtype(types.intp)
+    return as_dtype(dtype)
+
+
+def _scan_axis_impl(a, axis, func_name, dtype, acc_init, prod, skip_nan):
+    if not isinstance(axis, (int, types.Integer)):
+        raise TypingError("%s: axis must be an integer or None" % func_name)
+
+    def scan_axis_impl(a, axis=None):
+        axis = normalize_axis(func_name, "axis", a.ndim, axis)
+        out = np.empty(a.shape, dtype)
+        if out.size:
+            _scan_lanes(_moveaxis_last(a, axis), _moveaxis_last(out, axis),
+                        0, out.size // a.shape[axis], acc_init, prod,
+                        skip_nan)
+        return out
+
+    return scan_axis_impl
+
+
 @overload(np.cumsum)
 @overload_method(types.Array, "cumsum")
-def array_cumsum(a):
+def array_cumsum(a, axis=None):
     if isinstance(a, types.Array):
-        is_integer = a.dtype in types.signed_domain
-        is_bool = a.dtype == types.bool_
-        if (is_integer and a.dtype.bitwidth < types.intp.bitwidth)\
-                or is_bool:
-            dtype = as_dtype(types.intp)
-        else:
-            dtype = as_dtype(a.dtype)
-
+        dtype = _scan_out_dtype(a.dtype)
         acc_init = get_accumulator(dtype, 0)
 
-        def array_cumsum_impl(a):
+        if not is_nonelike(axis):
+            return _scan_axis_impl(a, axis, "np.cumsum", dtype, acc_init,
+                                   False, False)
+
+        def array_cumsum_impl(a, axis=None):
             out = np.empty(a.size, dtype)
             c = acc_init
             for idx, v in enumerate(a.flat):
@@ -399,19 +498,16 @@ def array_cumsum(a):
 
 @overload(np.cumprod)
 @overload_method(types.Array, "cumprod")
-def array_cumprod(a):
+def array_cumprod(a, axis=None):
     if isinstance(a, types.Array):
-        is_integer = a.dtype in types.signed_domain
-        is_bool = a.dtype == types.bool_
-        if (is_integer and a.dtype.bitwidth < types.intp.bitwidth)\
-                or is_bool:
-            dtype = as_dtype(types.intp)
-        else:
-            dtype = as_dtype(a.dtype)
-
+        dtype = _scan_out_dtype(a.dtype)
         acc_init = get_accumulator(dtype, 1)
 
-        def array_cumprod_impl(a):
+        if not is_nonelike(axis):
+            return _scan_axis_impl(a, axis, "np.cumprod", dtype, acc_init,
+                                   True, False)
+
+        def array_cumprod_impl(a, axis=None):
             out = np.empty(a.size, dtype)
             c = acc_init
             for idx, v in enumerate(a.flat):
@@ -1298,19 +1394,23 @@ def np_nanprod(a):
 
 
 @overload(np.nancumprod)
-def np_nancumprod(a):
+def np_nancumprod(a, axis=None):
     if not isinstance(a, types.Array):
         return
 
     if isinstance(a.dtype, (types.Boolean, types.Integer)):
         # dtype cannot possibly contain NaN
-        return lambda a: np.cumprod(a)
+        return lambda a, axis=None: np.cumprod(a, axis)
     else:
         retty = a.dtype
         is_nan = get_isnan(retty)
         one = retty(1)
 
-        def nancumprod_impl(a):
+        if not is_nonelike(axis):
+            return _scan_axis_impl(a, axis, "np.nancumprod", as_dtype(retty),
+                                   one, True, True)
+
+        def nancumprod_impl(a, axis=None):
             out = np.empty(a.size, retty)
             c = one
             for idx, v in enumerate(a.flat):
@@ -1323,19 +1423,23 @@ def np_nancumprod(a):
 
 
 @overload(np.nancumsum)
-def np_nancumsum(a):
+def np_nancumsum(a, axis=None):
     if not isinstance(a, types.Array):
         return
 
     if isinstance(a.dtype, (types.Boolean, types.Integer)):
         # dtype cannot possibly contain NaN
-        return lambda a: np.cumsum(a)
+        return lambda a, axis=None: np.cumsum(a, axis)
     else:
         retty = a.dtype
         is_nan = get_isnan(retty)
         zero = retty(0)
 
-        def nancumsum_impl(a):
+        if not is_nonelike(axis):
+            return _scan_axis_impl(a, axis, "np.nancumsum", as_dtype(retty),
+                                   zero, False, True)
+
+        def nancumsum_impl(a, axis=None):
             out = np.empty(a.size, retty)
             c = zero
             for idx, v in enumerate(a.flat):
@@ -1588,12 +1692,69 @@ def _median_inner(temp_arry, n):
         return _select(temp_arry, half, low, high)
 
 
+@register_jitable
+def _median_lanes(b, out, start, stop, skip_nan):
+    """
+    Store in out[start:stop] the medians of the lanes start to stop of *b*
+    along its last axis.  The lanes are copied in turn into a single
+    scratch buffer which is partitioned in place.
+    """
+    temp = np.empty(b.shape[-1], b.dtype)
+    for i in range(start, stop):
+        lane = _lane(b, i)
+        n = 0
+        for j in range(lane.size):
+            v = lane[j]
+            if not (skip_nan and np.isnan(v)):
+                temp[n] = v
+                n += 1
+        if n == 0:
+            out[i] = np.nan
+        else:
+            out[i] = _median_inner(temp, n)
+
+
+def _median_out_dtype(dtype):
+    # Inexact types are kept, as in NumPy
+    if isinstance(dtype, (types.Float, types.Complex)):
+        return as_dtype(dtype)
+    return np.float64
+
+
+def _median_axis_impl(a, axis, func_name, skip_nan):
+    if not isinstance(axis, (int, types.Integer)):
+        raise TypingError("%s: axis must be an integer or None" % func_name)
+    ndim = a.ndim
+    out_dt = _median_out_dtype(a.dtype)
+
+    if ndim <= 1:
+        def median_1d_impl(a, axis=None):
+            normalize_axis(func_name, "axis", ndim, axis)
+            if skip_nan:
+                return np.nanmedian(a)
+            else:
+                return np.median(a)
+
+        return median_1d_impl
+
+    def median_axis_impl(a, axis=None):
+        axis = normalize_axis(func_name, "axis", ndim, axis)
+        b = _moveaxis_last(a, axis)
+        out = np.empty(_lanes_shape(b), out_dt)
+        _median_lanes(b, out.reshape(-1), 0, out.size, skip_nan)
+        return out
+
+    return median_axis_impl
+
+
 @overload(np.median)
-def np_median(a):
+def np_median(a, axis=None):
     if not isinstance(a, types.Array):
         return
+    if not is_nonelike(axis):
+        return _median_axis_impl(a, axis, "np.median", False)
 
-    def median_impl(a):
+    def median_impl(a, axis=None):
         # np.median() works on the flattened array, and we need a temporary
         # workspace anyway
         temp_arry = a.flatten()
@@ -1720,7 +1881,35 @@ def _collect_percentiles(a, q, check_q, factor, skip_nan):
     return out
 
 
-def _percentile_quantile_inner(a, q, skip_nan, factor, check_q):
+@register_jitable
+def _percentile_lanes(b, q, out, start, stop, skip_nan):
+    """
+    Store in out[:, start:stop] the percentiles *q* (in [0, 100]) of the
+    lanes start to stop of *b* along its last axis, using a single scratch
+    buffer.
+    """
+    temp = np.empty(b.shape[-1], np.float64)
+    for i in range(start, stop):
+        lane = _lane(b, i)
+        n = 0
+        has_nan = False
+        for j in range(lane.size):
+            v = lane[j]
+            if np.isnan(v):
+                has_nan = True
+            else:
+                temp[n] = v
+                n += 1
+        # Same rules as _can_collect_percentiles()
+        if ((has_nan and not skip_nan) or n == 0
+                or (n == 1 and not np.isfinite(temp[0]))):
+            out[:, i] = np.nan
+        else:
+            out[:, i] = _collect_percentiles_inner(temp[:n], q)
+
+
+def _percentile_quantile_inner(a, q, axis, skip_nan, factor, check_q,
+                               func_name):
     """
     The underlying algorithm to find percentiles and quantiles
     is the same, hence we converge onto the same code paths
@@ -1732,55 +1921,93 @@ def _percentile_quantile_inner(a, q, skip_nan, factor, check_q):
         # this could be supported, but would require a
         # lexicographic comparison
 
-    def np_percentile_q_scalar_impl(a, q):
+    q_scalar = (isinstance(q, (types.Number, types.Boolean)) or
+                (isinstance(q, types.Array) and q.ndim == 0))
+
+    def np_percentile_q_scalar_impl(a, q, axis=None):
         return _collect_percentiles(a, q, check_q, factor, skip_nan)[0]
 
-    def np_percentile_impl(a, q):
+    def np_percentile_impl(a, q, axis=None):
         return _collect_percentiles(a, q, check_q, factor, skip_nan)
 
-    if isinstance(q, (types.Number, types.Boolean)):
-        return np_percentile_q_scalar_impl
-    elif isinstance(q, types.Array) and q.ndim == 0:
-        return np_percentile_q_scalar_impl
-    else:
-        return np_percentile_impl
+    if is_nonelike(axis):
+        return np_percentile_q_scalar_impl if q_scalar else np_percentile_impl
+
+    if not isinstance(axis, (int, types.Integer)):
+        raise TypingError("%s: axis must be an integer or None" % func_name)
+    ndim = a.ndim if isinstance(a, types.Array) else 0
+
+    if ndim <= 1:
+        flat_impl = register_jitable(
+            np_percentile_q_scalar_impl if q_scalar else np_percentile_impl)
+
+        def np_percentile_1d_impl(a, q, axis=None):
+            normalize_axis(func_name, "axis", ndim, axis)
+            return flat_impl(a, q)
+
+        return np_percentile_1d_impl
+
+    def np_percentile_axis_impl(a, q, axis=None):
+        axis = normalize_axis(func_name, "axis", ndim, axis)
+        q = np.asarray(q, dtype=np.float64).flatten()
+        check_q(q)
+        q = q * factor
+        b = _moveaxis_last(a, axis)
+        lanes = _lanes_shape(b)
+        nlanes = 1
+        for s in lanes:
+            nlanes *= s
+        out = np.empty((len(q), nlanes), dtype=np.float64)
+        _percentile_lanes(b, q, out, 0, nlanes, skip_nan)
+        if q_scalar:
+            return out.reshape(lanes)
+        else:
+            return out.reshape((len(q),) + lanes)
+
+    return np_percentile_axis_impl
 
 
 @overload(np.percentile)
-def np_percentile(a, q):
+def np_percentile(a, q, axis=None):
     return _percentile_quantile_inner(
-        a, q, skip_nan=False, factor=1.0, check_q=percentile_is_valid
+        a, q, axis, skip_nan=False, factor=1.0, check_q=percentile_is_valid,
+        func_name="np.percentile"
     )
 
 
 @overload(np.nanpercentile)
-def np_nanpercentile(a, q):
+def np_nanpercentile(a, q, axis=None):
     return _percentile_quantile_inner(
-        a, q, skip_nan=True, factor=1.0, check_q=percentile_is_valid
+        a, q, axis, skip_nan=True, factor=1.0, check_q=percentile_is_valid,
+        func_name="np.nanpercentile"
     )
 
 
 @overload(np.quantile)
-def np_quantile(a, q):
+def np_quantile(a, q, axis=None):
     return _percentile_quantile_inner(
-        a, q, skip_nan=False, factor=100.0, check_q=quantile_is_valid
+        a, q, axis, skip_nan=False, factor=100.0, check_q=quantile_is_valid,
+        func_name="np.quantile"
     )
 
 
 @overload(np.nanquantile)
-def np_nanquantile(a, q):
+def np_nanquantile(a, q, axis=None):
     return _percentile_quantile_inner(
-        a, q, skip_nan=True, factor=100.0, check_q=quantile_is_valid
+        a, q, axis, skip_nan=True, factor=100.0, check_q=quantile_is_valid,
+        func_name="np.nanquantile"
     )
 
 
 @overload(np.nanmedian)
-def np_nanmedian(a):
+def np_nanmedian(a, axis=None):
     if not isinstance(a, types.Array):
         return
+    if not is_nonelike(axis):
+        return _median_axis_impl(a, axis, "np.nanmedian", True)
     isnan = get_isnan(a.dtype)
 
-    def nanmedian_impl(a):
+    def nanmedian_impl(a, axis=None):
         # Create a temporary workspace with only non-NaN values
         temp_arry = np.empty(a.size, a.dtype)
         n = 0
@@ -3528,40 +3755,58 @@ def np_delete(arr, obj):
         return np_delete_scalar_impl
 
 
+@register_jitable
+def _diff_lanes(b, out, start, stop, n):
+    """
+    Store in the lanes start to stop of *out* the n-th differences of the
+    same lanes of *b*, along their last axis.
+    """
+    size = b.shape[-1]
+    # A scratchpad for the lanes
+    work = np.empty(size, out.dtype)
+    for i in range(start, stop):
+        lane = _lane(b, i)
+        # First iteration: diff the lane into work
+        for j in range(size - 1):
+            work[j] = lane[j + 1] - lane[j]
+        # Other iterations: diff work into itself
+        for niter in range(1, n):
+            for j in range(size - niter - 1):
+                work[j] = work[j + 1] - work[j]
+        # Copy final diff into the output lane
+        _lane(out, i)[:] = work[:size - n]
+
+
+@register_jitable
+def _diff_shape(a, n, axis):
+    return tuple_setitem(a.shape, axis, max(a.shape[axis] - n, 0))
+
+
+@register_jitable
+def _diff_check(n):
+    if n < 0:
+        raise ValueError("diff(): order must be non-negative")
+
+
 @overload(np.diff)
-def np_diff_impl(a, n=1):
+def np_diff_impl(a, n=1, axis=-1):
     if not isinstance(a, types.Array) or a.ndim == 0:
         return
+    if not isinstance(axis, (int, types.Integer)):
+        raise TypingError("np.diff: axis must be an integer")
 
-    def diff_impl(a, n=1):
+    def diff_impl(a, n=1, axis=-1):
+        axis = normalize_axis("np.diff", "axis", a.ndim, axis)
         if n == 0:
             return a.copy()
-        if n < 0:
-            raise ValueError("diff(): order must be non-negative")
-        size = a.shape[-1]
-        out_shape = a.shape[:-1] + (max(size - n, 0),)
-        out = np.empty(out_shape, a.dtype)
+        _diff_check(n)
+        out = np.empty(_diff_shape(a, n, axis), a.dtype)
         if out.size == 0:
             return out
 
-        # np.diff() works on each last dimension subarray independently.
-        # To make things easier, normalize input and output into 2d arrays
-        a2 = a.reshape((-1, size))
-        out2 = out.reshape((-1, out.shape[-1]))
-        # A scratchpad for subarrays
-        work = np.empty(size, a.dtype)
-
-        for major in range(a2.shape[0]):
-            # First iteration: diff a2 into work
-            for i in range(size - 1):
-                work[i] = a2[major, i + 1] - a2[major, i]
-            # Other iterations: diff work into itself
-            for niter in range(1, n):
-                for i in range(size - niter - 1):
-                    work[i] = work[i + 1] - work[i]
-            # Copy final diff into out2
-            out2[major] = work[:size - n]
-
+        # np.diff() works on each lane along the axis independently
+        _diff_lanes(_moveaxis_last(a, axis), _moveaxis_last(out, axis),
+                    0, out.size // out.shape[axis], n)
         return out
 
     return diff_impl
@@ -3932,6 +4177,43 @@ def np_digitize(x, bins, right=False):
 _range = range
 
 
+@register_jitable
+def _histogram_uniform_bin(v, bins, bin_min, bin_max, bin_ratio):
+    """
+    Index of the bin of *v* among *bins* uniform bins spanning
+    [bin_min, bin_max], or -1 if *v* is out of bounds.
+    """
+    b = math.floor((v - bin_min) * bin_ratio)
+    if 0 <= b < bins:
+        return int(b)
+    elif v == bin_max:
+        return bins - 1
+    return -1
+
+
+@register_jitable
+def _histogram_bisect_bin(v, bins, nbins):
+    """
+    Index of the bin of *v* in the bin edges array *bins*, or -1 if *v*
+    is out of bounds.
+    """
+    if not bins[0] <= v <= bins[nbins]:
+        # Value is out of bounds, ignore (also catches NaNs)
+        return -1
+    # Bisect in bins[:-1]
+    lo = 0
+    hi = nbins - 1
+    while lo < hi:
+        # Note the `+ 1` is necessary to avoid an infinite
+        # loop where mid = lo => lo = mid
+        mid = (lo + hi + 1) >> 1
+        if v < bins[mid]:
+            hi = mid - 1
+        else:
+            lo = mid
+    return lo
+
+
 @overload(np.histogram)
 def np_histogram(a, bins=10, range=None):
     if isinstance(bins, (int, types.Integer)):
@@ -3966,12 +4248,10 @@ def np_histogram(a, bins=10, range=None):
                 if bin_max > bin_min:
                     bin_ratio = bins / (bin_max - bin_min)
                     for view in np.nditer(a):
-                        v = view.item()
-                        b = math.floor((v - bin_min) * bin_ratio)
-                        if 0 <= b < bins:
-                            hist[int(b)] += 1
-                        elif v == bin_max:
-                            hist[bins - 1] += 1
+                        b = _histogram_uniform_bin(view.item(), bins, bin_min,
+                                                   bin_max, bin_ratio)
+                        if b >= 0:
+                            hist[b] += 1
 
                 bins_array = np.linspace(bin_min, bin_max, bins + 1)
                 return hist, bins_array
@@ -3987,28 +4267,13 @@ def np_histogram(a, bins=10, range=None):
                     raise ValueError("histogram(): bins must increase "
                                      "monotonically")
 
-            bin_min = bins[0]
-            bin_max = bins[nbins]
             hist = np.zeros(nbins, np.intp)
 
             if nbins > 0:
                 for view in np.nditer(a):
-                    v = view.item()
-                    if not bin_min <= v <= bin_max:
-                        # Value is out of bounds, ignore (also catches NaNs)
-                        continue
-                    # Bisect in bins[:-1]
-                    lo = 0
-                    hi = nbins - 1
-                    while lo < hi:
-                        # Note the `+ 1` is necessary to avoid an infinite
-                        # loop where mid = lo => lo = mid
-                        mid = (lo + hi + 1) >> 1
-                        if v < bins[mid]:
-                            hi = mid - 1
-                        else:
-                            lo = mid
-                    hist[lo] += 1
+                    b = _histogram_bisect_bin(view.item(), bins, nbins)
+                    if b >= 0:
+                        hist[b] += 1
 
             return hist, bins
 
@@ -4325,14 +4590,20 @@ def np_asarray(a, dtype=None):
                 "asarray support for List is limited "
                 "to Boolean and Number types")
 
-        target_dtype = a.dtype if is_nonelike(dtype) else dtype
+        if is_nonelike(dtype) or a.dtype == dtype.dtype:
+            from numba.typed.listobject import _as_array
 
-        def impl(a, dtype=None):
-            l = len(a)
-            ret = np.empty(l, dtype=target_dtype)
-            for i, v in enumerate(a):
-                ret[i] = v
-            return ret
+            # A copy of the items of the list in one go, a view would only be
+            # valid until the next resize of the list, see List.view().
+            def impl(a, dtype=None):
+                return _as_array(a).copy()
+        else:
+            def impl(a, dtype=None):
+                l = len(a)
+                ret = np.empty(l, dtype=dtype)
+                for i, v in enumerate(a):
+                    ret[i] = v
+                return ret
     elif isinstance(a, types.StringLiteral):
         arr = np.asarray(a.literal_value)
 
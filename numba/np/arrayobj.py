@@ -30,7 +30,7 @@ from numba.core.typing import signature
 from numba.core.types import StringLiteral
 from numba.core.extending import (register_jitable, overload, overload_method,
                                   intrinsic, overload_attribute)
-from numba.misc import quicksort, mergesort
+from numba.misc import quicksort, mergesort, radixsort
 from numba.cpython import slicing
 from numba.cpython.unsafe.tuple import tuple_setitem, build_full_slice_tuple
 from numba.core.extending import overload_classmethod
@@ -6373,11 +6373,26 @@ def default_lt(a, b):
     return a < b
 
 
-def get_sort_func(kind, lt_impl, is_argsort=False):
+def resolve_sort_kind(kind, dtype):
     """
-    Get a sort implementation of the given kind.
+    Get the kind of sort implementation used for the numpy sort *kind* on
+    arrays of *dtype*.
+    """
+    if kind == 'stable':
+        if isinstance(dtype, (types.Integer, types.Boolean)):
+            return 'radix'
+        return 'mergesort'
+    return kind
+
+
+def get_sort_func(kind, lt_impl, is_argsort=False, dtype=None):
+    """
+    Get a sort implementation of the given kind.  The radix sort also needs
+    the *dtype* of the keys.
     """
     key = kind, lt_impl.__name__, is_argsort
+    if kind == 'radix':
+        key += (dtype,)
 
     try:
         return _sorts[key]
@@ -6393,6 +6408,11 @@ def get_sort_func(kind, lt_impl, is_argsort=False):
                 lt=lt_impl,
                 is_argsort=is_argsort)
             func = sort.run_mergesort
+        elif kind == 'radix':
+            sort = radixsort.make_jit_radixsort(
+                dtype,
+                is_argsort=is_argsort)
+            func = sort.run_radixsort
         _sorts[key] = func
         return func
 
@@ -6407,28 +6427,63 @@ def lt_implementation(dtype):
 
 
 @lower_builtin("array.sort", types.Array)
+@lower_builtin("array.sort", types.Array, types.StringLiteral)
 def array_sort(context, builder, sig, args):
     arytype = sig.args[0]
+    kind = sig.args[1].literal_value if len(sig.args) > 1 else 'quicksort'
+    kind = resolve_sort_kind(kind, arytype.dtype)
 
-    sort_func = get_sort_func(kind='quicksort',
-                              lt_impl=lt_implementation(arytype.dtype))
+    sort_func = get_sort_func(kind=kind,
+                              lt_impl=lt_implementation(arytype.dtype),
+                              dtype=arytype.dtype)
 
-    def array_sort_impl(arr):
-        # Note we clobber the return value
-        sort_func(arr)
+    if kind == 'mergesort':
+        def array_sort_impl(arr):
+            # The mergesort only handles one-dimensional arrays
+            if arr.ndim == 1:
+                sort_func(arr)
+            else:
+                for idx in np.ndindex(arr.shape[:-1]):
+                    sort_func(arr[idx])
+    else:
+        def array_sort_impl(arr):
+            # Note we clobber the return value
+            sort_func(arr)
 
-    return context.compile_internal(builder, array_sort_impl, sig, args)
+    innersig = sig.replace(args=sig.args[:1])
+    innerargs = args[:1]
+    return context.compile_internal(builder, array_sort_impl,
+                                    innersig, innerargs)
+
+
+@register_jitable
+def _check_sort_axis(a, axis):
+    # Only sorting along the last axis or the flattened array is supported
+    if axis is not None and axis != -1 and axis != a.ndim - 1:
+        raise ValueError("np.sort() only supports sorting along the last "
+                         "axis or the flattened array")
 
 
-@overload(np.sort)
-def impl_np_sort(a):
+@overload(np.sort, prefer_literal=True)
+def impl_np_sort(a, axis=-1, kind=None):
     if not type_can_asarray(a):
         raise errors.TypingError('Argument "a" must '
                                  'be array-like')
-
-    def np_sort_impl(a):
-        res = a.copy()
-        res.sort()
+    flatten = is_nonelike(axis)
+    if not (flatten or axis == -1 or isinstance(axis, types.Integer)):
+        raise errors.TypingError('"axis" must be an integer or None')
+    default_kind = is_nonelike(kind)
+
+    def np_sort_impl(a, axis=-1, kind=None):
+        if flatten:
+            res = a.flatten()
+        else:
+            _check_sort_axis(a, axis)
+            res = a.copy()
+        if default_kind:
+            res.sort()
+        else:
+            res.sort(kind=kind)
         return res
     return np_sort_impl
 
@@ -6438,9 +6493,11 @@ def impl_np_sort(a):
 def array_argsort(context, builder, sig, args):
     arytype, kind = sig.args
 
-    sort_func = get_sort_func(kind=kind.literal_value,
+    sort_func = get_sort_func(kind=resolve_sort_kind(kind.literal_value,
+                                                     arytype.dtype),
                               lt_impl=lt_implementation(arytype.dtype),
-                              is_argsort=True)
+                              is_argsort=True,
+                              dtype=arytype.dtype)
 
     def array_argsort_impl(arr):
         return sort_func(arr)
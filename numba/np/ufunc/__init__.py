@@ -6,7 +6,9 @@ from numba.np.ufunc import _internal, array_exprs
 from numba.np.ufunc.parallel import (threading_layer, get_num_threads,
                                      set_num_threads, get_thread_id,
                                      set_parallel_chunksize,
-                                     get_parallel_chunksize)
+                                     get_parallel_chunksize,
+                                     set_parallel_schedule,
+                                     get_parallel_schedule)
 
 
 if hasattr(_internal, 'PyUFunc_ReorderableNone'):
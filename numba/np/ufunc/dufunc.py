@@ -14,8 +14,8 @@ from numba.core.typing.templates import AbstractTemplate, signature
 from numba.cpython.unsafe.tuple import tuple_setitem
 from numba.np.ufunc import _internal
 from numba.np.ufunc.ufunc_base import UfuncBase, UfuncLowererBase
-from numba.parfors import array_analysis
 from numba.np.ufunc import ufuncbuilder
+from numba.np.ufunc.wrappers import UfuncWrapperCache
 from numba.np import numpy_support
 from typing import Callable
 from llvmlite import ir
@@ -347,8 +347,9 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
             self._dispatcher, self.targetoptions, sig)
         actual_sig = ufuncbuilder._finalize_ufunc_signature(
             cres, argtys, return_type)
+        cache = self._dispatcher.library_cache(UfuncWrapperCache)
         dtypenums, ptr, env = ufuncbuilder._build_element_wise_ufunc_wrapper(
-            cres, actual_sig)
+            cres, actual_sig, cache=cache)
         self._add_loop(int(ptr), dtypenums)
         self._keepalive.append((ptr, cres.library, env))
         self._lower_me.libs.append(cres.library)
@@ -865,5 +866,3 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
         outtys.extend(argtys)
         return signature(*outtys)
 
-
-array_analysis.MAP_TYPES.append(DUFunc)
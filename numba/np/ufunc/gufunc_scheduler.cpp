@@ -10,8 +10,17 @@
 #include <iostream>
 #include <stdio.h>
 #include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
 #include "gufunc_scheduler.h"
 
+#if defined(_WIN32)
+#include <windows.h>
+#elif defined(__linux__)
+#include <pthread.h>
+#include <sched.h>
+#endif
+
 #ifdef _MSC_VER
 #define THREAD_LOCAL(ty) __declspec(thread) ty
 #else
@@ -22,6 +31,18 @@
 // Default 0 value means one evenly-sized chunk of work per worker thread.
 static THREAD_LOCAL(uintp) parallel_chunksize = 0;
 
+// How the chunks are handed out to the threads, one of the SCHEDULE_* kinds.
+static THREAD_LOCAL(uintp) parallel_schedule = SCHEDULE_STATIC;
+
+// Without a chunksize, the dynamic schedules split the work in this many
+// chunks per thread.
+#define DYNAMIC_CHUNKS_PER_THREAD 16
+
+// The CPUs the pool threads are pinned to, in thread order.  No pinning is
+// done while this is empty, see set_thread_affinity().
+static int *affinity_cpus = NULL;
+static int affinity_count = 0;
+
 // round not available on VS2010.
 double guround (double number) {
 	return number < 0.0 ? ceil(number - 0.5) : floor(number + 0.5);
@@ -110,13 +131,71 @@ extern "C" uintp get_parallel_chunksize() {
     return parallel_chunksize;
 }
 
+extern "C" uintp set_parallel_schedule(uintp kind) {
+    uintp orig = parallel_schedule;
+    parallel_schedule = kind;
+    return orig;
+}
+
+extern "C" uintp get_parallel_schedule() {
+    return parallel_schedule;
+}
+
+extern "C" void set_thread_affinity(int *cpus, int count) {
+    int *copy = NULL;
+    if (count > 0) {
+        copy = (int*)malloc(count * sizeof(int));
+        memcpy(copy, cpus, count * sizeof(int));
+    }
+    free(affinity_cpus);
+    affinity_cpus = copy;
+    affinity_count = copy ? count : 0;
+}
+
+extern "C" int get_thread_affinity_count() {
+    return affinity_count;
+}
+
+extern "C" int pin_current_thread(int index) {
+    if (affinity_count == 0 || index < 0) {
+        return 0;
+    }
+    int cpu = affinity_cpus[index % affinity_count];
+#if defined(_WIN32)
+    if (cpu >= (int)(8 * sizeof(DWORD_PTR))) {
+        return 0;
+    }
+    return SetThreadAffinityMask(GetCurrentThread(),
+                                 (DWORD_PTR)1 << cpu) != 0;
+#elif defined(__linux__)
+    if (cpu >= CPU_SETSIZE) {
+        return 0;
+    }
+    cpu_set_t cpuset;
+    CPU_ZERO(&cpuset);
+    CPU_SET(cpu, &cpuset);
+    return pthread_setaffinity_np(pthread_self(), sizeof(cpuset), &cpuset) == 0;
+#else
+    // No portable way to pin a thread, e.g. on macOS
+    return 0;
+#endif
+}
+
 extern "C" uintp get_sched_size(uintp num_threads, uintp num_dim, intp *starts, intp *ends) {
-    if (parallel_chunksize == 0) {
+    if (parallel_chunksize == 0 && parallel_schedule == SCHEDULE_STATIC) {
         return num_threads;
     }
     RangeActual ra(num_dim, starts, ends);
     uintp total_work_size = ra.total_size();
-    uintp num_divisions = total_work_size / parallel_chunksize;
+    uintp chunksize = parallel_chunksize;
+    if (chunksize == 0) {
+        // Dynamic schedules need more chunks than threads to balance the work
+        chunksize = total_work_size / (num_threads * DYNAMIC_CHUNKS_PER_THREAD);
+        if (chunksize == 0) {
+            chunksize = 1;
+        }
+    }
+    uintp num_divisions = total_work_size / chunksize;
     return num_divisions < num_threads ? num_threads : num_divisions;
 }
 
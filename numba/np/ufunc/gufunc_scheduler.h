@@ -33,6 +33,11 @@
     #define uintp unsigned
 #endif
 
+/* Schedule kinds, see set_parallel_schedule() */
+#define SCHEDULE_STATIC 0
+#define SCHEDULE_DYNAMIC 1
+#define SCHEDULE_GUIDED 2
+
 #ifdef __cplusplus
 extern "C"
 {
@@ -42,6 +47,15 @@ void do_scheduling_signed(uintp num_dim, intp *starts, intp *ends, uintp num_thr
 void do_scheduling_unsigned(uintp num_dim, intp *starts, intp *ends, uintp num_threads, uintp *sched, intp debug);
 uintp set_parallel_chunksize(uintp);
 uintp get_parallel_chunksize(void);
+uintp set_parallel_schedule(uintp);
+uintp get_parallel_schedule(void);
+/* Thread pinning: set_thread_affinity() records the CPUs, pin_current_thread()
+ * pins the calling thread to the CPU for a thread index and returns whether it
+ * did.
+ */
+void set_thread_affinity(int *cpus, int count);
+int get_thread_affinity_count(void);
+int pin_current_thread(int index);
 uintp get_sched_size(uintp num_threads, uintp num_dim, intp *starts, intp *ends);
 intp * allocate_sched(uintp sched_size);
 void deallocate_sched(intp * sched);
@@ -57,6 +57,9 @@ static int _INIT_NUM_THREADS = -1;
 // This is the per-thread thread mask, each thread can carry its own mask.
 static THREAD_LOCAL(int) _TLS_num_threads = 0;
 
+// Whether this thread has been pinned to its CPU, see set_thread_affinity()
+static THREAD_LOCAL(bool) _TLS_pinned = false;
+
 static void
 set_num_threads(int count)
 {
@@ -92,8 +95,9 @@ add_task(void *fn, void *args, void *dims, void *steps, void *data)
 }
 
 static void
-parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *data,
-             size_t inner_ndim, size_t array_count, int num_threads)
+parallel_for_sched(void *fn, char **args, size_t *dimensions, size_t *steps,
+                   void *data, size_t inner_ndim, size_t array_count,
+                   int num_threads, int schedule)
 {
     typedef void (*func_ptr_t)(char **args, size_t *dims, size_t *steps, void *data);
     func_ptr_t func = reinterpret_cast<func_ptr_t>(fn);
@@ -164,8 +168,16 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
         // tell the active thread team about the number of threads
         set_num_threads(agreed_nthreads);
 
-        #pragma omp for
-        for(ptrdiff_t r = 0; r < size; r++)
+        // Pin the workers of the outermost team, the calling thread is left
+        // alone.  OpenMP reuses the same threads from one region to the next.
+        if (!_TLS_pinned && omp_get_level() == 1 && omp_get_thread_num() > 0
+            && get_thread_affinity_count() > 0)
+        {
+            pin_current_thread(omp_get_thread_num() - 1);
+            _TLS_pinned = true;
+        }
+
+        auto run_iteration = [&](ptrdiff_t r)
         {
             memcpy(count_space, dimensions, arg_len * sizeof(size_t));
             count_space[0] = 1;
@@ -203,10 +215,40 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
                 printf("\n");
             }
             func(array_arg_space, count_space, steps, data);
+        };
+
+        // The schedule clause can't take a variable kind
+        if (schedule == SCHEDULE_DYNAMIC)
+        {
+            #pragma omp for schedule(dynamic)
+            for(ptrdiff_t r = 0; r < size; r++)
+                run_iteration(r);
+        }
+        else if (schedule == SCHEDULE_GUIDED)
+        {
+            #pragma omp for schedule(guided)
+            for(ptrdiff_t r = 0; r < size; r++)
+                run_iteration(r);
+        }
+        else
+        {
+            // A static schedule gives each thread the same iterations on
+            // every call, which keeps them on the memory they first touched
+            #pragma omp for schedule(static)
+            for(ptrdiff_t r = 0; r < size; r++)
+                run_iteration(r);
         }
     }
 }
 
+static void
+parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *data,
+             size_t inner_ndim, size_t array_count, int num_threads)
+{
+    parallel_for_sched(fn, args, dimensions, steps, data, inner_ndim,
+                       array_count, num_threads, SCHEDULE_STATIC);
+}
+
 static void launch_threads(int count)
 {
     // this must be called in a fork+thread safe region from Python
@@ -249,6 +291,7 @@ MOD_INIT(omppool)
     SetAttrStringFromVoidPointer(m, ready);
     SetAttrStringFromVoidPointer(m, add_task);
     SetAttrStringFromVoidPointer(m, parallel_for);
+    SetAttrStringFromVoidPointer(m, parallel_for_sched);
     SetAttrStringFromVoidPointer(m, do_scheduling_signed);
     SetAttrStringFromVoidPointer(m, do_scheduling_unsigned);
     SetAttrStringFromVoidPointer(m, set_num_threads);
@@ -256,6 +299,9 @@ MOD_INIT(omppool)
     SetAttrStringFromVoidPointer(m, get_thread_id);
     SetAttrStringFromVoidPointer(m, set_parallel_chunksize);
     SetAttrStringFromVoidPointer(m, get_parallel_chunksize);
+    SetAttrStringFromVoidPointer(m, set_parallel_schedule);
+    SetAttrStringFromVoidPointer(m, get_parallel_schedule);
+    SetAttrStringFromVoidPointer(m, set_thread_affinity);
     SetAttrStringFromVoidPointer(m, get_sched_size);
     SetAttrStringFromVoidPointer(m, allocate_sched);
     SetAttrStringFromVoidPointer(m, deallocate_sched);
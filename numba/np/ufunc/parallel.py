@@ -10,6 +10,8 @@ UFuncCore also defines a work-stealing mechanism that allows idle threads
 to steal works from other threads.
 """
 
+import glob
+import itertools
 import os
 import sys
 import warnings
@@ -24,9 +26,10 @@ from llvmlite import ir
 from numba.np.numpy_support import as_dtype
 from numba.core import types, cgutils, config, errors
 from numba.core.typing import signature
+from numba.core.caching import make_library_cache
 from numba.np.ufunc.wrappers import _wrapper_info
 from numba.np.ufunc import ufuncbuilder
-from numba.extending import overload, intrinsic
+from numba.extending import overload, intrinsic, register_jitable
 
 _IS_OSX = sys.platform.startswith('darwin')
 _IS_LINUX = sys.platform.startswith('linux')
@@ -46,7 +49,34 @@ def get_thread_count():
 NUM_THREADS = get_thread_count()
 
 
-def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
+# The schedule kinds of parallel regions, indexed by their value in
+# gufunc_scheduler.h
+_SCHEDULE_KINDS = ('static', 'dynamic', 'guided')
+
+
+ParallelWrapperCache = make_library_cache('parallel')
+
+
+def _cached_kernel_name(cres):
+    # The name must be known before loading a cached kernel, so unlike in
+    # the uncached case it can't depend on the environment object's address
+    return ".kernel.{}".format(cres.fndesc.mangled_name)
+
+
+def _load_gufunc_kernel(cache, cres, sig):
+    """Load the parallel dispatcher built by build_gufunc_kernel() for the
+    compilation result *cres* from the library *cache*.  Returns None if it
+    is not cached.
+    """
+    wrapperlib = cache.load_overload(sig, cres.target_context)
+    if wrapperlib is None:
+        return None
+    return _wrapper_info(library=wrapperlib, name=_cached_kernel_name(cres),
+                         env=cres.environment)
+
+
+def build_gufunc_kernel(library, ctx, info, sig, inner_ndim, cache=None,
+                        cres=None, is_parfors=False):
     """Wrap the original CPU ufunc/gufunc with a parallel dispatcher.
     This function will wrap gufuncs and ufuncs something like.
 
@@ -65,6 +95,15 @@ def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
         inner dimension of the gufunc (this is len(sig.args) in the case of a
         ufunc)
 
+    cache
+        optional library cache the wrapper is saved to, see
+        _load_gufunc_kernel(); *cres* is then the compilation result of the
+        kernel
+
+    is_parfors
+        whether the kernel runs a parfor, its outer dimension is then
+        scheduled as set by set_parallel_schedule()
+
     Returns
     -------
     wrapper_info : (library, env, name)
@@ -109,7 +148,11 @@ def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
                                            byte_ptr_t])
     wrapperlib = ctx.codegen().create_library('parallelgufuncwrapper')
     mod = wrapperlib.create_ir_module('parallel.gufunc.wrapper')
-    kernel_name = ".kernel.{}_{}".format(id(info.env), info.name)
+    if cache is None:
+        kernel_name = ".kernel.{}_{}".format(id(info.env), info.name)
+    else:
+        wrapperlib.enable_object_caching()
+        kernel_name = _cached_kernel_name(cres)
     lfunc = ir.Function(mod, fnty, name=kernel_name)
 
     bb_entry = lfunc.append_basic_block('')
@@ -137,10 +180,16 @@ def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
     if not isinstance(sig.return_type, types.NoneType):
         array_count += 1
 
-    parallel_for_ty = ir.FunctionType(ir.VoidType(),
-                                      [byte_ptr_t] * 5 + [intp_t, ] * 3)
-    parallel_for = cgutils.get_or_insert_function(mod, parallel_for_ty,
-                                                  'numba_parallel_for')
+    if is_parfors:
+        parallel_for_ty = ir.FunctionType(ir.VoidType(),
+                                          [byte_ptr_t] * 5 + [intp_t, ] * 4)
+        parallel_for = cgutils.get_or_insert_function(
+            mod, parallel_for_ty, 'numba_parallel_for_sched')
+    else:
+        parallel_for_ty = ir.FunctionType(ir.VoidType(),
+                                          [byte_ptr_t] * 5 + [intp_t, ] * 3)
+        parallel_for = cgutils.get_or_insert_function(mod, parallel_for_ty,
+                                                      'numba_parallel_for')
 
     # Reference inner-function and link
     innerfunc_fnty = ir.FunctionType(
@@ -162,8 +211,19 @@ def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
     fnptr = builder.bitcast(tmp_voidptr, byte_ptr_t)
     innerargs = [as_void_ptr(x) for x
                  in [args, dimensions, steps, data]]
-    builder.call(parallel_for, [fnptr] + innerargs +
-                 [intp_t(x) for x in (inner_ndim, array_count)] + [num_threads])
+    callargs = ([fnptr] + innerargs +
+                [intp_t(x) for x in (inner_ndim, array_count)] + [num_threads])
+    if is_parfors:
+        # Take the schedule requested for this region, any nested region
+        # gets the static schedule unless it asks otherwise.
+        set_schedule = cgutils.get_or_insert_function(
+            builder.module, ir.FunctionType(intp_t, [intp_t]),
+            "set_parallel_schedule")
+        schedule = builder.call(set_schedule, [intp_t(0)])
+        builder.call(parallel_for, callargs + [schedule])
+        builder.call(set_schedule, [schedule])
+    else:
+        builder.call(parallel_for, callargs)
 
     # Release the GIL
     pyapi.restore_thread(thread_state)
@@ -173,6 +233,8 @@ def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
 
     wrapperlib.add_ir_module(mod)
     wrapperlib.add_linking_library(library)
+    if cache is not None:
+        cache.save_overload(sig, wrapperlib)
     return _wrapper_info(library=wrapperlib, name=lfunc.name, env=info.env)
 
 
@@ -188,7 +250,9 @@ class ParallelUFuncBuilder(ufuncbuilder.UFuncBuilder):
         library = cres.library
         fname = cres.fndesc.llvm_func_name
 
-        info = build_ufunc_wrapper(library, ctx, fname, signature, cres)
+        cache = self.nb_func.library_cache(ParallelWrapperCache)
+        info = build_ufunc_wrapper(library, ctx, fname, signature, cres,
+                                   cache=cache)
         ptr = info.library.get_pointer_to_function(info.name)
         # Get dtypes
         dtypenums = [np.dtype(a.name).num for a in signature.args]
@@ -197,12 +261,17 @@ class ParallelUFuncBuilder(ufuncbuilder.UFuncBuilder):
         return dtypenums, ptr, keepalive
 
 
-def build_ufunc_wrapper(library, ctx, fname, signature, cres):
+def build_ufunc_wrapper(library, ctx, fname, signature, cres, cache=None):
+    if cache is not None:
+        # The inner wrapper is linked into the cached parallel dispatcher
+        info = _load_gufunc_kernel(cache, cres, signature)
+        if info is not None:
+            return info
     innerfunc = ufuncbuilder.build_ufunc_wrapper(library, ctx, fname,
                                                  signature, objmode=False,
                                                  cres=cres)
     info = build_gufunc_kernel(library, ctx, innerfunc, signature,
-                               len(signature.args))
+                               len(signature.args), cache=cache, cres=cres)
     return info
 
 # ---------------------------------------------------------------------------
@@ -261,6 +330,13 @@ def build_gufunc_wrapper(py_func, cres, sin, sout, cache, is_parfors):
     library = cres.library
     ctx = cres.target_context
     signature = cres.signature
+    # Parfors kernels are cached along with the function they belong to
+    kernel_cache = (ParallelWrapperCache(py_func)
+                    if cache and not is_parfors else None)
+    if kernel_cache is not None:
+        info = _load_gufunc_kernel(kernel_cache, cres, signature)
+        if info is not None:
+            return info
     innerinfo = ufuncbuilder.build_gufunc_wrapper(
         py_func, cres, sin, sout, cache=cache, is_parfors=is_parfors,
     )
@@ -270,6 +346,7 @@ def build_gufunc_wrapper(py_func, cres, sin, sout, cache, is_parfors):
 
     info = build_gufunc_kernel(
         library, ctx, innerinfo, signature, inner_ndim,
+        cache=kernel_cache, cres=cres, is_parfors=is_parfors,
     )
     return info
 
@@ -376,6 +453,65 @@ def _check_tbb_version_compatible():
         raise ImportError("Problem with TBB. Reason: %s" % e)
 
 
+def _parse_cpu_list(cpulist):
+    """
+    Parse a list of CPU ranges such as ``"0-3,8"``, the format used by
+    NUMBA_THREAD_AFFINITY and by Linux in ``/sys``.
+    """
+    cpus = []
+    for part in cpulist.strip().split(','):
+        if part:
+            first, _, last = part.partition('-')
+            cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def _numa_nodes():
+    """
+    Get the CPUs of each NUMA node, an empty list where this is unknown.
+    """
+    paths = glob.glob('/sys/devices/system/node/node[0-9]*/cpulist')
+    paths.sort(key=lambda path: int(path.split('/')[-2][len('node'):]))
+    nodes = []
+    for path in paths:
+        with open(path) as f:
+            nodes.append(_parse_cpu_list(f.read()))
+    return nodes
+
+
+def _thread_affinity_cpus(affinity, count, available=None, nodes=None):
+    """
+    Get the CPUs the *count* threads of the pool are pinned to, in thread
+    order, for the NUMBA_THREAD_AFFINITY policy *affinity*.  An empty list
+    means no pinning.
+
+    *available* are the CPUs the process may use and *nodes* the CPUs of each
+    NUMA node, they are queried from the system if not given.
+    """
+    if not affinity:
+        return []
+    if available is None:
+        try:
+            available = sorted(os.sched_getaffinity(0))
+        except AttributeError:
+            available = list(range(os.cpu_count() or 1))
+    if affinity == 'compact':
+        cpus = available
+    elif affinity == 'scatter':
+        if nodes is None:
+            nodes = _numa_nodes()
+        usable = set(available)
+        nodes = [[cpu for cpu in node if cpu in usable] for node in nodes]
+        nodes = [node for node in nodes if node] or [available]
+        # Deal the CPUs of the nodes in turn, consecutive threads are on
+        # different nodes
+        cpus = [cpu for cpus in itertools.zip_longest(*nodes)
+                for cpu in cpus if cpu is not None]
+    else:
+        cpus = _parse_cpu_list(affinity)
+    return [cpus[i % len(cpus)] for i in range(count)]
+
+
 def _launch_threads():
     if not _backend_init_process_lock:
         _set_init_process_lock()
@@ -473,13 +609,15 @@ def _launch_threads():
                 available = ['tbb']
                 requirements.append('TBB')
                 if t == "safe":
-                    # "safe" is TBB, which is fork and threadsafe everywhere
-                    pass
+                    # "safe" is TBB, which is fork and threadsafe everywhere,
+                    # workqueue is too but has the lowest performance
+                    available.append('workqueue')
                 elif t == "threadsafe":
                     if _IS_OSX:
                         requirements.append('OSX_OMP')
-                    # omp is threadsafe everywhere
+                    # omp is threadsafe everywhere, as is workqueue
                     available.append('omp')
+                    available.append('workqueue')
                 elif t == "forksafe":
                     # everywhere apart from linux (GNU OpenMP) has a guaranteed
                     # forksafe OpenMP, as OpenMP has better performance, prefer
@@ -513,11 +651,18 @@ def _launch_threads():
                 raise_with_hint(requirements)
 
             ll.add_symbol('numba_parallel_for', lib.parallel_for)
+            ll.add_symbol('numba_parallel_for_sched', lib.parallel_for_sched)
             ll.add_symbol('do_scheduling_signed', lib.do_scheduling_signed)
             ll.add_symbol('do_scheduling_unsigned', lib.do_scheduling_unsigned)
             ll.add_symbol('allocate_sched', lib.allocate_sched)
             ll.add_symbol('deallocate_sched', lib.deallocate_sched)
 
+            cpus = _thread_affinity_cpus(config.THREAD_AFFINITY, NUM_THREADS)
+            if cpus:
+                set_thread_affinity = CFUNCTYPE(None, POINTER(c_int), c_int)(
+                    lib.set_thread_affinity)
+                set_thread_affinity((c_int * len(cpus))(*cpus), len(cpus))
+
             launch_threads = CFUNCTYPE(None, c_int)(lib.launch_threads)
             launch_threads(NUM_THREADS)
 
@@ -553,6 +698,13 @@ def _load_threading_functions(lib):
                                         c_uint)(lib.set_parallel_chunksize)
     global _get_parallel_chunksize
     _get_parallel_chunksize = CFUNCTYPE(c_uint)(lib.get_parallel_chunksize)
+    ll.add_symbol('set_parallel_schedule', lib.set_parallel_schedule)
+    ll.add_symbol('get_parallel_schedule', lib.get_parallel_schedule)
+    global _set_parallel_schedule
+    _set_parallel_schedule = CFUNCTYPE(c_uint,
+                                       c_uint)(lib.set_parallel_schedule)
+    global _get_parallel_schedule
+    _get_parallel_schedule = CFUNCTYPE(c_uint)(lib.get_parallel_schedule)
     global _get_sched_size
     _get_sched_size = CFUNCTYPE(c_uint,
                                 c_uint,
@@ -759,3 +911,50 @@ def ol_get_parallel_chunksize():
     def impl():
         return _get_parallel_chunksize()
     return impl
+
+
+@register_jitable
+def _schedule_index(kind):
+    if kind == 'static':
+        return 0
+    elif kind == 'dynamic':
+        return 1
+    elif kind == 'guided':
+        return 2
+    raise ValueError("schedule must be one of 'static', 'dynamic' or "
+                     "'guided'")
+
+
+def set_parallel_schedule(kind):
+    _launch_threads()
+    if not isinstance(kind, str):
+        raise TypeError("The parallel schedule must be a string")
+    global _set_parallel_schedule
+    return _SCHEDULE_KINDS[_set_parallel_schedule(_schedule_index(kind))]
+
+
+def get_parallel_schedule():
+    _launch_threads()
+    global _get_parallel_schedule
+    return _SCHEDULE_KINDS[_get_parallel_schedule()]
+
+
+@overload(set_parallel_schedule)
+def ol_set_parallel_schedule(kind):
+    _launch_threads()
+    if not isinstance(kind, types.UnicodeType):
+        msg = "The parallel schedule must be a string"
+        raise errors.TypingError(msg)
+
+    def impl(kind):
+        return _SCHEDULE_KINDS[_set_parallel_schedule(_schedule_index(kind))]
+    return impl
+
+
+@overload(get_parallel_schedule)
+def ol_get_parallel_schedule():
+    _launch_threads()
+
+    def impl():
+        return _SCHEDULE_KINDS[_get_parallel_schedule()]
+    return impl
@@ -95,8 +95,19 @@ public:
     }
 };
 
+// Whether this thread has been pinned to its CPU, see set_thread_affinity()
+static THREAD_LOCAL(bool) _TLS_pinned = false;
+
 void fix_tls_observer::on_scheduler_entry(bool worker) {
     set_num_threads(mask_val);
+    // Pin the worker threads the first time they join an arena, the calling
+    // thread is left alone.  Slot 0 is reserved for the calling thread.
+    if (worker && !_TLS_pinned && get_thread_affinity_count() > 0)
+    {
+        int slot = tbb::this_task_arena::current_thread_index();
+        pin_current_thread(slot > 0 ? slot - 1 : slot);
+        _TLS_pinned = true;
+    }
 }
 
 static void
@@ -110,8 +121,9 @@ add_task(void *fn, void *args, void *dims, void *steps, void *data)
 }
 
 static void
-parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *data,
-             size_t inner_ndim, size_t array_count, int num_threads)
+parallel_for_sched(void *fn, char **args, size_t *dimensions, size_t *steps,
+                   void *data, size_t inner_ndim, size_t array_count,
+                   int num_threads, int schedule)
 {
     static bool printed = false;
     if(!printed && _DEBUG)
@@ -158,53 +170,80 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
     tbb::task_arena limited(num_threads);
     fix_tls_observer observer(limited, num_threads);
 
-    limited.execute([&]{
-        using range_t = tbb::blocked_range<size_t>;
-        tbb::parallel_for(range_t(0, dimensions[0]), [=](const range_t &range)
+    using range_t = tbb::blocked_range<size_t>;
+    auto run_range = [=](const range_t &range)
+    {
+        size_t * count_space = (size_t *)alloca(sizeof(size_t) * arg_len);
+        char ** array_arg_space = (char**)alloca(sizeof(char*) * array_count);
+        memcpy(count_space, dimensions, arg_len * sizeof(size_t));
+        count_space[0] = range.size();
+
+        if(_DEBUG && _TRACE_SPLIT > 1)
+        {
+            printf("THREAD %p:", count_space);
+            printf("count_space: ");
+            for(size_t j = 0; j < arg_len; j++)
+                printf("%lu, ", count_space[j]);
+            printf("\n");
+        }
+        for(size_t j = 0; j < array_count; j++)
         {
-            size_t * count_space = (size_t *)alloca(sizeof(size_t) * arg_len);
-            char ** array_arg_space = (char**)alloca(sizeof(char*) * array_count);
-            memcpy(count_space, dimensions, arg_len * sizeof(size_t));
-            count_space[0] = range.size();
+            char * base = args[j];
+            size_t step = steps[j];
+            ptrdiff_t offset = step * range.begin();
+            array_arg_space[j] = base + offset;
 
-            if(_DEBUG && _TRACE_SPLIT > 1)
+            if(_DEBUG && _TRACE_SPLIT > 2)
             {
-                printf("THREAD %p:", count_space);
-                printf("count_space: ");
-                for(size_t j = 0; j < arg_len; j++)
-                    printf("%lu, ", count_space[j]);
-                printf("\n");
+                printf("Index %ld\n", j);
+                printf("-->Got base %p\n", (void *)base);
+                printf("-->Got step %lu\n", step);
+                printf("-->Got offset %ld\n", offset);
+                printf("-->Got addr %p\n", (void *)array_arg_space[j]);
             }
+        }
+
+        if(_DEBUG && _TRACE_SPLIT > 2)
+        {
+            printf("array_arg_space: ");
             for(size_t j = 0; j < array_count; j++)
-            {
-                char * base = args[j];
-                size_t step = steps[j];
-                ptrdiff_t offset = step * range.begin();
-                array_arg_space[j] = base + offset;
-
-                if(_DEBUG && _TRACE_SPLIT > 2)
-                {
-                    printf("Index %ld\n", j);
-                    printf("-->Got base %p\n", (void *)base);
-                    printf("-->Got step %lu\n", step);
-                    printf("-->Got offset %ld\n", offset);
-                    printf("-->Got addr %p\n", (void *)array_arg_space[j]);
-                }
-            }
+                printf("%p, ", (void *)array_arg_space[j]);
+            printf("\n");
+        }
+        auto func = reinterpret_cast<void (*)(char **args, size_t *dims, size_t *steps, void *data)>(fn);
+        func(array_arg_space, count_space, steps, data);
+    };
 
-            if(_DEBUG && _TRACE_SPLIT > 2)
-            {
-                printf("array_arg_space: ");
-                for(size_t j = 0; j < array_count; j++)
-                    printf("%p, ", (void *)array_arg_space[j]);
-                printf("\n");
-            }
-            auto func = reinterpret_cast<void (*)(char **args, size_t *dims, size_t *steps, void *data)>(fn);
-            func(array_arg_space, count_space, steps, data);
-        });
+    limited.execute([&]{
+        range_t range(0, dimensions[0]);
+        if (schedule == SCHEDULE_DYNAMIC)
+        {
+            // Every iteration is a task of its own
+            tbb::parallel_for(range, run_range, tbb::simple_partitioner());
+        }
+        else if (schedule == SCHEDULE_STATIC && get_thread_affinity_count() > 0)
+        {
+            // With pinned threads, split the range evenly and deterministically
+            // so each thread works on the memory it first touched
+            tbb::parallel_for(range, run_range, tbb::static_partitioner());
+        }
+        else
+        {
+            // The default partitioner already balances the load like a guided
+            // schedule does
+            tbb::parallel_for(range, run_range);
+        }
     });
 }
 
+static void
+parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *data,
+             size_t inner_ndim, size_t array_count, int num_threads)
+{
+    parallel_for_sched(fn, args, dimensions, steps, data, inner_ndim,
+                       array_count, num_threads, SCHEDULE_STATIC);
+}
+
 static std::thread::id init_thread_id;
 static THREAD_LOCAL(bool) need_reinit_after_fork = false;
 
@@ -334,6 +373,7 @@ MOD_INIT(tbbpool)
     SetAttrStringFromVoidPointer(m, ready);
     SetAttrStringFromVoidPointer(m, add_task);
     SetAttrStringFromVoidPointer(m, parallel_for);
+    SetAttrStringFromVoidPointer(m, parallel_for_sched);
     SetAttrStringFromVoidPointer(m, do_scheduling_signed);
     SetAttrStringFromVoidPointer(m, do_scheduling_unsigned);
     SetAttrStringFromVoidPointer(m, set_num_threads);
@@ -341,6 +381,9 @@ MOD_INIT(tbbpool)
     SetAttrStringFromVoidPointer(m, get_thread_id);
     SetAttrStringFromVoidPointer(m, set_parallel_chunksize);
     SetAttrStringFromVoidPointer(m, get_parallel_chunksize);
+    SetAttrStringFromVoidPointer(m, set_parallel_schedule);
+    SetAttrStringFromVoidPointer(m, get_parallel_schedule);
+    SetAttrStringFromVoidPointer(m, set_thread_affinity);
     SetAttrStringFromVoidPointer(m, get_sched_size);
     SetAttrStringFromVoidPointer(m, allocate_sched);
     SetAttrStringFromVoidPointer(m, deallocate_sched);
@@ -16,7 +16,8 @@ from numba.core import utils, types, serialize, compiler, sigutils
 from numba.np.numpy_support import as_dtype
 from numba.np.ufunc import _internal
 from numba.np.ufunc.sigparse import parse_signature
-from numba.np.ufunc.wrappers import build_ufunc_wrapper, build_gufunc_wrapper
+from numba.np.ufunc.wrappers import (build_ufunc_wrapper, build_gufunc_wrapper,
+                                     UfuncWrapperCache)
 from numba.core.caching import FunctionCache, NullCache
 from numba.core.compiler_lock import global_compiler_lock
 
@@ -103,6 +104,15 @@ class UFuncDispatcher(serialize.ReduceMixin):
     def enable_caching(self):
         self.cache = FunctionCache(self.py_func)
 
+    def library_cache(self, cache_class):
+        """
+        Return a *cache_class* library cache for the wrappers built around
+        the compiled kernels, or None if caching is not enabled.
+        """
+        if isinstance(self.cache, NullCache):
+            return None
+        return cache_class(self.py_func)
+
     def compile(self, sig, locals={}, **targetoptions):
         locs = self.locals.copy()
         locs.update(locals)
@@ -193,9 +203,10 @@ def _finalize_ufunc_signature(cres, args, return_type):
     return return_type(*args)
 
 
-def _build_element_wise_ufunc_wrapper(cres, signature):
+def _build_element_wise_ufunc_wrapper(cres, signature, cache=None):
     '''Build a wrapper for the ufunc loop entry point given by the
-    compilation result object, using the element-wise signature.
+    compilation result object, using the element-wise signature.  The
+    wrapper is loaded from and saved to the library *cache* if given.
     '''
     ctx = cres.target_context
     library = cres.library
@@ -203,7 +214,7 @@ def _build_element_wise_ufunc_wrapper(cres, signature):
 
     with global_compiler_lock:
         info = build_ufunc_wrapper(library, ctx, fname, signature,
-                                   cres.objectmode, cres)
+                                   cres.objectmode, cres, cache=cache)
         ptr = info.library.get_pointer_to_function(info.name)
     # Get dtypes
     dtypenums = [as_dtype(a).num for a in signature.args]
@@ -331,7 +342,8 @@ class UFuncBuilder(_BaseUFuncBuilder):
         '''Slated for deprecation, use
         ufuncbuilder._build_element_wise_ufunc_wrapper().
         '''
-        return _build_element_wise_ufunc_wrapper(cres, signature)
+        cache = self.nb_func.library_cache(UfuncWrapperCache)
+        return _build_element_wise_ufunc_wrapper(cres, signature, cache=cache)
 
 
 class GUFuncBuilder(_BaseUFuncBuilder):
@@ -1,12 +1,21 @@
 /*
 Implement parallel vectorize workqueue.
 
-This keeps a set of worker threads running all the time.
-They wait and spin on a task queue for jobs.
-
-**WARNING**
-This module is not thread-safe.  Adding task to queue is not protected from
-race conditions.
+This keeps a set of worker threads running all the time.  They wait on a
+condition variable for parallel regions to be submitted and take chunks of
+work from any region that has chunks left.
+
+Every call to parallel_for() submits a region made of `num_threads` chunks to
+a list shared by all threads, and the submitting thread executes chunks of its
+own region until none is left before waiting for the ones taken by the
+workers.  As a region is always worked on by its submitter, a worker that
+launches a nested parallel region can't deadlock waiting for the pool, and
+several threads may submit regions concurrently.  All the pool state is
+protected by a single mutex, which is only held to claim or complete a chunk.
+
+When the workers are pinned to CPUs (see set_thread_affinity()), statically
+scheduled regions submitted from outside the pool are "affine": chunk `i` is
+always run by worker `i`, so it keeps working on the memory it first touched.
 */
 #include "../../_pymodule.h"
 #ifdef _POSIX_C_SOURCE
@@ -48,71 +57,47 @@ race conditions.
 
 #define _DEBUG 0
 
-/* workqueue is not threadsafe, so we use DSO globals to flag and update various
- * states.
- */
-/* This variable is the nesting level, it's incremented at the start of each
- * parallel region and decremented at the end, if parallel regions are nested
- * on entry the value == 1 and workqueue will abort (this in preference to just
- * hanging or segfaulting).
- */
-static int _nesting_level = 0;
-
 /* As the thread-pool isn't inherited by children,
-   free the task-queue, too. */
+   reset the pool state, too. */
 static void reset_after_fork(void);
 
-static void
-add_task_internal(void *fn, void *args, void *dims, void *steps, void *data, int tid);
-
 /* PThread */
 #ifdef NUMBA_PTHREAD
 
 static pthread_key_t tidkey;
 
-typedef struct
-{
-    pthread_cond_t cond;
-    pthread_mutex_t mutex;
-} queue_condition_t;
+typedef pthread_mutex_t pool_mutex_t;
+typedef pthread_cond_t pool_cond_t;
 
-static int
-queue_condition_init(queue_condition_t *qc)
-{
-    int r;
-    if ((r = pthread_cond_init(&qc->cond, NULL)))
-        return r;
-    if ((r = pthread_mutex_init(&qc->mutex, NULL)))
-        return r;
-    return 0;
-}
+#define POOL_MUTEX_INITIALIZER PTHREAD_MUTEX_INITIALIZER
+#define POOL_COND_INITIALIZER PTHREAD_COND_INITIALIZER
 
 static void
-queue_condition_lock(queue_condition_t *qc)
+pool_mutex_lock(pool_mutex_t *mutex)
 {
     /* XXX errors? */
-    pthread_mutex_lock(&qc->mutex);
+    pthread_mutex_lock(mutex);
 }
 
 static void
-queue_condition_unlock(queue_condition_t *qc)
+pool_mutex_unlock(pool_mutex_t *mutex)
 {
     /* XXX errors? */
-    pthread_mutex_unlock(&qc->mutex);
+    pthread_mutex_unlock(mutex);
 }
 
 static void
-queue_condition_signal(queue_condition_t *qc)
+pool_cond_wait(pool_cond_t *cond, pool_mutex_t *mutex)
 {
     /* XXX errors? */
-    pthread_cond_signal(&qc->cond);
+    pthread_cond_wait(cond, mutex);
 }
 
 static void
-queue_condition_wait(queue_condition_t *qc)
+pool_cond_broadcast(pool_cond_t *cond)
 {
     /* XXX errors? */
-    pthread_cond_wait(&qc->cond, &qc->mutex);
+    pthread_cond_broadcast(cond);
 }
 
 static thread_pointer
@@ -122,8 +107,6 @@ numba_new_thread(void *worker, void *arg)
     pthread_attr_t attr;
     pthread_t th;
 
-    pthread_atfork(0, 0, reset_after_fork);
-
     /* Create detached threads */
     pthread_attr_init(&attr);
     pthread_attr_setdetachstate(&attr, PTHREAD_CREATE_DETACHED);
@@ -154,7 +137,15 @@ set_thread_id(int tid)
 static void
 platform_launch(void)
 {
-    pthread_key_create(&tidkey, NULL);
+    static int launched = 0;
+    /* The TLS key and the fork handler survive a fork, only set them up once
+     */
+    if (!launched)
+    {
+        pthread_key_create(&tidkey, NULL);
+        pthread_atfork(0, 0, reset_after_fork);
+        launched = 1;
+    }
 }
 
 #endif /* pthread threading */
@@ -164,42 +155,34 @@ platform_launch(void)
 
 DWORD tidkey;
 
-typedef struct
-{
-    CONDITION_VARIABLE cv;
-    CRITICAL_SECTION cs;
-} queue_condition_t;
+typedef SRWLOCK pool_mutex_t;
+typedef CONDITION_VARIABLE pool_cond_t;
 
-static int
-queue_condition_init(queue_condition_t *qc)
-{
-    InitializeConditionVariable(&qc->cv);
-    InitializeCriticalSection(&qc->cs);
-    return 0;
-}
+#define POOL_MUTEX_INITIALIZER SRWLOCK_INIT
+#define POOL_COND_INITIALIZER CONDITION_VARIABLE_INIT
 
 static void
-queue_condition_lock(queue_condition_t *qc)
+pool_mutex_lock(pool_mutex_t *mutex)
 {
-    EnterCriticalSection(&qc->cs);
+    AcquireSRWLockExclusive(mutex);
 }
 
 static void
-queue_condition_unlock(queue_condition_t *qc)
+pool_mutex_unlock(pool_mutex_t *mutex)
 {
-    LeaveCriticalSection(&qc->cs);
+    ReleaseSRWLockExclusive(mutex);
 }
 
 static void
-queue_condition_signal(queue_condition_t *qc)
+pool_cond_wait(pool_cond_t *cond, pool_mutex_t *mutex)
 {
-    WakeConditionVariable(&qc->cv);
+    SleepConditionVariableSRW(cond, mutex, INFINITE, 0);
 }
 
 static void
-queue_condition_wait(queue_condition_t *qc)
+pool_cond_broadcast(pool_cond_t *cond)
 {
-    SleepConditionVariableCS(&qc->cv, &qc->cs, INFINITE);
+    WakeAllConditionVariable(cond);
 }
 
 /* Adapted from Python/thread_nt.h */
@@ -259,7 +242,12 @@ set_thread_id(int tid)
 static void
 platform_launch(void)
 {
-    tidkey = TlsAlloc();
+    static int launched = 0;
+    if (!launched)
+    {
+        tidkey = TlsAlloc();
+        launched = 1;
+    }
 }
 
 #endif /* Windows threading */
@@ -269,36 +257,47 @@ typedef struct Task
     void (*func)(void *args, void *dims, void *steps, void *data);
     void *args, *dims, *steps, *data;
     int tid;
+    /* Set once a thread has taken the task */
+    int claimed;
 } Task;
 
-typedef struct
-{
-    queue_condition_t cond;
-    int state;
-    Task task;
-} Queue;
-
-
-static Queue *queues = NULL;
-static int queue_count;
-static int queue_pivot = 0;
+/* A parallel region: a set of tasks submitted together by one thread, which
+ * waits for all of them to complete.  Regions live on the stack of their
+ * submitter (or in its thread local batch, for add_task()).
+ */
+typedef struct Region
+{
+    Task *tasks;
+    int ntasks;
+    /* Number of tasks allocated, for regions built by add_task() */
+    int capacity;
+    /* Index of the next task to be claimed */
+    int next;
+    /* Number of tasks not claimed yet */
+    int unclaimed;
+    /* If set, task `i` may only be run by worker `i` */
+    int affine;
+    /* Number of tasks not completed yet */
+    int pending;
+    /* The number of threads seen by get_num_threads() in the tasks */
+    int num_threads;
+    /* Regions with unclaimed tasks are linked in submission order */
+    struct Region *link;
+} Region;
+
+static pool_mutex_t pool_mutex = POOL_MUTEX_INITIALIZER;
+/* Signalled when a region is submitted */
+static pool_cond_t work_cond = POOL_COND_INITIALIZER;
+/* Signalled when a region completes */
+static pool_cond_t done_cond = POOL_COND_INITIALIZER;
+
+/* Regions which have unclaimed tasks, oldest first */
+static Region *regions_head = NULL;
+static Region *regions_tail = NULL;
+
+static int pool_launched = 0;
 static int NUM_THREADS = -1;
 
-static void
-queue_state_wait(Queue *queue, int old, int repl)
-{
-    queue_condition_t *cond = &queue->cond;
-
-    queue_condition_lock(cond);
-    while (queue->state != old)
-    {
-        queue_condition_wait(cond);
-    }
-    queue->state = repl;
-    queue_condition_signal(cond);
-    queue_condition_unlock(cond);
-}
-
 // break on this for debug
 void debug_marker(void);
 void debug_marker() {};
@@ -311,6 +310,25 @@ void debug_marker() {};
 #define THREAD_LOCAL(ty) __thread ty
 #endif
 
+#ifdef _MSC_VER
+#ifdef _WIN64
+#define ATOMIC_LOAD(ptr) (*(volatile size_t *)(ptr))
+#define ATOMIC_CAS(ptr, old, new) \
+    (InterlockedCompareExchange64((volatile LONG64 *)(ptr), (LONG64)(new), \
+                                  (LONG64)(old)) == (LONG64)(old))
+#else
+#define ATOMIC_LOAD(ptr) (*(volatile size_t *)(ptr))
+#define ATOMIC_CAS(ptr, old, new) \
+    (InterlockedCompareExchange((volatile LONG *)(ptr), (LONG)(new), \
+                                (LONG)(old)) == (LONG)(old))
+#endif
+#else
+#define ATOMIC_LOAD(ptr) __atomic_load_n((ptr), __ATOMIC_RELAXED)
+#define ATOMIC_CAS(ptr, old, new) \
+    __atomic_compare_exchange_n((ptr), &(old), (new), 0, __ATOMIC_RELAXED, \
+                                __ATOMIC_RELAXED)
+#endif
+
 // This is the number of threads that is default, it is set on initialisation of
 // the threading backend via the launch_threads() call
 static int _INIT_NUM_THREADS = -1;
@@ -318,26 +336,33 @@ static int _INIT_NUM_THREADS = -1;
 // This is the per-thread thread mask, each thread can carry its own mask.
 static THREAD_LOCAL(int) _TLS_num_threads = 0;
 
+// The tasks added by add_task() on this thread, submitted by ready()
+static THREAD_LOCAL(Region *) _TLS_batch = NULL;
+
+// The index of a worker thread of the pool, -1 for any other thread
+static THREAD_LOCAL(int) _TLS_worker = -1;
+
 static void
-set_num_threads(int count)
+ensure_launched(void)
 {
-    if (!queues)
+    // launch_threads() takes the pool lock, only call it when needed
+    if (!pool_launched)
     {
         launch_threads(NUM_THREADS);
     }
+}
+
+static void
+set_num_threads(int count)
+{
+    ensure_launched();
     _TLS_num_threads = count;
 }
 
 static int
 get_num_threads(void)
 {
-    if (!queues)
-    {
-        launch_threads(NUM_THREADS);
-    }
-    // This is purely to permit the implementation to survive to the point
-    // where it can exit cleanly as multiple threads cannot be used with this
-    // backend
+    ensure_launched();
     if (_TLS_num_threads == 0)
     {
         // This is a thread that did not call launch_threads() but is still a
@@ -348,19 +373,264 @@ get_num_threads(void)
     return _TLS_num_threads;
 }
 
+/* Append a region to the list of regions with work available.
+ * The pool mutex must be held.
+ */
+static void
+push_region(Region *region)
+{
+    region->link = NULL;
+    if (regions_tail)
+        regions_tail->link = region;
+    else
+        regions_head = region;
+    regions_tail = region;
+}
+
+/* Unlink a region that has no unclaimed task left.
+ * The pool mutex must be held.
+ */
+static void
+unlink_region(Region *region)
+{
+    Region **prev = &regions_head;
+    Region *last = NULL;
+    while (*prev && *prev != region)
+    {
+        last = *prev;
+        prev = &(*prev)->link;
+    }
+    if (*prev)
+    {
+        *prev = region->link;
+        if (regions_tail == region)
+            regions_tail = last;
+    }
+    region->link = NULL;
+}
+
+/* Find a task of `region` that the calling thread may run, or NULL.
+ * The pool mutex must be held.
+ */
+static Task *
+find_task(Region *region)
+{
+    Task *task;
+    if (!region->affine)
+    {
+        return region->next < region->ntasks ? &region->tasks[region->next]
+                                             : NULL;
+    }
+    if (_TLS_worker < 0 || _TLS_worker >= region->ntasks)
+        return NULL;
+    task = &region->tasks[_TLS_worker];
+    return task->claimed ? NULL : task;
+}
+
+/* Claim a task found by find_task(), the pool mutex must be held. */
+static void
+claim_task(Region *region, Task *task)
+{
+    task->claimed = 1;
+    if (!region->affine)
+        region->next++;
+    if (--region->unclaimed == 0)
+    {
+        unlink_region(region);
+    }
+}
+
+/* Run a task of `region`, with the thread id and mask it expects.  The pool
+ * mutex must *not* be held.  The caller's own thread id and mask are restored
+ * afterwards, this thread may be in the middle of a task of an enclosing
+ * region.
+ */
+static void
+run_task(Region *region, Task *task)
+{
+    int old_tid = get_thread_id();
+    int old_num_threads = _TLS_num_threads;
+
+    set_thread_id(task->tid);
+    _TLS_num_threads = region->num_threads;
+    task->func(task->args, task->dims, task->steps, task->data);
+
+    set_thread_id(old_tid);
+    _TLS_num_threads = old_num_threads;
+}
+
+/* Mark a task of `region` as completed, the pool mutex must be held.
+ * `region` may go out of scope as soon as the mutex is released.
+ */
+static void
+complete_task(Region *region)
+{
+    if (--region->pending == 0)
+    {
+        pool_cond_broadcast(&done_cond);
+    }
+}
+
+/* Make the tasks of a region available to the workers */
+static void
+submit_region(Region *region)
+{
+    int i;
+
+    ensure_launched();
+
+    region->next = 0;
+    region->unclaimed = region->ntasks;
+    region->pending = region->ntasks;
+    for (i = 0; i < region->ntasks; i++)
+    {
+        region->tasks[i].claimed = 0;
+    }
+    if (region->ntasks == 0)
+        return;
+
+    pool_mutex_lock(&pool_mutex);
+    push_region(region);
+    pool_cond_broadcast(&work_cond);
+    pool_mutex_unlock(&pool_mutex);
+}
+
+/* Wait for a submitted region to complete, the calling thread executes tasks
+ * of the region until they are all claimed and then waits for the tasks run
+ * by the workers.  The tasks of an affine region are all left to the workers.
+ */
+static void
+wait_region(Region *region)
+{
+    Task *task;
 
-// this complies to a launchable function from `add_task` like:
-// add_task(nopfn, NULL, NULL, NULL, NULL)
-// useful if you want to limit the number of threads locally
-// static void nopfn(void *args, void *dims, void *steps, void *data) {};
+    pool_mutex_lock(&pool_mutex);
+    while ((task = find_task(region)))
+    {
+        claim_task(region, task);
+        pool_mutex_unlock(&pool_mutex);
+        run_task(region, task);
+        pool_mutex_lock(&pool_mutex);
+        complete_task(region);
+    }
+    while (region->pending)
+    {
+        pool_cond_wait(&done_cond, &pool_mutex);
+    }
+    pool_mutex_unlock(&pool_mutex);
+}
 
+/* A loop whose iterations are handed out on demand to the tasks of a region,
+ * for the dynamic and guided schedules.
+ */
+typedef struct
+{
+    void (*func)(char **args, size_t *dims, size_t *steps, void *data);
+    char **args;
+    size_t *dimensions;
+    size_t *steps;
+    void *data;
+    size_t arg_len;
+    size_t array_count;
+    size_t total;
+    size_t num_threads;
+    int schedule;
+    /* Next unclaimed iteration, shared by the tasks */
+    size_t next;
+} SharedLoop;
+
+/* Claim the next iterations of `loop`, returns how many were claimed and
+ * stores the first one in `start`.
+ */
+static size_t
+claim_iterations(SharedLoop *loop, size_t *start)
+{
+    size_t cur, count;
+    while (1)
+    {
+        cur = ATOMIC_LOAD(&loop->next);
+        if (cur >= loop->total)
+            return 0;
+        count = 1;
+        if (loop->schedule == SCHEDULE_GUIDED)
+        {
+            // Chunks shrink as the remaining work does
+            count = (loop->total - cur) / (2 * loop->num_threads);
+            if (count == 0)
+                count = 1;
+        }
+        if (ATOMIC_CAS(&loop->next, cur, cur + count))
+        {
+            *start = cur;
+            return count;
+        }
+    }
+}
 
-// synchronize the TLS num_threads slot to value args[0]
-static void sync_tls(void *args, void *dims, void *steps, void *data) {
-    int nthreads = *((int *)(args));
-    _TLS_num_threads = nthreads;
-};
+/* The task run by each thread of a dynamically scheduled region, it runs the
+ * iterations of the loop until none is left.
+ */
+static void
+shared_loop_task(void *args, void *dims, void *steps, void *data)
+{
+    SharedLoop *loop = (SharedLoop *)args;
+    size_t *count_space = (size_t *)alloca(sizeof(size_t) * loop->arg_len);
+    char **array_arg_space = (char **)alloca(sizeof(char*) * loop->array_count);
+    size_t start, count, j;
 
+    memcpy(count_space, loop->dimensions, loop->arg_len * sizeof(size_t));
+    while ((count = claim_iterations(loop, &start)))
+    {
+        count_space[0] = count;
+        for (j = 0; j < loop->array_count; j++)
+        {
+            array_arg_space[j] = loop->args[j] + loop->steps[j] * start;
+        }
+        loop->func(array_arg_space, count_space, loop->steps, loop->data);
+    }
+}
+
+/* parallel_for() with the iterations handed out on demand */
+static void
+parallel_for_shared(void *fn, char **args, size_t *dimensions, size_t *steps,
+                    void *data, size_t inner_ndim, size_t array_count,
+                    int num_threads, int schedule)
+{
+    SharedLoop loop;
+    Region region;
+    Task *tasks;
+    int i;
+
+    loop.func = fn;
+    loop.args = args;
+    loop.dimensions = dimensions;
+    loop.steps = steps;
+    loop.data = data;
+    loop.arg_len = inner_ndim + 1;
+    loop.array_count = array_count;
+    loop.total = dimensions[0];
+    loop.num_threads = num_threads;
+    loop.schedule = schedule;
+    loop.next = 0;
+
+    tasks = (Task *)alloca(sizeof(Task) * num_threads);
+    for (i = 0; i < num_threads; i++)
+    {
+        tasks[i].func = shared_loop_task;
+        tasks[i].args = &loop;
+        tasks[i].dims = NULL;
+        tasks[i].steps = NULL;
+        tasks[i].data = NULL;
+        tasks[i].tid = i;
+    }
+
+    region.tasks = tasks;
+    region.ntasks = num_threads;
+    region.num_threads = num_threads;
+    region.affine = 0;
+    submit_region(&region);
+    wait_region(&region);
+}
 
 static void
 parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *data,
@@ -372,27 +642,6 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
     //     steps = <ir.Argument '.3' of type i64*>
     //     data = <ir.Argument '.4' of type i8*>
 
-    // check the nesting level, if it's already 1, abort, workqueue cannot
-    // handle nesting.
-    if (_nesting_level >= 1){
-        fprintf(stderr, "%s", "Numba workqueue threading layer is terminating: "
-                              "Concurrent access has been detected.\n\n"
-                              " - The workqueue threading layer is not "
-                              "threadsafe and may not be accessed concurrently "
-                              "by multiple threads. Concurrent access "
-                              "typically occurs through a nested parallel "
-                              "region launch or by calling Numba parallel=True "
-                              "functions from multiple Python threads.\n"
-                              " - Try using the TBB threading layer as an "
-                              "alternative, as it is, itself, threadsafe. "
-                              "Docs: https://numba.readthedocs.io/en/stable/user/threading-layer.html\n\n");
-        raise(SIGABRT);
-        return;
-    }
-
-    // increment the nest level
-    _nesting_level += 1;
-
     size_t * count_space = NULL;
     char ** array_arg_space = NULL;
     const size_t arg_len = (inner_ndim + 1);
@@ -401,9 +650,10 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
 
     ptrdiff_t offset;
     char * base;
-    int old_queue_count = -1;
 
     size_t step;
+    Region region;
+    Task *tasks;
 
     debug_marker();
 
@@ -439,18 +689,7 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
         }
     }
 
-    // sync the thread pool TLS slots, sync all slots, we don't know which
-    // threads will end up running.
-    for (i = 0; i < NUM_THREADS; i++)
-    {
-        add_task_internal(sync_tls, (void *)(&num_threads), NULL, NULL, NULL, i);
-    }
-    ready();
-    synchronize();
-
-    // This backend isn't threadsafe so just mutate the global
-    old_queue_count = queue_count;
-    queue_count = num_threads;
+    tasks = (Task *)alloca(sizeof(Task) * num_threads);
 
     for (i = 0; i < num_threads; i++)
     {
@@ -505,137 +744,170 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
                 printf("%p, ", (void *)array_arg_space[j]);
             }
         }
-        add_task_internal(fn, (void *)array_arg_space, (void *)count_space, steps, data, i);
+        tasks[i].func = fn;
+        tasks[i].args = array_arg_space;
+        tasks[i].dims = count_space;
+        tasks[i].steps = steps;
+        tasks[i].data = data;
+        // The chunk index is the thread id seen by the task, reductions use
+        // it to index their per-thread results.
+        tasks[i].tid = i;
     }
 
-    ready();
-    synchronize();
-
-    queue_count = old_queue_count;
-    // decrement the nest level
-    _nesting_level -= 1;
+    region.tasks = tasks;
+    region.ntasks = num_threads;
+    region.num_threads = num_threads;
+    // Keep each chunk on the same pinned worker from one call to the next,
+    // nested regions are run by whichever threads are available.
+    ensure_launched();
+    region.affine = (get_thread_affinity_count() > 0 && _TLS_worker < 0 &&
+                     num_threads <= NUM_THREADS);
+    submit_region(&region);
+    wait_region(&region);
 }
 
 static void
-add_task_internal(void *fn, void *args, void *dims, void *steps, void *data, int tid)
+parallel_for_sched(void *fn, char **args, size_t *dimensions, size_t *steps,
+                   void *data, size_t inner_ndim, size_t array_count,
+                   int num_threads, int schedule)
 {
-    void (*func)(void *args, void *dims, void *steps, void *data) = fn;
-
-    if (!queues)
+    if (schedule == SCHEDULE_STATIC)
     {
-        launch_threads(NUM_THREADS);
+        parallel_for(fn, args, dimensions, steps, data, inner_ndim,
+                     array_count, num_threads);
     }
-
-    Queue *queue = &queues[queue_pivot];
-
-    Task *task = &queue->task;
-    task->func = func;
-    task->args = args;
-    task->dims = dims;
-    task->steps = steps;
-    task->data = data;
-    task->tid = tid;
-
-    /* Move pivot */
-    if ( ++queue_pivot == queue_count )
+    else
     {
-        queue_pivot = 0;
+        parallel_for_shared(fn, args, dimensions, steps, data, inner_ndim,
+                            array_count, num_threads, schedule);
     }
 }
 
 static void
 add_task(void *fn, void *args, void *dims, void *steps, void *data)
 {
-    add_task_internal(fn, args, dims, steps, data, 0);
+    Region *batch = _TLS_batch;
+    Task *task;
+
+    if (!batch)
+    {
+        // calloc() leaves the batch not affine
+        batch = (Region *)calloc(1, sizeof(Region));
+        _TLS_batch = batch;
+    }
+    /* The batch only grows, it is kept for reuse by this thread */
+    if (batch->ntasks == batch->capacity)
+    {
+        batch->capacity = batch->capacity ? 2 * batch->capacity : 4;
+        batch->tasks = (Task *)realloc(batch->tasks,
+                                       sizeof(Task) * batch->capacity);
+    }
+    task = &batch->tasks[batch->ntasks++];
+    task->func = fn;
+    task->args = args;
+    task->dims = dims;
+    task->steps = steps;
+    task->data = data;
+    task->tid = 0;
 }
 
 static
 void thread_worker(void *arg)
 {
-    Queue *queue = (Queue*)arg;
-    Task *task;
+    Region *region;
+    Task *task = NULL;
+
+    _TLS_worker = (int)(intptr_t)arg;
+    pin_current_thread(_TLS_worker);
 
+    pool_mutex_lock(&pool_mutex);
     while (1)
     {
-        /* Wait for the queue to be in READY state (i.e. for some task
-         * to need running), and switch it to RUNNING.
+        /* Wait for some region to have a task left for this worker, and
+         * claim it.
          */
-        queue_state_wait(queue, READY, RUNNING);
+        for (region = regions_head; region; region = region->link)
+        {
+            if ((task = find_task(region)))
+                break;
+        }
+        if (!region)
+        {
+            pool_cond_wait(&work_cond, &pool_mutex);
+            continue;
+        }
+        claim_task(region, task);
+        pool_mutex_unlock(&pool_mutex);
 
-        task = &queue->task;
-        set_thread_id(task->tid);
-        task->func(task->args, task->dims, task->steps, task->data);
+        run_task(region, task);
 
-        /* Task is done. */
-        queue_state_wait(queue, RUNNING, DONE);
+        pool_mutex_lock(&pool_mutex);
+        complete_task(region);
     }
 }
 
 static void launch_threads(int count)
 {
-    if (!queues)
+    int i;
+
+    pool_mutex_lock(&pool_mutex);
+    if (!pool_launched)
     {
         platform_launch();
 
-        /* If queues are not yet allocated,
-           create them, one for each thread. */
-        int i;
-        size_t sz = sizeof(Queue) * count;
-
         /* set for use in parallel_for */
         NUM_THREADS = count;
-        queues = malloc(sz);     /* this memory will leak */
-        /* Note this initializes the state to IDLE */
-        memset(queues, 0, sz);
-        queue_count = count;
 
         for (i = 0; i < count; ++i)
         {
-            queue_condition_init(&queues[i].cond);
-            numba_new_thread(thread_worker, &queues[i]);
+            numba_new_thread(thread_worker, (void *)(intptr_t)i);
         }
 
         _INIT_NUM_THREADS = count;
+        pool_launched = 1;
     }
+    pool_mutex_unlock(&pool_mutex);
 }
 
+/* Wait until the tasks submitted by ready() on this thread are done */
 static void synchronize(void)
 {
-    // This probably isn't needed, but is put in as a guard
-    if (!queues)
-    {
-        launch_threads(NUM_THREADS);
-    }
-    int i;
-    for (i = 0; i < queue_count; ++i)
+    Region *batch = _TLS_batch;
+    if (batch)
     {
-        queue_state_wait(&queues[i], DONE, IDLE);
+        wait_region(batch);
+        batch->ntasks = 0;
     }
 }
 
+/* Submit the tasks added by add_task() on this thread */
 static void ready(void)
 {
-    // This probably isn't needed, but is put in as a guard
-    if (!queues)
+    Region *batch = _TLS_batch;
+    if (batch)
     {
-        launch_threads(NUM_THREADS);
-    }
-    int i;
-    for (i = 0; i < queue_count; ++i)
-    {
-        queue_state_wait(&queues[i], IDLE, READY);
+        batch->num_threads = get_num_threads();
+        submit_region(batch);
     }
 }
 
 static void reset_after_fork(void)
 {
-    free(queues);
-    queues = NULL;
+#ifdef NUMBA_PTHREAD
+    /* Only the forking thread exists in the child, the regions in flight
+     * belong to threads that are gone and the locks may be in any state.
+     */
+    pthread_mutex_init(&pool_mutex, NULL);
+    pthread_cond_init(&work_cond, NULL);
+    pthread_cond_init(&done_cond, NULL);
+#endif
+    regions_head = NULL;
+    regions_tail = NULL;
+    pool_launched = 0;
     if (_INIT_NUM_THREADS != -1)
     {
         NUM_THREADS = _INIT_NUM_THREADS;
     }
-    _nesting_level = 0;
 }
 
 MOD_INIT(workqueue)
@@ -650,6 +922,7 @@ MOD_INIT(workqueue)
     SetAttrStringFromVoidPointer(m, ready);
     SetAttrStringFromVoidPointer(m, add_task);
     SetAttrStringFromVoidPointer(m, parallel_for);
+    SetAttrStringFromVoidPointer(m, parallel_for_sched);
     SetAttrStringFromVoidPointer(m, do_scheduling_signed);
     SetAttrStringFromVoidPointer(m, do_scheduling_unsigned);
     SetAttrStringFromVoidPointer(m, set_num_threads);
@@ -657,6 +930,9 @@ MOD_INIT(workqueue)
     SetAttrStringFromVoidPointer(m, get_thread_id);
     SetAttrStringFromVoidPointer(m, set_parallel_chunksize);
     SetAttrStringFromVoidPointer(m, get_parallel_chunksize);
+    SetAttrStringFromVoidPointer(m, set_parallel_schedule);
+    SetAttrStringFromVoidPointer(m, get_parallel_schedule);
+    SetAttrStringFromVoidPointer(m, set_thread_affinity);
     SetAttrStringFromVoidPointer(m, get_sched_size);
     SetAttrStringFromVoidPointer(m, allocate_sched);
     SetAttrStringFromVoidPointer(m, deallocate_sched);
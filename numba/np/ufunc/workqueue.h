@@ -1,27 +1,13 @@
 typedef struct opaque_thread * thread_pointer;
 
-enum QUEUE_STATE
-{
-    /*
-    The queue has 4 states:
-
-    IDLE: not doing anything
-    READY: tasks enqueued; signal workers to start
-    RUNNING: workers running
-    DONE: workers completed
-    */
-    IDLE = 0, READY, RUNNING, DONE
-};
-
-/* Launch `count` number of threads and create the associated thread queue.
+/* Launch `count` number of worker threads.
 Must invoke once before each add_task() is used.
-*Warning* queues memory are leaked at interpreter tear down!
 */
 static
 void launch_threads(int count);
 
-/* Add task to queue
-Automatically assigned to queues of different thread in a round robin fashion.
+/* Add task to the calling thread's pending batch of tasks
+The batch is run by the next ready() call from the same thread.
 */
 static
 void add_task(void *fn, void *args, void *dims, void *steps, void *data);
@@ -55,6 +41,15 @@ static void
 parallel_for(void *fn, char **args, size_t *dims, size_t *steps, void *data,\
              size_t inner_ndim, size_t array_count, int num_threads);
 
+/* parallel_for() with the outer dimension scheduled as `schedule`, one of the
+ SCHEDULE_* kinds of gufunc_scheduler.h.  The dynamic and guided schedules
+ hand out the iterations of the outer dimension to the threads on demand.
+ */
+static void
+parallel_for_sched(void *fn, char **args, size_t *dims, size_t *steps,\
+                   void *data, size_t inner_ndim, size_t array_count,\
+                   int num_threads, int schedule);
+
 
 /* Masking API cf. OpenMP */
 static void
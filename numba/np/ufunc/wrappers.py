@@ -135,15 +135,28 @@ def build_fast_loop_body(context, func, builder, arrays, out, offsets,
                                   env=env)
 
 
-def build_ufunc_wrapper(library, context, fname, signature, objmode, cres):
+UfuncWrapperCache = make_library_cache('uf')
+
+
+def build_ufunc_wrapper(library, context, fname, signature, objmode, cres,
+                        cache=None):
     """
-    Wrap the scalar function with a loop that iterates over the arguments
+    Wrap the scalar function with a loop that iterates over the arguments.
+    If a library *cache* is given, the wrapper is loaded from it if
+    possible, and saved to it otherwise.
 
     Returns
     -------
     (library, env, name)
     """
     assert isinstance(fname, str)
+    if cache is None:
+        cache = NullCache()
+    wrapperlib = cache.load_overload(signature, context)
+    if wrapperlib is not None:
+        return _wrapper_info(library=wrapperlib, env=cres.environment,
+                             name="__ufunc__." + fname)
+
     byte_t = ir.IntType(8)
     byte_ptr_t = ir.PointerType(byte_t)
     byte_ptr_ptr_t = ir.PointerType(byte_ptr_t)
@@ -154,6 +167,7 @@ def build_ufunc_wrapper(library, context, fname, signature, objmode, cres):
                                            intp_ptr_t, byte_ptr_t])
 
     wrapperlib = context.codegen().create_library('ufunc_wrapper')
+    wrapperlib.enable_object_caching()
     wrapper_module = wrapperlib.create_ir_module('')
     if objmode:
         func_type = context.call_conv.get_function_type(
@@ -243,6 +257,7 @@ def build_ufunc_wrapper(library, context, fname, signature, objmode, cres):
     # Link and finalize
     wrapperlib.add_ir_module(wrapper_module)
     wrapperlib.add_linking_library(library)
+    cache.save_overload(signature, wrapperlib)
     return _wrapper_info(library=wrapperlib, env=env, name=wrapper.name)
 
 
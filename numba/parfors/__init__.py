@@ -1 +1,13 @@
-from numba.parfors import parfor_lowering
+import importlib
+
+
+_submodules = {'array_analysis', 'parfor', 'parfor_lowering',
+               'parfor_lowering_utils'}
+
+
+def __getattr__(name):
+    # Uses PEP-562, the submodules are heavy and only needed once a function
+    # using parfors is compiled
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -27,11 +27,12 @@ from numba.core.analysis import compute_cfg_from_blocks
 from numba.core.typing import npydecl, signature
 import copy
 from numba.core.extending import intrinsic
+from numba.np.ufunc.dufunc import DUFunc
 import llvmlite
 
 UNKNOWN_CLASS = -1
 CONST_CLASS = 0
-MAP_TYPES = [numpy.ufunc]
+MAP_TYPES = [numpy.ufunc, DUFunc]
 
 array_analysis_extensions = {}
 
@@ -23,7 +23,7 @@ from functools import reduce
 from collections import defaultdict, OrderedDict, namedtuple
 from contextlib import contextmanager
 import operator
-from dataclasses import make_dataclass
+from dataclasses import make_dataclass, field
 import warnings
 
 from llvmlite import ir as lir
@@ -31,8 +31,11 @@ from numba.core.imputils import impl_ret_untracked
 import numba.core.ir
 from numba.core import types, typing, utils, errors, ir, analysis, postproc, rewrites, typeinfer, config, ir_utils
 from numba import prange, pndindex
+from numba.misc.special import internal_prange
 from numba.np.npdatetime_helpers import datetime_minimum, datetime_maximum
 from numba.np.numpy_support import as_dtype, numpy_version
+from numba.np.arraymath import (_histogram_uniform_bin, _histogram_bisect_bin,
+                                percentile_is_valid, quantile_is_valid)
 from numba.core.typing.templates import infer_global, AbstractTemplate
 from numba.stencils.stencilparfor import StencilPass
 from numba.core.extending import register_jitable, lower_builtin
@@ -96,6 +99,7 @@ import copy
 import numpy
 import numpy as np
 from numba.parfors import array_analysis
+from numba.parfors.reduction import get_reduction
 import numba.cpython.builtins
 from numba.stencils import stencilparfor
 # circular dependency: import numba.npyufunc.dufunc.DUFunc
@@ -121,12 +125,6 @@ def init_prange_overload():
         return
     return no_op
 
-class internal_prange(object):
-
-    def __new__(cls, *args):
-        return range(*args)
-
-
 def min_parallel_impl(return_type, arg):
     # XXX: use prange for 1D arrays since pndindex returns a 1-tuple instead of
     # integer. This causes type and fusion issues.
@@ -447,6 +445,672 @@ def linspace_parallel_impl(return_type, *args):
     else:
         raise ValueError("parallel linspace with types {}".format(args))
 
+# Smallest number of elements processed by each thread in the parallel
+# sorts, histograms and lane reductions
+_PARALLEL_MIN_CHUNK = 1 << 14
+
+def _parallel_sortable(arg):
+    return (isinstance(arg, types.Array) and arg.ndim == 1 and
+            isinstance(arg.dtype, (types.Integer, types.Float, types.Boolean)))
+
+@register_jitable
+def _parallel_chunking(n):
+    """Split ``n`` elements into one chunk per thread.
+    Returns the number of chunks and the size of the chunks.
+    """
+    nthreads = numba.np.ufunc.parallel.get_num_threads()
+    nchunks = max(1, min(nthreads, n // _PARALLEL_MIN_CHUNK))
+    chunk = max(1, (n + nchunks - 1) // nchunks)
+    return (n + chunk - 1) // chunk, chunk
+
+@register_jitable
+def _serial_sort(arr):
+    arr.sort()
+
+@register_jitable
+def _serial_sort_kind(arr, kind):
+    arr.sort(kind=kind)
+
+@register_jitable
+def _sort_chunk(arr, lo, hi):
+    arr[lo:hi].sort()
+
+@register_jitable
+def _argsort_chunk(keys, out, lo, hi):
+    out[lo:hi] = np.argsort(keys[lo:hi], kind='mergesort') + lo
+
+@register_jitable
+def _sort_lt(a, b):
+    # NaNs are sorted to the end, as in np.sort
+    return a < b or (b != b and a == a)
+
+@register_jitable
+def _sort_key(src, keys, i):
+    # keys is None when sorting values, and the array being sorted otherwise
+    if keys is None:
+        return src[i]
+    return keys[src[i]]
+
+@register_jitable
+def _merge_co_rank(src, keys, lo, mid, hi, k):
+    """Number of elements of the run src[lo:mid] among the first ``k``
+    elements of the stable merge of src[lo:mid] and src[mid:hi].
+    """
+    first = max(0, k - (hi - mid))
+    last = min(k, mid - lo)
+    while first < last:
+        i = (first + last) // 2
+        j = k - i
+        if (j > 0 and not _sort_lt(_sort_key(src, keys, mid + j - 1),
+                                   _sort_key(src, keys, lo + i))):
+            first = i + 1
+        else:
+            last = i
+    return first
+
+@register_jitable
+def _merge_segment(src, dst, keys, n, width, pair, seg, nsegs):
+    """Merge the part ``seg`` out of ``nsegs`` of the pair of sorted runs of
+    size ``width`` numbered ``pair`` from src into dst.
+    """
+    lo = pair * 2 * width
+    mid = min(lo + width, n)
+    hi = min(lo + 2 * width, n)
+    size = hi - lo
+    k0 = size * seg // nsegs
+    k1 = size * (seg + 1) // nsegs
+    i0 = _merge_co_rank(src, keys, lo, mid, hi, k0)
+    i1 = _merge_co_rank(src, keys, lo, mid, hi, k1)
+    i = lo + i0
+    iend = lo + i1
+    j = mid + k0 - i0
+    jend = mid + k1 - i1
+    for k in range(lo + k0, lo + k1):
+        if j < jend and (i >= iend or
+                         _sort_lt(_sort_key(src, keys, j),
+                                  _sort_key(src, keys, i))):
+            dst[k] = src[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+
+def sort_parallel_impl(return_type, arg, axis=None, kind=None):
+    """Parallel merge sort: each thread sorts a chunk of the array, then the
+    sorted runs are merged pairwise, each merge being split between several
+    threads.
+    """
+    if not _parallel_sortable(arg):
+        return None
+    # The sorted values don't depend on the kind of sort, nor on the axis
+    # once checked as the array is 1-dimensional.  np.sort is itself
+    # replaced by sort_1 below.
+    if axis is not None and kind is not None:
+        def sort_2(in_arr, axis, kind):
+            numba.np.arrayobj._check_sort_axis(in_arr, axis)
+            return np.sort(in_arr)
+        return sort_2
+    if axis is not None:
+        def sort_2(in_arr, axis):
+            numba.np.arrayobj._check_sort_axis(in_arr, axis)
+            return np.sort(in_arr)
+        return sort_2
+    if kind is not None:
+        def sort_2(in_arr, kind):
+            return np.sort(in_arr)
+        return sort_2
+
+    def sort_1(in_arr):
+        numba.parfors.parfor.init_prange()
+        out = in_arr.copy()
+        n = len(out)
+        nchunks, chunk = numba.parfors.parfor._parallel_chunking(n)
+        for c in numba.parfors.parfor.internal_prange(nchunks):
+            numba.parfors.parfor._sort_chunk(out, c * chunk,
+                                             min(c * chunk + chunk, n))
+        tmp = np.empty_like(out)
+        width = chunk
+        while width < n:
+            npairs = (n + 2 * width - 1) // (2 * width)
+            nsegs = max(1, nchunks // npairs)
+            for t in numba.parfors.parfor.internal_prange(npairs * nsegs):
+                numba.parfors.parfor._merge_segment(out, tmp, None, n, width,
+                                                    t // nsegs, t % nsegs,
+                                                    nsegs)
+            out, tmp = tmp, out
+            width *= 2
+        return out
+    return sort_1
+
+def argsort_parallel_impl(return_type, arg, kind=None):
+    """Parallel argsort, see sort_parallel_impl.  The runs are sorted with
+    the mergesort kind so the result is always stable, which is a valid
+    result for any kind.
+    """
+    if not _parallel_sortable(arg):
+        return None
+    if kind is not None:
+        def argsort_2(in_arr, kind):
+            # np.argsort is itself replaced by argsort_1 below
+            return np.argsort(in_arr)
+        return argsort_2
+
+    def argsort_1(in_arr):
+        numba.parfors.parfor.init_prange()
+        n = len(in_arr)
+        out = np.empty(n, np.intp)
+        nchunks, chunk = numba.parfors.parfor._parallel_chunking(n)
+        for c in numba.parfors.parfor.internal_prange(nchunks):
+            numba.parfors.parfor._argsort_chunk(in_arr, out, c * chunk,
+                                                min(c * chunk + chunk, n))
+        tmp = np.empty_like(out)
+        width = chunk
+        while width < n:
+            npairs = (n + 2 * width - 1) // (2 * width)
+            nsegs = max(1, nchunks // npairs)
+            for t in numba.parfors.parfor.internal_prange(npairs * nsegs):
+                numba.parfors.parfor._merge_segment(out, tmp, in_arr, n, width,
+                                                    t // nsegs, t % nsegs,
+                                                    nsegs)
+            out, tmp = tmp, out
+            width *= 2
+        return out
+    return argsort_1
+
+def unique_parallel_impl(return_type, arg):
+    if not (isinstance(arg, types.Array) and
+            _parallel_sortable(types.Array(arg.dtype, 1, 'C'))):
+        return None
+
+    def unique_1(ar):
+        # np.sort is itself replaced by its parallel implementation
+        b = np.sort(ar.ravel())
+        numba.parfors.parfor.init_prange()
+        n = len(b)
+        keep = np.empty(n, np.bool_)
+        for i in numba.parfors.parfor.internal_prange(n):
+            keep[i] = i == 0 or b[i] != b[i - 1]
+        return b[keep]
+    return unique_1
+
+def _bincount_chunk(a, weights, lo, hi, out_length):
+    pass
+
+@overload(_bincount_chunk)
+def _bincount_chunk_overload(a, weights, lo, hi, out_length):
+    """Private counts of the values in a[lo:hi]."""
+    if weights == types.none:
+        def impl(a, weights, lo, hi, out_length):
+            out = np.zeros(out_length, np.intp)
+            for i in range(lo, hi):
+                out[a[i]] += 1
+            return out
+    else:
+        def impl(a, weights, lo, hi, out_length):
+            out = np.zeros(out_length, np.float64)
+            for i in range(lo, hi):
+                out[a[i]] += weights[i]
+            return out
+    return impl
+
+@register_jitable
+def _bincount_check(a, weights, minlength):
+    if weights is not None and len(a) != len(weights):
+        raise ValueError("bincount(): weights and list don't have "
+                         "the same length")
+    if minlength < 0:
+        raise ValueError("'minlength' must not be negative")
+
+@register_jitable
+def _bincount_check_min(a_min):
+    if a_min < 0:
+        raise ValueError("bincount(): first argument must be "
+                         "non-negative")
+
+def bincount_parallel_impl(return_type, a, weights=None, minlength=None):
+    """Parallel bincount: each thread counts a chunk of the array into
+    private bins, which are then summed.
+    """
+    if not (isinstance(a, types.Array) and a.ndim == 1 and
+            isinstance(a.dtype, types.Integer)):
+        return None
+    if not (weights is None or weights == types.none or
+            (isinstance(weights, types.Array) and weights.ndim == 1)):
+        return None
+    # The other signatures are replaced by the one with all the arguments
+    if weights is None and minlength is None:
+        def bincount_1(a):
+            return np.bincount(a, None, 0)
+        return bincount_1
+    if minlength is None:
+        def bincount_2(a, weights):
+            return np.bincount(a, weights, 0)
+        return bincount_2
+    if weights is None:
+        def bincount_2(a, minlength):
+            return np.bincount(a, None, minlength)
+        return bincount_2
+
+    def bincount_3(a, weights, minlength):
+        numba.parfors.parfor._bincount_check(a, weights, minlength)
+        numba.parfors.parfor.init_prange()
+        n = len(a)
+        a_min = a[0] if n > 0 else 0
+        a_max = a[0] if n > 0 else -1
+        for i in numba.parfors.parfor.internal_prange(n):
+            a_min = min(a_min, a[i])
+            a_max = max(a_max, a[i])
+        numba.parfors.parfor._bincount_check_min(a_min)
+        out_length = max(a_max + 1, minlength)
+        # An empty chunk gives the zeroed output of the right dtype
+        out = numba.parfors.parfor._bincount_chunk(a, weights, 0, 0,
+                                                   out_length)
+        nchunks, chunk = numba.parfors.parfor._parallel_chunking(n)
+        for c in numba.parfors.parfor.internal_prange(nchunks):
+            out += numba.parfors.parfor._bincount_chunk(
+                a, weights, c * chunk, min(c * chunk + chunk, n), out_length)
+        return out
+    return bincount_3
+
+@register_jitable
+def _minmax_chunk(a, lo, hi):
+    """Range of the values in a[lo:hi], ignoring NaNs."""
+    vmin = np.inf
+    vmax = -np.inf
+    for i in range(lo, hi):
+        v = a[i]
+        if vmin > v:
+            vmin = v
+        if vmax < v:
+            vmax = v
+    return vmin, vmax
+
+@register_jitable
+def _histogram_uniform_chunk(a, lo, hi, bins, bin_min, bin_max, bin_ratio):
+    """Private histogram of a[lo:hi] with uniform bins."""
+    hist = np.zeros(bins, np.intp)
+    for i in range(lo, hi):
+        b = _histogram_uniform_bin(a[i], bins, bin_min, bin_max, bin_ratio)
+        if b >= 0:
+            hist[b] += 1
+    return hist
+
+@register_jitable
+def _histogram_bisect_chunk(a, lo, hi, bins, nbins):
+    """Private histogram of a[lo:hi] with the bin edges array bins."""
+    hist = np.zeros(nbins, np.intp)
+    for i in range(lo, hi):
+        b = _histogram_bisect_bin(a[i], bins, nbins)
+        if b >= 0:
+            hist[b] += 1
+    return hist
+
+@register_jitable
+def _histogram_check_bins(bins, nbins):
+    for i in range(nbins):
+        # Note this also catches NaNs
+        if not bins[i] <= bins[i + 1]:
+            raise ValueError("histogram(): bins must increase "
+                             "monotonically")
+
+@register_jitable
+def _histogram_check_range(bins, bin_min, bin_max):
+    if bins <= 0:
+        raise ValueError("histogram(): `bins` should be a "
+                         "positive integer")
+    if not bin_min <= bin_max:
+        raise ValueError("histogram(): max must be larger than "
+                         "min in range parameter")
+
+def histogram_parallel_impl(return_type, a, bins=None, range=None):
+    """Parallel histogram: each thread bins a chunk of the array into
+    private bins, which are then summed.
+    """
+    if not (isinstance(a, types.Array) and
+            isinstance(a.dtype, (types.Integer, types.Float))):
+        return None
+
+    if isinstance(bins, types.Array):
+        if range is not None:
+            # the range is ignored with a bins array, leave it to the
+            # sequential implementation
+            return None
+
+        def histogram_2(a, bins):
+            nbins = len(bins) - 1
+            numba.parfors.parfor._histogram_check_bins(bins, nbins)
+            numba.parfors.parfor.init_prange()
+            hist = np.zeros(nbins, np.intp)
+            if nbins > 0:
+                flat = a.ravel()
+                n = len(flat)
+                nchunks, chunk = numba.parfors.parfor._parallel_chunking(n)
+                for c in numba.parfors.parfor.internal_prange(nchunks):
+                    hist += numba.parfors.parfor._histogram_bisect_chunk(
+                        flat, c * chunk, min(c * chunk + chunk, n), bins,
+                        nbins)
+            return hist, bins
+        return histogram_2
+
+    # The other signatures are replaced by the one with all the arguments
+    if bins is None:
+        if range is not None:
+            return None
+
+        def histogram_1(a):
+            return np.histogram(a, 10, None)
+        return histogram_1
+    if not isinstance(bins, types.Integer):
+        return None
+    if range is None:
+        def histogram_2(a, bins):
+            return np.histogram(a, bins, None)
+        return histogram_2
+
+    if range == types.none:
+        def histogram_3(a, bins, range):
+            numba.parfors.parfor.init_prange()
+            flat = a.ravel()
+            n = len(flat)
+            # An empty chunk gives the initial values of the reductions
+            a_min, a_max = numba.parfors.parfor._minmax_chunk(flat, 0, 0)
+            nchunks, chunk = numba.parfors.parfor._parallel_chunking(n)
+            for c in numba.parfors.parfor.internal_prange(nchunks):
+                vmin, vmax = numba.parfors.parfor._minmax_chunk(
+                    flat, c * chunk, min(c * chunk + chunk, n))
+                a_min = min(a_min, vmin)
+                a_max = max(a_max, vmax)
+            return np.histogram(a, bins, (a_min, a_max))
+        return histogram_3
+
+    def histogram_3(a, bins, range):
+        bin_min, bin_max = range
+        numba.parfors.parfor._histogram_check_range(bins, bin_min, bin_max)
+        numba.parfors.parfor.init_prange()
+        hist = np.zeros(bins, np.intp)
+        if bin_max > bin_min:
+            bin_ratio = bins / (bin_max - bin_min)
+            flat = a.ravel()
+            n = len(flat)
+            nchunks, chunk = numba.parfors.parfor._parallel_chunking(n)
+            for c in numba.parfors.parfor.internal_prange(nchunks):
+                hist += numba.parfors.parfor._histogram_uniform_chunk(
+                    flat, c * chunk, min(c * chunk + chunk, n), bins,
+                    bin_min, bin_max, bin_ratio)
+        return hist, np.linspace(bin_min, bin_max, bins + 1)
+    return histogram_3
+
+@register_jitable
+def _searchsorted_chunk(a, v, out, lo, hi, side):
+    out[lo:hi] = np.searchsorted(a, v[lo:hi], side=side)
+
+def searchsorted_parallel_impl(return_type, a, v, side=None):
+    """Parallel searchsorted of an array of needles: each thread searches
+    a chunk of the needles.
+    """
+    if not (isinstance(a, types.Array) and a.ndim == 1 and
+            isinstance(v, types.Array)):
+        return None
+    if side is None:
+        def searchsorted_2(a, v):
+            return np.searchsorted(a, v, 'left')
+        return searchsorted_2
+
+    def searchsorted_3(a, v, side):
+        numba.parfors.parfor.init_prange()
+        flat = v.ravel()
+        n = len(flat)
+        out = np.empty(n, np.intp)
+        nchunks, chunk = numba.parfors.parfor._parallel_chunking(n)
+        for c in numba.parfors.parfor.internal_prange(nchunks):
+            numba.parfors.parfor._searchsorted_chunk(
+                a, flat, out, c * chunk, min(c * chunk + chunk, n), side)
+        return out.reshape(v.shape)
+    return searchsorted_3
+
+@register_jitable
+def _lanes_chunking(b):
+    """Split the lanes of ``b`` along its last axis into one chunk per
+    thread.  Returns the number of chunks and the number of lanes in each.
+    """
+    # Not b.size // b.shape[-1], the lanes must still be visited when the
+    # last axis is empty (e.g. to fill the median of empty lanes with NaN)
+    nlanes = 1
+    for d in b.shape[:-1]:
+        nlanes *= d
+    min_lanes = max(1, _PARALLEL_MIN_CHUNK // max(1, b.shape[-1]))
+    nthreads = numba.np.ufunc.parallel.get_num_threads()
+    nchunks = max(1, min(nthreads, nlanes // min_lanes))
+    chunk = max(1, (nlanes + nchunks - 1) // nchunks)
+    return (nlanes + chunk - 1) // chunk, chunk
+
+def _lane_reduction_axis(a, axis):
+    """Whether a reduction along ``axis`` of ``a`` is done in parallel,
+    i.e. an integer axis of an array with at least two dimensions.
+    """
+    return (isinstance(a, types.Array) and a.ndim >= 2 and
+            isinstance(axis, types.Integer))
+
+def _make_median_parallel_impl(func_name, skip_nan):
+    def median_parallel_impl(return_type, a, axis=None):
+        """Parallel median along an axis: each thread partitions a chunk
+        of the lanes in its own scratch buffer.
+        """
+        if not _lane_reduction_axis(a, axis):
+            return None
+        out_dt = numba.np.arraymath._median_out_dtype(a.dtype)
+
+        def median_2(a, axis):
+            numba.parfors.parfor.init_prange()
+            axis = numba.np.arrayobj.normalize_axis(func_name, "axis",
+                                                    a.ndim, axis)
+            b = numba.np.arraymath._moveaxis_last(a, axis)
+            out = np.empty(numba.np.arraymath._lanes_shape(b), out_dt)
+            flat = out.reshape(-1)
+            n = flat.size
+            nchunks, chunk = numba.parfors.parfor._lanes_chunking(b)
+            for c in numba.parfors.parfor.internal_prange(nchunks):
+                numba.np.arraymath._median_lanes(
+                    b, flat, c * chunk, min(c * chunk + chunk, n), skip_nan)
+            return out
+        return median_2
+    return median_parallel_impl
+
+def _make_percentile_parallel_impl(func_name, skip_nan, factor, check_q):
+    def percentile_parallel_impl(return_type, a, q, axis=None):
+        """Parallel percentiles along an axis: each thread partitions a
+        chunk of the lanes in its own scratch buffer.
+        """
+        if not _lane_reduction_axis(a, axis):
+            return None
+        q_scalar = (isinstance(q, (types.Number, types.Boolean)) or
+                    (isinstance(q, types.Array) and q.ndim == 0))
+
+        def percentile_3(a, q, axis):
+            numba.parfors.parfor.init_prange()
+            axis = numba.np.arrayobj.normalize_axis(func_name, "axis",
+                                                    a.ndim, axis)
+            qs = np.asarray(q, dtype=np.float64).flatten()
+            check_q(qs)
+            qs = qs * factor
+            b = numba.np.arraymath._moveaxis_last(a, axis)
+            lanes = numba.np.arraymath._lanes_shape(b)
+            out = np.empty((len(qs),) + lanes, np.float64)
+            flat = out.reshape((len(qs), -1))
+            n = flat.shape[1]
+            nchunks, chunk = numba.parfors.parfor._lanes_chunking(b)
+            for c in numba.parfors.parfor.internal_prange(nchunks):
+                numba.np.arraymath._percentile_lanes(
+                    b, qs, flat, c * chunk, min(c * chunk + chunk, n),
+                    skip_nan)
+            if q_scalar:
+                return out[0]
+            return out
+        return percentile_3
+    return percentile_parallel_impl
+
+@register_jitable
+def _scan_offset_chunk(out, start, stop, offset, prod):
+    for i in range(start, stop):
+        if prod:
+            out[i] *= offset
+        else:
+            out[i] += offset
+
+def _make_scan_parallel_impl(func_name, prod, skip_nan):
+    def scan_parallel_impl(return_type, a, axis=None):
+        """Parallel cumulative sum or product.  Without an axis, the
+        flattened array is scanned in two passes: each thread scans a chunk
+        and the totals of the preceding chunks are then added to it.  With an
+        axis, the lanes along it are split between the threads.
+        """
+        if not (isinstance(a, types.Array) and
+                isinstance(a.dtype, (types.Integer, types.Float,
+                                     types.Complex, types.Boolean))):
+            return None
+        if skip_nan and not isinstance(a.dtype, (types.Float,
+                                                 types.Complex)):
+            dtype = numba.np.arraymath._scan_out_dtype(a.dtype)
+            skip = False
+        elif skip_nan:
+            dtype = as_dtype(a.dtype)
+            skip = True
+        else:
+            dtype = numba.np.arraymath._scan_out_dtype(a.dtype)
+            skip = False
+        init = dtype.type(1 if prod else 0)
+
+        if axis is None:
+            def scan_1(a):
+                numba.parfors.parfor.init_prange()
+                flat = a.ravel()
+                n = flat.size
+                out = np.empty(n, dtype)
+                nchunks, chunk = numba.parfors.parfor._parallel_chunking(n)
+                totals = np.empty(nchunks, dtype)
+                for c in numba.parfors.parfor.internal_prange(nchunks):
+                    totals[c] = numba.np.arraymath._scan_chunk(
+                        flat, out, c * chunk, min(c * chunk + chunk, n),
+                        init, prod, skip)
+                numba.np.arraymath._scan_chunk(totals, totals, 0, nchunks,
+                                               init, prod, False)
+                for c in numba.parfors.parfor.internal_prange(1, nchunks):
+                    numba.parfors.parfor._scan_offset_chunk(
+                        out, c * chunk, min(c * chunk + chunk, n),
+                        totals[c - 1], prod)
+                return out
+            return scan_1
+
+        if not _lane_reduction_axis(a, axis):
+            return None
+
+        def scan_2(a, axis):
+            numba.parfors.parfor.init_prange()
+            axis = numba.np.arrayobj.normalize_axis(func_name, "axis",
+                                                    a.ndim, axis)
+            out = np.empty(a.shape, dtype)
+            b = numba.np.arraymath._moveaxis_last(a, axis)
+            outb = numba.np.arraymath._moveaxis_last(out, axis)
+            n = out.size // max(1, a.shape[axis])
+            nchunks, chunk = numba.parfors.parfor._lanes_chunking(b)
+            for c in numba.parfors.parfor.internal_prange(nchunks):
+                numba.np.arraymath._scan_lanes(
+                    b, outb, c * chunk, min(c * chunk + chunk, n), init,
+                    prod, skip)
+            return out
+        return scan_2
+    return scan_parallel_impl
+
+@register_jitable
+def _diff_chunk(src, out, start, stop):
+    for i in range(start, stop):
+        out[i] = src[i + 1] - src[i]
+
+@register_jitable
+def _diff_edges(out, edges, n, nchunks, chunk):
+    for c in range(nchunks):
+        edges[c] = out[min(c * chunk + chunk, n)]
+
+@register_jitable
+def _diff_chunk_inplace(out, start, stop, edge):
+    for i in range(start, stop - 1):
+        out[i] = out[i + 1] - out[i]
+    out[stop - 1] = edge - out[stop - 1]
+
+def diff_parallel_impl(return_type, a, n=None, axis=None):
+    """Parallel n-th discrete difference.  On one-dimensional arrays each
+    of the n differencing passes is split between the threads, otherwise
+    the lanes along the axis are.
+    """
+    if not (isinstance(a, types.Array) and a.ndim >= 1 and
+            isinstance(a.dtype, (types.Integer, types.Float,
+                                 types.Complex))):
+        return None
+    if n is None and axis is None:
+        def diff_1(a):
+            return np.diff(a, 1, -1)
+        return diff_1
+    if axis is None:
+        def diff_2(a, n):
+            return np.diff(a, n, -1)
+        return diff_2
+    if n is None:
+        def diff_2(a, axis):
+            return np.diff(a, 1, axis)
+        return diff_2
+    if not (isinstance(n, types.Integer) and
+            isinstance(axis, types.Integer)):
+        return None
+
+    if a.ndim == 1:
+        def diff_3(a, n, axis):
+            numba.parfors.parfor.init_prange()
+            numba.np.arrayobj.normalize_axis("np.diff", "axis", 1, axis)
+            if n == 0:
+                return a.copy()
+            numba.np.arraymath._diff_check(n)
+            m = max(a.size - 1, 0)
+            out = np.empty(m, a.dtype)
+            nchunks, chunk = numba.parfors.parfor._parallel_chunking(m)
+            for c in numba.parfors.parfor.internal_prange(nchunks):
+                numba.parfors.parfor._diff_chunk(
+                    a, out, c * chunk, min(c * chunk + chunk, m))
+            # The other passes are done in place, the first element of each
+            # chunk being saved as it is overwritten by the previous chunk
+            edges = np.empty(nchunks, a.dtype)
+            for k in range(1, n):
+                m = max(m - 1, 0)
+                nchunks, chunk = numba.parfors.parfor._parallel_chunking(m)
+                numba.parfors.parfor._diff_edges(out, edges, m, nchunks,
+                                                 chunk)
+                for c in numba.parfors.parfor.internal_prange(nchunks):
+                    numba.parfors.parfor._diff_chunk_inplace(
+                        out, c * chunk, min(c * chunk + chunk, m), edges[c])
+            if n > 1:
+                return out[:m].copy()
+            return out
+        return diff_3
+
+    def diff_3(a, n, axis):
+        numba.parfors.parfor.init_prange()
+        axis = numba.np.arrayobj.normalize_axis("np.diff", "axis", a.ndim,
+                                                axis)
+        if n == 0:
+            return a.copy()
+        numba.np.arraymath._diff_check(n)
+        out = np.empty(numba.np.arraymath._diff_shape(a, n, axis), a.dtype)
+        b = numba.np.arraymath._moveaxis_last(a, axis)
+        outb = numba.np.arraymath._moveaxis_last(out, axis)
+        nlanes = out.size // max(1, out.shape[axis])
+        nchunks, chunk = numba.parfors.parfor._lanes_chunking(b)
+        if out.size == 0:
+            nchunks = 0
+        for c in numba.parfors.parfor.internal_prange(nchunks):
+            numba.np.arraymath._diff_lanes(
+                b, outb, c * chunk, min(c * chunk + chunk, nlanes), n)
+        return out
+    return diff_3
+
 swap_functions_map = {
     ('argmin', 'numpy'): lambda r,a: argmin_parallel_impl,
     ('argmax', 'numpy'): lambda r,a: argmax_parallel_impl,
@@ -462,6 +1126,29 @@ swap_functions_map = {
     ('dot', 'numpy'): dot_parallel_impl,
     ('arange', 'numpy'): arange_parallel_impl,
     ('linspace', 'numpy'): linspace_parallel_impl,
+    ('sort', 'numpy'): sort_parallel_impl,
+    ('argsort', 'numpy'): argsort_parallel_impl,
+    ('unique', 'numpy'): unique_parallel_impl,
+    ('bincount', 'numpy'): bincount_parallel_impl,
+    ('histogram', 'numpy'): histogram_parallel_impl,
+    ('searchsorted', 'numpy'): searchsorted_parallel_impl,
+    ('median', 'numpy'): _make_median_parallel_impl('np.median', False),
+    ('nanmedian', 'numpy'): _make_median_parallel_impl('np.nanmedian', True),
+    ('percentile', 'numpy'): _make_percentile_parallel_impl(
+        'np.percentile', False, 1.0, percentile_is_valid),
+    ('nanpercentile', 'numpy'): _make_percentile_parallel_impl(
+        'np.nanpercentile', True, 1.0, percentile_is_valid),
+    ('quantile', 'numpy'): _make_percentile_parallel_impl(
+        'np.quantile', False, 100.0, quantile_is_valid),
+    ('nanquantile', 'numpy'): _make_percentile_parallel_impl(
+        'np.nanquantile', True, 100.0, quantile_is_valid),
+    ('cumsum', 'numpy'): _make_scan_parallel_impl('np.cumsum', False, False),
+    ('cumprod', 'numpy'): _make_scan_parallel_impl('np.cumprod', True, False),
+    ('nancumsum', 'numpy'): _make_scan_parallel_impl('np.nancumsum', False,
+                                                     True),
+    ('nancumprod', 'numpy'): _make_scan_parallel_impl('np.nancumprod', True,
+                                                      True),
+    ('diff', 'numpy'): diff_parallel_impl,
 }
 
 def fill_parallel_impl(return_type, arr, val):
@@ -483,8 +1170,34 @@ def fill_parallel_impl(return_type, arr, val):
             return None
     return fill_1
 
+def sort_inplace_parallel_impl(return_type, arr, kind=None):
+    """Parallel implementation of ndarray.sort, see sort_parallel_impl.
+    """
+    if _parallel_sortable(arr):
+        if kind is None:
+            def sort_1(in_arr):
+                in_arr[:] = np.sort(in_arr)
+                return None
+        else:
+            def sort_1(in_arr, kind):
+                in_arr[:] = np.sort(in_arr)
+                return None
+    else:
+        if kind is None:
+            def sort_1(in_arr):
+                numba.parfors.parfor._serial_sort(in_arr)
+                return None
+        else:
+            def sort_1(in_arr, kind):
+                numba.parfors.parfor._serial_sort_kind(in_arr, kind)
+                return None
+    return sort_1
+
 replace_functions_ndarray = {
     'fill': fill_parallel_impl,
+    'sort': sort_inplace_parallel_impl,
+    'cumsum': _make_scan_parallel_impl('np.cumsum', False, False),
+    'cumprod': _make_scan_parallel_impl('np.cumprod', True, False),
 }
 
 @register_jitable
@@ -1521,12 +2234,11 @@ class PreParforPass(object):
                                             typs, self.typemap, self.calltypes, work_list)
                             call_table = get_call_table(new_blocks, topological_ordering=False)
 
-                            # find the prange in the new blocks and record it for use in diagnostics
+                            # find the pranges in the new blocks and record them for use in diagnostics
                             for call in call_table:
                                 for k, v in call.items():
-                                    if v[0] == 'internal_prange':
+                                    if v and v[0] == 'internal_prange':
                                         swapped[k] = [callname, repl_func.__name__, func_def, block.body[i].loc]
-                                        break
                             return True
                         if guard(replace_func):
                             self.stats['replaced_func'] += 1
@@ -2121,6 +2833,8 @@ class ConvertNumpyPass:
             return False
         if call_name in ['zeros', 'ones']:
             return True
+        if call_name == 'empty' and self.pass_states.options.first_touch:
+            return True
         if mod_name == 'numpy.random' and call_name in random_calls:
             return True
         # TODO: add more calls
@@ -2130,7 +2844,8 @@ class ConvertNumpyPass:
         call_name, mod_name = find_callname(self.pass_states.func_ir, expr)
         args = expr.args
         kws = dict(expr.kws)
-        if call_name in ['zeros', 'ones'] or mod_name == 'numpy.random':
+        if (call_name in ['zeros', 'ones', 'empty'] or
+                mod_name == 'numpy.random'):
             return self._numpy_map_to_parfor(equiv_set, call_name, lhs, args, kws, expr)
         # return error if we couldn't handle it (avoid rewrite infinite loop)
         raise errors.UnsupportedRewriteError(
@@ -2145,6 +2860,9 @@ class ConvertNumpyPass:
         loc = lhs.loc
         arr_typ = pass_states.typemap[lhs.name]
         el_typ = arr_typ.dtype
+        if (call_name == 'empty' and
+                not isinstance(el_typ, (types.Number, types.Boolean))):
+            return None
 
         # generate loopnests and size variables from lhs correlations
         size_vars = equiv_set.get_shape(lhs)
@@ -2170,7 +2888,9 @@ class ConvertNumpyPass:
         index_var, index_var_typ = _make_index_var(
             pass_states.typemap, scope, index_vars, body_block)
 
-        if call_name == 'zeros':
+        if call_name in ('zeros', 'empty'):
+            # np.empty() is filled in parallel for its pages to be first
+            # touched by the threads that will work on them
             value = ir.Const(el_typ(0), loc)
         elif call_name == 'ones':
             value = ir.Const(el_typ(1), loc)
@@ -3688,7 +4408,8 @@ def get_parfor_outputs(parfor, parfor_params):
 
 _RedVarInfo = make_dataclass(
     "_RedVarInfo",
-    ["init_val", "reduce_nodes", "redop"],
+    ["init_val", "reduce_nodes", "redop",
+     ("reduction", object, field(default=None))],
     frozen=True,
 )
 
@@ -3771,6 +4492,8 @@ def get_parfor_reductions(func_ir, parfor, parfor_params, calltypes, reductions=
                     init_val=init_val,
                     reduce_nodes=reduce_nodes,
                     redop=redop,
+                    reduction=guard(get_declared_reduction, func_ir,
+                                    reduce_nodes[0].value),
                 )
 
     return reduce_varnames, reductions
@@ -3821,6 +4544,18 @@ def get_reduction_init(nodes):
         return 1, acc_expr_fn
     return None, None
 
+def get_declared_reduction(func_ir, expr):
+    """
+    Get the reduction declared with ``numba.reduction`` for the function
+    called by ``expr``.
+    """
+    require(isinstance(expr, ir.Expr) and expr.op == 'call')
+    func_def = get_definition(func_ir, expr.func)
+    require(isinstance(func_def, (ir.Global, ir.FreeVar)))
+    red = get_reduction(func_def.value)
+    require(red is not None)
+    return red
+
 def supported_reduction(x, func_ir):
     if x.op == 'inplace_binop' or x.op == 'binop':
         if x.fn == operator.ifloordiv or x.fn == operator.floordiv:
@@ -3847,6 +4582,8 @@ def supported_reduction(x, func_ir):
             ('datetime_maximum', 'numba.np.npdatetime_helpers'),
         ]:
             return True
+        if guard(get_declared_reduction, func_ir, x) is not None:
+            return True
     return False
 
 def get_reduce_nodes(reduction_node, nodes, func_ir):
@@ -3947,6 +4684,11 @@ def get_reduce_nodes(reduction_node, nodes, func_ir):
                 if not supported_reduction(rhs, func_ir):
                     raise ValueError(("Use of reduction variable " + unversioned_name +
                                       " in an unsupported reduction function."))
+                if guard(get_declared_reduction, func_ir, rhs) is not None:
+                    # Declared reductions are finalized by calling their
+                    # combine function, the update call is left untouched.
+                    reduce_nodes = nodes[i:]
+                    break
                 args = [(x.name, noncyclic_lookup(x, True))
                         for x in get_expr_args(rhs) ]
                 non_red_args = [ x for (x, y) in args if y.name != name ]
@@ -141,6 +141,7 @@ def _lower_parfor_parallel_std(lowerer, parfor):
     # init reduction array allocation here.
     nredvars = len(parfor_redvars)
     redarrs = {}
+    declared_reductions = {}
     to_cleanup = []
     if nredvars > 0:
         # reduction arrays outer dimension equal to thread count
@@ -168,6 +169,27 @@ def _lower_parfor_parallel_std(lowerer, parfor):
             redvar_typ = lowerer.fndesc.typemap[red_name]
             # Get the ir.Var for the reduction variable.
             redvar = ir.Var(scope, red_name, loc)
+
+            # A reduction declared with numba.reduction keeps the per-thread
+            # values in a typed List of the reduction variable's type, each
+            # element initialized to the identity of the reduction.
+            red = parfor_reddict[red_name].reduction
+            if red is not None:
+                new_partials = pfbdr.bind_global_function(
+                    fobj=red.new_partials,
+                    ftype=types.Dispatcher(red.new_partials),
+                    args=(types.intp, redvar_typ),
+                )
+                partials_var = pfbdr.assign_inplace(
+                    rhs=pfbdr.call(new_partials,
+                                   args=[num_threads_var, redvar]),
+                    typ=types.ListType(redvar_typ),
+                    name=_declared_reduction_partials(red_name),
+                )
+                declared_reductions[red_name] = partials_var
+                to_cleanup.append(partials_var)
+                continue
+
             # Get the type of the array that holds the per-thread
             # reduction variables.
             redarrvar_typ = redtyp_to_redarraytype(redvar_typ)
@@ -354,6 +376,9 @@ def _lower_parfor_parallel_std(lowerer, parfor):
 
     # get the shape signature
     func_args = ['sched'] + func_args
+    # The per-thread values of declared reductions are passed as inputs
+    parfor_redvars = [v for v in parfor_redvars
+                      if v not in declared_reductions]
     num_reductions = len(parfor_redvars)
     num_inputs = len(func_args) - len(parfor_output_arrays) - num_reductions
     if config.DEBUG_ARRAY_OPT:
@@ -398,6 +423,9 @@ def _lower_parfor_parallel_std(lowerer, parfor):
         _parfor_lowering_finalize_reduction(
             parfor, redarrs, lowerer, parfor_reddict, num_threads_var,
         )
+        for redvar_name, partials_var in declared_reductions.items():
+            _lower_declared_reduce(parfor, lowerer, redvar_name, partials_var,
+                                   parfor_reddict[redvar_name])
 
     # Cleanup reduction variable
     for v in to_cleanup:
@@ -540,6 +568,59 @@ def _lower_non_trivial_reduce(parfor, lowerer, thread_count_var, reduce_info):
             varname,
         )
 
+def _declared_reduction_partials(redvar_name):
+    """Name of the variable holding the per-thread values of a reduction
+    declared with ``numba.reduction``.
+    """
+    return f"${redvar_name}_partials"
+
+
+def _lower_declared_reduce(parfor, lowerer, redvar_name, partials_var,
+                           redvar_info):
+    """Lower reduction declared with ``numba.reduction``.  The per-thread
+    values are merged by the combine function of the reduction.
+    """
+    red = redvar_info.reduction
+    typemap = lowerer.fndesc.typemap
+    redvar_typ = typemap[redvar_name]
+    pfbdr = ParforLoweringBuilder(lowerer=lowerer,
+                                  scope=parfor.init_block.scope,
+                                  loc=parfor.init_block.loc)
+    for inst in redvar_info.reduce_nodes:
+        # Var assigns to Var?
+        if _lower_var_to_var_assign(lowerer, inst):
+            pass
+        # The call to the update function?
+        elif (isinstance(inst, ir.Assign)
+                and isinstance(inst.value, ir.Expr)
+                and inst.value.op == "call"):
+            finish = pfbdr.bind_global_function(
+                fobj=red.finish,
+                ftype=types.Dispatcher(red.finish),
+                args=(redvar_typ, typemap[partials_var.name]),
+            )
+            redvar = ir.Var(parfor.init_block.scope, redvar_name,
+                            parfor.init_block.loc)
+            pfbdr.assign_inplace(
+                rhs=pfbdr.call(finish, args=[redvar, partials_var]),
+                typ=redvar_typ,
+                name=inst.target.name,
+            )
+        # Otherwise?
+        else:
+            raise ParforsUnexpectedReduceNodeError(inst)
+
+        # XXX: This seems like a hack to stop the loop with this condition.
+        if _fix_redvar_name_ssa_mismatch(parfor, lowerer, inst, redvar_name):
+            break
+
+    if config.DEBUG_ARRAY_OPT_RUNTIME:
+        lowerer.print_variable(
+            f"{parfor.loc}: parfor declared reduction {redvar_name} =",
+            redvar_name,
+        )
+
+
 def _lower_var_to_var_assign(lowerer, inst):
     """Lower Var->Var assignment.
 
@@ -1098,12 +1179,22 @@ def _create_gufunc_for_parfor_body(
     typemap = lowerer.fndesc.typemap
     parfor_redvars, parfor_reddict = numba.parfors.parfor.get_parfor_reductions(
         lowerer.func_ir, parfor, parfor_params, lowerer.fndesc.calltypes)
+    # The per-thread values of reductions declared with numba.reduction are
+    # passed in a typed List rather than a reduction array.
+    declared_redvars = [v for v in parfor_redvars
+                        if parfor_reddict[v].reduction is not None]
+    declared_partials = []
+    for var in declared_redvars:
+        partials = _declared_reduction_partials(var)
+        declared_partials.append(partials)
+        typemap.setdefault(partials, types.ListType(typemap[var]))
     # Compute just the parfor inputs as a set difference.
     parfor_inputs = sorted(
         list(
             set(parfor_params) -
             set(parfor_outputs) -
-            set(parfor_redvars)))
+            set(parfor_redvars)) + declared_partials)
+    parfor_redvars = [v for v in parfor_redvars if v not in declared_redvars]
 
     if config.DEBUG_ARRAY_OPT >= 1:
         print("parfor_params = ", parfor_params, " ", type(parfor_params))
@@ -1171,7 +1262,7 @@ def _create_gufunc_for_parfor_body(
         print("parfor_inputs post tuple handling = ", parfor_inputs, " ", type(parfor_inputs))
     # -------------------------------------------------------------------------
 
-    races = races.difference(set(parfor_redvars))
+    races = races.difference(set(parfor_redvars + declared_redvars))
     for race in races:
         msg = ("Variable %s used in parallel loop may be written "
                "to simultaneously by multiple workers and may result "
@@ -1205,7 +1296,7 @@ def _create_gufunc_for_parfor_body(
 
     # Some Var are not legal parameter names so create a dict of potentially illegal
     # param name to guaranteed legal name.
-    param_dict = legalize_names_with_typemap(parfor_params + parfor_redvars + parfor_tuple_params, typemap)
+    param_dict = legalize_names_with_typemap(parfor_params + parfor_redvars + declared_redvars + parfor_tuple_params, typemap)
     if config.DEBUG_ARRAY_OPT >= 1:
         print(
             "param_dict = ",
@@ -1354,10 +1445,14 @@ def _create_gufunc_for_parfor_body(
 
     gufunc_thread_id_var = "ParallelAcceleratorGufuncThreadId"
 
-    if len(parfor_redarrs) > 0:
+    if len(parfor_redarrs) > 0 or len(declared_redvars) > 0:
         gufunc_txt += "    " + gufunc_thread_id_var + " = "
         gufunc_txt += "numba.np.ufunc.parallel._iget_thread_id()\n"
 
+    for partials, var in zip(declared_partials, declared_redvars):
+        gufunc_txt += "    " + param_dict[var] + \
+             "=" + param_dict[partials] + "[" + gufunc_thread_id_var + "]\n"
+
     # Add initialization of reduction variables
     for arr, var in zip(parfor_redarrs, parfor_redvars):
         gufunc_txt += "    " + param_dict[var] + \
@@ -1405,6 +1500,9 @@ def _create_gufunc_for_parfor_body(
         # After the gufunc loops, copy the accumulated temp value back to reduction array.
         gufunc_txt += "    " + param_dict[arr] + \
             "[" + gufunc_thread_id_var + "] = " + param_dict[var] + "\n"
+    for partials, var in zip(declared_partials, declared_redvars):
+        gufunc_txt += "    " + param_dict[partials] + \
+            "[" + gufunc_thread_id_var + "] = " + param_dict[var] + "\n"
     gufunc_txt += "    return None\n"
 
     if config.DEBUG_ARRAY_OPT:
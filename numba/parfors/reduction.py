@@ -0,0 +1,118 @@
+"""
+User-defined reductions for ``prange`` loops.
+
+The reduction operators recognised by the parfors pass are limited to a few
+syntactic forms (``+=``, ``*=``, ``min``, ``max``...).  The :func:`reduction`
+decorator declares a function as an update step of a reduction with a given
+identity and combine function.  When such a function is used to update a
+variable in a ``prange`` loop, e.g. ``acc = update(acc, A[i])``, each worker
+thread accumulates into a private value initialised with the identity and the
+private values are merged with the combine function once the loop completes.
+
+This module is imported by ``import numba`` and must stay light, it must not
+import the parfors machinery.
+"""
+
+import weakref
+
+from numba.core import errors
+from numba.core.decorators import njit
+from numba.core.registry import CPUDispatcher
+
+
+# Maps the dispatcher of a declared update function to its Reduction
+_reductions = weakref.WeakKeyDictionary()
+
+
+def _as_dispatcher(func):
+    if isinstance(func, CPUDispatcher):
+        return func
+    return njit(func)
+
+
+class Reduction(object):
+    """
+    A reduction declared with :func:`reduction`.
+    """
+
+    def __init__(self, identity, combine):
+        from numba.typed import List
+
+        self.identity = identity = _as_dispatcher(identity)
+        self.combine = combine = _as_dispatcher(combine)
+
+        @njit
+        def new_partials(nthreads, acc):
+            # ``acc`` is only used to give the list its type, the slot of
+            # each thread starts at the identity.
+            partials = List()
+            partials.append(acc)
+            partials[0] = identity()
+            for i in range(1, nthreads):
+                partials.append(identity())
+            return partials
+
+        @njit
+        def finish(acc, partials):
+            # Pairwise tree combine of the per-thread partial results, the
+            # order of the operands is preserved so the combine function
+            # need not be commutative.
+            n = len(partials)
+            step = 1
+            while step < n:
+                for i in range(0, n - step, 2 * step):
+                    partials[i] = combine(partials[i], partials[i + step])
+                step *= 2
+            return combine(acc, partials[0])
+
+        self.new_partials = new_partials
+        self.finish = finish
+
+
+def reduction(identity, combine):
+    """
+    Declare the decorated function as the update step of a reduction that
+    can be parallelised in a ``prange`` loop.
+
+    *identity* is a function with no arguments returning the identity of the
+    reduction, a new value must be returned on each call since it is used to
+    initialise the private accumulator of every thread.  *combine* is an
+    associative function merging two accumulators into one.  It is required
+    as the update step cannot stand in for it in general: merging two partial
+    results is not the same as applying an update to them (e.g. counting).
+    All of them are compiled with ``njit`` unless they already are jitted
+    functions.
+
+    The decorated function must be called as ``acc = update(acc, ...)`` in
+    the loop body, where ``acc`` is the reduction variable.
+
+    Example::
+
+        @numba.reduction(identity=lambda: Dict.empty(int64, int64),
+                         combine=merge_counts)
+        def count(acc, key):
+            acc[key] = acc.get(key, 0) + 1
+            return acc
+    """
+    if not callable(identity):
+        raise errors.NumbaTypeError("identity must be a function")
+    if not callable(combine):
+        raise errors.NumbaTypeError("combine must be a function")
+
+    def decorate(update):
+        disp = _as_dispatcher(update)
+        _reductions[disp] = Reduction(identity, combine)
+        return disp
+
+    return decorate
+
+
+def get_reduction(func):
+    """
+    Return the :class:`Reduction` declared for *func* or None.
+    """
+    try:
+        return _reductions.get(func)
+    except TypeError:
+        # not weak-referenceable or not hashable
+        return None
@@ -0,0 +1,82 @@
+"""
+Measure the throughput of calls to already-compiled jitted functions from
+an increasing number of threads.
+
+Calls whose argument types exactly match a compiled overload are resolved
+by the dispatcher without taking the compiler lock, so the aggregate call
+rate should keep increasing with the number of threads, as far as the
+interpreter allows (the GIL is released while running ``nogil`` functions,
+and not at all needed on free-threaded builds).
+
+Usage: python -m numba.scripts.bench_dispatch_threads [max_threads]
+"""
+
+import sys
+import threading
+import time
+
+import numpy as np
+
+from numba import njit
+
+
+@njit(nogil=True)
+def small_kernel(x, y):
+    return x * y + 1
+
+
+@njit(nogil=True)
+def array_kernel(a, i):
+    return a[i % a.size] * 2.0
+
+
+def make_many_overloads(func, n):
+    # Populate the dispatcher with unrelated overloads, so that resolution
+    # has to pick the right one among many.
+    for dtype in (np.int8, np.int16, np.int32, np.uint8, np.uint16,
+                  np.uint32, np.float32)[:n]:
+        func(dtype(1), dtype(2))
+
+
+def worker(ncalls, barrier, out, idx):
+    a = np.arange(16.0)
+    barrier.wait()
+    start = time.perf_counter()
+    for i in range(ncalls):
+        small_kernel(i, 2.5)
+        array_kernel(a, i)
+    out[idx] = time.perf_counter() - start
+
+
+def run(nthreads, ncalls):
+    barrier = threading.Barrier(nthreads)
+    timings = [0.0] * nthreads
+    threads = [threading.Thread(target=worker,
+                                args=(ncalls, barrier, timings, i))
+               for i in range(nthreads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return 2 * ncalls * nthreads / max(timings)
+
+
+def main(max_threads=64, ncalls=50000):
+    make_many_overloads(small_kernel, 7)
+    # Compile the benchmarked signatures
+    small_kernel(1, 2.5)
+    array_kernel(np.arange(16.0), 1)
+
+    print("%8s %16s %10s" % ("threads", "calls/s", "scaling"))
+    base = None
+    nthreads = 1
+    while nthreads <= max_threads:
+        rate = run(nthreads, ncalls)
+        if base is None:
+            base = rate
+        print("%8d %16.0f %10.2f" % (nthreads, rate, rate / base))
+        nthreads *= 2
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:2]])
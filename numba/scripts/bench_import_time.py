@@ -0,0 +1,79 @@
+"""
+Measure the time taken by ``import numba`` in a fresh interpreter, and the
+time taken by the first compilation afterwards.
+
+The parfors and stencil machinery, the jitclass registrations and the
+typing/lowering registries are only loaded when the first function is
+compiled, so the import itself should stay cheap.  The first compilation
+pays for them instead.
+
+Usage: python -m numba.scripts.bench_import_time [repeat] [max_seconds]
+
+If ``max_seconds`` is given, the script exits with a non-zero status when
+the median import time exceeds it, so it can be used as a regression check.
+"""
+
+import statistics
+import subprocess
+import sys
+
+
+# Modules that must not be loaded by a plain ``import numba``
+LAZY_MODULES = (
+    'numba.parfors.parfor',
+    'numba.parfors.parfor_lowering',
+    'numba.parfors.array_analysis',
+    'numba.stencils.stencil',
+    'numba.experimental.jitclass.boxing',
+    'numba.experimental.jitclass.overloads',
+)
+
+_import_code = """if 1:
+    import sys, time
+    t0 = time.perf_counter()
+    import numba
+    t1 = time.perf_counter()
+    eager = [m for m in %(lazy)r if m in sys.modules]
+    @numba.njit
+    def f(x):
+        return x + 1
+    f(1)
+    t2 = time.perf_counter()
+    print(t1 - t0, t2 - t1, ','.join(eager))
+    """ % {'lazy': LAZY_MODULES}
+
+
+def run_once():
+    out = subprocess.check_output([sys.executable, '-c', _import_code])
+    import_time, compile_time, *eager = out.decode().split()
+    return float(import_time), float(compile_time), eager
+
+
+def main(repeat=5, max_seconds=None):
+    import_times = []
+    compile_times = []
+    eager = []
+    for _ in range(repeat):
+        import_time, compile_time, eager = run_once()
+        import_times.append(import_time)
+        compile_times.append(compile_time)
+
+    median = statistics.median(import_times)
+    print("%-22s %10.3f s" % ("import numba", median))
+    print("%-22s %10.3f s" % ("first compilation",
+                              statistics.median(compile_times)))
+    status = 0
+    if eager:
+        print("eagerly imported: %s" % eager[0])
+        status = 1
+    if max_seconds is not None and median > max_seconds:
+        print("import time exceeds %.3f s" % max_seconds)
+        status = 1
+    return status
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    repeat = int(args[0]) if args else 5
+    max_seconds = float(args[1]) if len(args) > 1 else None
+    sys.exit(main(repeat, max_seconds))
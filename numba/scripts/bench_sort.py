@@ -0,0 +1,90 @@
+"""
+Compare the default sort of jitted code (``array.sort``, ``np.sort``,
+``np.argsort``, ``list.sort`` and ``sorted``) with NumPy's on inputs that
+are usually hard for quicksorts: sorted, reversed, with many duplicates,
+sorted with a few unsorted elements, and random.
+
+Usage: python -m numba.scripts.bench_sort [size]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from numba import njit
+from numba.typed import List
+
+
+@njit
+def array_sort(a):
+    a.sort()
+
+
+@njit
+def np_argsort(a):
+    return np.argsort(a)
+
+
+@njit
+def list_sort(lst):
+    lst.sort()
+
+
+def make_inputs(n, dtype):
+    rng = np.random.default_rng(42)
+    random = rng.integers(0, 1 << 30, n).astype(dtype)
+    ascending = np.sort(random)
+    # Timestamps sorted by blocks, as in logs merged from several sources
+    nearly = ascending.copy()
+    idx = rng.integers(0, n, n // 100)
+    nearly[idx] = random[idx]
+    return {
+        'random': random,
+        'sorted': ascending,
+        'reversed': ascending[::-1].copy(),
+        'few uniques': rng.integers(0, 16, n).astype(dtype),
+        'nearly sorted': nearly,
+        'organ pipe': np.concatenate((ascending[::2], ascending[1::2][::-1])),
+    }
+
+
+def best_of(func, make_arg, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        arg = make_arg()
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n=1000000):
+    print("%-14s %-9s %10s %10s %10s %10s" % ("input", "dtype", "numba",
+                                              "numpy", "argsort", "np.arg"))
+    for dtype in (np.int64, np.float64):
+        for name, data in make_inputs(n, dtype).items():
+            array_sort(data.copy())
+            np_argsort(data)
+            t_nb = best_of(array_sort, data.copy)
+            t_np = best_of(lambda a: a.sort(kind='quicksort'), data.copy)
+            t_nb_arg = best_of(np_argsort, lambda: data)
+            t_np_arg = best_of(lambda a: np.argsort(a, kind='quicksort'),
+                               lambda: data)
+            print("%-14s %-9s %9.2fms %9.2fms %9.2fms %9.2fms"
+                  % (name, np.dtype(dtype).name, t_nb * 1e3, t_np * 1e3,
+                     t_nb_arg * 1e3, t_np_arg * 1e3))
+
+    print()
+    print("%-14s %10s %10s" % ("input", "list.sort", "python"))
+    m = n // 10
+    for name, data in make_inputs(m, np.int64).items():
+        values = data.tolist()
+        list_sort(List(values[:10]))
+        t_nb = best_of(list_sort, lambda: List(values), repeat=3)
+        t_py = best_of(lambda lst: lst.sort(), lambda: list(values))
+        print("%-14s %9.2fms %9.2fms" % (name, t_nb * 1e3, t_py * 1e3))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:2]])
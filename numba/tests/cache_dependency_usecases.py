@@ -0,0 +1,16 @@
+"""
+This file will be copied to a temporary directory in order to
+exercise the invalidation of cached functions calling jitted functions
+from another module, which the test writes next to it.
+
+See test_caching.py.
+"""
+
+from numba import jit
+
+from dependency_caching_test_callee import callee
+
+
+@jit(cache=True, nopython=True)
+def caller(x):
+    return callee(x) + 1
@@ -0,0 +1,27 @@
+"""
+This file will be copied to a temporary directory in order to
+exercise the caching of the implementations of @overload templates.
+
+See test_caching.py.
+"""
+
+from numba import jit
+from numba.extending import overload
+
+
+def scale(x):
+    pass
+
+
+@overload(scale)
+def ol_scale(x):
+    factor = 2
+
+    def impl(x):
+        return x * factor
+    return impl
+
+
+@jit(nopython=True)
+def use(x):
+    return scale(x) + 1
@@ -46,10 +46,12 @@ class UfuncCacheTest(BaseCacheTest):
         self.assertEqual(len(data_loaded), count)
         self.assertEqual(len(index_loaded), count)
 
-    def check_ufunc_cache(self, usecase_name, n_overloads, **kwargs):
+    def check_ufunc_cache(self, usecase_name, n_overloads, n_loaded=None,
+                          **kwargs):
         """
         Check number of cache load/save.
-        There should be one per overloaded version.
+        There should be one per overloaded version and cached wrapper, and
+        *n_loaded* (by default *n_overloads*) loads from the cache.
         """
         mod = self.import_module()
         usecase = getattr(mod, usecase_name)
@@ -63,7 +65,9 @@ class UfuncCacheTest(BaseCacheTest):
         with capture_cache_log() as out:
             cached_ufunc = usecase(**kwargs)
         cachelog = out.getvalue()
-        self.check_cache_loaded(cachelog, count=n_overloads)
+        if n_loaded is None:
+            n_loaded = n_overloads
+        self.check_cache_loaded(cachelog, count=n_loaded)
 
         return new_ufunc, cached_ufunc
 
@@ -71,8 +75,10 @@ class UfuncCacheTest(BaseCacheTest):
 class TestUfuncCacheTest(UfuncCacheTest):
 
     def test_direct_ufunc_cache(self, **kwargs):
+        # 2 cache entry for the 2 overloads
+        # and 2 cache entry for the ufunc (or parallel ufunc) wrapper
         new_ufunc, cached_ufunc = self.check_ufunc_cache(
-            "direct_ufunc_cache_usecase", n_overloads=2, **kwargs)
+            "direct_ufunc_cache_usecase", n_overloads=2 + 2, **kwargs)
         # Test the cached and original versions
         inp = np.random.random(10).astype(np.float64)
         np.testing.assert_equal(new_ufunc(inp), cached_ufunc(inp))
@@ -101,7 +107,7 @@ class TestUfuncCacheTest(UfuncCacheTest):
 class TestDUfuncCacheTest(UfuncCacheTest):
     # Note: DUFunc doesn't support parallel target yet
 
-    def check_dufunc_usecase(self, usecase_name):
+    def check_dufunc_usecase(self, usecase_name, n_cached):
         mod = self.import_module()
         usecase = getattr(mod, usecase_name)
         # Create dufunc
@@ -111,20 +117,21 @@ class TestDUfuncCacheTest(UfuncCacheTest):
         # Compile & cache
         with capture_cache_log() as out:
             ufunc(np.arange(10))
-        self.check_cache_saved(out.getvalue(), count=1)
+        self.check_cache_saved(out.getvalue(), count=n_cached)
         self.check_cache_loaded(out.getvalue(), count=0)
         # Use cached
         with capture_cache_log() as out:
             ufunc = usecase()
             ufunc(np.arange(10))
-        self.check_cache_loaded(out.getvalue(), count=1)
+        self.check_cache_loaded(out.getvalue(), count=n_cached)
 
     def test_direct_dufunc_cache(self):
         # We don't test for objmode because DUfunc don't support it.
-        self.check_dufunc_usecase('direct_dufunc_cache_usecase')
+        # The loop and its ufunc wrapper
+        self.check_dufunc_usecase('direct_dufunc_cache_usecase', n_cached=2)
 
     def test_indirect_dufunc_cache(self):
-        self.check_dufunc_usecase('indirect_dufunc_cache_usecase')
+        self.check_dufunc_usecase('indirect_dufunc_cache_usecase', n_cached=1)
 
 
 def _fix_raw_path(rstr):
@@ -166,7 +173,16 @@ class TestGUfuncCacheTest(UfuncCacheTest):
         self.test_direct_gufunc_cache(forceobj=True)
 
     def test_direct_gufunc_cache_parallel(self):
-        self.test_direct_gufunc_cache(target='parallel')
+        # 2 cache entry for the 2 overloads, 2 for the gufunc wrapper
+        # and 2 for the parallel wrapper, which the gufunc wrapper is
+        # linked into so that only it and the overloads are loaded
+        new_ufunc, cached_ufunc = self.check_ufunc_cache(
+            "direct_gufunc_cache_usecase", n_overloads=2 + 2 + 2,
+            n_loaded=2 + 2, target='parallel')
+        inp = np.random.random(10).astype(np.float64)
+        np.testing.assert_equal(new_ufunc(inp), cached_ufunc(inp))
+        inp = np.arange(10, dtype=np.intp)
+        np.testing.assert_equal(new_ufunc(inp), cached_ufunc(inp))
 
     def test_indirect_gufunc_cache(self, **kwargs):
         # 3 cache entry for the 3 overloads
@@ -1,4 +1,5 @@
 from itertools import product, combinations_with_replacement
+import warnings
 
 import numpy as np
 
@@ -38,6 +39,24 @@ def array_cumsum_global(arr):
 def array_nancumsum(arr):
     return np.nancumsum(arr)
 
+def array_cumsum_axis(arr, axis):
+    return arr.cumsum(axis=axis)
+
+def array_cumsum_axis_global(arr, axis):
+    return np.cumsum(arr, axis)
+
+def array_cumprod_axis(arr, axis):
+    return arr.cumprod(axis=axis)
+
+def array_cumprod_axis_global(arr, axis):
+    return np.cumprod(arr, axis)
+
+def array_nancumsum_axis(arr, axis):
+    return np.nancumsum(arr, axis=axis)
+
+def array_nancumprod_axis(arr, axis):
+    return np.nancumprod(arr, axis=axis)
+
 def array_sum(arr):
     return arr.sum()
 
@@ -101,6 +120,9 @@ def array_argmax_global(arr):
 def array_median_global(arr):
     return np.median(arr)
 
+def array_median_axis(arr, axis):
+    return np.median(arr, axis=axis)
+
 def array_nanmin(arr):
     return np.nanmin(arr)
 
@@ -125,6 +147,9 @@ def array_nanvar(arr):
 def array_nanmedian_global(arr):
     return np.nanmedian(arr)
 
+def array_nanmedian_axis(arr, axis):
+    return np.nanmedian(arr, axis=axis)
+
 def array_percentile_global(arr, q):
     return np.percentile(arr, q)
 
@@ -143,6 +168,18 @@ def array_quantile_global(arr, q):
 def array_nanquantile_global(arr, q):
     return np.nanquantile(arr, q)
 
+def array_percentile_axis(arr, q, axis):
+    return np.percentile(arr, q, axis=axis)
+
+def array_nanpercentile_axis(arr, q, axis):
+    return np.nanpercentile(arr, q, axis=axis)
+
+def array_quantile_axis(arr, q, axis):
+    return np.quantile(arr, q, axis=axis)
+
+def array_nanquantile_axis(arr, q, axis):
+    return np.nanquantile(arr, q, axis=axis)
+
 def base_test_arrays(dtype):
     if dtype == np.bool_:
         def factory(n):
@@ -546,6 +583,85 @@ class TestArrayReductions(MemoryLeakMixin, TestCase):
         pyfunc = array_nanmedian_global
         self.check_median_basic(pyfunc, self._array_variations)
 
+    def check_median_axis(self, pyfunc, array_variations):
+        cfunc = jit(nopython=True)(pyfunc)
+
+        def check(arr):
+            for axis in range(-arr.ndim, arr.ndim):
+                expected = pyfunc(arr, axis)
+                got = cfunc(arr, axis)
+                # NumPy may return non-contiguous results
+                if isinstance(expected, np.ndarray):
+                    expected = np.ascontiguousarray(expected)
+                self.assertPreciseEqual(got, expected)
+
+        for a in array_variations(np.arange(60) + 10.5):
+            check(a)
+            check(a.reshape((3, 4, 5)))
+            check(a.reshape((3, 4, 5)).T)
+            check(a.reshape((6, 10))[::2, 1::3])
+        check(np.arange(24, dtype=np.int32).reshape((4, 6)))
+        check(np.arange(24, dtype=np.float32).reshape((4, 6)))
+
+    def test_median_axis(self):
+        def variations(a):
+            yield a
+            a = a[::-1].copy()
+            yield a
+            np.random.shuffle(a)
+            yield a
+            a[a % 4 >= 1] = 3.5
+            yield a
+
+        self.check_median_axis(array_median_axis, variations)
+
+    def test_nanmedian_axis(self):
+        # all-NaN lanes are NaN and warn in NumPy
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            self.check_median_axis(array_nanmedian_axis,
+                                   self._array_variations)
+
+    def test_median_axis_exceptions(self):
+        cfunc = jit(nopython=True)(array_median_axis)
+        # Exceptions leak references
+        self.disable_leak_check()
+
+        with self.assertRaises(ValueError) as raises:
+            cfunc(np.ones((2, 3)), 2)
+        self.assertIn("np.median: Argument axis out of bounds",
+                      str(raises.exception))
+
+        with self.assertTypingError() as raises:
+            cfunc(np.ones((2, 3)), 1.0)
+        self.assertIn("np.median: axis must be an integer or None",
+                      str(raises.exception))
+
+    def test_percentile_quantile_axis(self):
+        pyfuncs = [(array_percentile_axis, 100),
+                   (array_nanpercentile_axis, 100),
+                   (array_quantile_axis, 1),
+                   (array_nanquantile_axis, 1)]
+        a = self.random.randn(60).reshape(3, 4, 5)
+        b = a.copy()
+        b.flat[::7] = np.nan
+        b[1, 2] = np.nan
+        for pyfunc, q_upper_bound in pyfuncs:
+            cfunc = jit(nopython=True)(pyfunc)
+            qs = [q_upper_bound / 3, np.linspace(0, q_upper_bound, 5),
+                  np.array(q_upper_bound)]
+            for arr, q in product((a, b, a[::2, ::-1]), qs):
+                for axis in range(-arr.ndim, arr.ndim):
+                    with warnings.catch_warnings():
+                        warnings.simplefilter('ignore', RuntimeWarning)
+                        expected = pyfunc(arr, q, axis)
+                    got = cfunc(arr, q, axis)
+                    self.assertEqual(got.shape, expected.shape)
+                    np.testing.assert_allclose(got, expected, rtol=1e-12)
+            # A 1d array gives a scalar
+            self.assertPreciseEqual(cfunc(a[0, 0], q_upper_bound / 2, 0),
+                                    pyfunc(a[0, 0], q_upper_bound / 2, 0))
+
     def test_array_sum_global(self):
         arr = np.arange(10, dtype=np.int32)
         arrty = typeof(arr)
@@ -605,6 +721,42 @@ class TestArrayReductions(MemoryLeakMixin, TestCase):
     def test_array_cumprod_global(self):
         self.check_cumulative(array_cumprod_global)
 
+    def check_cumulative_axis(self, pyfunc):
+        cfunc = jit(nopython=True)(pyfunc)
+        arr = np.linspace(2, 8, 24)
+        arr[::5] = np.nan
+        arrays = [np.arange(2, 10, dtype=np.int16),
+                  np.arange(24, dtype=np.int32).reshape((2, 3, 4)) % 5,
+                  np.ones((3, 4), dtype=np.bool_),
+                  arr.reshape((4, 6)),
+                  arr.reshape((2, 3, 4)).T,
+                  arr.reshape((4, 6))[::2, ::-2]]
+        for a in arrays:
+            for axis in range(-a.ndim, a.ndim):
+                expected = pyfunc(a, axis)
+                got = cfunc(a, axis)
+                self.assertPreciseEqual(got, np.ascontiguousarray(expected))
+
+        # Exceptions leak references
+        self.disable_leak_check()
+        with self.assertRaises(ValueError) as raises:
+            cfunc(arrays[1], 3)
+        self.assertIn("Argument axis out of bounds", str(raises.exception))
+
+    def test_array_cumsum_axis(self):
+        self.check_cumulative_axis(array_cumsum_axis)
+        self.check_cumulative_axis(array_cumsum_axis_global)
+
+    def test_array_cumprod_axis(self):
+        self.check_cumulative_axis(array_cumprod_axis)
+        self.check_cumulative_axis(array_cumprod_axis_global)
+
+    def test_nancumsum_axis(self):
+        self.check_cumulative_axis(array_nancumsum_axis)
+
+    def test_nancumprod_axis(self):
+        self.check_cumulative_axis(array_nancumprod_axis)
+
     def check_aggregation_magnitude(self, pyfunc, is_prod=False):
         """
         Check that integer overflows are avoided (issue #931).
@@ -10,9 +10,11 @@ import sys
 import traceback
 import unittest
 import warnings
-from numba import njit
-from numba.core import codegen
-from numba.core.caching import _UserWideCacheLocator
+from numba import njit, types
+from numba.core import caching, codegen, errors
+from numba.core.caching import (_MappedIndex, _UserWideCacheLocator,
+                                 collect_cache_garbage, function_content_hash,
+                                 populate_cache)
 from numba.core.errors import NumbaWarning
 from numba.parfors import parfor
 from numba.tests.support import (
@@ -702,6 +704,432 @@ class TestCache(DispatcherCacheUsecasesTest):
         self.assertIn("cache hits = 1", err.strip())
 
 
+class TestMappedIndexCache(DispatcherCacheUsecasesTest):
+
+    def setUp(self):
+        super().setUp()
+        _MappedIndex._instances.clear()
+
+    def import_module(self):
+        with override_config('CACHE_INDEX', 'mmap'):
+            return super().import_module()
+
+    def test_caching(self):
+        self.check_pycache(0)
+        mod = self.import_module()
+        self.check_pycache(0)
+
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.check_pycache(2)  # 1 shared index, 1 data
+        self.assertPreciseEqual(f(2.5, 3), 6.5)
+        self.check_pycache(3)  # 1 shared index, 2 data
+        self.check_hits(f, 0, 2)
+
+        f = mod.add_objmode_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.check_pycache(4)  # 1 shared index, 3 data
+        self.check_hits(f, 0, 1)
+        self.assertIn(_MappedIndex.index_name, self.cache_contents())
+
+        # Reload: overloads are loaded from the cache
+        mod = self.import_module()
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.assertPreciseEqual(f(2.5, 3), 6.5)
+        self.check_hits(f, 2, 0)
+        self.check_pycache(4)
+
+        # Check the code runs ok from another process
+        self.run_in_separate_process(envvars={'NUMBA_CACHE_INDEX': 'mmap'})
+
+    def test_cache_invalidate(self):
+        mod = self.import_module()
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+
+        # Touch the source file: the stale entry must not be used
+        os.utime(self.modfile, (os.path.getatime(self.modfile) + 10,
+                                os.path.getmtime(self.modfile) + 10))
+        mod = self.import_module()
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.check_hits(f, 0, 1)
+
+    def test_index_growth(self):
+        index = _MappedIndex(os.path.join(self.tempdir, 'index.nbm'))
+        digests = [bytes([i % 256, i // 256 + 1]) * 16 for i in range(1000)]
+        for i, digest in enumerate(digests):
+            index.insert(digest, b'owner%03d' % (i % 2), i)
+        self.assertGreaterEqual(index._capacity(index._mm), 2000)
+        for digest in digests:
+            self.assertTrue(index.lookup(digest))
+        self.assertFalse(index.lookup(b'x' * 32))
+        self.assertEqual(sorted(e[3] for e in index.entries()),
+                         list(range(1000)))
+        # Another handle on the same file sees the same entries
+        other = _MappedIndex(index.path)
+        self.assertTrue(other.lookup(digests[-1]))
+        index.remove_owner(b'owner000')
+        self.assertEqual(len(other.entries()), 500)
+        self.assertFalse(other.lookup(digests[0]))
+        self.assertTrue(other.lookup(digests[1]))
+
+
+    def test_same_key_repr(self):
+        # Keys sharing a repr() share a data file name, but must not be
+        # loaded for one another
+        cache_file = caching.MappedIndexDataCacheFile(self.tempdir, 'f',
+                                                      'stamp')
+        key1, key2 = _SameRepr(1), _SameRepr(2)
+        self.assertEqual(repr(key1), repr(key2))
+        cache_file.save(key1, 'data1')
+        self.assertEqual(cache_file.load(key1), 'data1')
+        self.assertIsNone(cache_file.load(key2))
+        cache_file.save(key2, 'data2')
+        self.assertEqual(cache_file.load(key2), 'data2')
+        self.assertIsNone(cache_file.load(key1))
+
+
+class _SameRepr(object):
+    """
+    A cache key whose repr() doesn't depend on its value, as for same-named
+    classes defined in different modules.
+    """
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, _SameRepr) and self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return '_SameRepr'
+
+
+class TestCacheGC(DispatcherCacheUsecasesTest):
+
+    def setUp(self):
+        super().setUp()
+        _MappedIndex._instances.clear()
+        caching._last_gc_time.clear()
+
+    def set_last_use(self, name, age):
+        path = os.path.join(self.cache_dir, name)
+        t = os.path.getmtime(path) - age
+        os.utime(path, (t, t))
+
+    def data_files(self):
+        return sorted(fn for fn in self.cache_contents()
+                      if fn.endswith('.nbc'))
+
+    def populate(self):
+        mod = self.import_module()
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.assertPreciseEqual(f(2.5, 3), 6.5)
+        return f
+
+    def test_orphans(self):
+        self.populate()
+        self.check_pycache(3)  # 1 index, 2 data
+        data = self.data_files()
+        # An unreferenced data file and a dangling temporary file
+        orphan = data[0].replace('.1.nbc', '.7.nbc')
+        tmpfile = data[0] + '.tmp.0123456789abcdef'
+        for name in (orphan, tmpfile):
+            with open(os.path.join(self.cache_dir, name), 'wb') as f:
+                f.write(b'x' * 10)
+        # Recent files may belong to a save in progress
+        res = collect_cache_garbage(self.cache_dir)
+        self.assertEqual(res.removed, 0)
+        for name in (orphan, tmpfile):
+            self.set_last_use(name, 3600)
+        res = collect_cache_garbage(self.cache_dir)
+        self.assertEqual(res.removed, 2)
+        self.assertEqual(res.freed, 20)
+        self.assertEqual(self.data_files(), data)
+
+    def test_max_size(self):
+        self.populate()
+        data = self.data_files()
+        self.set_last_use(data[0], 100)
+        size = os.path.getsize(os.path.join(self.cache_dir, data[1]))
+        res = collect_cache_garbage(self.cache_dir, max_size=size)
+        self.assertEqual(res.removed, 1)
+        self.assertEqual(self.data_files(), data[1:])
+        # The evicted overload is recompiled
+        f = self.import_module().add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.assertPreciseEqual(f(2.5, 3), 6.5)
+        self.check_hits(f, 1, 1)
+
+    def test_max_age(self):
+        self.populate()
+        data = self.data_files()
+        self.set_last_use(data[1], 7200)
+        res = collect_cache_garbage(self.cache_dir, max_age=3600)
+        self.assertEqual(res.removed, 1)
+        self.assertEqual(self.data_files(), data[:1])
+        # Loading an overload refreshes its last use
+        self.set_last_use(data[0], 7200)
+        f = self.import_module().add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.check_hits(f, 1, 0)
+        res = collect_cache_garbage(self.cache_dir, max_age=3600)
+        self.assertEqual(res.removed, 0)
+
+    def test_mapped_index(self):
+        with override_config('CACHE_INDEX', 'mmap'):
+            self.populate()
+        data = self.data_files()
+        self.assertEqual(len(data), 2)
+        # The last use is recorded in the index rather than the data files
+        index = _MappedIndex.for_path(self.cache_dir)
+        self.assertEqual(len(index.entries()), 2)
+        res = collect_cache_garbage(self.cache_dir, max_size=1)
+        self.assertEqual(res.removed, 2)
+        self.assertEqual(self.data_files(), [])
+        self.assertEqual(index.entries(), [])
+
+    def test_automatic_limits(self):
+        with override_config('CACHE_MAX_SIZE', 1):
+            self.populate()
+        # Eviction runs on save, at most once per interval: the first
+        # overload was evicted, the second one was saved afterwards.
+        self.assertEqual(len(self.data_files()), 1)
+
+
+class TestPopulateCache(DispatcherCacheUsecasesTest):
+    # Uses a process pool
+    _numba_parallel_test_ = False
+
+    def test_populate_cache(self):
+        mod = self.import_module()
+        items = [(mod.add_usecase, (types.int64, types.int64)),
+                 (mod.add_usecase, (types.float64, types.int64)),
+                 (mod.inner, (types.int64, types.int64)),
+                 (mod.add_nocache_usecase, (types.int64, types.int64))]
+        populate_cache(items, max_workers=2)
+        # The cached overloads were compiled by the workers
+        self.check_hits(mod.add_usecase, 2, 0)
+        self.check_hits(mod.inner, 1, 0)
+        self.assertEqual(len(mod.add_nocache_usecase.signatures), 1)
+        self.check_pycache(5)  # 2 index, 3 data
+        self.assertPreciseEqual(mod.add_usecase(2, 3), 6)
+        self.assertPreciseEqual(mod.inner(3, 2), 6)
+
+    def test_populate_cache_signatures(self):
+        # The signatures of a single function are spread across the workers
+        mod = self.import_module()
+        f = mod.add_usecase
+        items = [(f, (types.int64, types.int64)),
+                 (f, (types.float64, types.int64)),
+                 (f, (types.int32, types.float32)),
+                 (f, (types.int64, types.int64))]
+        populate_cache(items, max_workers=2)
+        self.check_hits(f, 3, 0)
+        self.check_pycache(4)  # 1 index, 3 data
+
+    def test_populate_cache_errors(self):
+        mod = self.import_module()
+        # Typing errors are raised by the parent process
+        items = [(mod.add_usecase, (types.int64, types.unicode_type))]
+        with self.assertRaises(errors.TypingError):
+            populate_cache(items, max_workers=2)
+
+
+class TestContentAddressedCache(DispatcherCacheUsecasesTest):
+
+    def import_module(self):
+        with override_config('CACHE_CONTENT_KEYS', 1):
+            return super().import_module()
+
+    def test_touch(self):
+        mod = self.import_module()
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.check_hits(f, 0, 1)
+        # Touching the source file doesn't invalidate the entries
+        os.utime(self.modfile, (os.path.getatime(self.modfile) + 10,
+                                os.path.getmtime(self.modfile) + 10))
+        mod = self.import_module()
+        f = mod.add_usecase
+        self.assertPreciseEqual(f(2, 3), 6)
+        self.check_hits(f, 1, 0)
+
+    def test_relocation(self):
+        # The same source file at two locations shares a user provided cache
+        cache_dir = os.path.join(self.tempdir, 'cache')
+        for copy in ('one', 'two'):
+            srcdir = os.path.join(self.tempdir, copy, 'src')
+            os.makedirs(srcdir)
+            shutil.copy(self.usecases_file,
+                        os.path.join(srcdir, self.modname + '.py'))
+            sys.modules.pop(self.modname, None)
+            sys.path.insert(0, srcdir)
+            try:
+                with override_config('CACHE_DIR', cache_dir), \
+                        override_config('CACHE_CONTENT_KEYS', 1):
+                    mod = import_dynamic(self.modname)
+            finally:
+                sys.path.remove(srcdir)
+            self.assertTrue(mod.__file__.startswith(srcdir))
+            f = mod.add_usecase
+            self.assertPreciseEqual(f(2, 3), 6)
+            if copy == 'one':
+                self.check_hits(f, 0, 1)
+            else:
+                self.check_hits(f, 1, 0)
+
+    def test_content_hash(self):
+        source = ("import math\n"
+                  "def g(x):\n"
+                  "    return x + 1\n"
+                  "def f(x):\n"
+                  "    return g(x) * math.pi + K\n"
+                  "K = 3\n")
+
+        def make(filename, lineno, **overrides):
+            ns = {}
+            code = compile("\n" * lineno + source, filename, "exec")
+            exec(code, ns)
+            ns.update(overrides)
+            return ns
+
+        ns = make('/a/mod.py', 0)
+        ref = function_content_hash(ns['f'])
+        # Independent of the location of the code
+        self.assertEqual(function_content_hash(make('/b/mod.py', 5)['f']),
+                         ref)
+        # Depends on the globals
+        self.assertNotEqual(function_content_hash(make('/a/mod.py', 0,
+                                                       K=4)['f']),
+                            ref)
+        # Depends on the callees, transitively
+        callee = njit(lambda x: x + 2)
+        self.assertNotEqual(function_content_hash(make('/a/mod.py', 0,
+                                                       g=callee)['f']),
+                            ref)
+
+    def test_content_hash_names(self):
+        # Edits that only change the names or the signature of the code
+        def content_hash(source):
+            ns = {}
+            exec(compile("import numpy as np\n" + source, "mod.py", "exec"),
+                 ns)
+            return function_content_hash(ns['f'])
+
+        def check(source, edited):
+            self.assertEqual(content_hash(source), content_hash(source))
+            self.assertNotEqual(content_hash(source), content_hash(edited))
+
+        # Attributes
+        check("def f(x):\n    return np.sin(x)\n",
+              "def f(x):\n    return np.cos(x)\n")
+        check("def f(x):\n    return x.real\n",
+              "def f(x):\n    return x.imag\n")
+        # Builtins
+        check("def f(x):\n    return len(x)\n",
+              "def f(x):\n    return abs(x)\n")
+        # Arguments
+        check("def f(x, y):\n    return x\n",
+              "def f(x, y, z):\n    return x\n")
+        check("def f(x, y):\n    return x\n",
+              "def f(x, *, y):\n    return x\n")
+        check("def f(x, y):\n    return x\n",
+              "def f(y, x):\n    return x\n")
+        check("def f(x, *, y=1):\n    return x + y\n",
+              "def f(x, *, y=2):\n    return x + y\n")
+        # Nested code objects
+        check("def f(x):\n    return (lambda a: a.real)(x)\n",
+              "def f(x):\n    return (lambda a: a.imag)(x)\n")
+
+
+class TestCacheDependencies(DispatcherCacheUsecasesTest):
+    usecases_file = os.path.join(DispatcherCacheUsecasesTest.here,
+                                 "cache_dependency_usecases.py")
+    modname = "dependency_caching_test_fodder"
+    callee_modname = "dependency_caching_test_callee"
+
+    callee_source = """if 1:
+        from numba import jit
+
+        @jit(cache=True, nopython=True)
+        def callee(x):
+            return x * %d
+        """
+
+    def write_callee(self, factor, mtime_offset=0):
+        path = os.path.join(self.tempdir, self.callee_modname + ".py")
+        with open(path, "w") as f:
+            f.write(self.callee_source % factor)
+        st = os.stat(path)
+        os.utime(path, (st.st_atime + mtime_offset,
+                        st.st_mtime + mtime_offset))
+
+    def import_module(self):
+        sys.modules.pop(self.callee_modname, None)
+        return super().import_module()
+
+    def tearDown(self):
+        sys.modules.pop(self.callee_modname, None)
+        super().tearDown()
+
+    def test_callee_change(self):
+        self.write_callee(2)
+        f = self.import_module().caller
+        self.assertPreciseEqual(f(3), 7)
+        self.check_hits(f, 0, 1)
+
+        f = self.import_module().caller
+        self.assertPreciseEqual(f(3), 7)
+        self.check_hits(f, 1, 0)
+
+        # The callee changes in another module: the cached caller is stale
+        self.write_callee(3, mtime_offset=10)
+        f = self.import_module().caller
+        self.assertPreciseEqual(f(3), 10)
+        self.check_hits(f, 0, 1)
+
+        f = self.import_module().caller
+        self.assertPreciseEqual(f(3), 10)
+        self.check_hits(f, 1, 0)
+
+
+class TestOverloadImplCache(DispatcherCacheUsecasesTest):
+    usecases_file = os.path.join(DispatcherCacheUsecasesTest.here,
+                                 "cache_overload_usecases.py")
+    modname = "overload_caching_test_fodder"
+
+    def get_impl(self, mod):
+        fnty = mod.use.typingctx.resolve_value_type(mod.scale)
+        [template] = fnty.templates
+        [(disp, _)] = template._impl_cache.values()
+        return disp
+
+    def test_caching(self):
+        with override_config('CACHE_OVERLOADS', 1):
+            mod = self.import_module()
+            self.assertPreciseEqual(mod.use(3), 7)
+            self.check_hits(self.get_impl(mod), 0, 1)
+            # 1 index, 1 data for the implementation, `use` isn't cached
+            self.check_pycache(2)
+
+            mod = self.import_module()
+            self.assertPreciseEqual(mod.use(3), 7)
+            self.check_hits(self.get_impl(mod), 1, 0)
+            self.check_pycache(2)
+
+    def test_disabled(self):
+        mod = self.import_module()
+        self.assertPreciseEqual(mod.use(3), 7)
+        self.check_hits(self.get_impl(mod), 0)
+        self.check_pycache(0)
+
+
 @skip_parfors_unsupported
 class TestSequentialParForsCache(DispatcherCacheUsecasesTest):
     def setUp(self):
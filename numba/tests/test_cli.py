@@ -106,6 +106,20 @@ class TestCLI(TestCase):
                         self.assertIsInstance(info[k], t)
 
     @needs_gdb
+    def test_cache_gc_from_module(self):
+        with TemporaryDirectory() as d:
+            cache_dir = os.path.join(d, "cache")
+            os.mkdir(cache_dir)
+            orphan = os.path.join(cache_dir, "f-1.py311.1.nbc")
+            with open(orphan, "wb") as f:
+                f.write(b"x" * 2048)
+            os.utime(orphan, (0, 0))
+            cmdline = [sys.executable, "-m", "numba", "--cache-gc", d]
+            o, _ = run_cmd(cmdline)
+            self.assertFalse(os.path.exists(orphan))
+            self.assertIn("%s: removed 1 files, freed 2.0 KiB" % cache_dir, o)
+            self.assertIn("Cache GC: removed 1 files, freed 2.0 KiB", o)
+
     def test_gdb_status_from_module(self):
         # Check that the `python -m numba -g` works ok
         cmdline = [sys.executable, "-m", "numba", "-g"]
@@ -6,6 +6,7 @@ correctly.  Detailed testing of the underlying dictionary operations is done
 in test_dictimpl.py.
 """
 
+import pickle
 import sys
 import warnings
 
@@ -1049,6 +1050,100 @@ class TestDictObject(MemoryLeakMixin, TestCase):
         self.assertEqual(a, b)
 
 
+class TestPrimitiveDict(MemoryLeakMixin, TestCase):
+    """
+    Tests for the inlined operations on dicts of primitive keys and values.
+    """
+
+    def test_inlined(self):
+        @njit
+        def foo(n):
+            d = dictobject.new_dict(int64, float64)
+            for i in range(n):
+                d[i] = i
+            return d.get(n // 2, -1.0)
+
+        self.assertEqual(foo(10), 5.0)
+        llvm_ir = foo.inspect_llvm(foo.signatures[0])
+        self.assertNotIn('@numba_dict_lookup(', llvm_ir)
+        # numba_dict_insert is still called to resize the dict
+        self.assertIn('@numba_dict_insert(', llvm_ir)
+
+        @njit
+        def bar():
+            d = dictobject.new_dict(types.unicode_type, float64)
+            d['a'] = 1.
+            return d['a']
+
+        self.assertEqual(bar(), 1.)
+        llvm_ir = bar.inspect_llvm(bar.signatures[0])
+        self.assertIn('@numba_dict_lookup(', llvm_ir)
+
+    def check_operations(self, keyty, valty, keys):
+        # Compare a mix of insertions, lookups and deletions against a
+        # Python dict, through all the widths of the hash table indices
+        @njit
+        def foo(keys):
+            d = dictobject.new_dict(keyty, valty)
+            for i in range(len(keys)):
+                d[keys[i]] = i
+            count = 0
+            for i in range(0, len(keys), 3):
+                if keys[i] in d:
+                    count += 1
+                del d[keys[i]]
+                d.pop(keys[i], -1)
+            for i in range(0, len(keys), 6):
+                d[keys[i]] = d.get(keys[i], -1) - 1
+            d.popitem()
+            d.setdefault(keys[1], 7)
+            return d, count
+
+        expected = {}
+        for i, k in enumerate(keys):
+            expected[k] = i
+        count = 0
+        for k in keys[::3]:
+            count += k in expected
+            expected.pop(k, None)
+        for k in keys[::6]:
+            expected[k] = expected.get(k, -1) - 1
+        expected.popitem()
+        expected.setdefault(keys[1], 7)
+
+        got, got_count = foo(keys)
+        self.assertEqual(got_count, count)
+        self.assertEqual(dict(got), expected)
+        # The iteration order is preserved
+        self.assertEqual(list(got.keys()), list(expected.keys()))
+
+    def test_operations_int_keys(self):
+        rng = np.random.default_rng(42)
+        keys = rng.permutation(100000).astype(np.int64)
+        self.check_operations(int64, float64, keys)
+        self.check_operations(types.int8, int32,
+                              np.arange(-128, 128, dtype=np.int8))
+
+    def test_operations_float_keys(self):
+        rng = np.random.default_rng(42)
+        keys = rng.random(5000).astype(np.float32)
+        self.check_operations(float32, int64, keys)
+
+    def test_operations_tuple_values(self):
+        valty = types.UniTuple(int64, 2)
+
+        @njit
+        def foo(n):
+            d = dictobject.new_dict(types.uint16, valty)
+            for i in range(n):
+                d[i] = (i, -i)
+            for i in range(0, n, 2):
+                d[i] = (0, 0)
+            return d[1], d[2], len(d)
+
+        self.assertEqual(foo(1000), ((1, -1), (0, 0), 1000))
+
+
 class TestDictTypeCasting(TestCase):
     def check_good(self, fromty, toty):
         _sentry_safe_cast(fromty, toty)
@@ -1162,6 +1257,134 @@ class TestTypedDict(MemoryLeakMixin, TestCase):
         d[(1, 1)] = 12345
         self.assertEqual(d[(1, 1)], d.get((1, 1)))
 
+    def test_from_arrays(self):
+        keys = np.array([3, 1, 2, 1], dtype=np.int32)
+        values = np.array([0.5, 1.5, 2.5, 3.5])
+        expected = dict(zip(keys.tolist(), values.tolist()))
+
+        d = Dict.from_arrays(keys, values)
+        self.assertEqual(typeof(d), types.DictType(types.int32, float64))
+        self.assertEqual(dict(d), expected)
+        self.assertEqual(list(d.keys()), list(expected.keys()))
+
+        @njit
+        def foo(keys, values):
+            return Dict.from_arrays(keys, values)
+
+        self.assertEqual(dict(foo(keys, values)), expected)
+        # Non contiguous arrays
+        self.assertEqual(dict(foo(keys[::2], values[::2])),
+                         {3: 0.5, 2: 2.5})
+
+    def test_from_arrays_errors(self):
+        # Raising from compiled code leaks the arguments
+        self.disable_leak_check()
+
+        @njit
+        def foo(keys, values):
+            return Dict.from_arrays(keys, values)
+
+        keys = np.arange(4)
+        values = np.ones(4)
+        with self.assertRaises(ValueError) as raises:
+            Dict.from_arrays(keys, values[:2])
+        self.assertIn("keys and values must have the same length",
+                      str(raises.exception))
+        with self.assertRaises(TypingError) as raises:
+            foo(keys.reshape((2, 2)), values)
+        self.assertIn("Dict.from_arrays() arguments must be 1D arrays",
+                      str(raises.exception))
+
+    def test_get_many(self):
+        keys = np.arange(20, dtype=np.int64)
+        d = Dict.from_arrays(keys, keys * 2.0)
+
+        query = np.array([[3, 19], [0, 7]])
+        self.assertPreciseEqual(d.get_many(query), query * 2.0)
+        self.assertPreciseEqual(d.get_many([4, 30], default=-1),
+                                np.array([8.0, -1.0]))
+        self.assertPreciseEqual(d.get_many(np.array([], dtype=np.int64)),
+                                np.array([]))
+
+        @njit
+        def foo(d, query):
+            return d.get_many(query, 0.0)
+
+        self.assertPreciseEqual(foo(d, query[:, ::-1]), query[:, ::-1] * 2.0)
+        self.assertPreciseEqual(foo(d, np.array([100, 5], dtype=np.int32)),
+                                np.array([0.0, 10.0]))
+
+        # Untyped dictionary
+        self.assertPreciseEqual(Dict().get_many([1, 2], default=0),
+                                np.array([0, 0]))
+        self.assertPreciseEqual(Dict().get_many([]), np.array([]))
+        self.assertEqual(Dict().get_many(np.empty((0, 3))).shape, (0, 3))
+
+    def test_get_many_errors(self):
+        # Raising from compiled code leaks the arguments
+        self.disable_leak_check()
+
+        d = Dict.from_arrays(np.arange(20), np.arange(20.0))
+        with self.assertRaises(KeyError):
+            d.get_many(np.array([1, 30]))
+        with self.assertRaises(KeyError):
+            Dict().get_many([1, 2])
+
+        # Values that can't be stored in an array
+        d = Dict.empty(types.int64, types.unicode_type)
+        d[1] = 'a'
+        with self.assertRaises(TypingError) as raises:
+            d.get_many(np.array([1]))
+        self.assertIn("get_many() is not supported for values of type",
+                      str(raises.exception))
+
+    def test_pickle(self):
+        d = Dict.from_arrays(np.arange(5, dtype=np.int32), np.arange(5.0))
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            e = pickle.loads(pickle.dumps(d, protocol=proto))
+            self.assertEqual(typeof(e), typeof(d))
+            self.assertEqual(dict(e), dict(d))
+
+        # The keys and values are passed out-of-band with protocol 5
+        buffers = []
+        data = pickle.dumps(d, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 2)
+        self.assertEqual(dict(pickle.loads(data, buffers=buffers)), dict(d))
+
+        # Other types of items are pickled one by one
+        d = Dict.empty(types.unicode_type, types.ListType(types.int64))
+        d['a'] = List([1, 2])
+        e = pickle.loads(pickle.dumps(d))
+        self.assertEqual(typeof(e), typeof(d))
+        self.assertEqual(list(e['a']), [1, 2])
+
+        e = pickle.loads(pickle.dumps(Dict()))
+        self.assertEqual(len(e), 0)
+        e[1] = 2
+        self.assertEqual(typeof(e), types.DictType(types.int64, types.int64))
+
+    def test_shared_memory(self):
+        d = Dict.from_arrays(np.arange(5), np.arange(5) > 2)
+        shm = d.to_shared_memory()
+        self.addCleanup(shm.unlink)
+        self.addCleanup(shm.close)
+        e = Dict.from_shared_memory(shm.name)
+        self.assertEqual(typeof(e), typeof(d))
+        self.assertEqual(dict(e), dict(d))
+        # The block of shared memory can be attached to again
+        self.assertEqual(dict(Dict.from_shared_memory(shm.name)), dict(d))
+
+        with self.assertRaises(ValueError) as raises:
+            List.from_shared_memory(shm.name)
+        self.assertIn("expected a block of shared memory holding 1 arrays, "
+                      "got 2", str(raises.exception))
+
+        d = Dict.empty(types.unicode_type, types.int64)
+        with self.assertRaises(TypeError) as raises:
+            d.to_shared_memory()
+        self.assertIn("to_shared_memory() requires a dictionary of numbers "
+                      "or booleans", str(raises.exception))
+
     def check_stringify(self, strfn, prefix=False):
         nbd = Dict.empty(int32, int32)
         d = {}
@@ -1912,6 +2135,13 @@ class TestNoJit(TestCase):
                 d = Dict.empty(types.int32, types.float32)
                 self.assertEqual(type(d), dict)
 
+    def test_dict_create_no_jit_using_from_arrays(self):
+        with override_config('DISABLE_JIT', True):
+            with forbid_codegen():
+                d = Dict.from_arrays(np.arange(2), np.ones(2))
+                self.assertEqual(type(d), dict)
+                self.assertEqual(d, {0: 1.0, 1: 1.0})
+
 
 class TestDictIterator(TestCase):
     def test_dict_iterator(self):
@@ -10,8 +10,10 @@ import numpy as np
 
 from numba import njit, jit, typeof, vectorize
 from numba.core import types, errors
+from numba.core.compiler_lock import global_compiler_lock
+from numba.core.registry import cpu_target
 from numba import _dispatcher
-from numba.tests.support import TestCase, captured_stdout
+from numba.tests.support import TestCase, captured_stdout, override_config
 from numba.np.numpy_support import as_dtype
 from numba.core.dispatcher import Dispatcher
 from numba.extending import overload
@@ -203,6 +205,99 @@ class TestDispatcher(BaseTest):
             t.join()
         self.assertFalse(errors)
 
+    def test_lock_concurrent_llvm_opt(self):
+        """
+        Test compiling from several threads at once with the compiler lock
+        released during LLVM optimization.
+        """
+        errors = []
+
+        @jit(nopython=True)
+        def foo(x):
+            return x + 1
+
+        dtypes = [np.int8, np.int16, np.int32, np.int64, np.float32,
+                  np.float64]
+
+        def wrapper(dtype):
+            try:
+                self.assertPreciseEqual(foo(dtype(1)), foo.py_func(dtype(1)))
+            except Exception as e:
+                errors.append(e)
+
+        with override_config('CONCURRENT_LLVM_OPT', 1):
+            # Distinct signatures as well as the same signature twice
+            threads = [threading.Thread(target=wrapper, args=(dtype,))
+                       for dtype in dtypes * 2]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertFalse(errors)
+        self.assertEqual(len(foo.overloads), len(dtypes))
+        self.assertFalse(global_compiler_lock.is_locked())
+
+    def test_concurrent_llvm_opt_pipeline_depth(self):
+        """
+        Test that the compiler lock is only released during the LLVM
+        optimization of the outermost compilation pipeline.
+        """
+        codegen = cpu_target.target_context.codegen()
+        library = codegen.create_library('test_pipeline_depth')
+        with override_config('CONCURRENT_LLVM_OPT', 1):
+            with override_config('LLVM_REFPRUNE_PASS', 1):
+                # Outside of any pipeline, e.g. the wrappers of a ufunc
+                self.assertFalse(library._can_optimize_unlocked())
+                with global_compiler_lock.pipeline():
+                    self.assertTrue(library._can_optimize_unlocked())
+                    # A nested pipeline
+                    with global_compiler_lock.pipeline():
+                        self.assertFalse(library._can_optimize_unlocked())
+
+    def test_compiled_signatures_without_lock(self):
+        """
+        Test that calling or compiling an already-compiled signature doesn't
+        wait for the compiler lock.
+        """
+        @jit(nopython=True)
+        def foo(x):
+            return x + 1
+
+        self.assertPreciseEqual(foo(1), 2)
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with global_compiler_lock:
+                acquired.set()
+                release.wait()
+
+        t = threading.Thread(target=hold_lock)
+        t.start()
+        acquired.wait()
+        try:
+            self.assertPreciseEqual(foo(2), 3)
+            foo.compile((types.intp,))
+        finally:
+            release.set()
+            t.join()
+
+    def test_exact_match_many_overloads(self):
+        @jit(nopython=True)
+        def foo(x, y):
+            return x + y
+
+        dtypes = [np.int8, np.int16, np.int32, np.int64, np.uint8,
+                  np.uint16, np.uint32, np.uint64, np.float32, np.float64]
+        expected = [foo(dtype(1), dtype(2)) for dtype in dtypes]
+        self.assertEqual(len(foo.signatures), len(dtypes))
+        # Each call dispatches to the overload of its exact types
+        for dtype, exp in zip(dtypes, expected):
+            got = foo(dtype(1), dtype(2))
+            self.assertPreciseEqual(got, exp)
+            self.assertEqual(got, 3)
+        self.assertEqual(len(foo.signatures), len(dtypes))
+
     def test_explicit_signatures(self):
         f = jit("(int64,int64)")(add)
         # Approximate match (unsafe conversion)
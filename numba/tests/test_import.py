@@ -21,6 +21,12 @@ class TestNumbaImport(TestCase):
                    'numba.core.typing.collections',
                    'numba.core.typing.listdecl',
                    'numba.core.typing.npdatetime',
+                   'numba.parfors.parfor',
+                   'numba.parfors.parfor_lowering',
+                   'numba.parfors.array_analysis',
+                   'numba.stencils.stencil',
+                   'numba.experimental.jitclass.boxing',
+                   'numba.experimental.jitclass.overloads',
                    ]
         # Sanity check the modules still exist...
         for mod in banlist:
@@ -65,6 +65,10 @@ def diff2(a, n):
     return np.diff(a, n)
 
 
+def diff3(a, n, axis):
+    return np.diff(a, n, axis)
+
+
 def bincount1(a):
     return np.bincount(a)
 
@@ -945,6 +949,28 @@ class TestNPFunctions(MemoryLeakMixin, TestCase):
                 got = cfunc(arr, n)
                 self.assertPreciseEqual(expected, got)
 
+    def test_diff3(self):
+        pyfunc = diff3
+        cfunc = jit(nopython=True)(pyfunc)
+        arrays = list(self.diff_arrays())
+        arrays.append(arrays[-1].T)
+        arrays.append(arrays[-1][::2, ::-1])
+        for arr in arrays:
+            for axis in range(-arr.ndim, arr.ndim):
+                size = arr.shape[axis]
+                for n in (0, 1, 2, size, size + 1):
+                    expected = pyfunc(arr, n, axis)
+                    got = cfunc(arr, n, axis)
+                    self.assertPreciseEqual(np.ascontiguousarray(expected),
+                                            got)
+
+        # Exceptions leak references
+        self.disable_leak_check()
+        with self.assertRaises(ValueError) as raises:
+            cfunc(arrays[1], 1, 2)
+        self.assertIn("np.diff: Argument axis out of bounds",
+                      str(raises.exception))
+
     def test_diff2_exceptions(self):
         pyfunc = diff2
         cfunc = jit(nopython=True)(pyfunc)
@@ -265,13 +265,10 @@ class TestNumThreads(TestCase):
             self.check_mask(mask, len(np.unique(x)))
 
     # this test can only run on OpenMP (providing OMP_MAX_ACTIVE_LEVELS is not
-    # set or >= 2) and TBB backends
+    # set or >= 2), TBB and workqueue backends
     @skip_parfors_unsupported
     @unittest.skipIf(config.NUMBA_NUM_THREADS < 2, "Not enough CPU cores")
     def _test_nested_parallelism_1(self):
-        if threading_layer() == 'workqueue':
-            self.skipTest("workqueue is not threadsafe")
-
         # check that get_num_threads is ok in nesting
         mask = config.NUMBA_NUM_THREADS - 1
 
@@ -354,13 +351,10 @@ class TestNumThreads(TestCase):
             np.testing.assert_equal(math_arr, got_arr)
 
     # this test can only run on OpenMP (providing OMP_MAX_ACTIVE_LEVELS is not
-    # set or >= 2) and TBB backends
+    # set or >= 2), TBB and workqueue backends
     @skip_parfors_unsupported
     @unittest.skipIf(config.NUMBA_NUM_THREADS < 2, "Not enough CPU cores")
     def _test_nested_parallelism_2(self):
-        if threading_layer() == 'workqueue':
-            self.skipTest("workqueue is not threadsafe")
-
         # check that get_num_threads is ok in nesting
 
         N = config.NUMBA_NUM_THREADS + 1
@@ -457,15 +451,12 @@ class TestNumThreads(TestCase):
         np.testing.assert_equal(math_arr, py_arr)
 
     # this test can only run on OpenMP (providing OMP_MAX_ACTIVE_LEVELS is not
-    # set or >= 2) and TBB backends
+    # set or >= 2), TBB and workqueue backends
     # This test needs at least 3 threads to run, N>=2 for the launch, M>=N+1 for
     # the nested function
     @skip_parfors_unsupported
     @unittest.skipIf(config.NUMBA_NUM_THREADS < 3, "Not enough CPU cores")
     def _test_nested_parallelism_3(self):
-        if threading_layer() == 'workqueue':
-            self.skipTest("workqueue is not threadsafe")
-
         # check that the right number of threads are present in nesting
         # this relies on there being a load of cores present
         BIG = 1000000
@@ -423,11 +423,6 @@ class TestSpecificBackend(TestInSubprocess, TestParallelBackendBase):
                             sys.platform.startswith('linux')):
                         continue
 
-                    # workqueue is not thread safe
-                    if (p in ('threading', 'random') and
-                            backend == 'workqueue'):
-                        continue
-
                     cls._inject(p, name, backend, backend_guard)
 
 
@@ -529,6 +524,93 @@ class TestThreadingLayerSelection(ThreadLayerTestHelper):
 TestThreadingLayerSelection.generate()
 
 
+@skip_parfors_unsupported
+class TestThreadAffinity(ThreadLayerTestHelper):
+    """
+    Checks the pinning of the threading layers threads to CPUs.
+    """
+    _DEBUG = False
+
+    backends = {'tbb': skip_no_tbb,
+                'omp': skip_no_omp,
+                'workqueue': unittest.skipIf(False, '')}
+
+    def test_validate_affinity(self):
+        validate = config._validate_thread_affinity
+        self.assertEqual(validate('compact'), 'compact')
+        self.assertEqual(validate(' Scatter '), 'scatter')
+        self.assertEqual(validate('none'), '')
+        self.assertEqual(validate('0-3,8'), '0-3,8')
+        for bad in ('spread', '0-', '1,,2', 'a-b'):
+            with self.assertRaises(ValueError):
+                validate(bad)
+
+    def test_affinity_cpus(self):
+        from numba.np.ufunc.parallel import (_parse_cpu_list,
+                                             _thread_affinity_cpus)
+        self.assertEqual(_parse_cpu_list("0-3,8\n"), [0, 1, 2, 3, 8])
+        available = [0, 1, 2, 3, 4, 5]
+        nodes = [[0, 1, 2], [3, 4, 5]]
+
+        def cpus(affinity, count):
+            return _thread_affinity_cpus(affinity, count, available, nodes)
+
+        self.assertEqual(cpus('', 4), [])
+        self.assertEqual(cpus('compact', 4), [0, 1, 2, 3])
+        self.assertEqual(cpus('scatter', 4), [0, 3, 1, 4])
+        # CPUs are reused when there are more threads
+        self.assertEqual(cpus('compact', 8), [0, 1, 2, 3, 4, 5, 0, 1])
+        self.assertEqual(cpus('4-5,1', 4), [4, 5, 1, 4])
+        # CPUs the process can't use are left out, as are empty nodes
+        self.assertEqual(_thread_affinity_cpus('scatter', 3, [1, 2], nodes),
+                         [1, 2, 1])
+        # Without NUMA information, scatter is compact
+        self.assertEqual(_thread_affinity_cpus('scatter', 2, available, []),
+                         [0, 1])
+
+    @classmethod
+    def _inject(cls, backend, backend_guard):
+
+        @linux_only
+        def test_template(self):
+            # Pin to the last CPU, the workers must have moved there but not
+            # the calling thread.
+            body = """if 1:
+                cpu = max(os.sched_getaffinity(0))
+                before = os.sched_getaffinity(0)
+                X = np.arange(1000000.)
+                Y = np.arange(1000000.)
+                func = threading_backend_usecases.busy_func_inner
+                np.testing.assert_allclose(func(X, Y), func.py_func(X, Y))
+                assert numba.threading_layer() == '%s'
+                assert os.sched_getaffinity(0) == before
+                pinned = 0
+                for tid in os.listdir('/proc/self/task'):
+                    if os.sched_getaffinity(int(tid)) == {cpu}:
+                        pinned += 1
+                assert pinned > 0
+            """
+            runme = self.template % (body % backend)
+            cmdline = [sys.executable, '-c', runme]
+            env = os.environ.copy()
+            env['NUMBA_THREADING_LAYER'] = str(backend)
+            env['NUMBA_NUM_THREADS'] = "2"
+            env['NUMBA_THREAD_AFFINITY'] = str(max(os.sched_getaffinity(0)))
+            out, err = self.run_cmd(cmdline, env=env)
+            if self._DEBUG:
+                print(out, err)
+        injected_test = "test_thread_affinity_%s" % backend
+        setattr(cls, injected_test, backend_guard(test_template))
+
+    @classmethod
+    def generate(cls):
+        for backend, backend_guard in cls.backends.items():
+            cls._inject(backend, backend_guard)
+
+
+TestThreadAffinity.generate()
+
+
 @skip_parfors_unsupported
 class TestThreadingLayerPriority(ThreadLayerTestHelper):
 
@@ -655,13 +737,15 @@ class TestMiscBackendIssues(ThreadLayerTestHelper):
         env['NUMBA_NUM_THREADS'] = "1"
         self.run_cmd(cmdline, env=env)
 
-    def test_workqueue_aborts_on_nested_parallelism(self):
+    def test_workqueue_handles_nested_parallelism(self):
         """
-        Tests workqueue raises sigabrt if a nested parallel call is performed
+        Tests workqueue runs nested parallel regions, including ones
+        launched concurrently from several threads
         """
         runme = """if 1:
-            from numba import njit, prange
+            from numba import njit, prange, threading_layer
             import numpy as np
+            import threading
 
             @njit(parallel=True)
             def nested(x):
@@ -676,25 +760,25 @@ class TestMiscBackendIssues(ThreadLayerTestHelper):
                     nested(Z[i])
                 return Z
 
-            main()
+            np.testing.assert_equal(main(), np.ones((5, 10)))
+
+            def run():
+                for _ in range(20):
+                    np.testing.assert_equal(main(), np.ones((5, 10)))
+
+            threads = [threading.Thread(target=run) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert threading_layer() == "workqueue"
         """
         cmdline = [sys.executable, '-c', runme]
         env = os.environ.copy()
         env['NUMBA_THREADING_LAYER'] = "workqueue"
         env['NUMBA_NUM_THREADS'] = "4"
 
-        try:
-            out, err = self.run_cmd(cmdline, env=env)
-        except AssertionError as e:
-            if self._DEBUG:
-                print(out, err)
-            e_msg = str(e)
-            self.assertIn("failed with code", e_msg)
-            # raised a SIGABRT, but the value is platform specific so just check
-            # the error message
-            expected = ("Numba workqueue threading layer is terminating: "
-                        "Concurrent access has been detected.")
-            self.assertIn(expected, e_msg)
+        self.run_cmd(cmdline, env=env)
 
     @unittest.skipUnless(_HAVE_OS_FORK, "Test needs fork(2)")
     def test_workqueue_handles_fork_from_non_main_thread(self):
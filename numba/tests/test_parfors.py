@@ -26,6 +26,8 @@ import subprocess as subp
 import numba.parfors.parfor
 from numba import (njit, prange, parallel_chunksize,
                    get_parallel_chunksize, set_parallel_chunksize,
+                   parallel_schedule, get_parallel_schedule,
+                   set_parallel_schedule, reduction,
                    set_num_threads, get_num_threads, typeof)
 from numba.core import (types, errors, ir, rewrites,
                         typed_passes, inline_closurecall, config, compiler, cpu)
@@ -1169,6 +1171,297 @@ class TestParforNumPy(TestParforsBase):
         self.check_variants(test_impl2, data_gen)
         self.count_parfors_variants(test_impl2, data_gen)
 
+    def test_sort(self):
+        def test_impl1(A):
+            return np.sort(A)
+
+        def test_impl2(A):
+            B = A.copy()
+            B.sort()
+            return B
+
+        def test_impl3(A):
+            B = A.copy()
+            B.sort(kind='stable')
+            return B
+
+        def test_impl4(A):
+            return np.sort(A, -1, 'mergesort')
+
+        def test_impl5(A):
+            return np.sort(A, axis=None)
+
+        # large enough to be sorted in several chunks when threads are
+        # available
+        n = 100000
+        A = np.random.ranf(n)
+        A[::17] = np.nan
+        B = np.random.randint(50, size=n).astype(np.int32)
+        C = np.random.randint(2, size=n).astype(np.bool_)
+        for arr in (A, B, C, B[:10], B[:0]):
+            self.check(test_impl1, arr)
+            self.check(test_impl2, arr)
+            self.check(test_impl3, arr)
+            self.check(test_impl4, arr)
+            self.check(test_impl5, arr)
+        self.assertEqual(countParfors(test_impl1, (types.float64[::1],)), 2)
+        self.assertEqual(countParfors(test_impl4, (types.float64[::1],)), 2)
+
+        pfunc = njit(parallel=True)(lambda A, axis: np.sort(A, axis))
+        with self.assertRaises(ValueError):
+            pfunc(A, 1)
+
+    def test_argsort(self):
+        def test_impl1(A):
+            return np.argsort(A)
+
+        def test_impl2(A):
+            return A.argsort(kind='mergesort')
+
+        n = 100000
+        A = np.random.ranf(n)
+        B = np.random.randint(50, size=n)
+        for arr in (A, A[:10], A[:0]):
+            self.check(test_impl1, arr)
+        # equal keys keep their order
+        for arr in (A, B, B[:10]):
+            self.check(test_impl2, arr)
+        self.assertEqual(countParfors(test_impl2, (types.int64[::1],)), 2)
+
+    def test_unique(self):
+        def test_impl(A):
+            return np.unique(A)
+
+        n = 100000
+        self.check(test_impl, np.random.randint(1000, size=n))
+        self.check(test_impl, np.random.randint(1000, size=(n // 100, 100)))
+        self.check(test_impl, np.random.ranf(n))
+        self.assertEqual(countParfors(test_impl, (types.int64[::1],)), 3)
+
+    def test_bincount(self):
+        def test_impl1(A):
+            return np.bincount(A)
+
+        def test_impl2(A, W):
+            return np.bincount(A, W)
+
+        def test_impl3(A, W, minlength):
+            return np.bincount(A, W, minlength)
+
+        def test_impl4(A, minlength):
+            return np.bincount(A, minlength=minlength)
+
+        n = 100000
+        A = np.random.randint(100, size=n)
+        W = np.random.ranf(n)
+        self.check(test_impl1, A)
+        self.check(test_impl1, A[::3])
+        self.check(test_impl1, np.arange(0))
+        self.check(test_impl2, A, W)
+        self.check(test_impl3, A, W, 150)
+        self.check(test_impl3, A, None, 50)
+        self.check(test_impl4, A, 150)
+        self.assertEqual(countParfors(test_impl1, (types.int64[::1],)), 2)
+
+        cfunc = njit(parallel=True)(test_impl1)
+        with self.assertRaises(ValueError) as raises:
+            cfunc(np.array([1, 2, -1, 3]))
+        self.assertIn("first argument must be non-negative",
+                      str(raises.exception))
+        cfunc = njit(parallel=True)(test_impl2)
+        with self.assertRaises(ValueError) as raises:
+            cfunc(A, W[:-1])
+        self.assertIn("weights and list don't have the same length",
+                      str(raises.exception))
+
+    def test_histogram(self):
+        def test_impl1(A):
+            return np.histogram(A)
+
+        def test_impl2(A, bins):
+            return np.histogram(A, bins)
+
+        def test_impl3(A, bins, range):
+            return np.histogram(A, bins, range)
+
+        n = 100000
+        A = np.random.ranf(n)
+        B = np.random.randint(1000, size=(n // 100, 100))
+        C = A.copy()
+        C[::7] = np.nan
+
+        def check(pyfunc, *args):
+            # The histogram and the bin edges are checked separately
+            expected = pyfunc(*args)
+            for got in (njit(pyfunc)(*args),
+                        njit(parallel=True)(pyfunc)(*args)):
+                np.testing.assert_equal(got[0], expected[0])
+                np.testing.assert_almost_equal(got[1], expected[1])
+
+        check(test_impl1, A)
+        check(test_impl1, B)
+        check(test_impl2, A, 17)
+        check(test_impl2, B.T, 33)
+        check(test_impl2, A, np.sort(np.random.ranf(25)))
+        check(test_impl2, C, np.linspace(0.1, 0.8, 9))
+        check(test_impl3, A, 9, (0.25, 0.75))
+        check(test_impl3, C, 9, (0.0, 1.0))
+        check(test_impl3, B, 5, None)
+        # min and max reductions, then the per-thread bins
+        self.assertEqual(countParfors(test_impl1, (types.float64[::1],)), 4)
+
+        cfunc = njit(parallel=True)(test_impl3)
+        with self.assertRaises(ValueError) as raises:
+            cfunc(A, 5, (1.0, 0.0))
+        self.assertIn("max must be larger than min", str(raises.exception))
+        cfunc = njit(parallel=True)(test_impl2)
+        with self.assertRaises(ValueError) as raises:
+            cfunc(A, np.array([0.0, 1.0, 0.5]))
+        self.assertIn("bins must increase monotonically",
+                      str(raises.exception))
+
+    def test_searchsorted(self):
+        def test_impl1(A, V):
+            return np.searchsorted(A, V)
+
+        def test_impl2(A, V):
+            return np.searchsorted(A, V, side='right')
+
+        n = 100000
+        A = np.sort(np.random.randint(1000, size=n // 10))
+        V = np.random.randint(-10, 1010, size=n)
+        F = np.sort(np.random.ranf(1000))
+        self.check(test_impl1, A, V)
+        self.check(test_impl2, A, V)
+        self.check(test_impl1, A, V.reshape((n // 100, 100)))
+        self.check(test_impl2, F, np.random.ranf(n))
+        self.check(test_impl1, A, V[::-1])
+        self.assertEqual(countParfors(test_impl1, (types.int64[::1],
+                                                   types.int64[::1])), 1)
+
+    def test_median_axis(self):
+        def test_impl1(A):
+            return np.median(A, axis=0)
+
+        def test_impl2(A):
+            return np.median(A, axis=-1)
+
+        def test_impl3(A):
+            return np.nanmedian(A, 1)
+
+        A = np.random.ranf((300, 200))
+        B = A.copy()
+        B[::3, ::7] = np.nan
+        B[5] = np.nan
+        self.check(test_impl1, A)
+        self.check(test_impl2, A)
+        self.check(test_impl1, A.reshape((30, 10, 200)))
+        self.check(test_impl2, np.random.randint(100, size=(50, 6, 7)))
+        self.check(test_impl2, A[::2, ::-3])
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            self.check(test_impl3, B)
+            # The median of an empty lane is NaN
+            self.check(test_impl2, np.empty((4, 0)))
+            self.check(test_impl3, np.empty((4, 0, 3)))
+        self.assertEqual(countParfors(test_impl1, (types.float64[:, ::1],)),
+                         1)
+
+    def test_cumsum(self):
+        def test_impl1(A):
+            return np.cumsum(A)
+
+        def test_impl2(A):
+            return A.cumprod()
+
+        def test_impl3(A):
+            return np.nancumsum(A)
+
+        n = 100003
+        A = np.random.randint(-10, 10, size=n)
+        F = np.random.ranf(n)
+        G = F.copy()
+        G[::7] = np.nan
+        self.check(test_impl1, A)
+        self.check(test_impl1, F)
+        self.check(test_impl1, A[3:].reshape((100, -1))[::2])
+        self.check(test_impl1, np.ones(n, dtype=np.bool_))
+        self.check(test_impl2, F[:500] + 0.5)
+        self.check(test_impl2, A[:40] % 3 + 1)
+        self.check(test_impl3, G)
+        self.check(test_impl1, np.empty(0))
+        self.assertEqual(countParfors(test_impl1, (types.float64[::1],)), 2)
+
+    def test_cumsum_axis(self):
+        def test_impl1(A):
+            return np.cumsum(A, axis=0)
+
+        def test_impl2(A):
+            return A.cumprod(axis=-1)
+
+        def test_impl3(A):
+            return np.nancumprod(A, 1)
+
+        A = np.random.ranf((300, 200)) + 0.5
+        B = A.copy()
+        B[::3, ::7] = np.nan
+        self.check(test_impl1, A)
+        self.check(test_impl1, np.random.randint(100, size=(50, 6, 7)))
+        self.check(test_impl2, A[:, :50])
+        self.check(test_impl2, A.T[:50])
+        self.check(test_impl3, B[:, :50])
+        self.assertEqual(countParfors(test_impl1, (types.float64[:, ::1],)),
+                         1)
+
+    def test_diff(self):
+        def test_impl1(A):
+            return np.diff(A)
+
+        def test_impl2(A, n):
+            return np.diff(A, n)
+
+        def test_impl3(A, n):
+            return np.diff(A, n, axis=0)
+
+        n = 100003
+        A = np.random.randint(-10, 10, size=n)
+        F = np.random.ranf((300, 200))
+        self.check(test_impl1, A)
+        self.check(test_impl1, A[::-3])
+        self.check(test_impl1, F)
+        for k in (0, 1, 2, 5):
+            self.check(test_impl2, A, k)
+            self.check(test_impl3, F, k)
+        self.check(test_impl2, A[:3], 4)
+        # the first pass and the in-place other passes
+        self.assertEqual(countParfors(test_impl1, (types.int64[::1],)), 2)
+
+    def test_percentile_axis(self):
+        def test_impl1(A):
+            return np.percentile(A, 30, axis=0)
+
+        def test_impl2(A, q):
+            return np.quantile(A, q, axis=1)
+
+        def test_impl3(A, q):
+            return np.nanpercentile(A, q, 0)
+
+        A = np.random.ranf((300, 200))
+        B = A.copy()
+        B[::3, ::7] = np.nan
+        q = np.array([0.0, 0.25, 0.5, 1.0])
+        self.check(test_impl1, A)
+        self.check(test_impl1, A.reshape((30, 10, 200)))
+        self.check(test_impl2, A, q)
+        self.check(test_impl2, A.T, 0.5)
+        self.check(test_impl3, B, q * 100)
+        # The percentiles of an empty lane are NaN, NumPy raises an
+        # IndexError for them
+        got = njit(parallel=True)(test_impl2)(np.empty((4, 0)), q)
+        np.testing.assert_equal(got, np.full((4, 4), np.nan))
+        self.assertEqual(countParfors(test_impl2, (types.float64[:, ::1],
+                                                   types.float64)), 1)
+
     def test_argmin(self):
         def test_impl1(A):
             return A.argmin()
@@ -2762,6 +3055,24 @@ class TestParforsOptions(TestParforsBase):
                          comprehension=False, setitem=False, prange=False,
                          reduction=False, numpy=False), 0)
 
+    def test_parfor_first_touch(self):
+        def test_impl(n):
+            a = np.empty(n)
+            b = np.empty(n, dtype=np.bool_)
+            for i in prange(n):
+                a[i] = i
+            return a, b
+
+        args = (numba.intp,)
+        # np.empty() is only filled in parallel when asked for
+        self.assertEqual(countParfors(test_impl, args, fusion=False), 1)
+        self.assertEqual(countParfors(test_impl, args, fusion=False,
+                                      first_touch=True), 3)
+        cfunc = njit(parallel={'first_touch': True})(test_impl)
+        a, b = cfunc(10)
+        np.testing.assert_array_equal(a, np.arange(10.))
+        self.assertFalse(b.any())
+
 
 @skip_parfors_unsupported
 class TestParforsBitMask(TestParforsBase):
@@ -4662,6 +4973,99 @@ class TestParforChunksizing(TestCase):
         self.assertIn(msg, str(raised.exception))
 
 
+@skip_parfors_unsupported
+class TestParforScheduling(TestCase):
+    """
+    Tests schedule kind handling in ParallelAccelerator.
+    """
+    _numba_parallel_test_ = False
+
+    def setUp(self):
+        set_parallel_schedule('static')
+
+    def tearDown(self):
+        set_parallel_schedule('static')
+
+    def test_python_parallel_schedule_basic(self):
+        self.assertEqual(get_parallel_schedule(), 'static')
+        self.assertEqual(set_parallel_schedule('dynamic'), 'static')
+        self.assertEqual(get_parallel_schedule(), 'dynamic')
+        self.assertEqual(set_parallel_schedule('guided'), 'dynamic')
+        self.assertEqual(get_parallel_schedule(), 'guided')
+        with parallel_schedule('dynamic'):
+            self.assertEqual(get_parallel_schedule(), 'dynamic')
+        self.assertEqual(get_parallel_schedule(), 'guided')
+
+    def test_njit_with_schedule(self):
+        @njit
+        def test_impl():
+            s1 = get_parallel_schedule()
+            with parallel_schedule('guided'):
+                s2 = get_parallel_schedule()
+            s3 = set_parallel_schedule('dynamic')
+            return s1, s2, s3, get_parallel_schedule()
+
+        self.assertEqual(test_impl(), ('static', 'guided', 'static',
+                                       'dynamic'))
+
+    def test_all_iterations_reset_schedule(self):
+        """ Test that all the iterations get run and reductions are
+            correct with every schedule, with or without a chunksize, and
+            that the schedule each worker thread sees has been reset. """
+
+        @njit(parallel=True)
+        def test_impl(n):
+            res = np.zeros(n)
+            inner = np.full(n, -13)
+            acc = 0
+            for i in numba.prange(n):
+                inner[i] = len(numba.get_parallel_schedule())
+                res[i] = 13
+                acc += i
+            return res, inner, acc
+
+        for kind in ('static', 'dynamic', 'guided'):
+            for cs in (0, 1, 7):
+                for n in (1, 997, 1000):
+                    with parallel_schedule(kind), parallel_chunksize(cs):
+                        res, inner, acc = test_impl(n)
+                    self.assertTrue(np.all(res == 13))
+                    self.assertTrue(np.all(inner == len('static')))
+                    self.assertEqual(acc, n * (n - 1) // 2)
+
+    def test_multidimensional(self):
+        @njit(parallel=True)
+        def test_impl(n, m):
+            res = np.zeros((n, m))
+            for idx in numba.pndindex(res.shape):
+                res[idx] = idx[0] * m + idx[1]
+            return res
+
+        expected = np.arange(35 * 17.).reshape((35, 17))
+        for kind in ('dynamic', 'guided'):
+            with parallel_schedule(kind):
+                np.testing.assert_equal(test_impl(35, 17), expected)
+
+    def test_invalid_schedule(self):
+        msg = "schedule must be one of 'static', 'dynamic' or 'guided'"
+        with self.assertRaises(ValueError) as raised:
+            set_parallel_schedule('auto')
+        self.assertIn(msg, str(raised.exception))
+
+        @njit
+        def impl():
+            set_parallel_schedule('auto')
+
+        with self.assertRaises(ValueError) as raised:
+            impl()
+        self.assertIn(msg, str(raised.exception))
+
+        with self.assertRaises(TypeError) as raised:
+            set_parallel_schedule(1)
+        self.assertIn("The parallel schedule must be a string",
+                      str(raised.exception))
+
+
 @skip_parfors_unsupported
 @x86_only
 class TestParforsVectorizer(TestPrangeBase):
@@ -4927,6 +5331,118 @@ class TestParforReductionSetNumThreads(TestCase):
         self.assertPreciseEqual(expect, got)
 
 
+@njit
+def _merge_counts(a, b):
+    for k, v in b.items():
+        a[k] = a.get(k, 0) + v
+    return a
+
+
+@reduction(identity=lambda: Dict.empty(types.int64, types.int64),
+           combine=_merge_counts)
+def _count(acc, key):
+    acc[key] = acc.get(key, 0) + 1
+    return acc
+
+
+@njit
+def _merge_stats(a, b):
+    return (a[0] + b[0], a[1] + b[1], max(a[2], b[2]))
+
+
+@reduction(identity=lambda: (0, 0.0, -np.inf), combine=_merge_stats)
+def _stats(acc, v):
+    return (acc[0] + 1, acc[1] + v, max(acc[2], v))
+
+
+@njit
+def _gcd_merge(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+
+@reduction(identity=lambda: 0, combine=_gcd_merge)
+def _gcd(a, b):
+    return _gcd_merge(a, b)
+
+
+@skip_parfors_unsupported
+class TestParforDeclaredReduction(MemoryLeakMixin, TestCase):
+    """Test reductions declared with numba.reduction.
+    """
+    def test_dict_histogram(self):
+        @njit(parallel=True)
+        def udt(x):
+            acc = Dict.empty(types.int64, types.int64)
+            for i in prange(len(x)):
+                acc = _count(acc, x[i])
+            return acc
+
+        x = np.random.randint(0, 20, 1000)
+        got = udt(x)
+        keys, counts = np.unique(x, return_counts=True)
+        self.assertEqual(dict(got), dict(zip(keys, counts)))
+
+    def test_tuple_accumulator(self):
+        @njit(parallel=True)
+        def udt(x):
+            acc = (5, 0.5, -np.inf)
+            for i in prange(len(x)):
+                acc = _stats(acc, x[i])
+            return acc
+
+        x = np.arange(100.)
+        expect = udt.py_func(x)
+        got = udt(x)
+        self.assertPreciseEqual(expect, got)
+
+    def test_scalar_accumulator(self):
+        @njit(parallel=True)
+        def udt(x):
+            acc = 0
+            for i in prange(len(x)):
+                acc = _gcd(acc, x[i])
+            return acc
+
+        x = np.arange(12, 1200, 12)
+        self.assertPreciseEqual(udt(x), udt.py_func(x))
+
+    def test_set_num_threads(self):
+        N = config.NUMBA_NUM_THREADS
+
+        @njit(parallel=True)
+        def udt(x, nthreads):
+            set_num_threads(nthreads)
+            acc = Dict.empty(types.int64, types.int64)
+            for i in prange(len(x)):
+                acc = _count(acc, x[i])
+            return acc
+
+        x = np.arange(100) % 7
+        expect = dict(zip(range(7), np.bincount(x)))
+        for nthreads in range(1, N + 1):
+            self.assertEqual(dict(udt(x, nthreads)), expect)
+
+    def test_is_parallelized(self):
+        def udt(x):
+            acc = 0
+            for i in prange(len(x)):
+                acc = _gcd(acc, x[i])
+            return acc
+
+        self.assertEqual(countParfors(udt, (types.int64[::1],)), 1)
+
+    def test_invalid(self):
+        with self.assertRaises(errors.NumbaTypeError):
+            reduction(identity=0, combine=_gcd_merge)
+        with self.assertRaises(errors.NumbaTypeError):
+            reduction(identity=lambda: 0, combine=0)
+        # the update function is not a valid combine function in general
+        with self.assertRaises(TypeError):
+            reduction(identity=lambda: 0)
+
+
 @skip_parfors_unsupported
 class TestDiagnosticEnvVar(TestCase):
     @TestCase.run_test_in_subprocess()
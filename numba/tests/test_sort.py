@@ -11,6 +11,7 @@ from numba import jit, njit
 from numba.core import utils, errors
 from numba.tests.support import TestCase, MemoryLeakMixin
 
+from numba.misc import quicksort
 from numba.misc.quicksort import make_py_quicksort, make_jit_quicksort
 from numba.misc.mergesort import make_jit_mergesort
 from numba.misc.timsort import make_py_timsort, make_jit_timsort, MergeRun
@@ -48,6 +49,15 @@ def argsort_kind_usecase(val, is_stable=False):
     else:
         return val.argsort(kind='quicksort')
 
+def sort_radix_usecase(val):
+    val.sort(kind='radix')
+
+def sort_mergesort_usecase(val):
+    val.sort(kind='mergesort')
+
+def argsort_radix_usecase(val):
+    return val.argsort(kind='radix')
+
 def sorted_usecase(val):
     return sorted(val)
 
@@ -66,6 +76,18 @@ def np_argsort_kind_usecase(val, is_stable=False):
     else:
         return np.argsort(val, kind='quicksort')
 
+def np_sort_stable_usecase(val):
+    return np.sort(val, kind='stable')
+
+def np_sort_axis_usecase(val, axis):
+    return np.sort(val, axis)
+
+def np_sort_axis_kind_usecase(val, axis):
+    return np.sort(val, axis=axis, kind='radix')
+
+def np_argsort_stable_usecase(val):
+    return np.argsort(val, kind='stable')
+
 def list_sort_usecase(n):
     np.random.seed(42)
     l = []
@@ -591,28 +613,82 @@ class BaseQuicksortTest(BaseSortingTest):
         n = 20
         def check(l, n):
             res = self.array_factory([9999] + l + [-9999])
-            index = f(res, res, 1, n)
+            index, already_partitioned = f(res, res, 1, n)
             self.assertEqual(res[0], 9999)
             self.assertEqual(res[-1], -9999)
             pivot = res[index]
             for i in range(1, index):
-                self.assertLessEqual(res[i], pivot)
+                self.assertLess(res[i], pivot)
             for i in range(index + 1, n):
                 self.assertGreaterEqual(res[i], pivot)
+            return already_partitioned
+
+        for f in (self.quicksort.partition, self.partition_branchless):
+            for l in self.partition_lists(n):
+                check(l, n)
+            self.assertTrue(check(self.sorted_list(n), n))
+            l = self.sorted_list(n)
+            l[:3] = l[1], l[2], l[0]
+            self.assertFalse(check(l, n))
+            # Larger than the blocks of the branchless partitioning
+            for l in self.partition_lists(300):
+                check(l, 300)
+
+    def partition_branchless(self, A, R, low, high):
+        offsets = np.empty(quicksort.BLOCK_SIZE, dtype=np.intp)
+        return self.quicksort.partition_branchless(A, R, low, high,
+                                                   offsets, offsets.copy())
+
+    def partition_lists(self, n):
+        return [self.sorted_list(n), self.revsorted_list(n),
+                self.initially_sorted_list(n, n//2), self.random_list(n),
+                self.duprandom_list(n), self.dupsorted_list(n)]
+
+    def test_partition_left(self):
+        n = 20
+        def check(l, n):
+            # No element is smaller than the pivot
+            l = [min(l)] + l
+            res = self.array_factory([9999] + l + [-9999])
+            index = f(res, res, 1, n + 1)
+            self.assertEqual(res[0], 9999)
+            self.assertEqual(res[-1], -9999)
+            pivot = res[index]
+            for i in range(1, index):
+                self.assertEqual(res[i], pivot)
+            for i in range(index + 1, n + 2):
+                self.assertGreater(res[i], pivot)
+
+        f = self.quicksort.partition_left
+        for l in self.partition_lists(n):
+            check(l, n)
+
+    def test_heapsort(self):
+        def check(l, n):
+            res = self.array_factory([9999] + l + [-9999])
+            f(res, res, 1, n)
+            self.assertEqual(res[0], 9999)
+            self.assertEqual(res[-1], -9999)
+            self.assertSorted(l, res[1:-1])
+
+        f = self.quicksort.heapsort
+        for n in (2, 3, 20, 65):
+            for l in self.partition_lists(n):
+                check(l, n)
 
-        f = self.quicksort.partition
+    def test_partial_insertion_sort(self):
+        n = 40
+        f = self.quicksort.partial_insertion_sort
+        # A few moves are allowed
         l = self.sorted_list(n)
-        check(l, n)
+        l[10], l[11] = l[11], l[10]
+        res = self.array_factory(l)
+        self.assertTrue(f(res, res, 0, n - 1))
+        self.assertSorted(l, res)
+        # But not too many
         l = self.revsorted_list(n)
-        check(l, n)
-        l = self.initially_sorted_list(n, n//2)
-        check(l, n)
-        l = self.revsorted_list(n)
-        check(l, n)
-        l = self.random_list(n)
-        check(l, n)
-        l = self.duprandom_list(n)
-        check(l, n)
+        res = self.array_factory(l)
+        self.assertFalse(f(res, res, 0, n - 1))
 
     def test_partition3(self):
         # Test the unused partition3() function
@@ -659,6 +735,23 @@ class BaseQuicksortTest(BaseSortingTest):
                 # The list is now sorted
                 self.assertSorted(orig_keys, keys)
 
+    def test_run_quicksort_patterns(self):
+        # Inputs that make a naive quicksort quadratic
+        f = self.quicksort.run_quicksort
+        n = 2000
+        lists = self.partition_lists(n)
+        lists.append([x % 7 for x in range(n)])
+        lists.append(list(range(n // 2)) + list(range(n // 2, 0, -1)))
+        lists.append([0] * n)
+        # Median-of-3 killer
+        k = n // 2
+        lists.append([i + 1 if i % 2 == 0 else k + i for i in range(k)] +
+                     [2 * (i + 1) for i in range(k)])
+        for l in lists:
+            keys = self.array_factory(l)
+            f(keys)
+            self.assertSorted(l, keys)
+
     def test_run_quicksort_lt(self):
         def lt(a, b):
             return a > b
@@ -993,6 +1086,98 @@ class TestNumpySort(TestCase):
         check(argsort_kind_usecase, is_stable=False)
         check(np_argsort_kind_usecase, is_stable=False)
 
+    def radix_arrays(self):
+        for dtype in (np.int8, np.int16, np.int32, np.int64,
+                      np.uint8, np.uint16, np.uint32, np.uint64):
+            info = np.iinfo(dtype)
+            for size in (0, 1, 5, 500):
+                yield np.random.randint(info.min, info.max, size=size,
+                                        dtype=dtype)
+            # Many duplicates
+            yield np.random.randint(0, 10, size=500).astype(dtype)
+        for dtype in (np.float32, np.float64):
+            for orig in self.float_arrays():
+                yield orig.astype(dtype)
+            orig = np.random.randn(500).astype(dtype)
+            orig[:6] = [np.inf, -np.inf, 0.0, -0.0, -0.0, 0.0]
+            yield orig
+        yield np.random.random(500) < 0.5
+
+    def test_array_sort_radix(self):
+        cfunc = jit(nopython=True)(sort_radix_usecase)
+        for orig in self.radix_arrays():
+            got = orig.copy()
+            cfunc(got)
+            np.testing.assert_array_equal(got, np.sort(orig))
+
+    def test_np_sort_stable(self):
+        pyfunc = np_sort_stable_usecase
+        cfunc = jit(nopython=True)(pyfunc)
+        for orig in self.radix_arrays():
+            self.check_sort_copy(pyfunc, cfunc, orig)
+        for orig in self.float_arrays():
+            self.check_sort_copy(pyfunc, cfunc, orig)
+
+    def test_np_sort_axis(self):
+        for pyfunc in (np_sort_axis_usecase, np_sort_axis_kind_usecase):
+            cfunc = jit(nopython=True)(pyfunc)
+            for shape in ((50,), (5, 7), (3, 4, 50)):
+                orig = np.random.randint(99, size=shape)
+                val = orig.copy()
+                for axis in (-1, len(shape) - 1, None):
+                    got = cfunc(val, axis)
+                    self.assertPreciseEqual(got, np.sort(orig, axis))
+                # The input is left untouched
+                self.assertPreciseEqual(val, orig)
+
+    def test_argsort_radix(self):
+        def check(cfunc):
+            for orig in self.radix_arrays():
+                got = cfunc(orig)
+                # The radix sort is stable
+                self.assertPreciseEqual(got, np.argsort(orig, kind='stable'))
+
+        check(jit(nopython=True)(argsort_radix_usecase))
+        check(jit(nopython=True)(np_argsort_stable_usecase))
+
+    def test_sort_kind_multidimensional(self):
+        for pyfunc in (sort_radix_usecase, sort_mergesort_usecase):
+            cfunc = jit(nopython=True)(pyfunc)
+            for shape in ((5, 7), (3, 4, 50)):
+                orig = np.random.randint(99, size=shape)
+                got = orig.copy()
+                cfunc(got)
+                self.assertPreciseEqual(got, np.sort(orig))
+                # Non-contiguous
+                got = orig.copy()
+                cfunc(got[..., ::2])
+                np.testing.assert_array_equal(got[..., ::2],
+                                              np.sort(orig[..., ::2]))
+
+    def test_bad_sort_kind(self):
+        def bad_kind(val):
+            val.sort(kind='heapsort')
+
+        msg = '"kind" must be one of'
+        with self.assertRaisesRegex(errors.TypingError, msg):
+            jit(nopython=True)(bad_kind)(np.arange(3))
+
+        msg = 'radix sort is not supported for arrays of complex128'
+        with self.assertRaisesRegex(errors.TypingError, msg):
+            jit(nopython=True)(argsort_radix_usecase)(np.arange(3j))
+
+    def test_bad_sort_axis(self):
+        cfunc = jit(nopython=True)(np_sort_axis_usecase)
+
+        msg = 'only supports sorting along the last axis'
+        for axis in (0, -2, 2):
+            with self.assertRaisesRegex(ValueError, msg):
+                cfunc(np.ones((2, 2)), axis)
+
+        msg = '"axis" must be an integer or None'
+        with self.assertRaisesRegex(errors.TypingError, msg):
+            cfunc(np.ones((2, 2)), 1.0)
+
     def test_bad_array(self):
         cfunc = jit(nopython=True)(np_sort_usecase)
         msg = '.*Argument "a" must be array-like.*'
@@ -1,3 +1,4 @@
+import pickle
 import sys
 import subprocess
 from itertools import product
@@ -12,6 +13,7 @@ from numba.core import types
 from numba import typeof
 from numba.typed import List, Dict
 from numba.core.errors import TypingError
+from numba.np.numpy_support import numpy_version
 from numba.tests.support import (TestCase, MemoryLeakMixin, override_config,
                                  forbid_codegen, skip_parfors_unsupported)
 from numba.core.unsafe.refcount import get_refcount
@@ -1666,3 +1668,234 @@ class TestListFromIter(MemoryLeakMixin, TestCase):
             "List() takes no keyword arguments",
             str(raises.exception),
         )
+
+
+class TestArrayConversion(MemoryLeakMixin, TestCase):
+
+    def test_from_array(self):
+        for arr in (np.arange(10, dtype=np.int16),
+                    np.linspace(0, 1, 7)[::2],
+                    np.array([True, False]),
+                    np.array([], dtype=np.complex128)):
+            l = List.from_array(arr)
+            self.assertEqual(typeof(l), types.ListType(typeof(arr).dtype))
+            self.assertEqual(list(l), arr.tolist())
+
+        @njit
+        def foo(arr):
+            return List.from_array(arr)
+
+        arr = np.arange(5.0)
+        self.assertEqual(list(foo(arr)), arr.tolist())
+
+        with self.assertRaises(TypingError) as raises:
+            foo(np.ones((2, 2)))
+        self.assertIn("List.from_array() argument must be a 1D array",
+                      str(raises.exception))
+
+    def test_to_array(self):
+        l = List.from_array(np.arange(6, dtype=np.uint8))
+        l.append(np.uint8(200))
+        self.assertPreciseEqual(l.to_array(),
+                                np.array([0, 1, 2, 3, 4, 5, 200], np.uint8))
+        self.assertPreciseEqual(List().to_array(), np.array([]))
+
+        @njit
+        def foo(n):
+            l = List()
+            for i in range(n):
+                l.append(i * 0.5)
+            return l.to_array()
+
+        self.assertPreciseEqual(foo(5), np.arange(5) * 0.5)
+        self.assertPreciseEqual(foo(0), np.empty(0))
+
+        with self.assertRaises(TypingError) as raises:
+            List(["a", "b"]).to_array()
+        self.assertIn("to_array() is not supported for lists of",
+                      str(raises.exception))
+
+    def test_asarray(self):
+        l = List.from_array(np.arange(5.0))
+        a = np.asarray(l)
+        self.assertIsNot(a.base, l)
+        self.assertPreciseEqual(a, np.arange(5.0))
+        # The array is a copy of the items of the list
+        a[1] = 42.0
+        self.assertEqual(l[1], 1.0)
+        l[2] = -1.0
+        self.assertEqual(a[2], 2.0)
+        # and stays valid when the list is resized
+        for i in range(100000):
+            l.append(i)
+        self.assertPreciseEqual(a, np.array([0.0, 42.0, 2.0, 3.0, 4.0]))
+
+        for values in ([True, False], [1j, 2j], [np.int8(3)]):
+            l = List(values)
+            self.assertPreciseEqual(np.asarray(l), np.array(values))
+        self.assertPreciseEqual(np.asarray(List.empty_list(types.int32)),
+                                np.empty(0, np.int32))
+        self.assertPreciseEqual(np.asarray(List([1, 2]), dtype=np.float32),
+                                np.array([1.0, 2.0], np.float32))
+
+        # Other item types are converted item by item
+        self.assertPreciseEqual(np.asarray(List(["a", "b"])),
+                                np.array(["a", "b"]))
+        self.assertPreciseEqual(np.asarray(List()), np.array([]))
+        self.assertFalse(hasattr(List([1]), "__array_interface__"))
+
+        if numpy_version >= (2, 0):
+            with self.assertRaises(ValueError) as raises:
+                np.asarray(List([1]), copy=False)
+            self.assertIn("use view()", str(raises.exception))
+
+    def test_view(self):
+        @njit
+        def foo(n):
+            l = List()
+            for i in range(n):
+                l.append(i * 0.5)
+            a = l.view()
+            a[0] = -1.0
+            return a, l
+
+        a, l = foo(4)
+        self.assertPreciseEqual(a, np.array([-1.0, 0.5, 1.0, 1.5]))
+        self.assertEqual(list(l), a.tolist())
+        a[1] = 3.0
+        self.assertEqual(l[1], 3.0)
+
+        @njit
+        def bar(n):
+            l = List()
+            for i in range(n):
+                l.append(i)
+            # The view keeps the list alive
+            return l.view()
+
+        self.assertPreciseEqual(bar(3), np.arange(3))
+        self.assertPreciseEqual(bar(0), np.arange(0))
+
+        @njit
+        def write(l):
+            a = l.view()
+            a[0] = 42
+            return a
+
+        # An immutable list is copied
+        l = List([1, 2, 3])
+        l._make_immutable()
+        self.assertPreciseEqual(write(l), np.array([42, 2, 3]))
+        self.assertEqual(list(l), [1, 2, 3])
+
+        # From the interpreter
+        l = List([1.5, 2.5])
+        a = l.view()
+        a[0] = 0.0
+        self.assertEqual(list(l), [0.0, 2.5])
+        l[1] = 3.5
+        self.assertEqual(a[1], 3.5)
+        # The view keeps the list alive
+        del l
+        self.assertPreciseEqual(a, np.array([0.0, 3.5]))
+        self.assertPreciseEqual(List.empty_list(types.int32).view(),
+                                np.empty(0, np.int32))
+
+        # The view of an immutable list is read-only
+        l = List([1, 2])
+        l._make_immutable()
+        self.assertFalse(l.view().flags.writeable)
+        l = List.empty_list(types.int32)
+        l._make_immutable()
+        self.assertFalse(l.view().flags.writeable)
+
+    def test_view_errors(self):
+        @njit
+        def foo(l):
+            return l.view()
+
+        with self.assertRaises(TypingError) as raises:
+            foo(List(["a"]))
+        self.assertIn("view() is only supported for lists of numbers or "
+                      "booleans", str(raises.exception))
+        with self.assertRaises(TypeError) as raises:
+            List(["a"]).view()
+        self.assertIn("view() is only supported for lists of numbers or "
+                      "booleans", str(raises.exception))
+
+    def test_asarray_copy(self):
+        # In compiled code np.asarray() copies the items, as a view would be
+        # invalidated by the resizes of the list
+        @njit
+        def grow(l):
+            a = np.asarray(l)
+            for i in range(10000):
+                l.append(i)
+            return a.sum()
+
+        self.assertEqual(grow(List([1, 2, 3])), 6)
+
+        @njit
+        def write(l):
+            a = np.asarray(l)
+            a[0] = 42
+            return a
+
+        l = List([1, 2, 3])
+        self.assertPreciseEqual(write(l), np.array([42, 2, 3]))
+        self.assertEqual(list(l), [1, 2, 3])
+
+    def test_pickle(self):
+        l = List(np.arange(6, dtype=np.uint16))
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            m = pickle.loads(pickle.dumps(l, protocol=proto))
+            self.assertEqual(typeof(m), typeof(l))
+            self.assertEqual(list(m), list(l))
+
+        # The items are passed out-of-band with protocol 5
+        buffers = []
+        data = pickle.dumps(l, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        # The buffer of a mutable list is a copy, it stays valid when the
+        # list is resized before the buffer is consumed
+        l.extend(np.arange(1000, dtype=np.uint16))
+        m = pickle.loads(data, buffers=buffers)
+        self.assertEqual(list(m), list(range(6)))
+        # The unpickled list is independent of the original
+        m[0] = np.uint16(10)
+        self.assertEqual(l[0], 0)
+
+        # The mutability of the list is kept
+        for l in (List([1.5, 2.5]), List(["a", "b"])):
+            l._make_immutable()
+            m = pickle.loads(pickle.dumps(l, protocol=5))
+            self.assertEqual(list(m), list(l))
+            self.assertFalse(m._is_mutable())
+        self.assertTrue(pickle.loads(pickle.dumps(List([1])))._is_mutable())
+
+        # Other types of items are pickled one by one
+        l = List([List(["a", "b"]), List(["c"])])
+        m = pickle.loads(pickle.dumps(l))
+        self.assertEqual(typeof(m), typeof(l))
+        self.assertEqual([list(x) for x in m], [["a", "b"], ["c"]])
+
+        m = pickle.loads(pickle.dumps(List()))
+        self.assertEqual(len(m), 0)
+        m.append(1.5)
+        self.assertEqual(typeof(m), types.ListType(types.float64))
+
+    def test_shared_memory(self):
+        for l in (List([1.5, 2.5, -1.0]),
+                  List.empty_list(types.int8),
+                  List([True, False])):
+            shm = l.to_shared_memory()
+            self.addCleanup(shm.unlink)
+            self.addCleanup(shm.close)
+            m = List.from_shared_memory(shm.name)
+            self.assertEqual(typeof(m), typeof(l))
+            self.assertEqual(list(m), list(l))
+
+        with self.assertRaises(TypeError) as raises:
+            List(["a"]).to_shared_memory()
+        self.assertIn("to_shared_memory() requires a list of numbers or "
+                      "booleans", str(raises.exception))
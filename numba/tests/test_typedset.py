@@ -0,0 +1,210 @@
+import numpy as np
+
+from numba import njit, typeof
+from numba.core import types
+from numba.core.errors import TypingError
+from numba.typed import Set, List, Dict
+from numba.tests.support import (TestCase, MemoryLeakMixin, override_config,
+                                 forbid_codegen, unittest)
+
+
+class TestTypedSet(MemoryLeakMixin, TestCase):
+
+    def test_basic(self):
+        s = Set()
+        self.assertEqual(len(s), 0)
+        self.assertNotIn(1, s)
+        self.assertEqual(repr(s), "SetType[Undefined](set())")
+        s.add(3)
+        s.add(5)
+        s.add(3)
+        self.assertEqual(typeof(s), types.SetType(types.int64))
+        self.assertEqual(len(s), 2)
+        self.assertIn(3, s)
+        self.assertNotIn(4, s)
+        self.assertEqual(sorted(s), [3, 5])
+        s.discard(5)
+        s.discard(7)
+        self.assertEqual(list(s), [3])
+        s.remove(3)
+        self.assertEqual(len(s), 0)
+        with self.assertRaises(KeyError):
+            s.remove(3)
+        with self.assertRaises(KeyError):
+            s.pop()
+        s.update([1, 2], (3,))
+        self.assertEqual(s.pop(), 3)
+        c = s.copy()
+        s.clear()
+        self.assertEqual(len(s), 0)
+        self.assertEqual(set(c), {1, 2})
+
+    def test_empty(self):
+        s = Set.empty(types.int32, n_items=100)
+        self.assertEqual(typeof(s), types.SetType(types.int32))
+        self.assertEqual(len(s), 0)
+        s.add(np.int32(2))
+        self.assertEqual(set(s), {2})
+
+    def test_from_iterables(self):
+        arr = np.array([4, 2, 4, 1], dtype=np.int16)
+        s = Set(arr)
+        self.assertEqual(typeof(s), types.SetType(types.int16))
+        self.assertEqual(set(s), {1, 2, 4})
+        self.assertEqual(set(Set(List([1.5, 2.5]))), {1.5, 2.5})
+        d = Dict()
+        d["a"] = 1
+        self.assertEqual(set(Set(d)), {"a"})
+        self.assertEqual(set(Set(s)), {1, 2, 4})
+        self.assertEqual(set(Set(x * 2 for x in range(3))), {0, 2, 4})
+        self.assertEqual(len(Set(np.array([]))), 0)
+
+    def test_set_algebra(self):
+        a = {1, 2, 3, 4}
+        b = {3, 4, 5}
+        ta = Set(np.array(sorted(a)))
+        tb = Set(np.array(sorted(b)))
+        self.assertEqual(set(ta | tb), a | b)
+        self.assertEqual(set(ta & tb), a & b)
+        self.assertEqual(set(ta - tb), a - b)
+        self.assertEqual(set(ta ^ tb), a ^ b)
+        self.assertEqual(set(ta.union([7], [8])), a.union([7], [8]))
+        self.assertEqual(set(ta.intersection([1, 9])), {1})
+        self.assertEqual(set(ta.difference([1, 9])), {2, 3, 4})
+        self.assertFalse(ta.isdisjoint(tb))
+        self.assertTrue(ta.isdisjoint(Set([10])))
+        self.assertFalse(ta <= tb)
+        self.assertTrue((ta & tb) <= tb)
+        self.assertTrue(ta.issuperset([1, 2]))
+        self.assertTrue(ta == Set([4, 3, 2, 1]))
+        self.assertTrue(ta != tb)
+        # Comparison with other kinds of sets
+        self.assertTrue(ta == a)
+        self.assertEqual(ta | b, a | b)
+
+    def test_jit_usage(self):
+        @njit
+        def build(ids):
+            s = Set.empty(types.int64)
+            for i in ids:
+                s.add(i)
+            return s
+
+        @njit
+        def isin(s, query):
+            out = np.empty(len(query), dtype=np.bool_)
+            for i in range(len(query)):
+                out[i] = query[i] in s
+            return out
+
+        @njit
+        def mutate(s):
+            s.add(100)
+            s.discard(0)
+
+        s = build(np.arange(10))
+        self.assertEqual(typeof(s), types.SetType(types.int64))
+        self.assertEqual(set(s), set(range(10)))
+        self.assertPreciseEqual(isin(s, np.array([3, 11, 9])),
+                                np.array([True, False, True]))
+        # The set is passed by reference
+        mutate(s)
+        self.assertEqual(set(s), set(range(1, 10)) | {100})
+
+    def test_jit_methods(self):
+        @njit
+        def foo():
+            s = Set()
+            s.add(1.5)
+            s.add(2.5)
+            t = Set((2.5, 3.5))
+            u = s | t
+            total = 0.0
+            for x in u:
+                total += x
+            p = u.copy()
+            p.remove(3.5)
+            return (u, total, s & t, s - t, s ^ t, p.pop(), len(p),
+                    s == t, s != t, s <= u, s < u, u >= t, u > u,
+                    s.isdisjoint(t), bool(s), bool(Set.empty(types.int8)))
+
+        self.assertEqual(foo(), foo.py_func())
+
+    def test_jit_update(self):
+        @njit
+        def foo(s, arr, lst):
+            s.update(arr)
+            s.update(lst)
+            c = s.copy()
+            c.clear()
+            return len(c), Set(arr)
+
+        s = Set([1])
+        n, t = foo(s, np.array([2, 3]), List([4]))
+        self.assertEqual(n, 0)
+        self.assertEqual(set(s), {1, 2, 3, 4})
+        self.assertEqual(set(t), {2, 3})
+
+    def test_unicode(self):
+        @njit
+        def foo(s, x):
+            return x in s
+
+        s = Set(["a", "bc"])
+        self.assertEqual(typeof(s), types.SetType(types.unicode_type))
+        self.assertTrue(foo(s, "bc"))
+        self.assertFalse(foo(s, "b"))
+
+    def test_isinstance(self):
+        @njit
+        def foo(s):
+            return isinstance(s, Set), isinstance(s, List)
+
+        self.assertEqual(foo(Set([1])), (True, False))
+
+    def test_exceptions(self):
+        # Raising from compiled code leaks the arguments
+        self.disable_leak_check()
+
+        @njit
+        def remove(s, x):
+            s.remove(x)
+
+        @njit
+        def pop(s):
+            return s.pop()
+
+        @njit
+        def union(s, t):
+            return s | t
+
+        with self.assertRaises(KeyError):
+            remove(Set([1]), 2)
+        with self.assertRaises(KeyError):
+            pop(Set.empty(types.int64))
+        with self.assertRaises(TypingError) as raises:
+            union(Set([1]), Set([1.0]))
+        self.assertIn("union() is not supported for sets of different item "
+                      "types", str(raises.exception))
+        with self.assertRaises(TypeError) as raises:
+            Set([1], [2])
+        self.assertIn("Set() expected at most 1 argument, got 2",
+                      str(raises.exception))
+
+
+class TestNoJit(TestCase):
+    """Exercise set creation with JIT disabled. """
+
+    def test_set_create_no_jit(self):
+        with override_config('DISABLE_JIT', True):
+            with forbid_codegen():
+                s = Set()
+                self.assertEqual(type(s), set)
+                s = Set([1, 2])
+                self.assertEqual(s, {1, 2})
+                s = Set.empty(types.int32)
+                self.assertEqual(type(s), set)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@ import ctypes
 import operator
 from enum import IntEnum
 
+import numpy as np
 from llvmlite import ir
 
 from numba import _helperlib
@@ -31,8 +32,10 @@ from numba.core.types import (
     Type,
 )
 from numba.core.imputils import impl_ret_borrowed, RefType
-from numba.core.errors import TypingError, LoweringError
+from numba.core.errors import (TypingError, LoweringError,
+                               NumbaNotImplementedError)
 from numba.core import typing
+from numba.np import numpy_support
 from numba.typed.typedobjectutils import (_as_bytes, _cast, _nonoptional,
                                           _sentry_safe_cast_default,
                                           _get_incref_decref,
@@ -332,6 +335,311 @@ def _dict_set_method_table(typingctx, dp, keyty, valty):
     return sig, codegen
 
 
+# The layout of NB_Dict and of the header of NB_DictKeys in dictobject.h, the
+# hash table indices follow the header.  They are used by the inlined
+# operations on dicts of primitive types.
+ll_dictkeys_type = ir.LiteralStructType(
+    [ll_ssize_t] * 7 + [ll_voidptr_type] * 5,
+)
+ll_dictstruct_type = ir.LiteralStructType(
+    [ll_ssize_t, ll_dictkeys_type.as_pointer()],
+)
+
+# Fields of NB_Dict
+_D_USED, _D_KEYS = 0, 1
+# Fields of NB_DictKeys
+_DK_SIZE, _DK_USABLE, _DK_NENTRIES = 0, 1, 2
+_DK_ENTRY_SIZE, _DK_ENTRY_OFFSET = 5, 6
+
+# Must match dictobject.c
+_PERTURB_SHIFT = 5
+
+
+def _is_primitive_dict(context, td):
+    """Whether the keys of the dict type *td* are scalars, which are compared
+    by their bytes, and its values are not reference counted.  Lookups and
+    insertions in such dicts are inlined and specialised to the types rather
+    than calls to the generic C functions comparing and copying opaque bytes.
+    """
+    primitive_keys = (types.Integer, types.Boolean, types.Float,
+                      types.NPDatetime, types.NPTimedelta)
+    if not isinstance(td.key_type, primitive_keys):
+        return False
+    dm_val = context.data_model_manager[td.value_type]
+    return not dm_val.contains_nrt_meminfo()
+
+
+def _dict_index_op(builder, size, indices, op):
+    """Emit *op(ptr)* on the hash table *indices* cast to a pointer to the
+    integer type of the indices of a table of *size* slots, as chosen in
+    get_index() and set_index() in dictobject.c.  Returns the phi of the
+    results of *op* extended to a ssize_t, or None.
+    """
+    bb_end = builder.append_basic_block('dict_index.end')
+    widths = (8, 16, 32, 64) if ll_ssize_t.width > 32 else (8, 16, 32)
+    blocks = [builder.append_basic_block('dict_index.int%d' % w)
+              for w in widths]
+    bb_not8 = builder.append_basic_block('dict_index.not8')
+    builder.cbranch(builder.icmp_signed('<=', size, size.type(0xff)),
+                    blocks[0], bb_not8)
+    builder.position_at_end(bb_not8)
+    if len(widths) == 4:
+        bb_not16 = builder.append_basic_block('dict_index.not16')
+        builder.cbranch(builder.icmp_signed('<=', size, size.type(0xffff)),
+                        blocks[1], bb_not16)
+        builder.position_at_end(bb_not16)
+        builder.cbranch(builder.icmp_signed('>', size,
+                                            size.type(0xffffffff)),
+                        blocks[3], blocks[2])
+    else:
+        builder.cbranch(builder.icmp_signed('<=', size, size.type(0xffff)),
+                        blocks[1], blocks[2])
+
+    results = []
+    for width, bb in zip(widths, blocks):
+        builder.position_at_end(bb)
+        ptr = builder.bitcast(indices, ir.IntType(width).as_pointer())
+        res = op(ptr)
+        if res is not None and width < ll_ssize_t.width:
+            res = builder.sext(res, ll_ssize_t)
+        results.append((res, builder.block))
+        builder.branch(bb_end)
+
+    builder.position_at_end(bb_end)
+    if results[0][0] is None:
+        return None
+    phi = builder.phi(ll_ssize_t)
+    for res, bb in results:
+        phi.add_incoming(res, bb)
+    return phi
+
+
+def _dict_get_index(builder, size, indices, i):
+    return _dict_index_op(builder, size, indices,
+                          lambda ptr: builder.load(builder.gep(ptr, [i])))
+
+
+def _dict_set_index(builder, size, indices, i, ix):
+    def op(ptr):
+        value = ix
+        if ptr.type.pointee.width < ll_ssize_t.width:
+            value = builder.trunc(ix, ptr.type.pointee)
+        builder.store(value, builder.gep(ptr, [i]))
+    _dict_index_op(builder, size, indices, op)
+
+
+def _dict_probe(builder, size, hashval, found):
+    """Emit the probing loop of the hash table of *size* slots for
+    *hashval*, as in numba_dict_lookup().  *found(i)* is called in the loop
+    body with the slot index *i* and returns a flag ending the loop.
+    Returns the slot index at the end of the loop.
+    """
+    mask = builder.sub(size, size.type(1))
+    start = builder.and_(hashval, mask)
+    bb_entry = builder.block
+    bb_loop = builder.append_basic_block('dict_probe.loop')
+    bb_next = builder.append_basic_block('dict_probe.next')
+    bb_end = builder.append_basic_block('dict_probe.end')
+    builder.branch(bb_loop)
+
+    builder.position_at_end(bb_loop)
+    i = builder.phi(ll_ssize_t)
+    perturb = builder.phi(ll_ssize_t)
+    i.add_incoming(start, bb_entry)
+    perturb.add_incoming(hashval, bb_entry)
+    builder.cbranch(found(i), bb_end, bb_next)
+
+    builder.position_at_end(bb_next)
+    next_perturb = builder.lshr(perturb, perturb.type(_PERTURB_SHIFT))
+    next_i = builder.mul(i, i.type(5))
+    next_i = builder.add(next_i, next_perturb)
+    next_i = builder.add(next_i, i.type(1))
+    next_i = builder.and_(next_i, mask)
+    i.add_incoming(next_i, bb_next)
+    perturb.add_incoming(next_perturb, bb_next)
+    builder.branch(bb_loop)
+
+    builder.position_at_end(bb_end)
+    return i
+
+
+class _PrimitiveDictCodegen(object):
+    """Emit the inlined lookup and insertion for a dict of primitive type,
+    see _is_primitive_dict().  They work on the same C structures as the
+    functions of dictobject.c so both can be used on a dict.
+    """
+
+    def __init__(self, context, td):
+        self.context = context
+        self.td = td
+        self.ll_key = context.get_data_type(td.key_type)
+        self.ll_val = context.get_data_type(td.value_type)
+        # Offsets of the key and the value in an entry, see NB_DictEntry
+        # and entry_get_val()
+        align = context.get_abi_sizeof(ll_voidptr_type)
+        key_size = context.get_abi_sizeof(self.ll_key)
+        self.key_offset = context.get_abi_sizeof(ll_hash)
+        self.val_offset = self.key_offset + -(-key_size // align) * align
+        self.suffix = context.mangler('', [td.key_type, td.value_type])
+
+    def _key_bits(self, builder, key):
+        # The keys are compared by their bytes, as memcmp() in key_equal()
+        if isinstance(key.type, (ir.FloatType, ir.DoubleType)):
+            width = 32 if isinstance(key.type, ir.FloatType) else 64
+            return builder.bitcast(key, ir.IntType(width))
+        return key
+
+    def _field_ptr(self, builder, ep, offset, llty):
+        ptr = builder.gep(ep, [ll_ssize_t(offset)])
+        return builder.bitcast(ptr, llty.as_pointer())
+
+    def _load_keys(self, builder, dp):
+        d = builder.bitcast(dp, ll_dictstruct_type.as_pointer())
+        dk = builder.load(cgutils.gep_inbounds(builder, d, 0, _D_KEYS))
+
+        def field(i):
+            return builder.load(cgutils.gep_inbounds(builder, dk, 0, i))
+
+        indices = builder.bitcast(cgutils.gep_inbounds(builder, dk, 1),
+                                  cgutils.voidptr_t)
+        entries = builder.gep(indices, [field(_DK_ENTRY_OFFSET)])
+        return d, dk, field, indices, entries
+
+    def _entry(self, builder, entries, entry_size, ix):
+        return builder.gep(entries, [builder.mul(ix, entry_size)])
+
+    def _lookup(self, builder, dp, key, hashval):
+        """Emit the lookup of *key*, returns the index of its entry or
+        DKIX.EMPTY, and the pointer to the entry.
+        """
+        _, _, field, indices, entries = self._load_keys(builder, dp)
+        size = field(_DK_SIZE)
+        entry_size = field(_DK_ENTRY_SIZE)
+        key_bits = self._key_bits(builder, key)
+        pix = cgutils.alloca_once(builder, ll_ssize_t)
+
+        def found(i):
+            ix = _dict_get_index(builder, size, indices, i)
+            builder.store(ix, pix)
+            is_empty = builder.icmp_signed('==', ix, ix.type(int(DKIX.EMPTY)))
+            is_match = cgutils.alloca_once_value(builder, is_empty)
+            is_entry = builder.icmp_signed('>=', ix, ix.type(0))
+            with builder.if_then(is_entry):
+                ep = self._entry(builder, entries, entry_size, ix)
+                ephash = builder.load(self._field_ptr(builder, ep, 0,
+                                                      ll_hash))
+                with builder.if_then(builder.icmp_signed('==', ephash,
+                                                         hashval)):
+                    epkey = builder.load(self._field_ptr(
+                        builder, ep, self.key_offset, self.ll_key))
+                    epkey = self._key_bits(builder, epkey)
+                    builder.store(builder.icmp_unsigned('==', epkey,
+                                                        key_bits),
+                                  is_match)
+            return builder.load(is_match)
+
+        _dict_probe(builder, size, hashval, found)
+        ix = builder.load(pix)
+        ep = self._entry(builder, entries, entry_size, ix)
+        return ix, ep
+
+    def _define(self, module, name, fnty):
+        fn = cgutils.get_or_insert_function(
+            module, fnty, '.numba_dict_{}{}'.format(name, self.suffix))
+        if not fn.is_declaration:
+            return fn, None
+        fn.linkage = 'linkonce_odr'
+        fn.attributes.add('alwaysinline')
+        return fn, ir.IRBuilder(fn.append_basic_block())
+
+    def get_lookup(self, module):
+        """The function (dict, key, hash, value pointer) -> ix replacing
+        numba_dict_lookup().
+        """
+        fnty = ir.FunctionType(ll_ssize_t, [ll_dict_type, self.ll_key,
+                                            ll_hash,
+                                            self.ll_val.as_pointer()])
+        fn, builder = self._define(module, 'lookup', fnty)
+        if builder is not None:
+            dp, key, hashval, pval = fn.args
+            ix, ep = self._lookup(builder, dp, key, hashval)
+            with builder.if_then(builder.icmp_signed('>=', ix, ix.type(0))):
+                val = builder.load(self._field_ptr(builder, ep,
+                                                   self.val_offset,
+                                                   self.ll_val))
+                builder.store(val, pval)
+            builder.ret(ix)
+        return fn
+
+    def get_insert(self, module):
+        """The function (dict, key, hash, value) -> status replacing
+        numba_dict_insert().
+        """
+        fnty = ir.FunctionType(ll_status, [ll_dict_type, self.ll_key,
+                                           ll_hash, self.ll_val])
+        fn, builder = self._define(module, 'insert', fnty)
+        if builder is None:
+            return fn
+        dp, key, hashval, val = fn.args
+
+        ix, ep = self._lookup(builder, dp, key, hashval)
+        with builder.if_then(builder.icmp_signed('>=', ix, ix.type(0))):
+            # Replace the value of the existing key
+            builder.store(val, self._field_ptr(builder, ep, self.val_offset,
+                                               self.ll_val))
+            builder.ret(ll_status(int(Status.OK_REPLACED)))
+
+        d, dk, field, indices, entries = self._load_keys(builder, dp)
+        usable = field(_DK_USABLE)
+        with builder.if_then(builder.icmp_signed('<=', usable,
+                                                 usable.type(0)),
+                             likely=False):
+            # Resizing is left to the C implementation
+            c_fnty = ir.FunctionType(
+                ll_status,
+                [ll_dict_type, ll_bytes, ll_hash, ll_bytes, ll_bytes],
+            )
+            c_fn = cgutils.get_or_insert_function(module, c_fnty,
+                                                  'numba_dict_insert')
+            ptr_key = cgutils.alloca_once_value(builder, key)
+            ptr_val = cgutils.alloca_once_value(builder, val)
+            ptr_oldval = cgutils.alloca_once(builder, self.ll_val)
+            status = builder.call(c_fn, [dp, _as_bytes(builder, ptr_key),
+                                         hashval,
+                                         _as_bytes(builder, ptr_val),
+                                         _as_bytes(builder, ptr_oldval)])
+            builder.ret(status)
+
+        # Insert into a new entry, as in find_empty_slot() and
+        # numba_dict_insert()
+        size = field(_DK_SIZE)
+        nentries = field(_DK_NENTRIES)
+
+        def found(i):
+            ix = _dict_get_index(builder, size, indices, i)
+            return builder.icmp_signed('<', ix, ix.type(0))
+
+        slot = _dict_probe(builder, size, hashval, found)
+        _dict_set_index(builder, size, indices, slot, nentries)
+        ep = self._entry(builder, entries, field(_DK_ENTRY_SIZE), nentries)
+        builder.store(hashval, self._field_ptr(builder, ep, 0, ll_hash))
+        builder.store(key, self._field_ptr(builder, ep, self.key_offset,
+                                           self.ll_key))
+        builder.store(val, self._field_ptr(builder, ep, self.val_offset,
+                                           self.ll_val))
+
+        def incr(struct, i, delta):
+            ptr = cgutils.gep_inbounds(builder, struct, 0, i)
+            builder.store(builder.add(builder.load(ptr),
+                                      ll_ssize_t(delta)), ptr)
+
+        incr(d, _D_USED, 1)
+        incr(dk, _DK_USABLE, -1)
+        incr(dk, _DK_NENTRIES, 1)
+        builder.ret(ll_status(int(Status.OK)))
+        return fn
+
+
 @intrinsic
 def _dict_insert(typingctx, d, key, hashval, val):
     """Wrap numba_dict_insert
@@ -363,6 +671,9 @@ def _dict_insert(typingctx, d, key, hashval, val):
         ptr_oldval = cgutils.alloca_once(builder, data_val.type)
 
         dp = _container_get_data(context, builder, td, d)
+        if _is_primitive_dict(context, td):
+            fn = _PrimitiveDictCodegen(context, td).get_insert(builder.module)
+            return builder.call(fn, [dp, data_key, hashval, data_val])
         status = builder.call(
             fn,
             [
@@ -457,15 +768,19 @@ def _dict_lookup(typingctx, d, key, hashval):
         ptr_val = cgutils.alloca_once(builder, ll_val)
 
         dp = _container_get_data(context, builder, td, d)
-        ix = builder.call(
-            fn,
-            [
-                dp,
-                _as_bytes(builder, ptr_key),
-                hashval,
-                _as_bytes(builder, ptr_val),
-            ],
-        )
+        if _is_primitive_dict(context, td):
+            fn = _PrimitiveDictCodegen(context, td).get_lookup(builder.module)
+            ix = builder.call(fn, [dp, data_key, hashval, ptr_val])
+        else:
+            ix = builder.call(
+                fn,
+                [
+                    dp,
+                    _as_bytes(builder, ptr_key),
+                    hashval,
+                    _as_bytes(builder, ptr_val),
+                ],
+            )
         # Load value if output is available
         found = builder.icmp_signed('>', ix, ix.type(int(DKIX.EMPTY)))
 
@@ -757,6 +1072,50 @@ def impl_get(dct, key, default=None):
     return impl
 
 
+@overload_method(types.DictType, 'get_many')
+def impl_get_many(dct, keys, default=None):
+    if not isinstance(dct, types.DictType):
+        return
+    if not isinstance(keys, types.Array):
+        raise TypingError("get_many() argument must be an array of keys")
+    keyty = dct.key_type
+    valty = dct.value_type
+    try:
+        dtype = numpy_support.as_dtype(valty)
+    except NumbaNotImplementedError:
+        raise TypingError("get_many() is not supported for values of "
+                          "type {}".format(valty))
+    _sentry_safe_cast_default(default, valty)
+
+    if cgutils.is_nonelike(default):
+        def impl(dct, keys, default=None):
+            flat = keys.ravel()
+            out = np.empty(flat.size, dtype=dtype)
+            for i in range(flat.size):
+                castedkey = _cast(flat[i], keyty)
+                ix, val = _dict_lookup(dct, castedkey, hash(castedkey))
+                if ix == DKIX.EMPTY:
+                    raise KeyError()
+                elif ix < DKIX.EMPTY:
+                    raise AssertionError("internal dict error during lookup")
+                out[i] = _nonoptional(val)
+            return out.reshape(keys.shape)
+    else:
+        def impl(dct, keys, default=None):
+            flat = keys.ravel()
+            out = np.empty(flat.size, dtype=dtype)
+            for i in range(flat.size):
+                castedkey = _cast(flat[i], keyty)
+                ix, val = _dict_lookup(dct, castedkey, hash(castedkey))
+                if ix > DKIX.EMPTY:
+                    out[i] = _nonoptional(val)
+                else:
+                    out[i] = default
+            return out.reshape(keys.shape)
+
+    return impl
+
+
 @overload_attribute(types.DictType, '__hash__')
 def impl_hash(dct):
     if not isinstance(dct, types.DictType):
@@ -26,8 +26,9 @@ from numba.core.types import (
     NoneType,
 )
 from numba.core.imputils import impl_ret_borrowed, RefType
-from numba.core.errors import TypingError
+from numba.core.errors import TypingError, NumbaNotImplementedError
 from numba.core import typing
+from numba.np import numpy_support
 from numba.typed.typedobjectutils import (_as_bytes, _cast, _nonoptional,
                                           _get_incref_decref,
                                           _container_get_data,
@@ -421,23 +422,27 @@ def _list_length(typingctx, l):
     def codegen(context, builder, sig, args):
         [tl] = sig.args
         [l] = args
-        fnty = ir.FunctionType(
-            ll_ssize_t,
-            [ll_list_type],
-        )
-        fname = 'numba_list_size_address'
-        fn = cgutils.get_or_insert_function(builder.module, fnty, fname)
-        fn.attributes.add('alwaysinline')
-        fn.attributes.add('readonly')
-        fn.attributes.add('nounwind')
-        lp = _container_get_data(context, builder, tl, l)
-        len_addr = builder.call(fn, [lp,],)
-        ptr = builder.inttoptr(len_addr, cgutils.intp_t.as_pointer())
-        return builder.load(ptr)
+        return _list_length_codegen(context, builder, tl, l)
 
     return sig, codegen
 
 
+def _list_length_codegen(context, builder, tl, l):
+    fnty = ir.FunctionType(
+        ll_ssize_t,
+        [ll_list_type],
+    )
+    fname = 'numba_list_size_address'
+    fn = cgutils.get_or_insert_function(builder.module, fnty, fname)
+    fn.attributes.add('alwaysinline')
+    fn.attributes.add('readonly')
+    fn.attributes.add('nounwind')
+    lp = _container_get_data(context, builder, tl, l)
+    len_addr = builder.call(fn, [lp,],)
+    ptr = builder.inttoptr(len_addr, cgutils.intp_t.as_pointer())
+    return builder.load(ptr)
+
+
 @overload_method(types.ListType, "_allocated")
 def impl_allocated(l):
     """list._allocated()
@@ -1296,6 +1301,92 @@ def ol_list_sort(lst, key=None, reverse=False):
     return impl
 
 
+@intrinsic
+def _as_array(typingctx, l):
+    """Returns a 1D array viewing the items of the list *l*.
+
+    The array shares the meminfo of the list, which is kept alive by the array,
+    but its data is only valid until the next resize of the list.
+    """
+    if not isinstance(l, types.ListType):
+        return
+    resty = types.Array(l.item_type, 1, 'C')
+    sig = resty(l)
+
+    def codegen(context, builder, sig, args):
+        from numba.np.arrayobj import populate_array
+
+        [tl] = sig.args
+        [l] = args
+        fnty = ir.FunctionType(
+            ll_voidptr_type,
+            [ll_list_type],
+        )
+        fname = 'numba_list_base_ptr'
+        fn = cgutils.get_or_insert_function(builder.module, fnty, fname)
+        fn.attributes.add('alwaysinline')
+        fn.attributes.add('nounwind')
+        fn.attributes.add('readonly')
+
+        lp = _container_get_data(context, builder, tl, l)
+        base_ptr = builder.call(fn, [lp,])
+
+        ary = context.make_array(resty)(context, builder)
+        itemsize = context.get_constant(types.intp, context.get_abi_sizeof(
+            context.get_data_type(tl.item_type)))
+        populate_array(ary,
+                       data=builder.bitcast(base_ptr, ary.data.type),
+                       shape=[_list_length_codegen(context, builder, tl, l)],
+                       strides=[itemsize],
+                       itemsize=itemsize,
+                       meminfo=_container_get_meminfo(context, builder, tl,
+                                                      l))
+        # The array holds a new reference to the list
+        context.nrt.incref(builder, tl, l)
+        return ary._getvalue()
+
+    return sig, codegen
+
+
+@overload_method(types.ListType, "to_array")
+def ol_list_to_array(lst):
+    if not isinstance(lst, types.ListType):
+        return
+
+    _check_for_none_typed(lst, 'to_array')
+
+    try:
+        numpy_support.as_dtype(lst.item_type)
+    except NumbaNotImplementedError:
+        raise TypingError("to_array() is not supported for lists of "
+                          "{}".format(lst.item_type))
+
+    def impl(lst):
+        return _as_array(lst).copy()
+
+    return impl
+
+
+@overload_method(types.ListType, "view")
+def ol_list_view(lst):
+    if not isinstance(lst, types.ListType):
+        return
+
+    _check_for_none_typed(lst, 'view')
+
+    if not isinstance(lst.item_type, (types.Number, types.Boolean)):
+        raise TypingError("view() is only supported for lists of numbers or "
+                          "booleans, got {}".format(lst))
+
+    def impl(lst):
+        # The array type is not read-only, so an immutable list is copied
+        if not lst._is_mutable():
+            return _as_array(lst).copy()
+        return _as_array(lst)
+
+    return impl
+
+
 @overload_method(types.ListType, "getitem_unchecked")
 def ol_getitem_unchecked(lst, index):
     if not isinstance(index, types.Integer):
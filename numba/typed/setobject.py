@@ -0,0 +1,451 @@
+"""
+Compiler-side implementation of the Numba typed-set.
+
+A typed-set is stored as a typed dictionary whose keys are the items of the
+set and whose values are unused placeholders.  Both share the same data model,
+so a set is converted to its dictionary and back for free and all the
+operations reuse the compiled hash table of the dictionary.
+"""
+import operator
+
+import numpy as np
+
+from numba.core.extending import (
+    overload,
+    overload_method,
+    overload_attribute,
+    intrinsic,
+    register_model,
+    models,
+    lower_builtin,
+)
+from numba.core.imputils import impl_ret_borrowed
+from numba.core import types, cgutils
+from numba.core.types import SetType
+from numba.core.errors import TypingError
+from numba.core import typing
+from numba.typed import dictobject
+from numba.typed.dictobject import _meminfo_dictptr, ll_dict_type
+from numba.typed.typedobjectutils import _cast
+
+
+# The value stored for every item in the underlying dictionary
+_PLACEHOLDER = np.int8(0)
+
+
+@register_model(SetType)
+class SetModel(models.StructModel):
+    def __init__(self, dmm, fe_type):
+        members = [
+            ('meminfo', _meminfo_dictptr),
+            ('data', types.voidptr),   # ptr to the C dict
+        ]
+        super(SetModel, self).__init__(dmm, fe_type, members)
+
+
+def new_set(item, n_items=0):
+    """Construct a new set with enough space for *n_items* without a resize.
+
+    Parameters
+    ----------
+    item : TypeRef
+        Item type of the new set.
+    n_items : int, default 0
+        The number of items to insert without needing a resize.
+        A value of 0 creates a set with minimum size.
+    """
+    # With JIT disabled, ignore all arguments and return a Python set.
+    return set()
+
+
+@intrinsic
+def _as_dict(typingctx, s):
+    """Returns the dictionary storing the items of the set *s*.
+    """
+    if not isinstance(s, SetType):
+        raise TypingError('expected *s* to be a SetType')
+    sig = s.dict_type(s)
+
+    def codegen(context, builder, sig, args):
+        return impl_ret_borrowed(context, builder, sig.return_type, args[0])
+
+    return sig, codegen
+
+
+@intrinsic
+def _as_set(typingctx, d):
+    """Returns the set of the keys of the dictionary *d* created by
+    ``_as_dict()`` or ``new_set()``.
+    """
+    if not isinstance(d, types.DictType):
+        raise TypingError('expected *d* to be a DictType')
+    sig = SetType(d.key_type)(d)
+
+    def codegen(context, builder, sig, args):
+        return impl_ret_borrowed(context, builder, sig.return_type, args[0])
+
+    return sig, codegen
+
+
+@intrinsic
+def _from_meminfo(typingctx, mi, settyperef):
+    """Recreate a set from a MemInfoPointer
+    """
+    if mi != _meminfo_dictptr:
+        raise TypingError('expected a MemInfoPointer for set.')
+    settype = settyperef.instance_type
+    if not isinstance(settype, SetType):
+        raise TypingError('expected a {}'.format(SetType))
+
+    def codegen(context, builder, sig, args):
+        [mi, _] = args
+
+        ctor = cgutils.create_struct_proxy(settype)
+        sstruct = ctor(context, builder)
+
+        data_pointer = context.nrt.meminfo_data(builder, mi)
+        data_pointer = builder.bitcast(data_pointer, ll_dict_type.as_pointer())
+
+        sstruct.data = builder.load(data_pointer)
+        sstruct.meminfo = mi
+
+        return impl_ret_borrowed(
+            context,
+            builder,
+            settype,
+            sstruct._getvalue(),
+        )
+
+    sig = settype(mi, settyperef)
+    return sig, codegen
+
+
+def _check_same_type(s, other, method):
+    if not isinstance(other, SetType):
+        raise TypingError("{}() argument must be a typed set".format(method))
+    if s.item_type != other.item_type:
+        raise TypingError("{}() is not supported for sets of different item "
+                          "types, got {} and {}".format(method, s, other))
+
+
+@overload(new_set)
+def impl_new_set(item, n_items=0):
+    """Creates a new set with *item* as the type of the set items.
+    """
+    if not isinstance(item, types.Type):
+        raise TypeError("expecting *item* to be a numba Type")
+
+    def imp(item, n_items=0):
+        if n_items < 0:
+            raise RuntimeError("expecting *n_items* to be >= 0")
+        return _as_set(dictobject.new_dict(item, types.int8, n_keys=n_items))
+
+    return imp
+
+
+@overload(len)
+def impl_len(s):
+    if not isinstance(s, SetType):
+        return
+
+    def impl(s):
+        return len(_as_dict(s))
+
+    return impl
+
+
+@overload(operator.contains)
+def impl_contains(s, item):
+    if not isinstance(s, SetType):
+        return
+
+    def impl(s, item):
+        return item in _as_dict(s)
+
+    return impl
+
+
+@lower_builtin('getiter', SetType)
+def impl_set_getiter(context, builder, sig, args):
+    """Implement iter(Set) as the iteration over the keys of the dictionary
+    """
+    [ts] = sig.args
+    sig = typing.signature(sig.return_type, ts.dict_type)
+    return dictobject.impl_dict_getiter(context, builder, sig, args)
+
+
+@overload_attribute(SetType, '__hash__')
+def impl_hash(s):
+    if not isinstance(s, SetType):
+        return
+    return lambda s: None
+
+
+@overload_method(SetType, 'add')
+def impl_add(s, item):
+    if not isinstance(s, SetType):
+        return
+
+    itemty = s.item_type
+
+    def impl(s, item):
+        _as_dict(s)[_cast(item, itemty)] = _PLACEHOLDER
+
+    if s.is_precise():
+        # Handle the precise case.
+        return impl
+    else:
+        # Handle the imprecise case.
+        s = s.refine(item)
+        # Re-bind the item type to match the arguments.
+        itemty = s.item_type
+        # Create the signature that we wanted this impl to have.
+        sig = typing.signature(types.void, s, itemty)
+        return sig, impl
+
+
+@overload_method(SetType, 'discard')
+def impl_discard(s, item):
+    if not isinstance(s, SetType):
+        return
+
+    def impl(s, item):
+        _as_dict(s).pop(item, _PLACEHOLDER)
+
+    return impl
+
+
+@overload_method(SetType, 'remove')
+def impl_remove(s, item):
+    if not isinstance(s, SetType):
+        return
+
+    def impl(s, item):
+        d = _as_dict(s)
+        if item not in d:
+            raise KeyError("set.remove(item): item not in set")
+        d.pop(item)
+
+    return impl
+
+
+@overload_method(SetType, 'pop')
+def impl_pop(s):
+    if not isinstance(s, SetType):
+        return
+
+    def impl(s):
+        d = _as_dict(s)
+        if len(d) == 0:
+            raise KeyError("set.pop(): set is empty")
+        return d.popitem()[0]
+
+    return impl
+
+
+@overload_method(SetType, 'clear')
+def impl_clear(s):
+    if not isinstance(s, SetType):
+        return
+
+    def impl(s):
+        _as_dict(s).clear()
+
+    return impl
+
+
+@overload_method(SetType, 'copy')
+def impl_copy(s):
+    if not isinstance(s, SetType):
+        return
+
+    def impl(s):
+        return _as_set(_as_dict(s).copy())
+
+    return impl
+
+
+@overload_method(SetType, 'update')
+def impl_update(s, iterable):
+    if not isinstance(s, SetType):
+        return
+    if not isinstance(iterable, types.IterableType):
+        raise TypingError("update() argument must be iterable")
+
+    def impl(s, iterable):
+        d = _as_dict(s)
+        for item in iterable:
+            d[item] = _PLACEHOLDER
+
+    return impl
+
+
+@overload_method(SetType, 'union')
+@overload(operator.or_)
+def impl_union(s, other):
+    if not isinstance(s, SetType):
+        return
+    _check_same_type(s, other, 'union')
+
+    def impl(s, other):
+        res = s.copy()
+        res.update(other)
+        return res
+
+    return impl
+
+
+@overload_method(SetType, 'intersection')
+@overload(operator.and_)
+def impl_intersection(s, other):
+    if not isinstance(s, SetType):
+        return
+    _check_same_type(s, other, 'intersection')
+
+    itemty = s.item_type
+
+    def impl(s, other):
+        if len(other) < len(s):
+            s, other = other, s
+        res = new_set(itemty)
+        for item in s:
+            if item in other:
+                res.add(item)
+        return res
+
+    return impl
+
+
+@overload_method(SetType, 'difference')
+@overload(operator.sub)
+def impl_difference(s, other):
+    if not isinstance(s, SetType):
+        return
+    _check_same_type(s, other, 'difference')
+
+    itemty = s.item_type
+
+    def impl(s, other):
+        res = new_set(itemty)
+        for item in s:
+            if item not in other:
+                res.add(item)
+        return res
+
+    return impl
+
+
+@overload_method(SetType, 'symmetric_difference')
+@overload(operator.xor)
+def impl_symmetric_difference(s, other):
+    if not isinstance(s, SetType):
+        return
+    _check_same_type(s, other, 'symmetric_difference')
+
+    def impl(s, other):
+        res = s - other
+        for item in other:
+            if item not in s:
+                res.add(item)
+        return res
+
+    return impl
+
+
+@overload_method(SetType, 'isdisjoint')
+def impl_isdisjoint(s, other):
+    if not isinstance(s, SetType):
+        return
+    _check_same_type(s, other, 'isdisjoint')
+
+    def impl(s, other):
+        if len(other) < len(s):
+            s, other = other, s
+        for item in s:
+            if item in other:
+                return False
+        return True
+
+    return impl
+
+
+@overload_method(SetType, 'issubset')
+@overload(operator.le)
+def impl_issubset(s, other):
+    if not isinstance(s, SetType):
+        return
+    _check_same_type(s, other, 'issubset')
+
+    def impl(s, other):
+        if len(s) > len(other):
+            return False
+        for item in s:
+            if item not in other:
+                return False
+        return True
+
+    return impl
+
+
+@overload_method(SetType, 'issuperset')
+@overload(operator.ge)
+def impl_issuperset(s, other):
+    if not isinstance(s, SetType):
+        return
+    _check_same_type(s, other, 'issuperset')
+
+    def impl(s, other):
+        return other <= s
+
+    return impl
+
+
+@overload(operator.lt)
+def impl_lt(s, other):
+    if not isinstance(s, SetType):
+        return
+    _check_same_type(s, other, '__lt__')
+
+    def impl(s, other):
+        return len(s) < len(other) and s <= other
+
+    return impl
+
+
+@overload(operator.gt)
+def impl_gt(s, other):
+    if not isinstance(s, SetType):
+        return
+    _check_same_type(s, other, '__gt__')
+
+    def impl(s, other):
+        return other < s
+
+    return impl
+
+
+@overload(operator.eq)
+def impl_equal(s, other):
+    if not isinstance(s, SetType):
+        return
+    if not isinstance(other, SetType):
+        return lambda s, other: False
+
+    if s.item_type != other.item_type:
+        return lambda s, other: False
+
+    def impl(s, other):
+        return len(s) == len(other) and s <= other
+
+    return impl
+
+
+@overload(operator.ne)
+def impl_not_equal(s, other):
+    if not isinstance(s, SetType):
+        return
+
+    def impl(s, other):
+        return not (s == other)
+
+    return impl
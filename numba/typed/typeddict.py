@@ -2,6 +2,9 @@
 Python wrapper that connects CPython interpreter to the numba dictobject.
 """
 from collections.abc import MutableMapping, Iterable, Mapping
+
+import numpy as np
+
 from numba.core.types import DictType
 from numba.core.imputils import numba_typeref_ctor
 from numba import njit, typeof
@@ -15,7 +18,10 @@ from numba.core.extending import (
     overload_classmethod,
 )
 from numba.typed import dictobject
+from numba.typed.typedobjectutils import (_arrays_to_shared_memory,
+                                          _arrays_from_shared_memory)
 from numba.core.typing import signature
+from numba.np import numpy_support
 
 
 @njit
@@ -74,6 +80,30 @@ def _copy(d):
     return d.copy()
 
 
+@njit
+def _get_many(d, keys, default):
+    return d.get_many(keys, default)
+
+
+@njit
+def _from_arrays(keys, values):
+    return Dict.from_arrays(keys, values)
+
+
+@njit
+def _fill_arrays(d, keys, values):
+    for i, (k, v) in enumerate(d.items()):
+        keys[i] = k
+        values[i] = v
+
+
+def _from_items(dicttype, items):
+    d = Dict.empty(dicttype.key_type, dicttype.value_type, n_keys=len(items))
+    for k, v in items:
+        d[k] = v
+    return d
+
+
 def _from_meminfo_ptr(ptr, dicttype):
     d = Dict(meminfo=ptr, dcttype=dicttype)
     return d
@@ -104,6 +134,30 @@ class Dict(MutableMapping):
         else:
             return cls(dcttype=DictType(key_type, value_type), n_keys=n_keys)
 
+    @classmethod
+    def from_arrays(cls, keys, values):
+        """Create a new Dict mapping the items of the 1D array *keys* to the
+        items of the 1D array *values* at the same positions.
+
+        The key and value types are the dtypes of the arrays and the whole
+        dictionary is built in a single compiled call, which is much faster
+        than setting the items one by one from the interpreter.
+        """
+        if config.DISABLE_JIT:
+            return dict(zip(keys, values))
+        else:
+            return _from_arrays(np.asarray(keys), np.asarray(values))
+
+    @classmethod
+    def from_shared_memory(cls, name):
+        """Create a new Dict from the block of shared memory *name* created by
+        ``Dict.to_shared_memory()``, e.g. in another process.
+
+        The keys and values are read in place and inserted in a single
+        compiled call, the block is left open for other processes.
+        """
+        return _arrays_from_shared_memory(name, 2, cls.from_arrays)
+
     def __init__(self, *args, **kwargs):
         """
         For users, the constructor does not take any parameters.
@@ -237,6 +291,63 @@ class Dict(MutableMapping):
     def copy(self):
         return _copy(self)
 
+    def __reduce__(self):
+        if not self._typed:
+            return Dict, ()
+        arrays = self._as_arrays()
+        if arrays is None:
+            return _from_items, (self._dict_type, list(self.items()))
+        # The keys and values are pickled as contiguous buffers, out-of-band
+        # with protocol 5 and a *buffer_callback*.
+        return Dict.from_arrays, arrays
+
+    def _as_arrays(self):
+        """Returns the keys and values of a dictionary of numbers or booleans
+        as two new arrays, or None for other dictionaries.
+        """
+        primitives = (types.Number, types.Boolean)
+        dcttype = self._dict_type
+        if not (isinstance(dcttype.key_type, primitives) and
+                isinstance(dcttype.value_type, primitives)):
+            return None
+        n = len(self)
+        keys = np.empty(n, numpy_support.as_dtype(dcttype.key_type))
+        values = np.empty(n, numpy_support.as_dtype(dcttype.value_type))
+        _fill_arrays(self, keys, values)
+        return keys, values
+
+    def to_shared_memory(self, name=None):
+        """Copy the keys and values of a dictionary of numbers or booleans
+        into a new block of shared memory and return the
+        ``multiprocessing.shared_memory.SharedMemory``.
+
+        Other processes rebuild the dictionary from the name of the block with
+        ``Dict.from_shared_memory()``, without pickling it.  The caller must
+        close and unlink the block once they are done.
+        """
+        arrays = self._as_arrays() if self._typed else None
+        if arrays is None:
+            raise TypeError("to_shared_memory() requires a dictionary of "
+                            "numbers or booleans, got {}"
+                            .format(self._dict_type))
+        return _arrays_to_shared_memory(arrays, name=name)
+
+    def get_many(self, keys, default=None):
+        """Look up all the items of the array *keys* in a single compiled
+        call and return an array of the same shape with their values.
+
+        A missing key raises a KeyError, unless a *default* value is given
+        to use instead.
+        """
+        keys = np.asarray(keys)
+        if not self._typed:
+            if default is not None:
+                return np.full(keys.shape, default)
+            if keys.size > 0:
+                raise KeyError('dictionary is empty')
+            return np.empty(keys.shape)
+        return _get_many(self, keys, default)
+
 
 @overload_classmethod(types.DictType, 'empty')
 def typeddict_empty(cls, key_type, value_type, n_keys=0):
@@ -249,6 +360,28 @@ def typeddict_empty(cls, key_type, value_type, n_keys=0):
     return impl
 
 
+@overload_classmethod(types.DictType, 'from_arrays')
+def typeddict_from_arrays(cls, keys, values):
+    if cls.instance_type is not DictType:
+        return
+    if not (isinstance(keys, types.Array) and keys.ndim == 1 and
+            isinstance(values, types.Array) and values.ndim == 1):
+        raise errors.TypingError("Dict.from_arrays() arguments must be 1D "
+                                 "arrays")
+    key_type, value_type = keys.dtype, values.dtype
+
+    def impl(cls, keys, values):
+        n = len(keys)
+        if len(values) != n:
+            raise ValueError("keys and values must have the same length")
+        d = dictobject.new_dict(key_type, value_type, n_keys=n)
+        for i in range(n):
+            d[keys[i]] = values[i]
+        return d
+
+    return impl
+
+
 @box(types.DictType)
 def box_dicttype(typ, val, c):
     context = c.context
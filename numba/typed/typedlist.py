@@ -10,6 +10,8 @@ it should really quack like the CPython `list`.
 """
 from collections.abc import MutableSequence
 
+import numpy as np
+
 from numba.core.types import ListType
 from numba.core.imputils import numba_typeref_ctor
 from numba.core.dispatcher import Dispatcher
@@ -24,6 +26,9 @@ from numba.core.extending import (
     overload_classmethod,
 )
 from numba.typed import listobject
+from numba.typed.typedobjectutils import (_arrays_to_shared_memory,
+                                          _arrays_from_shared_memory)
+from numba.np import numpy_support
 from numba.core.errors import TypingError, LoweringError
 from numba.core.typing.templates import Signature
 import typing as pt
@@ -182,6 +187,55 @@ def _sort(l, key, reverse):
     return l.sort(key, reverse)
 
 
+@njit
+def _to_array(l):
+    return l.to_array()
+
+
+@njit
+def _data_address(l):
+    return listobject._as_array(l).ctypes.data
+
+
+@njit
+def _from_array(arr):
+    return List.from_array(arr)
+
+
+class _ListView(object):
+    """Exports the items of a typed-list of numbers or booleans through the
+    ``__array_interface__`` protocol, for ``List.view()``.  The array keeps
+    a reference to this object, and so to the list, as its base.
+    """
+
+    def __init__(self, lst, dtype):
+        self.list = lst
+        self.__array_interface__ = {
+            'shape': (len(lst),),
+            'typestr': dtype.str,
+            'data': (_data_address(lst), not lst._is_mutable()),
+            'version': 3,
+        }
+
+
+def _from_items(listtype, items, mutable=True):
+    lst = List.empty_list(listtype.item_type, allocated=len(items))
+    for item in items:
+        lst.append(item)
+    return _restore_mutability(lst, mutable)
+
+
+def _from_array_reduced(arr, mutable):
+    return _restore_mutability(List.from_array(arr), mutable)
+
+
+def _restore_mutability(lst, mutable):
+    # With JIT disabled, the list is a Python list
+    if not mutable and isinstance(lst, List):
+        lst._make_immutable()
+    return lst
+
+
 def _from_meminfo_ptr(ptr, listtype):
     return List(meminfo=ptr, lsttype=listtype)
 
@@ -225,6 +279,33 @@ class List(MutableSequence, pt.Generic[T]):
         else:
             return cls(lsttype=ListType(item_type), allocated=allocated)
 
+    @classmethod
+    def from_array(cls, arr):
+        """Create a new List holding the items of the 1D array *arr*.
+
+        The item type is the dtype of the array and the whole list is built
+        in a single compiled call.
+
+        Parameters
+        ----------
+        arr: 1D array
+            the array to copy the items from
+        """
+        if config.DISABLE_JIT:
+            return list(arr)
+        else:
+            return _from_array(np.asarray(arr))
+
+    @classmethod
+    def from_shared_memory(cls, name):
+        """Create a new List from the block of shared memory *name* created by
+        ``List.to_shared_memory()``, e.g. in another process.
+
+        The items are copied in a single compiled call, the block is left
+        open for other processes.
+        """
+        return _arrays_from_shared_memory(name, 1, cls.from_array)
+
     def __init__(self, *args, **kwargs):
         """
         For users, the constructor does not take any parameters.
@@ -295,6 +376,24 @@ class List(MutableSequence, pt.Generic[T]):
             raise RuntimeError("invalid operation on untyped list")
         return self._list_type.dtype
 
+    def __array__(self, dtype=None, copy=None):
+        """Copies the items of the list into a new array, in a single
+        compiled call for a list of numbers or booleans.  ``np.asarray(lst)``
+        is not a view as it would be invalidated by the next resize of the
+        list, see ``view()``.
+        """
+        if copy is False:
+            raise ValueError("a typed-list is always copied by NumPy, use "
+                             "view() to view its items")
+        if not self._typed:
+            return np.array([], dtype=dtype)
+        if not isinstance(self._dtype, (types.Number, types.Boolean)):
+            return np.array(list(self), dtype=dtype)
+        arr = self.to_array()
+        if dtype is not None:
+            arr = arr.astype(dtype, copy=False)
+        return arr
+
     def _initialise_list(self, item):
         lsttype = types.ListType(typeof(item))
         self._list_type, self._opaque = self._parse_arg(lsttype)
@@ -416,6 +515,64 @@ class List(MutableSequence, pt.Generic[T]):
               stop: pt.Optional[int] = None) -> int:
         return _index(self, item, start, stop)
 
+    def __reduce__(self):
+        if not self._typed:
+            return List, ()
+        mutable = self._is_mutable()
+        if not isinstance(self._dtype, (types.Number, types.Boolean)):
+            return _from_items, (self._list_type, list(self), mutable)
+        # The items are pickled as a contiguous buffer, out-of-band with
+        # protocol 5 and a *buffer_callback*.  The buffer may be consumed
+        # after the list is resized, so only an immutable list is viewed
+        # rather than copied.
+        arr = self.view() if not mutable else self.to_array()
+        return _from_array_reduced, (arr, mutable)
+
+    def to_shared_memory(self, name=None):
+        """Copy the items of a list of numbers or booleans into a new block
+        of shared memory and return the
+        ``multiprocessing.shared_memory.SharedMemory``.
+
+        Other processes rebuild the list from the name of the block with
+        ``List.from_shared_memory()``, without pickling it.  The caller must
+        close and unlink the block once they are done.
+        """
+        if not self._typed or not isinstance(self._dtype, (types.Number,
+                                                           types.Boolean)):
+            raise TypeError("to_shared_memory() requires a list of numbers "
+                            "or booleans, got {}".format(self._list_type))
+        # The view is only read before the list can be resized
+        return _arrays_to_shared_memory([self.view()], name=name)
+
+    def view(self):
+        """Return a 1D array viewing the items of a list of numbers or
+        booleans without copying them.
+
+        Writing to the array modifies the list and the other way round, the
+        array is read-only if the list is immutable.  The view is only valid
+        until the next resize of the list.
+        """
+        if not self._typed or not isinstance(self._dtype, (types.Number,
+                                                           types.Boolean)):
+            raise TypeError("view() is only supported for lists of numbers "
+                            "or booleans, got {}".format(self._list_type))
+        dtype = numpy_support.as_dtype(self._dtype)
+        if len(self) == 0:
+            # The items of an empty list may not be allocated and NumPy
+            # rejects a NULL data pointer, no item is ever accessed anyway.
+            arr = np.empty(0, dtype)
+            arr.flags.writeable = self._is_mutable()
+            return arr
+        return np.asarray(_ListView(self, dtype))
+
+    def to_array(self):
+        """Return a new 1D array holding the items of the list, copied in a
+        single compiled call.
+        """
+        if not self._typed:
+            return np.array([])
+        return _to_array(self)
+
     def sort(self, key=None, reverse=False):
         """Sort the list inplace.
 
@@ -454,6 +611,24 @@ def typedlist_empty(cls, item_type, allocated=DEFAULT_ALLOCATED):
     return impl
 
 
+@overload_classmethod(ListType, 'from_array')
+def typedlist_from_array(cls, arr):
+    if cls.instance_type is not ListType:
+        return
+    if not (isinstance(arr, types.Array) and arr.ndim == 1):
+        raise TypingError("List.from_array() argument must be a 1D array")
+    item_type = arr.dtype
+
+    def impl(cls, arr):
+        n = len(arr)
+        lst = listobject.new_list(item_type, allocated=n)
+        for i in range(n):
+            lst.append(arr[i])
+        return lst
+
+    return impl
+
+
 @box(types.ListType)
 def box_lsttype(typ, val, c):
     context = c.context
@@ -1,8 +1,11 @@
-""" Common compiler level utilities for typed dict and list. """
+""" Common utilities for typed dict and list. """
 
 import operator
+import struct
 import warnings
 
+import numpy as np
+
 from llvmlite import ir
 
 from numba.core import types, cgutils
@@ -197,3 +200,61 @@ def _get_equal(context, module, datamodel, container_element_type):
     builder.ret(context.get_constant(types.int32, -1))
 
     return equal_fn
+
+
+# A block of shared memory holding the contents of a typed container starts
+# with the number of items and the dtypes of the (one or two) arrays of items,
+# followed by the arrays aligned on _SHM_ALIGN bytes.
+_shm_header = struct.Struct('<q16s16s')
+_SHM_ALIGN = 64
+
+
+def _shm_array_size(nbytes):
+    return -(-nbytes // _SHM_ALIGN) * _SHM_ALIGN
+
+
+def _arrays_to_shared_memory(arrays, name=None):
+    """Copy the 1D *arrays* of the same length into a new block of shared
+    memory and return the ``multiprocessing.shared_memory.SharedMemory``.
+    """
+    from multiprocessing import shared_memory
+
+    size = _SHM_ALIGN + sum(_shm_array_size(arr.nbytes) for arr in arrays)
+    shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+    dtypes = [arr.dtype.str.encode() for arr in arrays]
+    dtypes += [b''] * (2 - len(arrays))
+    _shm_header.pack_into(shm.buf, 0, len(arrays[0]), *dtypes)
+    offset = _SHM_ALIGN
+    for arr in arrays:
+        view = np.ndarray(arr.shape, arr.dtype, buffer=shm.buf, offset=offset)
+        view[:] = arr
+        offset += _shm_array_size(arr.nbytes)
+    return shm
+
+
+def _arrays_from_shared_memory(name, n_arrays, build):
+    """Attach to the block of shared memory *name* holding *n_arrays* arrays
+    created by ``_arrays_to_shared_memory()`` and return ``build(*arrays)``,
+    where the arrays are views of the block that must not outlive the call.
+    """
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=name)
+    arrays = []
+    try:
+        n, *dtypes = _shm_header.unpack_from(shm.buf)
+        dtypes = [dtype.rstrip(b'\0') for dtype in dtypes
+                  if dtype.rstrip(b'\0')]
+        if len(dtypes) != n_arrays:
+            raise ValueError("expected a block of shared memory holding {} "
+                             "arrays, got {}".format(n_arrays, len(dtypes)))
+        offset = _SHM_ALIGN
+        for dtype in dtypes:
+            arrays.append(np.ndarray(n, np.dtype(dtype.decode()),
+                                     buffer=shm.buf, offset=offset))
+            offset += _shm_array_size(arrays[-1].nbytes)
+        return build(*arrays)
+    finally:
+        # The views must be released before the block can be closed
+        arrays.clear()
+        shm.close()
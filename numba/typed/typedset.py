@@ -0,0 +1,517 @@
+"""
+Python wrapper that connects CPython interpreter to the Numba typed-set.
+
+This is the code that is used when creating typed sets outside of a `@jit`
+context and when returning a typed-set from a `@jit` decorated function. It is
+a Python class that has a Numba allocated typed-set under the hood and uses
+`@jit` functions to access it. Since it inherits from MutableSet it should
+behave like the CPython `set`.
+"""
+from collections.abc import MutableSet
+
+from numba.core.types import SetType
+from numba.core.imputils import numba_typeref_ctor
+from numba import njit, typeof
+from numba.core import types, errors, config, cgutils
+from numba.core.extending import (
+    overload,
+    box,
+    unbox,
+    NativeValue,
+    type_callable,
+    overload_classmethod,
+)
+from numba.typed import dictobject, setobject
+from numba.core.typing import signature
+
+
+@njit
+def _make_set(itemty, n_items=0):
+    return dictobject._as_meminfo(dictobject.new_dict(itemty, types.int8,
+                                                      n_keys=n_items))
+
+
+@njit
+def _length(s):
+    return len(s)
+
+
+@njit
+def _contains(s, item):
+    return item in s
+
+
+@njit
+def _add(s, item):
+    s.add(item)
+
+
+@njit
+def _discard(s, item):
+    s.discard(item)
+
+
+@njit
+def _pop(s):
+    return s.pop()
+
+
+@njit
+def _clear(s):
+    s.clear()
+
+
+@njit
+def _copy(s):
+    return s.copy()
+
+
+@njit
+def _update(s, iterable):
+    s.update(iterable)
+
+
+@njit
+def _iter(s):
+    return list(s)
+
+
+@njit
+def _union(s, other):
+    return s | other
+
+
+@njit
+def _intersection(s, other):
+    return s & other
+
+
+@njit
+def _difference(s, other):
+    return s - other
+
+
+@njit
+def _symmetric_difference(s, other):
+    return s ^ other
+
+
+@njit
+def _isdisjoint(s, other):
+    return s.isdisjoint(other)
+
+
+@njit
+def _issubset(s, other):
+    return s <= other
+
+
+@njit
+def _eq(s, other):
+    return s == other
+
+
+def _from_meminfo_ptr(ptr, settype):
+    return Set(meminfo=ptr, settype=settype)
+
+
+def _bulk_item_type(iterable):
+    """Returns the item type of an iterable that can be consumed by a single
+    compiled call, i.e. a 1D array or a typed container, or None.
+    """
+    from numba.typed import Dict, List
+
+    if isinstance(iterable, (Set, List, Dict)):
+        if iterable._typed:
+            return typeof(iterable).iterator_type.yield_type
+    elif getattr(iterable, 'ndim', None) == 1 and hasattr(iterable, 'dtype'):
+        try:
+            return typeof(iterable).dtype
+        except ValueError:
+            pass
+    return None
+
+
+class Set(MutableSet):
+    """A typed-set usable in Numba compiled functions.
+
+    Implements the MutableSet interface.
+    """
+
+    _legal_kwargs = ["settype", "meminfo", "n_items"]
+
+    def __new__(cls, *args, settype=None, meminfo=None, n_items=0, **kwargs):
+        if config.DISABLE_JIT:
+            return set(*args, **kwargs)
+        else:
+            return object.__new__(cls)
+
+    @classmethod
+    def empty(cls, item_type, n_items=0):
+        """Create a new empty Set with *item_type* as the type of its items.
+
+        Optionally, allocate enough memory to hold *n_items* without requiring
+        resizes. The default value of 0 returns a set with minimum size.
+        """
+        if config.DISABLE_JIT:
+            return set()
+        else:
+            return cls(settype=SetType(item_type), n_items=n_items)
+
+    def __init__(self, *args, **kwargs):
+        """
+        For users, the constructor takes at most an iterable to initialize the
+        set from.  1D arrays and typed containers are consumed in a single
+        compiled call.
+        The keyword arguments are for internal use only.
+
+        Parameters
+        ----------
+        settype : numba.core.types.SetType; keyword-only
+            Used internally for the set type.
+        meminfo : MemInfo; keyword-only
+            Used internally to pass the MemInfo object when boxing.
+        n_items: int; keyword-only
+            Used internally to pre-allocate space for items
+        """
+        illegal_kwargs = any((kw not in self._legal_kwargs for kw in kwargs))
+        if illegal_kwargs or args and kwargs:
+            raise TypeError("Set() takes no keyword arguments")
+        if kwargs:
+            self._set_type, self._opaque = self._parse_arg(**kwargs)
+        else:
+            self._set_type = None
+            if args:
+                if len(args) > 1:
+                    raise TypeError("Set() expected at most 1 argument, got "
+                                    "{}".format(len(args)))
+                self.update(args[0])
+
+    def _parse_arg(self, settype, meminfo=None, n_items=0):
+        if not isinstance(settype, SetType):
+            raise TypeError('*settype* must be a SetType')
+
+        if meminfo is not None:
+            opaque = meminfo
+        else:
+            opaque = _make_set(settype.item_type, n_items=n_items)
+        return settype, opaque
+
+    @property
+    def _numba_type_(self):
+        if self._set_type is None:
+            raise TypeError("invalid operation on untyped set")
+        return self._set_type
+
+    @property
+    def _typed(self):
+        """Returns True if the set is typed.
+        """
+        return self._set_type is not None
+
+    def _initialise_set(self, item_type):
+        self._set_type, self._opaque = self._parse_arg(SetType(item_type))
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return cls(it)
+
+    def __len__(self):
+        if not self._typed:
+            return 0
+        else:
+            return _length(self)
+
+    def __contains__(self, item):
+        if len(self) == 0:
+            return False
+        else:
+            return _contains(self, item)
+
+    def __iter__(self):
+        if not self._typed:
+            return iter(())
+        else:
+            return iter(_iter(self))
+
+    def add(self, item):
+        if not self._typed:
+            self._initialise_set(typeof(item))
+        _add(self, item)
+
+    def discard(self, item):
+        if len(self) != 0:
+            _discard(self, item)
+
+    def remove(self, item):
+        if item not in self:
+            raise KeyError(item)
+        _discard(self, item)
+
+    def pop(self):
+        if len(self) == 0:
+            raise KeyError('pop from an empty set')
+        return _pop(self)
+
+    def clear(self):
+        if self._typed:
+            _clear(self)
+
+    def copy(self):
+        if not self._typed:
+            return Set()
+        return _copy(self)
+
+    def update(self, *iterables):
+        """Add the items of all the *iterables* to the set.
+        """
+        for iterable in iterables:
+            item_type = _bulk_item_type(iterable)
+            if item_type is None:
+                for item in iterable:
+                    self.add(item)
+            elif len(iterable) != 0:
+                if not self._typed:
+                    self._initialise_set(item_type)
+                _update(self, iterable)
+
+    def _same_type(self, other):
+        return (isinstance(other, Set) and self._typed and other._typed and
+                self._set_type == other._set_type)
+
+    def __or__(self, other):
+        if self._same_type(other):
+            return _union(self, other)
+        return super().__or__(other)
+
+    def __and__(self, other):
+        if self._same_type(other):
+            return _intersection(self, other)
+        return super().__and__(other)
+
+    def __sub__(self, other):
+        if self._same_type(other):
+            return _difference(self, other)
+        return super().__sub__(other)
+
+    def __xor__(self, other):
+        if self._same_type(other):
+            return _symmetric_difference(self, other)
+        return super().__xor__(other)
+
+    def __le__(self, other):
+        if self._same_type(other):
+            return _issubset(self, other)
+        return super().__le__(other)
+
+    def __eq__(self, other):
+        if self._same_type(other):
+            return _eq(self, other)
+        return super().__eq__(other)
+
+    def isdisjoint(self, other):
+        if self._same_type(other):
+            return _isdisjoint(self, other)
+        return super().isdisjoint(other)
+
+    def union(self, *others):
+        res = self.copy()
+        res.update(*others)
+        return res
+
+    def intersection(self, other):
+        if not isinstance(other, Set):
+            other = Set(other)
+        return self & other
+
+    def difference(self, other):
+        if not isinstance(other, Set):
+            other = Set(other)
+        return self - other
+
+    def symmetric_difference(self, other):
+        if not isinstance(other, Set):
+            other = Set(other)
+        return self ^ other
+
+    def issubset(self, other):
+        if not isinstance(other, Set):
+            other = Set(other)
+        return self <= other
+
+    def issuperset(self, other):
+        if not isinstance(other, Set):
+            other = Set(other)
+        return other <= self
+
+    def __str__(self):
+        if len(self) == 0:
+            return 'set()'
+        return '{{{0}}}'.format(', '.join(str(x) for x in self))
+
+    def __repr__(self):
+        body = str(self)
+        prefix = str(self._set_type) if self._typed else "SetType[Undefined]"
+        return "{prefix}({body})".format(prefix=prefix, body=body)
+
+
+@overload_classmethod(SetType, 'empty')
+def typedset_empty(cls, item_type, n_items=0):
+    if cls.instance_type is not SetType:
+        return
+
+    def impl(cls, item_type, n_items=0):
+        return setobject.new_set(item_type, n_items=n_items)
+
+    return impl
+
+
+@box(SetType)
+def box_settype(typ, val, c):
+    context = c.context
+    builder = c.builder
+
+    ctor = cgutils.create_struct_proxy(typ)
+    sstruct = ctor(context, builder, value=val)
+    # Returns the plain MemInfo
+    boxed_meminfo = c.box(
+        types.MemInfoPointer(types.voidptr),
+        sstruct.meminfo,
+    )
+
+    modname = c.context.insert_const_string(
+        c.builder.module, 'numba.typed.typedset',
+    )
+    typedset_mod = c.pyapi.import_module_noblock(modname)
+    fmp_fn = c.pyapi.object_getattr_string(typedset_mod, '_from_meminfo_ptr')
+
+    settype_obj = c.pyapi.unserialize(c.pyapi.serialize_object(typ))
+
+    result_var = builder.alloca(c.pyapi.pyobj)
+    builder.store(cgutils.get_null_value(c.pyapi.pyobj), result_var)
+    with builder.if_then(cgutils.is_not_null(builder, settype_obj)):
+        res = c.pyapi.call_function_objargs(
+            fmp_fn, (boxed_meminfo, settype_obj),
+        )
+        c.pyapi.decref(fmp_fn)
+        c.pyapi.decref(typedset_mod)
+        c.pyapi.decref(boxed_meminfo)
+        builder.store(res, result_var)
+    return builder.load(result_var)
+
+
+@unbox(SetType)
+def unbox_settype(typ, val, c):
+    context = c.context
+
+    # Check that `type(val) is Set`
+    set_type = c.pyapi.unserialize(c.pyapi.serialize_object(Set))
+    valtype = c.pyapi.object_type(val)
+    same_type = c.builder.icmp_unsigned("==", valtype, set_type)
+
+    with c.builder.if_else(same_type) as (then, orelse):
+        with then:
+            miptr = c.pyapi.object_getattr_string(val, '_opaque')
+
+            mip_type = types.MemInfoPointer(types.voidptr)
+            native = c.unbox(mip_type, miptr)
+
+            mi = native.value
+
+            argtypes = mip_type, typeof(typ)
+
+            def convert(mi, typ):
+                return setobject._from_meminfo(mi, typ)
+
+            sig = signature(typ, *argtypes)
+            nil_typeref = context.get_constant_null(argtypes[1])
+            args = (mi, nil_typeref)
+            is_error, setobj = c.pyapi.call_jit_code(convert, sig, args)
+            # decref here because we are stealing a reference.
+            c.context.nrt.decref(c.builder, typ, setobj)
+
+            c.pyapi.decref(miptr)
+            bb_unboxed = c.builder.basic_block
+
+        with orelse:
+            # Raise error on incorrect type
+            c.pyapi.err_format(
+                "PyExc_TypeError",
+                "can't unbox a %S as a %S",
+                valtype, set_type,
+            )
+            bb_else = c.builder.basic_block
+
+    # Phi nodes to gather the output
+    setobj_res = c.builder.phi(setobj.type)
+    is_error_res = c.builder.phi(is_error.type)
+
+    setobj_res.add_incoming(setobj, bb_unboxed)
+    setobj_res.add_incoming(setobj.type(None), bb_else)
+
+    is_error_res.add_incoming(is_error, bb_unboxed)
+    is_error_res.add_incoming(cgutils.true_bit, bb_else)
+
+    # cleanup
+    c.pyapi.decref(set_type)
+    c.pyapi.decref(valtype)
+
+    return NativeValue(setobj_res, is_error=is_error_res)
+
+
+@type_callable(SetType)
+def typedset_call(context):
+    """
+    Defines typing logic for ``Set()`` and ``Set(iterable)``.
+    Produces Set[undefined] or Set[item]
+    """
+    def typer(arg=None):
+        if arg is None:
+            return SetType(types.undefined)
+        elif isinstance(arg, types.IterableType):
+            return SetType(arg.iterator_type.yield_type)
+        else:
+            raise errors.TypingError("Set() argument must be iterable")
+    return typer
+
+
+@overload(numba_typeref_ctor)
+def impl_numba_typeref_ctor(cls, *args):
+    """
+    Defines lowering for ``Set()`` and ``Set(iterable)``.
+
+    The type-inferred version of the set ctor.
+
+    Parameters
+    ----------
+    cls : TypeRef
+        Expecting a TypeRef of a precise SetType.
+    args: tuple
+        A tuple that contains a single iterable (optional)
+
+    Returns
+    -------
+    impl : function
+        An implementation suitable for lowering the constructor call.
+
+    See also: `redirect_type_ctor` in numba/cpython/builtins.py
+    """
+    set_ty = cls.instance_type
+    if not isinstance(set_ty, SetType):
+        return  # reject
+    # Ensure the set is precisely typed.
+    if not set_ty.is_precise():
+        msg = "expecting a precise SetType but got {}".format(set_ty)
+        raise errors.LoweringError(msg)
+
+    item_type = types.TypeRef(set_ty.item_type)
+    if args:
+        def impl(cls, *args):
+            r = setobject.new_set(item_type)
+            r.update(args[0])
+            return r
+    else:
+        def impl(cls, *args):
+            return setobject.new_set(item_type)
+
+    return impl